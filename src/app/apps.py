@@ -1,11 +1,17 @@
 from django.apps import AppConfig as Config
 from django.conf import settings
-from prometheus_client import start_http_server
+from django.core.signals import request_started
+from prometheus_client import REGISTRY, start_http_server
+
+from app.internal.general.db.ConnectionReleasingRegistry import ConnectionReleasingRegistry
+from app.internal.general.db.replicas import reset_database_user
 
 
 class AppConfig(Config):
     name = "app"
 
     def ready(self) -> None:
+        request_started.connect(reset_database_user)
+
         if settings.METRICS:
-            start_http_server(settings.METRICS_PORT)
+            start_http_server(settings.METRICS_PORT, registry=ConnectionReleasingRegistry(REGISTRY))
@@ -7,6 +7,7 @@ from ninja.security import HttpBearer
 from app.internal.authentication.db.repositories import AuthRepository
 from app.internal.authentication.domain.services import JWTService
 from app.internal.authentication.domain.services.TokenTypes import TokenTypes
+from app.internal.general.db.replicas import set_database_user
 from app.internal.user.db.repositories import TelegramUserRepository
 
 
@@ -22,6 +23,7 @@ class JWTAuthentication(HttpBearer):
             payload, TokenTypes.ACCESS, settings.ACCESS_TOKEN_TTL
         ):
             request.telegram_user = self._service.get_authenticated_telegram_user(payload)
+            set_database_user(request.telegram_user.id if request.telegram_user else None)
 
             return token if request.telegram_user is not None else None
 
@@ -6,6 +6,7 @@ from ninja.responses import Response
 from app.internal.authentication.domain.entities import AccessTokenOut, CredentialsSchema
 from app.internal.authentication.domain.services import JWTService
 from app.internal.authentication.domain.services.TokenTypes import TokenTypes
+from app.internal.general.budget import query_budget
 from app.internal.general.rest.exceptions import (
     AccessTokenTTLZeroException,
     InvalidPayloadException,
@@ -20,6 +21,7 @@ class AuthHandlers:
     def __init__(self, auth_service: JWTService):
         self._auth_service = auth_service
 
+    @query_budget(5)
     def login(self, request: HttpRequest, credentials: CredentialsSchema = Body(...)) -> Response:
         user = self._auth_service.get_user_by_credentials(credentials.username, credentials.password)
         if not user:
@@ -32,6 +34,7 @@ class AuthHandlers:
 
         return response
 
+    @query_budget(7)
     def refresh(self, request: HttpRequest) -> Response:
         refresh_token: str = request.COOKIES.get(settings.REFRESH_TOKEN_COOKIE)
         if not refresh_token:
@@ -0,0 +1,45 @@
+import os
+from typing import Dict
+
+from django.conf import settings
+from django.db import models
+from django.db.models import F
+from django.db.models.fields.files import FieldFile
+from django.db.transaction import atomic, on_commit
+
+
+class PhotoBlob(models.Model):
+    digest = models.CharField(primary_key=True, max_length=64)
+    name = models.CharField(max_length=255, unique=True)
+    size = models.PositiveIntegerField()
+    references = models.PositiveIntegerField(default=1)
+    has_variants = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    @staticmethod
+    def get_variant_names(name: str) -> Dict[str, str]:
+        stem = os.path.splitext(name)[0]
+        extension = settings.PHOTO_VARIANT_FORMAT.lower()
+
+        return {variant: f"{stem}.{variant}.{extension}" for variant in settings.PHOTO_VARIANT_SIDES}
+
+    @classmethod
+    def release(cls, file: FieldFile) -> None:
+        if cls.objects.filter(name=file.name).update(references=F("references") - 1):
+            on_commit(lambda: cls._delete_unreferenced(file))
+        else:
+            on_commit(lambda: file.storage.delete(file.name))
+
+    @classmethod
+    def _delete_unreferenced(cls, file: FieldFile) -> None:
+        with atomic():
+            if not cls.objects.filter(name=file.name, references=0).delete()[0]:
+                return
+
+            for name in [file.name, *cls.get_variant_names(file.name).values()]:
+                file.storage.delete(name)
+
+    class Meta:
+        db_table = "photo_blobs"
+        verbose_name = "Photo Blob"
+        verbose_name_plural = "Photo Blobs"
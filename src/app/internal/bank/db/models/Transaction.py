@@ -1,10 +1,16 @@
+from typing import Dict
+
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models.signals import post_delete
+from django_cleanup import cleanup
 
 from app.internal.bank.db.models import BankAccount
+from app.internal.bank.db.models.PhotoBlob import PhotoBlob
 from app.internal.bank.db.models.TransactionTypes import TransactionTypes
 
 
+@cleanup.ignore
 class Transaction(models.Model):
     type = models.IntegerField(choices=TransactionTypes.choices, default=TransactionTypes.TRANSFER)
     source = models.ForeignKey(BankAccount, on_delete=models.CASCADE, related_name="transactions_from_me")
@@ -15,12 +21,22 @@ class Transaction(models.Model):
     was_destination_viewed = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
-    def delete(self, using=None, keep_parents=False):
-        super().delete(using, keep_parents)
-        self.photo.delete(save=False)
+    def get_photo_variant_names(self) -> Dict[str, str]:
+        if not getattr(self, "photo_has_variants", False):
+            return {}
+
+        return PhotoBlob.get_variant_names(self.photo.name)
 
     class Meta:
         ordering = ("created_at",)
         db_table = "transactions"
         verbose_name = "Transaction"
         verbose_name_plural = "Transactions"
+
+
+def release_photo(sender, instance: Transaction, **kwargs) -> None:
+    if instance.photo:
+        PhotoBlob.release(instance.photo)
+
+
+post_delete.connect(release_photo, sender=Transaction)
@@ -0,0 +1,14 @@
+from django.db import models
+
+
+class TransactionArchive(models.Model):
+    month = models.DateField(primary_key=True)
+    name = models.CharField(max_length=255, unique=True)
+    rows = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("month",)
+        db_table = "transaction_archives"
+        verbose_name = "Transaction Archive"
+        verbose_name_plural = "Transaction Archives"
@@ -1,5 +1,7 @@
 from .BankAccount import BankAccount
 from .BankCard import BankCard
 from .BankObject import BankObject
+from .PhotoBlob import PhotoBlob
 from .Transaction import Transaction
+from .TransactionArchive import TransactionArchive
 from .TransactionTypes import TransactionTypes
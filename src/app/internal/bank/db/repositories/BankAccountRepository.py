@@ -1,10 +1,11 @@
 from decimal import Decimal
-from typing import Optional, Union
+from typing import Iterable, Optional, Tuple, Union
 
 from django.db.models import F, Q, QuerySet, Sum
 
 from app.internal.bank.db.models import BankAccount
 from app.internal.bank.domain.interfaces import IBankAccountRepository
+from app.internal.general.db.replicas import read_replica
 
 
 class BankAccountRepository(IBankAccountRepository):
@@ -14,14 +15,30 @@ class BankAccountRepository(IBankAccountRepository):
     def get_bank_accounts(self, user_id: Union[int, str]) -> QuerySet[BankAccount]:
         return BankAccount.objects.filter(owner_id=user_id).all()
 
+    def get_bank_accounts_by_numbers(self, numbers: Iterable[str]) -> QuerySet[BankAccount]:
+        return BankAccount.objects.filter(number__in=numbers).select_related("owner")
+
+    def get_documents(self, user_id: Union[int, str]) -> QuerySet[Tuple[str, Decimal, Optional[str]]]:
+        return (
+            BankAccount.objects.filter(owner_id=user_id)
+            .order_by("number", "bank_cards__number")
+            .values_list("number", "balance", "bank_cards__number")
+        )
+
+    def get_balance(self, number: str) -> Optional[Decimal]:
+        return BankAccount.objects.filter(number=number).values_list("balance", flat=True).first()
+
+    @read_replica()
     def get_amount(self) -> int:
         return BankAccount.objects.count()
 
     def accrue(self, number: int, accrual: Decimal) -> None:
         BankAccount.objects.filter(number=number).update(balance=F("balance") + accrual)
 
-    def subtract(self, number: int, accrual: Decimal) -> None:
-        self.accrue(number, -accrual)
+    def subtract(self, number: int, accrual: Decimal) -> bool:
+        return (
+            BankAccount.objects.filter(number=number, balance__gte=accrual).update(balance=F("balance") - accrual) == 1
+        )
 
     def get_bank_account_by_document_number(self, number: int) -> Optional[BankAccount]:
         return self._get_by_document_number(number).first()
@@ -29,6 +46,7 @@ class BankAccountRepository(IBankAccountRepository):
     def get_user_bank_account_by_document_number(self, user_id: Union[int, str], number: int) -> Optional[BankAccount]:
         return self._get_by_document_number(number).filter(owner_id=user_id).first()
 
+    @read_replica()
     def get_balance_total(self) -> Decimal:
         return BankAccount.objects.aggregate(Sum("balance"))["balance__sum"]
 
@@ -4,14 +4,20 @@ from django.db.models import QuerySet
 
 from app.internal.bank.db.models import BankCard
 from app.internal.bank.domain.interfaces import IBankCardRepository
+from app.internal.general.db.replicas import read_replica
 
 
 class BankCardRepository(IBankCardRepository):
     def get_card(self, user_id: Union[int, str], number: str) -> Optional[BankCard]:
-        return BankCard.objects.filter(bank_account__owner_id=user_id, number=number).first()
+        return (
+            BankCard.objects.filter(bank_account__owner_id=user_id, number=number)
+            .select_related("bank_account")
+            .first()
+        )
 
     def get_cards(self, user_ud: Union[int, str]) -> QuerySet[BankCard]:
-        return BankCard.objects.filter(bank_account__owner_id=user_ud).all()
+        return BankCard.objects.filter(bank_account__owner_id=user_ud).select_related("bank_account").all()
 
+    @read_replica()
     def get_amount(self) -> int:
         return BankCard.objects.count()
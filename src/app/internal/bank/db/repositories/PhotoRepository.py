@@ -0,0 +1,69 @@
+import hashlib
+import os
+from typing import Dict, Tuple
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.db.models import F, Sum
+from django.db.transaction import atomic
+
+from app.internal.bank.db.models import PhotoBlob, Transaction
+from app.internal.bank.domain.interfaces import IPhotoRepository
+from app.internal.general.db.replicas import read_replica
+
+
+class PhotoRepository(IPhotoRepository):
+    DIRECTORY = "photos"
+    _ACQUIRE = (
+        f"INSERT INTO {PhotoBlob._meta.db_table} AS blobs "
+        '(digest, name, size, "references", has_variants, created_at) VALUES (%s, %s, %s, 1, FALSE, NOW()) '
+        'ON CONFLICT (digest) DO UPDATE SET "references" = blobs."references" + 1 '
+        'RETURNING blobs.name, blobs."references", blobs.has_variants'
+    )
+
+    def store(self, photo: File) -> Tuple[str, bool, bool]:
+        digest = self._get_digest(photo)
+
+        name = f"{self.DIRECTORY}/{digest[:2]}/{digest}{os.path.splitext(photo.name)[1]}"
+
+        with atomic(savepoint=False), connection.cursor() as cursor:
+            cursor.execute(self._ACQUIRE, [digest, name, photo.size])
+            name, references, has_variants = cursor.fetchone()
+
+            if references > 1:
+                return name, False, has_variants
+
+            storage = Transaction._meta.get_field("photo").storage
+            if storage.exists(name):
+                return name, True, has_variants
+
+            storage.save(name, photo)
+
+        return name, True, False
+
+    def save_variants(self, name: str, variants: Dict[str, bytes]) -> None:
+        storage = Transaction._meta.get_field("photo").storage
+
+        for variant, variant_name in PhotoBlob.get_variant_names(name).items():
+            if not storage.exists(variant_name):
+                storage.save(variant_name, ContentFile(variants[variant]))
+
+        PhotoBlob.objects.filter(name=name).update(has_variants=True)
+
+    @read_replica()
+    def get_saved_bytes(self) -> int:
+        return (
+            PhotoBlob.objects.filter(references__gt=0).aggregate(saved=Sum((F("references") - 1) * F("size")))["saved"]
+            or 0
+        )
+
+    def _get_digest(self, photo: File) -> str:
+        digest = hashlib.sha256()
+
+        for chunk in photo.chunks():
+            digest.update(chunk)
+
+        photo.seek(0)
+
+        return digest.hexdigest()
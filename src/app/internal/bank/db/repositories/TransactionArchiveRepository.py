@@ -0,0 +1,146 @@
+import csv
+import gzip
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.db.transaction import atomic
+
+from app.internal.bank.db.models import BankAccount, Transaction, TransactionArchive
+from app.internal.bank.domain.interfaces import ITransactionArchiveRepository
+
+
+class TransactionArchiveRepository(ITransactionArchiveRepository):
+    PARTITION_PREFIX = f"{Transaction._meta.db_table}_p"
+    DEFAULT_PARTITION = f"{Transaction._meta.db_table}_default"
+
+    def get_partition_months(self) -> List[date]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = %s::regclass",
+                [Transaction._meta.db_table],
+            )
+            names = [name for name, in cursor.fetchall() if name.startswith(self.PARTITION_PREFIX)]
+
+        return sorted(datetime.strptime(name.removeprefix(self.PARTITION_PREFIX), "%Y_%m").date() for name in names)
+
+    def get_archived_months(self) -> List[date]:
+        return list(TransactionArchive.objects.values_list("month", flat=True))
+
+    def get_oldest_unpartitioned(self) -> Optional[datetime]:
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT MIN(created_at) FROM {connection.ops.quote_name(self.DEFAULT_PARTITION)}")
+
+            return cursor.fetchone()[0]
+
+    def create_partition(self, month: date) -> None:
+        table, partition, default = self._get_tables(month)
+        start, end = self._get_bounds(month)
+
+        with atomic(), connection.cursor() as cursor:
+            cursor.execute(f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+            cursor.execute(
+                f"WITH moved AS (DELETE FROM {default} WHERE created_at >= %s AND created_at < %s RETURNING *) "
+                f"INSERT INTO {partition} SELECT * FROM moved",
+                [start, end],
+            )
+            cursor.execute(
+                f"ALTER TABLE {table} ATTACH PARTITION {partition} FOR VALUES FROM (%s) TO (%s)", [start, end]
+            )
+
+    def archive_partition(self, month: date) -> TransactionArchive:
+        table, partition, _ = self._get_tables(month)
+        name = f"{Transaction._meta.db_table}_{month:%Y_%m}.csv.gz"
+        path = Path(settings.TRANSACTION_ARCHIVE_ROOT, name)
+        partial = path.with_name(f"{name}.partial")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with atomic(), connection.cursor() as cursor:
+                cursor.execute(f"LOCK TABLE {partition} IN SHARE MODE")
+                cursor.execute(f"SELECT COUNT(*) FROM {partition}")
+                rows = cursor.fetchone()[0]
+
+                with gzip.open(partial, "wb") as file:
+                    cursor.copy_expert(f"COPY {partition} TO STDOUT WITH (FORMAT csv, HEADER)", file)
+
+                cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {partition}")
+                cursor.execute(f"DROP TABLE {partition}")
+                archive = TransactionArchive.objects.create(month=month, name=name, rows=rows)
+
+                os.replace(partial, path)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        return archive
+
+    def get_archived_transactions(
+        self, account_number: int, since: Optional[datetime], until: Optional[datetime]
+    ) -> List[Transaction]:
+        return list(self._read_transactions(str(account_number), since, until))
+
+    def get_detailed_archived_transactions(
+        self, account_number: int, since: Optional[datetime], until: Optional[datetime]
+    ) -> List[Transaction]:
+        transactions = self.get_archived_transactions(account_number, since, until)
+        numbers = {
+            number for transaction in transactions for number in (transaction.source_id, transaction.destination_id)
+        }
+        accounts = BankAccount.objects.select_related("owner").in_bulk(numbers) if numbers else {}
+
+        detailed = []
+
+        for transaction in transactions:
+            if transaction.source_id in accounts and transaction.destination_id in accounts:
+                transaction.source = accounts[transaction.source_id]
+                transaction.destination = accounts[transaction.destination_id]
+                detailed.append(transaction)
+
+        return detailed
+
+    def _read_transactions(
+        self, account_number: str, since: Optional[datetime], until: Optional[datetime]
+    ) -> Iterator[Transaction]:
+        archives = TransactionArchive.objects.all()
+
+        if since:
+            archives = archives.filter(month__gte=since.astimezone(timezone.utc).date().replace(day=1))
+
+        if until:
+            archives = archives.filter(month__lte=until.astimezone(timezone.utc).date())
+
+        fields = {field.column: field for field in Transaction._meta.concrete_fields}
+
+        for archive in archives:
+            with gzip.open(Path(settings.TRANSACTION_ARCHIVE_ROOT, archive.name), "rt", newline="") as file:
+                for row in csv.DictReader(file):
+                    if account_number not in (row["source_id"], row["destination_id"]):
+                        continue
+
+                    transaction = Transaction(
+                        **{
+                            fields[column].attname: fields[column].to_python(value or None)
+                            for column, value in row.items()
+                        }
+                    )
+
+                    if (not since or transaction.created_at >= since) and (not until or transaction.created_at < until):
+                        yield transaction
+
+    def _get_tables(self, month: date) -> Tuple[str, str, str]:
+        return (
+            connection.ops.quote_name(Transaction._meta.db_table),
+            connection.ops.quote_name(f"{self.PARTITION_PREFIX}{month:%Y_%m}"),
+            connection.ops.quote_name(self.DEFAULT_PARTITION),
+        )
+
+    def _get_bounds(self, month: date) -> Tuple[datetime, datetime]:
+        start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+
+        return start, (start + timedelta(days=32)).replace(day=1)
@@ -1,12 +1,14 @@
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional, Union
 
 from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
-from django.db.models import Q, QuerySet
+from django.db.models import Exists, OuterRef, Q, QuerySet
 
-from app.internal.bank.db.models import Transaction, TransactionTypes
+from app.internal.bank.db.models import PhotoBlob, Transaction, TransactionTypes
 from app.internal.bank.domain.interfaces import ITransactionRepository
+from app.internal.general.db.replicas import read_replica
 
 
 class TransactionRepository(ITransactionRepository):
@@ -16,7 +18,7 @@ class TransactionRepository(ITransactionRepository):
         destination_number: int,
         type_: TransactionTypes,
         accrual: Decimal,
-        photo: Optional[ContentFile],
+        photo: Optional[Union[ContentFile, str]],
     ) -> Transaction:
         if accrual < 0:
             raise ValidationError("Accrual must not be less than 0")
@@ -29,28 +31,41 @@ class TransactionRepository(ITransactionRepository):
             photo=photo,
         )
 
-    def get_transactions(self, account_number: int) -> QuerySet[Transaction]:
-        return Transaction.objects.filter(
+    def attach_photo(self, transaction_id: int, created_at: datetime, name: str) -> None:
+        Transaction.objects.filter(pk=transaction_id, created_at=created_at).update(photo=name)
+
+    def get_transactions(
+        self, account_number: int, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> QuerySet[Transaction]:
+        transactions = Transaction.objects.filter(
             Q(source__number=account_number) | Q(destination__number=account_number)
-        ).all()
+        )
 
-    def get_related_usernames(self, user_id: Union[int, str]) -> QuerySet[str]:
-        from_ = Transaction.objects.filter(source__owner_id=user_id).values_list(
-            "destination__owner__username", flat=True
+        if since:
+            transactions = transactions.filter(created_at__gte=since)
+
+        if until:
+            transactions = transactions.filter(created_at__lt=until)
+
+        return transactions.annotate(
+            photo_has_variants=Exists(PhotoBlob.objects.filter(name=OuterRef("photo"), has_variants=True))
         )
-        to = Transaction.objects.filter(destination__owner_id=user_id).values_list("source__owner__username", flat=True)
 
-        return from_.union(to)
+    def get_detailed_transactions(
+        self, account_number: int, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> QuerySet[Transaction]:
+        return self.get_transactions(account_number, since, until).select_related("source__owner", "destination__owner")
 
     def get_new_transactions(self, user_id: Union[int, str]) -> QuerySet[Transaction]:
         return Transaction.objects.filter(
             Q(source__owner_id=user_id) & Q(was_source_viewed=False)
             | Q(destination__owner__id=user_id) & Q(was_destination_viewed=False)
-        )
+        ).select_related("source__owner", "destination__owner")
 
     def mark_transactions_as_viewed(self, user_id: Union[int, str]) -> None:
         Transaction.objects.filter(source__owner_id=user_id).update(was_source_viewed=True)
         Transaction.objects.filter(destination__owner_id=user_id).update(was_destination_viewed=True)
 
+    @read_replica()
     def get_amount(self) -> int:
         return Transaction.objects.count()
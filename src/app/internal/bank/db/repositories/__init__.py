@@ -1,3 +1,5 @@
 from .BankAccountRepository import BankAccountRepository
 from .BankCardRepository import BankCardRepository
+from .PhotoRepository import PhotoRepository
+from .TransactionArchiveRepository import TransactionArchiveRepository
 from .TransactionRepository import TransactionRepository
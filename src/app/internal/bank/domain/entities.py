@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from ninja import Schema, UploadedFile
 from pydantic import Field, validator
@@ -20,6 +20,7 @@ class TransactionOut(Schema):
     destination: str
     accrual: float
     photo: Optional[str]
+    photo_variants: Dict[str, str]
     created_at: datetime
 
 
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Optional, Union
+from typing import Iterable, Optional, Tuple, Union
 
 from django.db.models import QuerySet
 
@@ -17,6 +17,18 @@ class IBankAccountRepository(ABC):
     def get_bank_accounts(self, user_id: Union[int, str]) -> QuerySet[BankAccount]:
         pass
 
+    @abstractmethod
+    def get_bank_accounts_by_numbers(self, numbers: Iterable[str]) -> QuerySet[BankAccount]:
+        pass
+
+    @abstractmethod
+    def get_documents(self, user_id: Union[int, str]) -> QuerySet[Tuple[str, Decimal, Optional[str]]]:
+        pass
+
+    @abstractmethod
+    def get_balance(self, number: str) -> Optional[Decimal]:
+        pass
+
     @abstractmethod
     def get_amount(self) -> int:
         pass
@@ -26,7 +38,7 @@ class IBankAccountRepository(ABC):
         pass
 
     @abstractmethod
-    def subtract(self, number: int, accrual: Decimal) -> None:
+    def subtract(self, number: int, accrual: Decimal) -> bool:
         pass
 
     @abstractmethod
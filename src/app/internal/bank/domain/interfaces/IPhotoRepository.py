@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Tuple
+
+from django.core.files import File
+
+
+class IPhotoRepository(ABC):
+    @abstractmethod
+    def store(self, photo: File) -> Tuple[str, bool, bool]:
+        pass
+
+    @abstractmethod
+    def save_variants(self, name: str, variants: Dict[str, bytes]) -> None:
+        pass
+
+    @abstractmethod
+    def get_saved_bytes(self) -> int:
+        pass
@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import List, Optional
+
+from app.internal.bank.db.models import Transaction, TransactionArchive
+
+
+class ITransactionArchiveRepository(ABC):
+    @abstractmethod
+    def get_partition_months(self) -> List[date]:
+        pass
+
+    @abstractmethod
+    def get_archived_months(self) -> List[date]:
+        pass
+
+    @abstractmethod
+    def get_oldest_unpartitioned(self) -> Optional[datetime]:
+        pass
+
+    @abstractmethod
+    def create_partition(self, month: date) -> None:
+        pass
+
+    @abstractmethod
+    def archive_partition(self, month: date) -> TransactionArchive:
+        pass
+
+    @abstractmethod
+    def get_archived_transactions(
+        self, account_number: int, since: Optional[datetime], until: Optional[datetime]
+    ) -> List[Transaction]:
+        pass
+
+    @abstractmethod
+    def get_detailed_archived_transactions(
+        self, account_number: int, since: Optional[datetime], until: Optional[datetime]
+    ) -> List[Transaction]:
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from decimal import Decimal
 from typing import Iterable, Optional, Union
 
@@ -16,16 +17,24 @@ class ITransactionRepository(ABC):
         destination_number: int,
         type_: TransactionTypes,
         accrual: Decimal,
-        photo: Optional[ContentFile],
+        photo: Optional[Union[ContentFile, str]],
     ) -> Transaction:
         pass
 
     @abstractmethod
-    def get_transactions(self, account_number: int) -> QuerySet[Transaction]:
+    def attach_photo(self, transaction_id: int, created_at: datetime, name: str) -> None:
         pass
 
     @abstractmethod
-    def get_related_usernames(self, user_id: Union[int, str]) -> QuerySet[str]:
+    def get_transactions(
+        self, account_number: int, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> QuerySet[Transaction]:
+        pass
+
+    @abstractmethod
+    def get_detailed_transactions(
+        self, account_number: int, since: Optional[datetime] = None, until: Optional[datetime] = None
+    ) -> QuerySet[Transaction]:
         pass
 
     @abstractmethod
@@ -1,3 +1,5 @@
 from .IBankAccountRepository import IBankAccountRepository
 from .IBankCardRepository import IBankCardRepository
+from .IPhotoRepository import IPhotoRepository
+from .ITransactionArchiveRepository import ITransactionArchiveRepository
 from .ITransactionRepository import ITransactionRepository
@@ -1,10 +1,13 @@
-from itertools import chain
-from typing import Optional
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Union
 
 from django.db.models import QuerySet
+from telegram import User
 
 from app.internal.bank.db.models import BankAccount, BankCard, BankObject
 from app.internal.bank.domain.interfaces import IBankAccountRepository, IBankCardRepository
+from app.internal.bank.domain.services.Document import Document
+from app.internal.bank.domain.services.DocumentCatalog import DocumentCatalog
 from app.internal.metrics import ACCOUNT_AMOUNT, BALANCE_TOTAL, CARD_AMOUNT
 from app.internal.user.db.models import TelegramUser
 
@@ -27,13 +30,30 @@ class BankObjectService:
 
         raise ValueError()
 
-    def get_documents_order(self, user: TelegramUser) -> dict:
-        return dict(
-            (number, document)
-            for number, document in enumerate(
-                chain(self._account_repo.get_bank_accounts(user.id), self._card_repo.get_cards(user.id)), start=1
-            )
-        )
+    def get_document_catalog(self, user: Union[User, TelegramUser]) -> DocumentCatalog:
+        accounts: Dict[str, Document] = {}
+        cards = []
+
+        for number, balance, card in self._account_repo.get_documents(user.id):
+            if number not in accounts:
+                accounts[number] = Document.create(number, number, balance)
+
+            if card:
+                cards.append(Document.create(card, number, balance))
+
+        return DocumentCatalog([*accounts.values(), *cards])
+
+    def get_balance(self, account_number: str) -> Optional[Decimal]:
+        return self._account_repo.get_balance(account_number)
+
+    def get_document(self, user: Union[User, TelegramUser], number: str) -> Optional[BankObject]:
+        if len(number) == BankCard.DIGITS_COUNT:
+            return self._card_repo.get_card(user.id, number)
+
+        return self._account_repo.get_bank_account(user.id, number)
+
+    def get_bank_accounts_by_numbers(self, numbers: Iterable[str]) -> Dict[str, BankAccount]:
+        return dict((account.number, account) for account in self._account_repo.get_bank_accounts_by_numbers(numbers))
 
     def is_balance_zero(self, document: BankObject) -> bool:
         return document.get_balance() == 0
@@ -41,7 +61,7 @@ class BankObjectService:
     def get_bank_accounts(self, user: TelegramUser) -> QuerySet[BankAccount]:
         return self._account_repo.get_bank_accounts(user.id)
 
-    def get_bank_account(self, user: TelegramUser, number: int) -> Optional[BankAccount]:
+    def get_bank_account(self, user: Union[User, TelegramUser], number: int) -> Optional[BankAccount]:
         return self._account_repo.get_bank_account(user.id, number)
 
     def get_cards(self, user: TelegramUser) -> QuerySet[BankCard]:
@@ -50,7 +70,9 @@ class BankObjectService:
     def get_card(self, user: TelegramUser, number: int) -> Optional[BankCard]:
         return self._card_repo.get_card(user.id, number)
 
-    def get_user_bank_account_by_document_number(self, user: TelegramUser, number: int) -> Optional[BankAccount]:
+    def get_user_bank_account_by_document_number(
+        self, user: Union[User, TelegramUser], number: int
+    ) -> Optional[BankAccount]:
         return self._account_repo.get_user_bank_account_by_document_number(user.id, number)
 
     def get_bank_account_by_document_number(self, number) -> Optional[BankAccount]:
@@ -0,0 +1,29 @@
+from decimal import Decimal
+from typing import NamedTuple, Optional, Type, Union
+
+from app.internal.bank.db.models import BankAccount, BankCard
+
+
+class Document(NamedTuple):
+    number: str
+    account: str
+    balance: Optional[Decimal]
+    short_number: str
+
+    @classmethod
+    def create(cls, number: str, account: str, balance: Decimal) -> "Document":
+        document = cls._get_type(number, account)(number=number)
+
+        return cls(number, account, balance, document.short_number)
+
+    @property
+    def is_card(self) -> bool:
+        return self.number != self.account
+
+    @property
+    def pretty_number(self) -> str:
+        return self._get_type(self.number, self.account)(number=self.number).pretty_number
+
+    @staticmethod
+    def _get_type(number: str, account: str) -> Type[Union[BankAccount, BankCard]]:
+        return BankCard if number != account else BankAccount
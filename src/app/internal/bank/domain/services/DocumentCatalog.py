@@ -0,0 +1,21 @@
+from typing import Iterator, List, Tuple
+
+from app.internal.bank.domain.services.Document import Document
+
+
+class DocumentCatalog:
+    def __init__(self, documents: List[Document]):
+        self.documents = documents
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    @classmethod
+    def from_rows(cls, rows: List[list]) -> "DocumentCatalog":
+        return cls([Document(number, account, None, short_number) for number, account, *_, short_number in rows])
+
+    def to_rows(self) -> List[list]:
+        return [[document.number, document.account, document.short_number] for document in self.documents]
+
+    def get_numbered(self) -> Iterator[Tuple[int, Document]]:
+        return enumerate(self.documents, start=1)
@@ -1,5 +1,10 @@
+from typing import Union
+
+from django.core.files import File
+
+
 class Photo:
-    def __init__(self, unique_name: str, content: bytes, size: int):
+    def __init__(self, unique_name: str, content: Union[bytes, File], size: int):
         self.unique_name = unique_name
         self.content = content
         self.size = size
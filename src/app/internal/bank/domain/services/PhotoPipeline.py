@@ -0,0 +1,87 @@
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Tuple
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.transaction import on_commit
+
+from app.internal.bank.domain.interfaces import IPhotoRepository
+from app.internal.general.images import render_variants
+from app.internal.metrics import PHOTO_VARIANT_ERRORS, PHOTO_VARIANTS_STORED
+
+logger = logging.getLogger(__name__)
+
+
+class PhotoPipeline:
+    def __init__(self, photo_repo: IPhotoRepository, workers: int):
+        self._photo_repo = photo_repo
+        self._workers = workers
+        self._executor = None
+        self._storing = None
+        self._lock = Lock()
+
+    def schedule(self, name: str, content: bytes) -> None:
+        on_commit(lambda: self.submit(name, content))
+
+    def submit(self, name: str, content: bytes) -> Future:
+        stored = Future()
+        executor, storing = self._get_executors()
+
+        try:
+            rendering = executor.submit(
+                render_variants,
+                content,
+                settings.PHOTO_VARIANT_SIDES,
+                settings.PHOTO_VARIANT_FORMAT,
+                settings.PHOTO_VARIANT_QUALITY,
+            )
+        except (BrokenProcessPool, RuntimeError):
+            PHOTO_VARIANT_ERRORS.inc()
+            logger.exception("Scheduling variants of %s failed, leaving them to the retry", name)
+            self._discard(executor)
+            stored.set_result(False)
+            return stored
+
+        rendering.add_done_callback(lambda done: storing.submit(self._store, name, done, stored))
+
+        return stored
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor:
+                self._executor.shutdown()
+                self._storing.shutdown()
+                self._executor = self._storing = None
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not executor:
+                return
+
+            self._executor = self._storing = None
+
+        executor.shutdown(wait=False)
+
+    def _get_executors(self) -> Tuple[ProcessPoolExecutor, ThreadPoolExecutor]:
+        with self._lock:
+            if not self._executor:
+                self._executor = ProcessPoolExecutor(self._workers, multiprocessing.get_context("spawn"))
+                self._storing = ThreadPoolExecutor(self._workers, thread_name_prefix="photo-store")
+
+            return self._executor, self._storing
+
+    def _store(self, name: str, rendering: Future, stored: Future) -> None:
+        try:
+            self._photo_repo.save_variants(name, rendering.result())
+            PHOTO_VARIANTS_STORED.inc()
+            stored.set_result(True)
+        except Exception:
+            PHOTO_VARIANT_ERRORS.inc()
+            logger.exception("Rendering variants of %s failed", name)
+            stored.set_result(False)
+        finally:
+            close_old_connections()
@@ -0,0 +1,52 @@
+from typing import Dict, Iterable, Optional
+
+from django.core.cache import cache
+from django.core.files.storage import Storage
+from django.utils.encoding import filepath_to_uri
+
+from app.internal.bank.db.models import Transaction
+from app.internal.metrics import PHOTO_URLS_SIGNED
+
+_URL_KEY = "photo:url:{name}"
+
+
+class PhotoUrlService:
+    def __init__(self, public_prefix: str, expiry_margin_seconds: int):
+        self._public_prefix = public_prefix.rstrip("/")
+        self._expiry_margin_seconds = expiry_margin_seconds
+
+    def get_urls(self, names: Iterable[str]) -> Dict[str, str]:
+        names = set(names)
+
+        if self._public_prefix:
+            return {name: f"{self._public_prefix}/{filepath_to_uri(name)}" for name in names}
+
+        keys = {_URL_KEY.format(name=name): name for name in names}
+        urls = {keys[key]: url for key, url in cache.get_many(keys).items()}
+        missing = names - urls.keys()
+
+        if missing:
+            storage = Transaction._meta.get_field("photo").storage
+            signed = {name: storage.url(name) for name in missing}
+            urls.update(signed)
+            PHOTO_URLS_SIGNED.inc(len(signed))
+
+            timeout = self._get_timeout(storage)
+            if timeout != 0:
+                cache.set_many({_URL_KEY.format(name=name): url for name, url in signed.items()}, timeout)
+
+        return urls
+
+    def get_transaction_urls(self, transactions: Iterable[Transaction]) -> Dict[str, str]:
+        return self.get_urls(
+            name
+            for transaction in transactions
+            if transaction.photo
+            for name in (transaction.photo.name, *transaction.get_photo_variant_names().values())
+        )
+
+    def _get_timeout(self, storage: Storage) -> Optional[int]:
+        if not getattr(storage, "querystring_auth", False):
+            return None
+
+        return max(storage.querystring_expire - self._expiry_margin_seconds, 0)
@@ -0,0 +1,49 @@
+from datetime import date, datetime, timezone
+from typing import List
+
+from django.utils.timezone import now
+
+from app.internal.bank.db.models import TransactionArchive
+from app.internal.bank.domain.interfaces import ITransactionArchiveRepository
+from app.internal.metrics import TRANSACTION_PARTITIONS_CREATED, TRANSACTIONS_ARCHIVED
+
+
+class TransactionPartitionService:
+    def __init__(self, archive_repo: ITransactionArchiveRepository):
+        self._archive_repo = archive_repo
+
+    def create_partitions(self, since: datetime, ahead: int) -> List[date]:
+        existing = {*self._archive_repo.get_partition_months(), *self._archive_repo.get_archived_months()}
+        last = self._shift(self._get_month(now()), ahead)
+        month = self._get_month(min(since, self._archive_repo.get_oldest_unpartitioned() or since))
+        created = []
+
+        while month <= last:
+            if month not in existing:
+                self._archive_repo.create_partition(month)
+                created.append(month)
+
+            month = self._shift(month, 1)
+
+        TRANSACTION_PARTITIONS_CREATED.inc(len(created))
+
+        return created
+
+    def archive_partitions(self, keep: int) -> List[TransactionArchive]:
+        cutoff = self._shift(self._get_month(now()), -keep)
+        months = [month for month in self._archive_repo.get_partition_months() if month < cutoff]
+        archives = [self._archive_repo.archive_partition(month) for month in months]
+
+        TRANSACTIONS_ARCHIVED.inc(sum(archive.rows for archive in archives))
+
+        return archives
+
+    @staticmethod
+    def _get_month(moment: datetime) -> date:
+        return moment.astimezone(timezone.utc).date().replace(day=1)
+
+    @staticmethod
+    def _shift(month: date, months: int) -> date:
+        year, index = divmod(month.year * 12 + month.month - 1 + months, 12)
+
+        return date(year, index + 1, 1)
@@ -1,21 +1,34 @@
+from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, Union
+from operator import attrgetter
+from typing import Dict, List, Optional, Union
 
 from django.conf import settings
 from django.core.files.base import ContentFile
-from django.db.models import QuerySet
 from django.template.loader import render_to_string
 from telegram import User
 
 from app.internal.bank.db.models import BankAccount, Transaction, TransactionTypes
-from app.internal.bank.domain.interfaces import ITransactionRepository
+from app.internal.bank.domain.interfaces import ITransactionArchiveRepository, ITransactionRepository
 from app.internal.bank.domain.services.OperationNames import OperationNames
+from app.internal.bank.domain.services.PhotoUrlService import PhotoUrlService
+from app.internal.general.db.replicas import read_replica
 from app.internal.user.db.models import TelegramUser
+from app.internal.user.domain.interfaces import ICounterpartyRepository
 
 
 class TransactionService:
-    def __init__(self, transaction_repo: ITransactionRepository):
+    def __init__(
+        self,
+        transaction_repo: ITransactionRepository,
+        archive_repo: ITransactionArchiveRepository,
+        counterparty_repo: ICounterpartyRepository,
+        photo_url_service: PhotoUrlService,
+    ):
         self._transaction_repo = transaction_repo
+        self._archive_repo = archive_repo
+        self._counterparty_repo = counterparty_repo
+        self._photo_url_service = photo_url_service
 
     def declare(
         self,
@@ -27,11 +40,27 @@ class TransactionService:
     ) -> Transaction:
         return self._transaction_repo.declare(source.number, destination.number, type_, accrual, photo)
 
-    def get_transactions(self, account: BankAccount) -> QuerySet[Transaction]:
-        return self._transaction_repo.get_transactions(account.number)
+    def get_transactions(
+        self,
+        account: BankAccount,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        include_archived: bool = False,
+    ) -> List[Transaction]:
+        transactions = list(self._transaction_repo.get_transactions(account.number, since, until))
+
+        if not include_archived:
+            return transactions
+
+        archived = self._archive_repo.get_archived_transactions(account.number, since, until)
 
-    def get_related_usernames(self, user_id: Union[int, str]) -> QuerySet[str]:
-        return self._transaction_repo.get_related_usernames(user_id)
+        return sorted(archived + transactions, key=attrgetter("created_at"))
+
+    def get_photo_urls(self, transactions: List[Transaction]) -> Dict[str, str]:
+        return self._photo_url_service.get_transaction_urls(transactions)
+
+    def get_related_usernames(self, user_id: Union[int, str]) -> List[str]:
+        return self._counterparty_repo.get_counterparty_usernames(user_id)
 
     def get_and_mark_new_transactions(self, user: Union[User, TelegramUser]) -> List[Transaction]:
         transactions = list(self._transaction_repo.get_new_transactions(user.id))
@@ -40,17 +69,25 @@ class TransactionService:
 
         return transactions
 
-    def get_history_html(self, account: BankAccount) -> bytes:
+    @read_replica()
+    def get_history_html(self, account_number: str, include_archived: bool = False) -> bytes:
         data = []
         context = {"transactions": data}
 
-        for transaction in self._transaction_repo.get_transactions(account.number):
-            is_accrual = account == transaction.destination
+        transactions = list(self._transaction_repo.get_detailed_transactions(account_number))
+
+        if include_archived:
+            archived = self._archive_repo.get_detailed_archived_transactions(account_number, None, None)
+            transactions = sorted(archived + transactions, key=attrgetter("created_at"))
+        urls = self.get_photo_urls(transactions)
+
+        for transaction in transactions:
+            is_accrual = transaction.destination_id == account_number
 
             date = transaction.created_at.strftime(settings.DATETIME_PARSE_FORMAT)
             type_ = (OperationNames.ACCRUAL if is_accrual else OperationNames.DEBIT).value
             username = (transaction.source if is_accrual else transaction.destination).get_owner().username
-            photo_url = transaction.photo.url if transaction.photo else None
+            photo_url = urls[transaction.photo.name] if transaction.photo else None
 
             data.append([date, type_, username, transaction.accrual, photo_url])
 
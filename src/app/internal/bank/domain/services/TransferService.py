@@ -1,25 +1,35 @@
 import logging.handlers
 import uuid
+from datetime import datetime
 from decimal import Decimal
 from time import time
 from typing import Optional
 
 from django.conf import settings
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.db import IntegrityError
 from django.db.transaction import atomic
 from ninja import UploadedFile
 
 from app.internal.bank.db.models import BankAccount, BankObject, Transaction, TransactionTypes
-from app.internal.bank.domain.interfaces import IBankAccountRepository, IBankCardRepository, ITransactionRepository
+from app.internal.bank.domain.interfaces import (
+    IBankAccountRepository,
+    IBankCardRepository,
+    IPhotoRepository,
+    ITransactionRepository,
+)
 from app.internal.bank.domain.services.Photo import Photo
-from app.internal.metrics import TRANSFER_AMOUNT, TRANSFER_ERRORS
+from app.internal.bank.domain.services.PhotoPipeline import PhotoPipeline
+from app.internal.metrics import PHOTO_STORAGE_SAVED, PHOTO_UPLOADS_AVOIDED, TRANSFER_AMOUNT, TRANSFER_ERRORS
+from app.internal.user.domain.interfaces import ICounterpartyRepository
 
 STARTING_LOG = "Starting transfer id={id} source={source} destination={destination} accrual={accrual} photo_size={size}"
 SUBTRACTION_LOG = "Subtraction completed id={id}"
 ACCRUAL_LOG = "Accrual completed id={id}"
 SUCCESS_LOG = "Transfer completed id={id} duration={seconds}s"
 INTEGRITY_LOG = "Transfer id={id} was not completed"
+INSUFFICIENT_FUNDS_LOG = "Transfer id={id} was declined due to insufficient funds"
+PHOTO_REJECTED_LOG = "Photo for transaction id={id} was rejected size={size}"
 logger = logging.getLogger(__name__)
 
 
@@ -31,12 +41,19 @@ class TransferService:
         account_repo: IBankAccountRepository,
         card_repo: IBankCardRepository,
         transaction_repo: ITransactionRepository,
+        counterparty_repo: ICounterpartyRepository,
+        photo_repo: IPhotoRepository,
+        photo_pipeline: PhotoPipeline,
     ):
         self._account_repo = account_repo
         self._card_repo = card_repo
         self._transaction_repo = transaction_repo
+        self._counterparty_repo = counterparty_repo
+        self._photo_repo = photo_repo
+        self._photo_pipeline = photo_pipeline
 
         TRANSFER_AMOUNT.set_function(self._transaction_repo.get_amount)
+        PHOTO_STORAGE_SAVED.set_function(self._photo_repo.get_saved_bytes)
 
     def is_balance_zero(self, document: BankObject) -> bool:
         return document.get_balance() == 0
@@ -52,6 +69,9 @@ class TransferService:
     def validate_file(self, file: UploadedFile) -> bool:
         return file is None or file.content_type.startswith("image") and file.size <= settings.MAX_SIZE_PHOTO_BYTES
 
+    def validate_photo(self, photo: Photo) -> bool:
+        return 0 < photo.size <= settings.MAX_SIZE_PHOTO_BYTES
+
     def parse_accrual(self, digits: str) -> Decimal:
         accrual = Decimal(round(Decimal(digits), BankAccount.DECIMAL_PLACES))
 
@@ -61,18 +81,30 @@ class TransferService:
         return accrual
 
     def can_extract_from(self, document: BankObject, accrual: Decimal) -> bool:
+        return self.can_extract(document.get_balance(), accrual)
+
+    def can_extract(self, balance: Decimal, accrual: Decimal) -> bool:
         if not self.validate_accrual(accrual):
             raise ValueError()
 
-        return accrual <= document.get_balance()
+        return accrual <= balance
 
-    @TRANSFER_ERRORS.count_exceptions(IntegrityError)
     def try_transfer(
         self,
         source: BankAccount,
         destination: BankAccount,
         accrual: Decimal,
         photo: Optional[Photo],
+    ) -> Optional[Transaction]:
+        return self.try_transfer_by_numbers(source.number, destination.number, accrual, photo)
+
+    @TRANSFER_ERRORS.count_exceptions(IntegrityError)
+    def try_transfer_by_numbers(
+        self,
+        source: str,
+        destination: str,
+        accrual: Decimal,
+        photo: Optional[Photo],
     ) -> Optional[Transaction]:
         if not self.validate_accrual(accrual):
             raise ValueError()
@@ -81,28 +113,32 @@ class TransferService:
         logger.info(
             STARTING_LOG.format(
                 id=id_,
-                source=source.pretty_number,
-                destination=destination.pretty_number,
+                source=BankAccount(number=source).pretty_number,
+                destination=BankAccount(number=destination).pretty_number,
                 accrual=accrual,
                 size=photo.size if photo else None,
             )
         )
         start = time()
 
-        content = (
-            ContentFile(content=photo.content, name=f"{photo.unique_name}.{self.PHOTO_EXTENSION}") if photo else None
-        )
         try:
             with atomic():
-                self._account_repo.subtract(source.number, accrual)
+                if not self._account_repo.subtract(source, accrual):
+                    TRANSFER_ERRORS.inc()
+                    logger.warning(INSUFFICIENT_FUNDS_LOG.format(id=id_))
+
+                    return None
+
                 logger.info(SUBTRACTION_LOG.format(id=id_))
 
-                self._account_repo.accrue(destination.number, accrual)
+                self._account_repo.accrue(destination, accrual)
                 logger.info(ACCRUAL_LOG.format(id=id_))
 
+                name = self._store_photo(photo) if photo else None
                 transaction = self._transaction_repo.declare(
-                    source.number, destination.number, TransactionTypes.TRANSFER, accrual, content
+                    source, destination, TransactionTypes.TRANSFER, accrual, name
                 )
+                self._counterparty_repo.record(source, destination, transaction.created_at)
 
                 seconds = round(time() - start, ndigits=3)
                 message = SUCCESS_LOG.format(id=id_, seconds=seconds)
@@ -114,3 +150,33 @@ class TransferService:
             logger.error(INTEGRITY_LOG.format(id=id_))
 
             return None
+
+    def attach_photo(self, transaction_id: int, created_at: datetime, photo: Photo) -> bool:
+        if not self.validate_photo(photo):
+            logger.warning(PHOTO_REJECTED_LOG.format(id=transaction_id, size=photo.size))
+            return False
+
+        self._transaction_repo.attach_photo(transaction_id, created_at, self._store_photo(photo))
+
+        return True
+
+    def _store_photo(self, photo: Photo) -> str:
+        content = self._get_content(photo)
+        name, uploaded, has_variants = self._photo_repo.store(content)
+
+        if not uploaded:
+            PHOTO_UPLOADS_AVOIDED.inc()
+
+        if not has_variants:
+            content.seek(0)
+            self._photo_pipeline.schedule(name, content.read())
+
+        return name
+
+    def _get_content(self, photo: Photo) -> File:
+        name = f"{photo.unique_name}.{self.PHOTO_EXTENSION}"
+
+        if isinstance(photo.content, File):
+            return File(photo.content.file, name=name)
+
+        return ContentFile(content=photo.content, name=name)
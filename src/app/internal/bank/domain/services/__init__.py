@@ -1,3 +1,6 @@
 from .BankObjectService import BankObjectService
+from .PhotoPipeline import PhotoPipeline
+from .PhotoUrlService import PhotoUrlService
+from .TransactionPartitionService import TransactionPartitionService
 from .TransactionService import TransactionService
 from .TransferService import TransferService
@@ -1,6 +1,8 @@
+from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from django.conf import settings
 from django.http import HttpRequest
 from django.utils.timezone import now
 from ninja import File, Form, UploadedFile
@@ -9,6 +11,9 @@ from app.internal.bank.db.models import BankAccount, BankCard, Transaction
 from app.internal.bank.domain.entities import BankAccountOut, BankCardOut, TransactionOut, TransferIn
 from app.internal.bank.domain.services import BankObjectService, TransactionService, TransferService
 from app.internal.bank.domain.services.Photo import Photo
+from app.internal.general.budget import query_budget
+from app.internal.general.db.replicas import read_replica
+from app.internal.general.rest.decorators import spooled_upload
 from app.internal.general.rest.exceptions import BadRequestException, IntegrityException, NotFoundException
 from app.internal.user.db.models import TelegramUser
 
@@ -24,37 +29,61 @@ class BankHandlers:
         self._transaction_service = transaction_service
         self._transfer_service = transfer_service
 
+    @query_budget(2)
     def get_bank_accounts(self, request: HttpRequest) -> List[BankAccountOut]:
         accounts = self._bank_obj_service.get_bank_accounts(request.telegram_user)
 
         return [BankAccountOut.from_orm(account) for account in accounts]
 
+    @query_budget(2)
     def get_bank_account(self, request: HttpRequest, number: int) -> BankAccountOut:
         account = self._try_get_account(request.telegram_user, number)
 
         return BankAccountOut.from_orm(account)
 
-    def get_account_history(self, request: HttpRequest, number: int) -> List[TransactionOut]:
+    @query_budget(4)
+    @read_replica()
+    def get_account_history(
+        self,
+        request: HttpRequest,
+        number: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        archived: bool = False,
+    ) -> List[TransactionOut]:
         account = self._try_get_account(request.telegram_user, number)
 
-        return self._create_history_response(account)
+        return self._create_history_response(account, since, until, archived)
 
+    @query_budget(2)
     def get_bank_cards(self, request: HttpRequest) -> List[BankCardOut]:
         cards = self._bank_obj_service.get_cards(request.telegram_user)
 
         return [self._get_card_response(card) for card in cards]
 
+    @query_budget(2)
     def get_bank_card(self, request: HttpRequest, number: int) -> BankCardOut:
         card = self._try_get_card(request.telegram_user, number)
 
         return self._get_card_response(card)
 
-    def get_card_history(self, request: HttpRequest, number: int) -> List[TransactionOut]:
+    @query_budget(4)
+    @read_replica()
+    def get_card_history(
+        self,
+        request: HttpRequest,
+        number: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        archived: bool = False,
+    ) -> List[TransactionOut]:
         card = self._try_get_card(request.telegram_user, number)
         account = self._bank_obj_service.get_bank_account_from_document(card)
 
-        return self._create_history_response(account)
+        return self._create_history_response(account, since, until, archived)
 
+    @query_budget(12)
+    @spooled_upload(settings.MAX_SIZE_PHOTO_BYTES, "image/")
     def transfer(
         self, request: HttpRequest, transfer: TransferIn = Form(...), photo: Optional[UploadedFile] = File(default=None)
     ) -> TransactionOut:
@@ -77,12 +106,12 @@ class BankHandlers:
         if source == destination:
             raise BadRequestException("Source account equals destination account")
 
-        content = Photo(unique_name=str(now().timestamp()), content=photo.read(), size=photo.size) if photo else None
+        content = Photo(unique_name=str(now().timestamp()), content=photo, size=photo.size) if photo else None
         transaction = self._transfer_service.try_transfer(source, destination, accrual, content)
         if not transaction:
             raise IntegrityException()
 
-        return self._get_transaction_response(transaction)
+        return self._get_transaction_response(transaction, self._transaction_service.get_photo_urls([transaction]))
 
     def _try_get_account(self, user: TelegramUser, number: int) -> BankAccount:
         account = self._bank_obj_service.get_bank_account(user, number)
@@ -100,17 +129,21 @@ class BankHandlers:
 
         return card
 
-    def _create_history_response(self, account: BankAccount) -> List[TransactionOut]:
-        transactions = self._transaction_service.get_transactions(account)
+    def _create_history_response(
+        self, account: BankAccount, since: Optional[datetime], until: Optional[datetime], archived: bool
+    ) -> List[TransactionOut]:
+        transactions = self._transaction_service.get_transactions(account, since, until, archived)
+        urls = self._transaction_service.get_photo_urls(transactions)
 
-        return [self._get_transaction_response(transaction) for transaction in transactions]
+        return [self._get_transaction_response(transaction, urls) for transaction in transactions]
 
-    def _get_transaction_response(self, transaction: Transaction) -> TransactionOut:
+    def _get_transaction_response(self, transaction: Transaction, urls: Dict[str, str]) -> TransactionOut:
         return TransactionOut(
-            source=transaction.source.number,
-            destination=transaction.destination.number,
+            source=transaction.source_id,
+            destination=transaction.destination_id,
             accrual=transaction.accrual,
-            photo=transaction.photo.url if transaction.photo else None,
+            photo=urls[transaction.photo.name] if transaction.photo else None,
+            photo_variants={variant: urls[name] for variant, name in transaction.get_photo_variant_names().items()},
             created_at=transaction.created_at,
         )
 
@@ -1,13 +1,14 @@
 from telegram import Update
 from telegram.ext import CallbackContext, CommandHandler, ConversationHandler, MessageHandler
 
-from app.internal.bank.db.models import BankAccount, BankObject
+from app.internal.bank.domain.services.Document import Document
 from app.internal.bank.presentation.handlers.bot.balance.BalanceStates import BalanceStates
-from app.internal.bank.presentation.handlers.bot.document import send_document_list
+from app.internal.bank.presentation.handlers.bot.document import get_catalog, send_document_list
 from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
 from app.internal.general.bot.filters import INT
-from app.internal.general.bot.handlers import cancel, mark_conversation_end, mark_conversation_start
-from app.internal.general.services import bank_object_service, user_service
+from app.internal.general.bot.handlers import cancel, get_variant, mark_conversation_end, mark_conversation_start
+from app.internal.general.budget import query_budget
+from app.internal.general.services import bank_object_service
 
 _LIST_EMPTY_MESSAGE = "Упс. Вы не завели ни карты, ни счёта. Позвоните Василию!"
 _WELCOME = "Выберите банковский счёт или карту, либо /cancel\n"
@@ -16,40 +17,37 @@ _STUPID_CHOICE = "Ммм. Я в банке работаю и то считать
 _BALANCE_BY_BANK_ACCOUNT = "На счёте {number} лежит {balance}"
 _BALANCE_BY_CARD = "На карточке {number} лежит {balance}"
 
-_DOCUMENTS_SESSION = "documents"
-
 
+@query_budget(3)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
 def handle_start(update: Update, context: CallbackContext) -> int:
     mark_conversation_start(context, entry_point.command)
 
-    user = user_service.get_user(update.effective_user.id)
-    documents = bank_object_service.get_documents_order(user)
+    catalog = get_catalog(update, context)
 
-    if len(documents) == 0:
+    if len(catalog) == 0:
         update.message.reply_text(_LIST_EMPTY_MESSAGE)
         return mark_conversation_end(context)
 
-    context.user_data[_DOCUMENTS_SESSION] = documents
-
-    send_document_list(update, documents, _WELCOME)
+    send_document_list(update, catalog, _WELCOME)
 
     return BalanceStates.CHOICE
 
 
+@query_budget(1)
 @is_message_defined
 def handle_choice(update: Update, context: CallbackContext) -> int:
-    choice = int(update.message.text)
-    document: BankObject = context.user_data[_DOCUMENTS_SESSION].get(choice)
+    document: Document = get_variant(get_catalog(update, context).documents, update.message.text)
+    balance = bank_object_service.get_balance(document.account) if document else None
 
-    if not document:
+    if balance is None:
         update.message.reply_text(_STUPID_CHOICE)
         return BalanceStates.CHOICE
 
-    details = (_BALANCE_BY_BANK_ACCOUNT if isinstance(document, BankAccount) else _BALANCE_BY_CARD).format(
-        number=document.short_number, balance=document.get_balance()
+    details = (_BALANCE_BY_CARD if document.is_card else _BALANCE_BY_BANK_ACCOUNT).format(
+        number=document.short_number, balance=balance
     )
 
     update.message.reply_text(details)
@@ -66,4 +64,6 @@ balance_conversation = ConversationHandler(
         BalanceStates.CHOICE: [MessageHandler(INT, handle_choice)],
     },
     fallbacks=[cancel],
+    name="balance",
+    persistent=True,
 )
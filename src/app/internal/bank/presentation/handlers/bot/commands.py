@@ -2,7 +2,8 @@ from telegram import Update
 from telegram.ext import CallbackContext, CommandHandler
 
 from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
-from app.internal.general.services import transaction_service, user_service
+from app.internal.general.budget import query_budget
+from app.internal.general.services import transaction_service
 
 _TRANSACTION_DETAILS = (
     "Откуда: {source_number} ({source})\n"
@@ -14,11 +15,12 @@ _NEW_TRANSACTIONS_EMPTY_MESSAGE = "Как жаль, новых платежей
 _LAST_END_MESSAGE = "Это был последний платёж..."
 
 
+@query_budget(4)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
 def handle_last(update: Update, context: CallbackContext) -> None:
-    user = user_service.get_user(update.effective_user.id)
+    user_id = update.effective_user.id
     transactions = transaction_service.get_and_mark_new_transactions(update.effective_user)
 
     if len(transactions) == 0:
@@ -26,8 +28,8 @@ def handle_last(update: Update, context: CallbackContext) -> None:
         return
 
     for transaction in transactions:
-        source = "Вы" if transaction.source.owner == user else transaction.source.owner.username
-        destination = "Вы" if transaction.destination.owner == user else transaction.destination.owner.username
+        source = "Вы" if transaction.source.owner_id == user_id else transaction.source.owner.username
+        destination = "Вы" if transaction.destination.owner_id == user_id else transaction.destination.owner.username
 
         details = _TRANSACTION_DETAILS.format(
             source_number=transaction.source.short_number,
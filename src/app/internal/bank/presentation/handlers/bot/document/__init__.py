@@ -1 +1,2 @@
+from .catalog import CATALOG_SESSION, get_catalog, refresh_catalog
 from .details import build_details, send_document_list
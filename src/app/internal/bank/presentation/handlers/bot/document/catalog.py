@@ -0,0 +1,23 @@
+from telegram import Update
+from telegram.ext import CallbackContext
+
+from app.internal.bank.domain.services.DocumentCatalog import DocumentCatalog
+from app.internal.general.services import bank_object_service
+
+CATALOG_SESSION = "document_catalog"
+
+
+def get_catalog(update: Update, context: CallbackContext) -> DocumentCatalog:
+    rows = context.user_data.get(CATALOG_SESSION)
+
+    if rows is not None:
+        return DocumentCatalog.from_rows(rows)
+
+    return refresh_catalog(update, context)
+
+
+def refresh_catalog(update: Update, context: CallbackContext) -> DocumentCatalog:
+    catalog = bank_object_service.get_document_catalog(update.effective_user)
+    context.user_data[CATALOG_SESSION] = catalog.to_rows()
+
+    return catalog
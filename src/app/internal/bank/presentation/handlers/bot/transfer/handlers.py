@@ -1,24 +1,52 @@
+from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Optional
+from functools import partial
+from typing import List, Optional
 
 from django.conf import settings
 from telegram import PhotoSize, Update
-from telegram.ext import CallbackContext, CommandHandler, ConversationHandler, MessageHandler
+from telegram.ext import CallbackContext, CallbackQueryHandler, CommandHandler, ConversationHandler, MessageHandler
 
-from app.internal.bank.db.models import BankAccount, BankCard, BankObject
+from app.internal.bank.db.models import BankAccount
+from app.internal.bank.domain.services.Document import Document
+from app.internal.bank.domain.services.DocumentCatalog import DocumentCatalog
 from app.internal.bank.domain.services.Photo import Photo
-from app.internal.bank.presentation.handlers.bot.document import send_document_list
+from app.internal.bank.presentation.handlers.bot.document import get_catalog, refresh_catalog, send_document_list
 from app.internal.bank.presentation.handlers.bot.transfer.TransferStates import TransferStates
-from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
+from app.internal.general.bot.decorators import (
+    authorize_user,
+    is_callback_query_defined,
+    is_message_defined,
+    is_not_user_in_conversation,
+)
+from app.internal.general.bot.FilePrefetcher import FilePrefetcher
 from app.internal.general.bot.filters import FLOATING, IMAGE, INT
-from app.internal.general.bot.handlers import cancel, mark_conversation_end, mark_conversation_start
-from app.internal.general.services import bank_object_service, friend_service, transfer_service, user_service
+from app.internal.general.bot.handlers import (
+    cancel,
+    get_variant,
+    mark_conversation_end,
+    mark_conversation_start,
+    run_in_background,
+)
+from app.internal.general.bot.pagination import (
+    fetch_page,
+    get_choice,
+    get_choice_buttons,
+    get_choice_pattern,
+    get_page_pattern,
+    send_page,
+    send_text,
+)
+from app.internal.general.budget import query_budget
+from app.internal.general.db.KeysetPage import KeysetPage
+from app.internal.general.services import bank_object_service, friend_service, transfer_service
 from app.internal.user.db.models import TelegramUser
 
 _STUPID_CHOICE_ERROR = "ИнвАлидный выбор. Нет такого в списке! Введите заново, либо /cancel"
 
-_FRIEND_VARIANTS_WELCOME = "Напишите номер друга, которому хотите перевести, либо /cancel:\n\n"
-_FRIEND_VARIANT = "{number}) {username} ({first_name})"
+_FRIEND_VARIANTS_WELCOME = "Выберите друга, которому хотите перевести, либо /cancel:"
+_RECENT_RECIPIENT = "★ {username} ({first_name})"
+_FRIEND_VARIANT = "{username} ({first_name})"
 
 _TRANSFER_DESTINATION_WELCOME = "Выберите банковский счёт или карту получателя, либо /cancel:\n"
 _TRANSFER_SOURCE_WELCOME = "Откуда списать, либо /cancel:\n"
@@ -43,105 +71,122 @@ _TRANSFER_DETAILS = (
 )
 _ACCRUAL_DETAILS = "{type} {number} зачислено {accrual} от {username}"
 
-_CARD_TYPE = "Карта"
 _ACCOUNT_TYPE = "Счёт"
 _TRANSFER_SUCCESS = "Ваш платёж успешно выполнен!"
 _TRANSFER_FAIL = "Произошла непредвиденная ошибка!"
 
 
-_SOURCE_DOCUMENTS_SESSION = "source_documents"
 _DESTINATION_DOCUMENTS_SESSION = "destination_documents"
 
 _DESTINATION_SESSION = "destination_document"
 _SOURCE_SESSION = "source_document"
 
 _CHOSEN_FRIEND_SESSION = "chosen_friend"
-_FRIEND_VARIANTS_SESSION = "friend_variants"
 _ACCRUAL_SESSION = "accrual"
 _CAPTION_SESSION = "photo_caption"
 _PHOTO_SESSION = "transfer_photo"
 
+_PHOTO_FILE_ID = "file_id"
+_PHOTO_FILE_UNIQUE_ID = "file_unique_id"
+
+_FRIEND_PREFIX = "transfer"
+
+_photo_prefetcher = FilePrefetcher(settings.BOT_PHOTO_PREFETCH_LIMIT)
 
+
+@query_budget(5)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
 def handle_start(update: Update, context: CallbackContext) -> int:
     mark_conversation_start(context, entry_point.command)
 
-    user = user_service.get_user(update.effective_user.id)
-
-    friends = friend_service.get_friends_as_dict(user)
-    if len(friends) == 0:
+    page = friend_service.get_friends_page(update.effective_user, settings.BOT_FRIENDS_PAGE_SIZE)
+    if not page:
         update.message.reply_text(_FRIEND_LIST_EMPTY_ERROR)
         return mark_conversation_end(context)
 
-    documents = bank_object_service.get_documents_order(user)
-    if len(documents) == 0:
+    if len(get_catalog(update, context)) == 0:
         update.message.reply_text(_SOURCE_DOCUMENT_LIST_EMPTY_ERROR)
         return mark_conversation_end(context)
 
-    context.user_data[_SOURCE_DOCUMENTS_SESSION] = documents
+    _send_friend_page(update, context, page)
+
+    return TransferStates.DESTINATION
 
-    _save_and_send_friend_list(update, context, friends)
+
+@query_budget(3)
+@is_callback_query_defined
+def handle_getting_destination_page(update: Update, context: CallbackContext) -> int:
+    fetch = partial(friend_service.get_friends_page, update.effective_user, settings.BOT_FRIENDS_PAGE_SIZE)
+    page = fetch_page(update, context, fetch)
+
+    if not page:
+        send_text(update, _FRIEND_LIST_EMPTY_ERROR)
+        return mark_conversation_end(context)
+
+    _send_friend_page(update, context, page)
 
     return TransferStates.DESTINATION
 
 
-@is_message_defined
+@query_budget(2)
+@is_callback_query_defined
 def handle_getting_destination(update: Update, context: CallbackContext) -> int:
-    number = int(update.message.text)
+    friend: TelegramUser = friend_service.get_friend(update.effective_user, get_choice(update))
+
+    update.callback_query.answer()
 
-    friend: TelegramUser = context.user_data[_FRIEND_VARIANTS_SESSION].get(number)
     if not friend:
-        update.message.reply_text(_STUPID_CHOICE_ERROR)
+        update.effective_message.reply_text(_STUPID_CHOICE_ERROR)
         return TransferStates.DESTINATION
 
-    context.user_data[_CHOSEN_FRIEND_SESSION] = friend
+    context.user_data[_CHOSEN_FRIEND_SESSION] = friend.id
 
-    documents = bank_object_service.get_documents_order(friend)
+    catalog = bank_object_service.get_document_catalog(friend)
 
-    return _save_and_send_friend_document_list(update, context, documents)
+    return _save_and_send_friend_document_list(update, context, catalog)
 
 
+@query_budget(1)
 @is_message_defined
 def handle_getting_destination_document(update: Update, context: CallbackContext) -> int:
-    number = int(update.message.text)
-    destination: BankObject = context.user_data[_DESTINATION_DOCUMENTS_SESSION].get(number)
+    catalog = DocumentCatalog.from_rows(context.user_data[_DESTINATION_DOCUMENTS_SESSION])
+    destination: Document = get_variant(catalog.documents, update.message.text)
 
     if not destination:
         update.message.reply_text(_STUPID_CHOICE_ERROR)
         return TransferStates.DESTINATION_DOCUMENT
 
-    context.user_data[_DESTINATION_SESSION] = bank_object_service.get_bank_account_from_document(destination)
+    context.user_data[_DESTINATION_SESSION] = destination.account
 
-    source_documents: Dict[int, BankObject] = context.user_data[_SOURCE_DOCUMENTS_SESSION]
-    send_document_list(update, source_documents, _TRANSFER_SOURCE_WELCOME, show_balance=True)
+    send_document_list(update, refresh_catalog(update, context), _TRANSFER_SOURCE_WELCOME, show_balance=True)
 
     return TransferStates.SOURCE_DOCUMENT
 
 
+@query_budget(1)
 @is_message_defined
 def handle_getting_source_document(update: Update, context: CallbackContext) -> int:
-    number = int(update.message.text)
-    source: BankObject = context.user_data[_SOURCE_DOCUMENTS_SESSION].get(number)
+    source: Document = get_variant(get_catalog(update, context).documents, update.message.text)
+    balance = bank_object_service.get_balance(source.account) if source else None
 
-    if not source:
+    if balance is None:
         update.message.reply_text(_STUPID_CHOICE_ERROR)
         return TransferStates.SOURCE_DOCUMENT
 
-    source: BankAccount = bank_object_service.get_bank_account_from_document(source)
-
-    if bank_object_service.is_balance_zero(source):
+    if balance == 0:
         update.message.reply_text(_BALANCE_ZERO_ERROR)
         return TransferStates.SOURCE_DOCUMENT
 
-    context.user_data[_SOURCE_SESSION] = source
+    context.user_data[_SOURCE_SESSION] = source.account
 
     update.message.reply_text(_ACCRUAL_WELCOME)
 
     return TransferStates.ACCRUAL
 
 
+@query_budget(1)
 @is_message_defined
 def handle_getting_accrual(update: Update, context: CallbackContext) -> int:
     try:
@@ -150,33 +195,39 @@ def handle_getting_accrual(update: Update, context: CallbackContext) -> int:
         update.message.reply_text(_ACCRUAL_PARSE_ERROR)
         return TransferStates.ACCRUAL
 
-    source: BankAccount = context.user_data[_SOURCE_SESSION]
-    if not transfer_service.can_extract_from(source, accrual):
+    balance = bank_object_service.get_balance(context.user_data[_SOURCE_SESSION])
+    if balance is None or not transfer_service.can_extract(balance, accrual):
         update.message.reply_text(_ACCRUAL_GREATER_BALANCE_ERROR)
         return TransferStates.ACCRUAL
 
-    context.user_data[_ACCRUAL_SESSION] = accrual
+    context.user_data[_ACCRUAL_SESSION] = str(accrual)
 
     update.message.reply_text(_PHOTO_WELCOME)
 
     return TransferStates.PHOTO
 
 
+@query_budget(1)
 @is_message_defined
 def handle_getting_photo(update: Update, context: CallbackContext) -> int:
-    photo = update.message.photo[-1]
+    photo = _choose_photo_size(update.message.photo)
 
-    if photo.file_size > settings.MAX_SIZE_PHOTO_BYTES:
+    if not photo:
         update.message.reply_text(_PHOTO_SIZE_ERROR)
         return TransferStates.PHOTO
 
-    context.user_data[_PHOTO_SESSION] = photo
+    context.user_data[_PHOTO_SESSION] = {
+        _PHOTO_FILE_ID: photo.file_id,
+        _PHOTO_FILE_UNIQUE_ID: photo.file_unique_id,
+    }
+    _photo_prefetcher.prefetch(context.bot, photo.file_id, photo.file_unique_id)
 
     _send_transfer_details(update, context)
 
     return TransferStates.CONFIRM
 
 
+@query_budget(1)
 @is_message_defined
 def handle_skip_getting_photo(update: Update, context: CallbackContext) -> int:
     _send_transfer_details(update, context)
@@ -184,96 +235,127 @@ def handle_skip_getting_photo(update: Update, context: CallbackContext) -> int:
     return TransferStates.CONFIRM
 
 
+@query_budget(9)
 @is_message_defined
 def handle_transfer(update: Update, context: CallbackContext) -> int:
-    source: BankAccount = context.user_data[_SOURCE_SESSION]
-    destination: BankAccount = context.user_data[_DESTINATION_SESSION]
-    accrual: Decimal = context.user_data[_ACCRUAL_SESSION]
-    photo: Optional[PhotoSize] = context.user_data.get(_PHOTO_SESSION)
-
-    content = (
-        Photo(unique_name=photo.file_unique_id, content=photo.get_file().download_as_bytearray(), size=photo.file_size)
-        if photo
-        else None
-    )
-    transaction = transfer_service.try_transfer(source, destination, accrual, content)
+    source, destination = context.user_data[_SOURCE_SESSION], context.user_data[_DESTINATION_SESSION]
+    accrual = Decimal(context.user_data[_ACCRUAL_SESSION])
+    photo: Optional[dict] = context.user_data.get(_PHOTO_SESSION)
+
+    transaction = transfer_service.try_transfer_by_numbers(source, destination, accrual, None)
     message = _TRANSFER_SUCCESS if transaction else _TRANSFER_FAIL
 
     update.message.reply_text(message)
 
     if transaction:
-        details = _get_accrual_detail(source, destination, accrual)
-        destination_id = destination.get_owner().id
+        details = _ACCRUAL_DETAILS.format(
+            type=_ACCOUNT_TYPE,
+            number=BankAccount(number=destination).short_number,
+            accrual=accrual,
+            username=update.effective_user.username,
+        )
+        destination_id = context.user_data[_CHOSEN_FRIEND_SESSION]
 
         if photo:
-            context.bot.send_photo(chat_id=destination_id, photo=photo, caption=details)
+            _attach_photo_when_downloaded(context, transaction.id, transaction.created_at, photo)
+            context.bot.send_photo(chat_id=destination_id, photo=photo[_PHOTO_FILE_ID], caption=details)
         else:
             context.bot.send_message(chat_id=destination_id, text=details)
 
     return mark_conversation_end(context)
 
 
-def _get_accrual_detail(source: BankObject, destination: BankObject, accrual: Decimal) -> str:
-    type_ = _CARD_TYPE if isinstance(destination, BankCard) else _ACCOUNT_TYPE
+def _choose_photo_size(sizes: List[PhotoSize]) -> Optional[PhotoSize]:
+    fitting = [size for size in sizes if (size.file_size or 0) <= settings.MAX_SIZE_PHOTO_BYTES]
+    if not fitting:
+        return None
+
+    suitable = [size for size in fitting if min(size.width, size.height) >= settings.BOT_PHOTO_MIN_SIDE]
+
+    return min(suitable, key=_get_area) if suitable else max(fitting, key=_get_area)
+
+
+def _get_area(size: PhotoSize) -> int:
+    return size.width * size.height
+
+
+def _attach_photo_when_downloaded(
+    context: CallbackContext, transaction_id: int, created_at: datetime, photo: dict
+) -> None:
+    unique_name = photo[_PHOTO_FILE_UNIQUE_ID]
+    download = _photo_prefetcher.take(context.bot, photo[_PHOTO_FILE_ID], unique_name)
 
-    return _ACCRUAL_DETAILS.format(
-        type=type_, number=destination.short_number, accrual=accrual, username=source.get_owner().username
+    download.add_done_callback(
+        lambda done: run_in_background(_attach_photo, transaction_id, created_at, unique_name, done.result())
     )
 
 
-def _save_and_send_friend_list(update: Update, context: CallbackContext, friends: Dict[int, TelegramUser]) -> None:
-    context.user_data[_FRIEND_VARIANTS_SESSION] = friends
+def _attach_photo(transaction_id: int, created_at: datetime, unique_name: str, content: Optional[bytes]) -> None:
+    if content is None:
+        return
 
-    friend_list = "\n".join(
-        _FRIEND_VARIANT.format(number=number, username=friend.username, first_name=friend.first_name)
-        for number, friend in friends.items()
+    photo = Photo(unique_name=unique_name, content=content, size=len(content))
+    transfer_service.attach_photo(transaction_id, created_at, photo)
+
+
+def _send_friend_page(update: Update, context: CallbackContext, page: KeysetPage[TelegramUser]) -> None:
+    recipients = (
+        []
+        if page.has_previous
+        else friend_service.get_recent_recipients(update.effective_user, settings.TRANSFER_RECENT_RECIPIENTS)
     )
+    buttons = get_choice_buttons(
+        _FRIEND_PREFIX, recipients, partial(_get_friend_label, _RECENT_RECIPIENT)
+    ) + get_choice_buttons(_FRIEND_PREFIX, page.items, partial(_get_friend_label, _FRIEND_VARIANT))
+
+    send_page(update, context, _FRIEND_PREFIX, _FRIEND_VARIANTS_WELCOME, page, buttons)
+
 
-    update.message.reply_text(_FRIEND_VARIANTS_WELCOME + friend_list)
+def _get_friend_label(pattern: str, friend: TelegramUser) -> str:
+    return pattern.format(username=friend.username, first_name=friend.first_name)
 
 
-def _save_and_send_friend_document_list(
-    update: Update, context: CallbackContext, documents: Dict[int, BankObject]
-) -> int:
-    if len(documents) == 0:
-        update.message.reply_text(_FRIEND_DOCUMENT_LIST_EMPTY_ERROR)
+def _save_and_send_friend_document_list(update: Update, context: CallbackContext, catalog: DocumentCatalog) -> int:
+    if len(catalog) == 0:
+        update.effective_message.reply_text(_FRIEND_DOCUMENT_LIST_EMPTY_ERROR)
         return TransferStates.DESTINATION
 
-    context.user_data[_DESTINATION_DOCUMENTS_SESSION] = documents
+    context.user_data[_DESTINATION_DOCUMENTS_SESSION] = catalog.to_rows()
 
-    send_document_list(update, documents, _TRANSFER_DESTINATION_WELCOME)
+    update.callback_query.edit_message_reply_markup(reply_markup=None)
+
+    send_document_list(update, catalog, _TRANSFER_DESTINATION_WELCOME)
 
     return TransferStates.DESTINATION_DOCUMENT
 
 
 def _send_transfer_details(update: Update, context: CallbackContext) -> None:
-    source: BankObject = context.user_data[_SOURCE_SESSION]
-    destination: BankObject = context.user_data[_DESTINATION_SESSION]
-    accrual: int = context.user_data[_ACCRUAL_SESSION]
+    source = BankAccount(number=context.user_data[_SOURCE_SESSION])
+    destination = BankAccount(number=context.user_data[_DESTINATION_SESSION])
+    accrual: str = context.user_data[_ACCRUAL_SESSION]
 
     details = _TRANSFER_DETAILS.format(
         source=source.short_number,
-        source_type=_type_to_string(source),
-        balance=source.get_balance(),
+        source_type=_ACCOUNT_TYPE,
+        balance=bank_object_service.get_balance(source.number),
         destination=destination,
-        dest_type=_type_to_string(destination),
+        dest_type=_ACCOUNT_TYPE,
         accrual=accrual,
     )
 
     update.message.reply_text(details)
 
 
-def _type_to_string(document: BankObject) -> str:
-    return _ACCOUNT_TYPE if isinstance(document, BankAccount) else _CARD_TYPE
-
-
 entry_point = CommandHandler("transfer", handle_start)
 
 
 transfer_conversation = ConversationHandler(
     entry_points=[entry_point],
     states={
-        TransferStates.DESTINATION: [MessageHandler(INT, handle_getting_destination)],
+        TransferStates.DESTINATION: [
+            CallbackQueryHandler(handle_getting_destination_page, pattern=get_page_pattern(_FRIEND_PREFIX)),
+            CallbackQueryHandler(handle_getting_destination, pattern=get_choice_pattern(_FRIEND_PREFIX)),
+        ],
         TransferStates.DESTINATION_DOCUMENT: [MessageHandler(INT, handle_getting_destination_document)],
         TransferStates.SOURCE_DOCUMENT: [MessageHandler(INT, handle_getting_source_document)],
         TransferStates.ACCRUAL: [MessageHandler(FLOATING, handle_getting_accrual)],
@@ -284,4 +366,6 @@ transfer_conversation = ConversationHandler(
         TransferStates.CONFIRM: [CommandHandler("confirm", handle_transfer)],
     },
     fallbacks=[cancel],
+    name="transfer",
+    persistent=True,
 )
@@ -1,7 +1,13 @@
+from django.conf import settings
+from telegram import Bot, Update
+from telegram.ext import CallbackContext, ContextTypes, Dispatcher, TypeHandler
+
 from app.internal.bank.presentation.handlers.bot.balance import balance_conversation
 from app.internal.bank.presentation.handlers.bot.commands import bank_commands
 from app.internal.bank.presentation.handlers.bot.history import history_conversation
 from app.internal.bank.presentation.handlers.bot.transfer import transfer_conversation
+from app.internal.general.bot.BotContext import BotContext
+from app.internal.general.services import session_persistence
 from app.internal.user.presentation.handlers.bot.commands import user_commands
 from app.internal.user.presentation.handlers.bot.friends import (
     accept_conversation,
@@ -13,6 +19,10 @@ from app.internal.user.presentation.handlers.bot.friends import (
 from app.internal.user.presentation.handlers.bot.password import password_conversation
 from app.internal.user.presentation.handlers.bot.phone import phone_conversation
 
+_SESSION_GROUP = -1
+
+context_types = ContextTypes(context=BotContext)
+
 commands = [*user_commands, *friends_commands, *bank_commands]
 
 conversations = [
@@ -28,3 +38,30 @@ conversations = [
 ]
 
 handlers = commands + conversations
+
+
+def _load_session(update: Update, context: CallbackContext) -> None:
+    # Dispatcher refreshes user_data only when a handler matches, and ConversationHandler.check_update reads the
+    # persisted state before that. Matching every update in an earlier group loads the session first.
+    pass
+
+
+session_handler = TypeHandler(Update, _load_session)
+
+
+def register_handlers(dispatcher: Dispatcher) -> None:
+    dispatcher.add_handler(session_handler, group=_SESSION_GROUP)
+
+    for handler in handlers:
+        dispatcher.add_handler(handler)
+
+
+def create_bot(token: str) -> Bot:
+    return Bot(token, base_url=settings.TELEGRAM_API_URL, base_file_url=settings.TELEGRAM_FILE_URL)
+
+
+def create_dispatcher(bot: Bot) -> Dispatcher:
+    dispatcher = Dispatcher(bot, update_queue=None, persistence=session_persistence, context_types=context_types)
+    register_handlers(dispatcher)
+
+    return dispatcher
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from telegram import Update
+from telegram.ext import CallbackContext, Dispatcher
+
+from app.internal.general.db.replicas import set_database_user
+from app.internal.general.services import user_service
+from app.internal.user.db.models import TelegramUser
+
+_NOT_LOADED = object()
+
+
+class BotContext(CallbackContext):
+    def __init__(self, dispatcher: Dispatcher):
+        super().__init__(dispatcher)
+
+        self._user_id: Optional[int] = None
+        self._telegram_user = _NOT_LOADED
+
+    @classmethod
+    def from_update(cls, update: object, dispatcher: Dispatcher) -> "BotContext":
+        context = super().from_update(update, dispatcher)
+
+        if isinstance(update, Update) and update.effective_user:
+            context._user_id = update.effective_user.id
+
+        set_database_user(context._user_id)
+
+        return context
+
+    @property
+    def telegram_user(self) -> Optional[TelegramUser]:
+        if self._telegram_user is _NOT_LOADED:
+            self._telegram_user = user_service.get_user(self._user_id) if self._user_id else None
+
+        return self._telegram_user
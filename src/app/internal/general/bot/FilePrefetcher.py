@@ -0,0 +1,42 @@
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+
+from telegram import Bot
+
+from app.internal.general.bot.handlers import run_in_background
+
+
+class FilePrefetcher:
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._downloads: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._downloads)
+
+    def prefetch(self, bot: Bot, file_id: str, unique_id: str) -> Future:
+        with self._lock:
+            download = self._downloads.get(unique_id)
+
+            if download is None:
+                download = run_in_background(self._download, bot, file_id)
+                self._downloads[unique_id] = download
+
+                while len(self._downloads) > self._limit:
+                    self._downloads.popitem(last=False)
+
+            return download
+
+    def take(self, bot: Bot, file_id: str, unique_id: str) -> Future:
+        download = self.prefetch(bot, file_id, unique_id)
+
+        with self._lock:
+            self._downloads.pop(unique_id, None)
+
+        return download
+
+    @staticmethod
+    def _download(bot: Bot, file_id: str) -> bytes:
+        return bytes(bot.get_file(file_id).download_as_bytearray())
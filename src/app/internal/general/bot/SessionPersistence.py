@@ -0,0 +1,169 @@
+from collections import defaultdict
+from copy import deepcopy
+from datetime import timedelta
+from threading import Lock, local
+from typing import DefaultDict, Dict, Iterator, Optional, Tuple
+
+from django.utils.timezone import now
+from telegram.ext import BasePersistence
+from telegram.ext.utils.promise import Promise
+
+from app.internal.general.domain.interfaces import IBotSessionRepository
+
+ConversationKey = Tuple[int, ...]
+
+
+class _Session:
+    def __init__(self, data: dict, states: dict):
+        self.data = data
+        self.states = states
+        self.user_data: Optional[dict] = None
+        self.changes: Dict[str, Optional[int]] = {}
+
+
+class SessionPersistence(BasePersistence):
+    def __init__(self, session_repo: IBotSessionRepository, ttl: timedelta, eviction_interval: timedelta):
+        super().__init__(store_user_data=True, store_chat_data=False, store_bot_data=False)
+
+        self._session_repo = session_repo
+        self._ttl = ttl
+        self._eviction_interval = eviction_interval
+        self._evicted_at = now()
+        self._local = local()
+        self._lock = Lock()
+
+    def get_user_data(self) -> DefaultDict[int, dict]:
+        return defaultdict(dict)
+
+    def get_chat_data(self) -> DefaultDict[int, dict]:
+        return defaultdict(dict)
+
+    def get_bot_data(self) -> dict:
+        return {}
+
+    def get_conversations(self, name: str) -> "ConversationStore":
+        return ConversationStore(self, name)
+
+    def update_conversation(self, name: str, key: ConversationKey, new_state: Optional[object]) -> None:
+        pass
+
+    def update_chat_data(self, chat_id: int, data: dict) -> None:
+        pass
+
+    def update_bot_data(self, data: dict) -> None:
+        pass
+
+    def refresh_user_data(self, user_id: int, user_data: dict) -> None:
+        session = self._load(user_id)
+        session.user_data = user_data
+
+        user_data.clear()
+        user_data.update(deepcopy(session.data))
+
+    def update_user_data(self, user_id: int, data: dict) -> None:
+        session = self._get_sessions().pop(user_id, None)
+
+        if session is None:
+            return
+
+        if session.changes or data != session.data:
+            self._session_repo.save(user_id, data, session.changes, self._ttl)
+
+        if session.user_data is not None:
+            session.user_data.clear()
+
+        self._evict_idle()
+
+    def flush(self) -> None:
+        pass
+
+    def get_state(self, name: str, key: ConversationKey) -> Optional[int]:
+        return self._get_session(key).states.get(self._get_state_key(name, key))
+
+    def set_state(self, name: str, key: ConversationKey, state: int) -> None:
+        session = self._get_session(key)
+        state_key = self._get_state_key(name, key)
+        session.states[state_key] = session.changes[state_key] = state
+
+    def remove_state(self, name: str, key: ConversationKey) -> None:
+        session = self._get_session(key)
+        state_key = self._get_state_key(name, key)
+        session.states.pop(state_key, None)
+        session.changes[state_key] = None
+
+    def _get_session(self, key: ConversationKey) -> _Session:
+        user_id = key[-1]
+        session = self._get_sessions().get(user_id)
+
+        return session if session is not None else self._load(user_id)
+
+    def _load(self, user_id: int) -> _Session:
+        stored = self._session_repo.get_alive(user_id, self._ttl)
+        session = _Session(stored.data, stored.states) if stored else _Session({}, {})
+
+        self._get_sessions()[user_id] = session
+
+        return session
+
+    def _get_sessions(self) -> Dict[int, _Session]:
+        if not hasattr(self._local, "sessions"):
+            self._local.sessions = {}
+
+        return self._local.sessions
+
+    def _evict_idle(self) -> None:
+        with self._lock:
+            if now() - self._evicted_at < self._eviction_interval:
+                return
+
+            self._evicted_at = now()
+
+        self._session_repo.remove_idle(self._ttl)
+
+    @staticmethod
+    def _get_state_key(name: str, key: ConversationKey) -> str:
+        return ":".join(map(str, (name, *key[:-1])))
+
+
+class ConversationStore:
+    def __init__(self, persistence: SessionPersistence, name: str):
+        self._persistence = persistence
+        self._name = name
+        self._pending: Dict[ConversationKey, Tuple[Optional[int], Promise]] = {}
+
+    def get(self, key: ConversationKey, default: Optional[object] = None) -> Optional[object]:
+        if key in self._pending:
+            return self._pending[key]
+
+        state = self._persistence.get_state(self._name, key)
+
+        return default if state is None else state
+
+    def __contains__(self, key: ConversationKey) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: ConversationKey) -> object:
+        state = self.get(key)
+
+        if state is None:
+            raise KeyError(key)
+
+        return state
+
+    def __setitem__(self, key: ConversationKey, state: object) -> None:
+        if isinstance(state, tuple):
+            self._pending[key] = state
+            return
+
+        self._pending.pop(key, None)
+        self._persistence.set_state(self._name, key, state)
+
+    def __delitem__(self, key: ConversationKey) -> None:
+        self._pending.pop(key, None)
+        self._persistence.remove_state(self._name, key)
+
+    def __iter__(self) -> Iterator[ConversationKey]:
+        return iter(self._pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
@@ -0,0 +1,144 @@
+import atexit
+import logging
+from collections import OrderedDict
+from queue import Full, Queue
+from threading import Lock, Thread
+from time import time
+from typing import Callable, List, Optional
+
+from django.db import close_old_connections
+
+from app.internal.metrics import (
+    BOT_QUEUE_DEPTH,
+    BOT_UPDATE_LAG,
+    BOT_UPDATE_PROCESSING,
+    BOT_UPDATES_DUPLICATED,
+    BOT_UPDATES_PROCESSED,
+    BOT_UPDATES_REJECTED,
+)
+
+logger = logging.getLogger(__name__)
+
+_STOP = None
+_UPDATE_ID = "update_id"
+
+
+class UpdateWorkerPool:
+    _STOP_TIMEOUT_SECONDS = 10
+
+    def __init__(
+        self,
+        process: Callable[[dict], None],
+        workers: int,
+        queue_size: int,
+        deduplication_window: int,
+        mode: str = "webhook",
+    ):
+        self._process = process
+        self._queues: List[Queue] = [Queue(maxsize=queue_size) for _ in range(workers)]
+        self._threads: List[Thread] = []
+        self._lock = Lock()
+        self._seen = OrderedDict()
+        self._deduplication_window = deduplication_window
+        self._mode = mode
+
+        BOT_QUEUE_DEPTH.labels(mode).set_function(self.get_depth)
+
+    def start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+
+            for number, queue in enumerate(self._queues):
+                thread = Thread(target=self._work, args=(queue,), name=f"bot-{self._mode}-{number}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+            atexit.register(self.stop, timeout=self._STOP_TIMEOUT_SECONDS)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            threads, self._threads = self._threads, []
+
+        if not threads:
+            return
+
+        for queue in self._queues:
+            queue.put(_STOP)
+
+        for thread in threads:
+            thread.join(timeout)
+
+    def submit(self, json: dict, timeout: Optional[float] = None) -> bool:
+        update_id = json.get(_UPDATE_ID)
+
+        if not self._remember(update_id):
+            BOT_UPDATES_DUPLICATED.labels(self._mode).inc()
+            return False
+
+        try:
+            self._get_queue(json).put((time(), json), timeout=timeout)
+        except Full:
+            self._forget(update_id)
+            BOT_UPDATES_REJECTED.labels(self._mode).inc()
+            raise
+
+        return True
+
+    def get_depth(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
+
+    def _work(self, queue: Queue) -> None:
+        while True:
+            item = queue.get()
+
+            if item is _STOP:
+                return
+
+            enqueued_at, json = item
+            BOT_UPDATE_LAG.labels(self._mode).observe(time() - enqueued_at)
+
+            try:
+                with BOT_UPDATE_PROCESSING.labels(self._mode).time():
+                    self._process(json)
+            except Exception:
+                logger.exception("Update id=%s was not processed", json.get(_UPDATE_ID))
+            finally:
+                BOT_UPDATES_PROCESSED.labels(self._mode).inc()
+                close_old_connections()
+
+    def _get_queue(self, json: dict) -> Queue:
+        return self._queues[self._get_chat_id(json) % len(self._queues)]
+
+    def _remember(self, update_id: Optional[int]) -> bool:
+        if update_id is None:
+            return True
+
+        with self._lock:
+            if update_id in self._seen:
+                return False
+
+            self._seen[update_id] = None
+            if len(self._seen) > self._deduplication_window:
+                self._seen.popitem(last=False)
+
+        return True
+
+    def _forget(self, update_id: Optional[int]) -> None:
+        if update_id is None:
+            return
+
+        with self._lock:
+            self._seen.pop(update_id, None)
+
+    @staticmethod
+    def _get_chat_id(json: dict) -> int:
+        for value in json.values():
+            if not isinstance(value, dict):
+                continue
+
+            chat = value.get("chat") or value.get("message", {}).get("chat") or value.get("from")
+            if chat and "id" in chat:
+                return abs(int(chat["id"]))
+
+        return 0
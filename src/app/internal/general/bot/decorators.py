@@ -1,11 +1,13 @@
 import functools
 from typing import Callable, Optional
 
+from django.conf import settings
+from django.core.cache import cache
 from telegram import Update
 from telegram.ext import CallbackContext, ConversationHandler
 
+from app.internal.general.bot.BotContext import BotContext
 from app.internal.general.bot.handlers import COMMAND, IN_CONVERSATION
-from app.internal.general.services import user_service
 
 _USER_DOESNT_EXIST = "Моя вас не знать. Моя предложить знакомиться с вами! (команда /start)"
 _UNDEFINED_PHONE = "Вы забыли уведомить нас о вашей мобилке. Пожалуйста, продиктуйте! (команда /phone)"
@@ -13,6 +15,8 @@ _UNDEFINED_USERNAME = "Пожалуйста, установите никнейм
 
 _MUST_CONVERSATION_END = "Вы не завершили команду /{command}. Это можно сделать с помощью /cancel"
 
+_AUTHORIZATION_KEY = "bot:authorization:{id}"
+
 
 def is_message_defined(handler: Callable) -> Callable:
     @functools.wraps(handler)
@@ -25,23 +29,40 @@ def is_message_defined(handler: Callable) -> Callable:
     return wrapper
 
 
+def is_callback_query_defined(handler: Callable) -> Callable:
+    @functools.wraps(handler)
+    def wrapper(update: Update, context: CallbackContext) -> Optional[int]:
+        if update.callback_query is None:
+            return
+
+        return handler(update, context)
+
+    return wrapper
+
+
 def authorize_user(phone: bool = True) -> Callable:
     def decorator(handler: Callable) -> Callable:
         @functools.wraps(handler)
-        def wrapper(update: Update, context: CallbackContext) -> Optional[int]:
+        def wrapper(update: Update, context: BotContext) -> Optional[int]:
             if not update.effective_user.username:
                 update.message.reply_text(_UNDEFINED_USERNAME)
                 return ConversationHandler.END
 
-            user = user_service.get_user(update.effective_user.id)
+            key = _AUTHORIZATION_KEY.format(id=update.effective_user.id)
+            has_phone = cache.get(key)
 
-            if not user:
-                update.message.reply_text(_USER_DOESNT_EXIST)
-                return ConversationHandler.END
+            if has_phone is None or (phone and not has_phone):
+                user = context.telegram_user
 
-            if phone and not user.phone:
-                update.message.reply_text(_UNDEFINED_PHONE)
-                return ConversationHandler.END
+                if not user:
+                    update.message.reply_text(_USER_DOESNT_EXIST)
+                    return ConversationHandler.END
+
+                if phone and not user.phone:
+                    update.message.reply_text(_UNDEFINED_PHONE)
+                    return ConversationHandler.END
+
+                cache.set(key, bool(user.phone), settings.BOT_AUTHORIZATION_TTL_SECONDS)
 
             return handler(update, context)
 
@@ -56,7 +77,7 @@ def is_not_user_in_conversation(handler: Callable) -> Callable:
         if context.user_data.get(IN_CONVERSATION):
             command = context.user_data[COMMAND]
 
-            update.message.reply_text(_MUST_CONVERSATION_END.format(command=command))
+            update.effective_message.reply_text(_MUST_CONVERSATION_END.format(command=command))
             return None
 
         return handler(update, context)
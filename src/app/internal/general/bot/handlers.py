@@ -1,13 +1,27 @@
-from typing import List
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, TypeVar
 
+from django.conf import settings
+from django.db import close_old_connections
 from telegram import Update
 from telegram.ext import CallbackContext, CommandHandler, ConversationHandler
 
+from app.internal.general.budget import query_budget
+from app.internal.general.db.replicas import get_database_user, set_database_user
+
 _CANCEL_OPERATION = "Не хочешь разговаривать - ну и, ладно. Я не обидчивый :("
 IN_CONVERSATION = "in_conversation"
 COMMAND = "command"
 
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(settings.BOT_ASYNC_WORKERS, thread_name_prefix="bot-background")
 
+
+@query_budget(0)
 def handle_cancel(update: Update, context: CallbackContext) -> int:
     update.message.reply_text(_CANCEL_OPERATION)
 
@@ -25,4 +39,26 @@ def mark_conversation_end(contex: CallbackContext) -> int:
     return ConversationHandler.END
 
 
+def get_variant(variants: List[T], choice: str) -> Optional[T]:
+    number = int(choice)
+
+    return variants[number - 1] if 0 < number <= len(variants) else None
+
+
+def run_in_background(func: Callable, *args) -> Future:
+    user_id = get_database_user()
+
+    def job() -> Any:
+        set_database_user(user_id)
+
+        try:
+            return func(*args)
+        except Exception:
+            logger.exception("Background job %s failed", func.__name__)
+        finally:
+            close_old_connections()
+
+    return _executor.submit(job)
+
+
 cancel = CommandHandler("cancel", handle_cancel)
@@ -0,0 +1,87 @@
+from typing import Callable, Iterable, List
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram.ext import CallbackContext
+
+from app.internal.general.db.KeysetPage import KeysetPage
+from app.internal.user.db.models import TelegramUser
+
+PREVIOUS = "prev"
+NEXT = "next"
+
+_PREVIOUS_BUTTON = "« Назад"
+_NEXT_BUTTON = "Вперёд »"
+_CALLBACK_DATA = "{prefix}:{value}"
+
+_PAGE_CURSOR_SESSION = "page_cursor"
+
+
+def get_choice_pattern(prefix: str) -> str:
+    return f"^{prefix}:[0-9]+$"
+
+
+def get_page_pattern(prefix: str) -> str:
+    return f"^{prefix}:({PREVIOUS}|{NEXT})$"
+
+
+def get_choice(update: Update) -> int:
+    return int(_get_callback_value(update))
+
+
+def fetch_page(update: Update, context: CallbackContext, fetch: Callable[..., KeysetPage]) -> KeysetPage:
+    if not update.callback_query:
+        return fetch()
+
+    first, last = context.user_data.get(_PAGE_CURSOR_SESSION, (None, None))
+    page = fetch(before=first) if _get_callback_value(update) == PREVIOUS else fetch(after=last)
+
+    return page or fetch()
+
+
+def get_choice_buttons(
+    prefix: str, users: Iterable[TelegramUser], label: Callable[[TelegramUser], str] = str
+) -> List[List[InlineKeyboardButton]]:
+    return [
+        [InlineKeyboardButton(label(user), callback_data=_CALLBACK_DATA.format(prefix=prefix, value=user.id))]
+        for user in users
+    ]
+
+
+def send_page(
+    update: Update,
+    context: CallbackContext,
+    prefix: str,
+    text: str,
+    page: KeysetPage[TelegramUser],
+    buttons: List[List[InlineKeyboardButton]],
+) -> None:
+    context.user_data[_PAGE_CURSOR_SESSION] = [page.items[0].username, page.items[-1].username]
+
+    navigation = [
+        InlineKeyboardButton(label, callback_data=_CALLBACK_DATA.format(prefix=prefix, value=direction))
+        for label, direction, exists in (
+            (_PREVIOUS_BUTTON, PREVIOUS, page.has_previous),
+            (_NEXT_BUTTON, NEXT, page.has_next),
+        )
+        if exists
+    ]
+    rows = buttons + [navigation] if navigation else buttons
+    markup = InlineKeyboardMarkup(rows) if rows else None
+
+    if update.callback_query:
+        update.callback_query.answer()
+        update.callback_query.edit_message_text(text, reply_markup=markup)
+    else:
+        update.message.reply_text(text, reply_markup=markup)
+
+
+def send_text(update: Update, text: str) -> None:
+    if update.callback_query:
+        update.callback_query.answer()
+        update.callback_query.edit_message_text(text)
+    else:
+        update.message.reply_text(text)
+
+
+def _get_callback_value(update: Update) -> str:
+    return update.callback_query.data.rsplit(":", 1)[1]
@@ -0,0 +1,97 @@
+import functools
+import logging
+from contextlib import ExitStack, contextmanager
+from threading import local
+from typing import Callable, Iterator
+
+from django.conf import settings
+from django.db import connections
+
+from app.internal.general.db import QueryCounter
+from app.internal.metrics import HANDLER_QUERIES, HANDLER_QUERY_DURATION, QUERY_BUDGET_EXCEEDED
+
+logger = logging.getLogger(__name__)
+
+_NAME_PREFIX = "app.internal."
+_BUDGET_EXCEEDED = "%s ran %d queries with a budget of %d"
+
+_state = local()
+
+
+class QueryBudgetExceeded(Exception):
+    def __init__(self, name: str, limit: int, amount: int):
+        super().__init__(_BUDGET_EXCEEDED % (name, amount, limit))
+
+        self.name = name
+        self.limit = limit
+        self.amount = amount
+
+
+def query_budget(limit: int) -> Callable:
+    def decorator(handler: Callable) -> Callable:
+        name = _get_name(handler)
+
+        @functools.wraps(handler)
+        def wrapper(*args, **kwargs):
+            with measure_queries(name, limit):
+                return handler(*args, **kwargs)
+
+        contribute = getattr(handler, "_ninja_contribute_to_operation", None)
+
+        def contribute_to_operation(operation) -> None:
+            if contribute:
+                contribute(operation)
+
+            run = operation.run
+
+            @functools.wraps(run)
+            def measured_run(*args, **kwargs):
+                with measure_queries(name, limit):
+                    return run(*args, **kwargs)
+
+            operation.run = measured_run
+
+        wrapper.query_budget = limit
+        wrapper._ninja_contribute_to_operation = contribute_to_operation
+
+        return wrapper
+
+    return decorator
+
+
+def _get_name(handler: Callable) -> str:
+    if "." in handler.__qualname__:
+        return handler.__qualname__
+
+    return f"{handler.__module__.removeprefix(_NAME_PREFIX)}.{handler.__qualname__}"
+
+
+@contextmanager
+def measure_queries(name: str, limit: int) -> Iterator[None]:
+    if not settings.QUERY_BUDGET_MONITORING or getattr(_state, "measuring", False):
+        yield
+        return
+
+    counter = QueryCounter()
+    _state.measuring = True
+
+    try:
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(counter))
+
+            yield
+    finally:
+        _state.measuring = False
+
+        HANDLER_QUERIES.labels(name).observe(counter.amount)
+        HANDLER_QUERY_DURATION.labels(name).observe(counter.duration)
+
+    if counter.amount <= limit:
+        return
+
+    QUERY_BUDGET_EXCEEDED.labels(name).inc()
+    logger.warning(_BUDGET_EXCEEDED, name, counter.amount, limit)
+
+    if settings.QUERY_BUDGET_STRICT:
+        raise QueryBudgetExceeded(name, limit, counter.amount)
@@ -0,0 +1,139 @@
+import logging
+from threading import Condition
+from time import monotonic
+from typing import Any, Callable, List, Tuple
+
+import psycopg2
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_UNKNOWN
+
+from app.internal.metrics import DATABASE_POOL_CONNECTIONS, DATABASE_POOL_TIMEOUTS, DATABASE_POOL_WAIT
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        name: str,
+        max_size: int,
+        wait_seconds: float,
+        idle_seconds: float,
+        health_check_seconds: float,
+    ):
+        self._name = name
+        self._max_size = max_size
+        self._wait_seconds = wait_seconds
+        self._idle_seconds = idle_seconds
+        self._health_check_seconds = health_check_seconds
+        self._idle: List[Tuple[float, Any]] = []
+        self._in_use = 0
+        self._condition = Condition()
+
+    def acquire(self, connect: Callable[[], Any]) -> Any:
+        started = monotonic()
+
+        with self._condition:
+            self._reap()
+
+            while not self._idle and self._in_use >= self._max_size:
+                remaining = self._wait_seconds - (monotonic() - started)
+
+                if remaining <= 0:
+                    DATABASE_POOL_TIMEOUTS.labels(self._name).inc()
+                    raise psycopg2.OperationalError(f"Connection pool {self._name} is exhausted")
+
+                self._condition.wait(remaining)
+
+            released_at, connection = self._idle.pop() if self._idle else (None, None)
+            self._in_use += 1
+            self._update_metrics()
+
+        DATABASE_POOL_WAIT.labels(self._name).observe(monotonic() - started)
+
+        try:
+            if connection is None or not self._is_healthy(connection, released_at):
+                connection = connect()
+        except Exception:
+            self._return(None)
+            raise
+
+        return connection
+
+    def release(self, connection: Any) -> None:
+        self._return(connection if self._reset(connection) else None)
+
+    def close(self) -> None:
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._update_metrics()
+
+        for _, connection in idle:
+            self._discard(connection)
+
+    def get_size(self) -> Tuple[int, int]:
+        with self._condition:
+            return self._in_use, len(self._idle)
+
+    def _return(self, connection: Any) -> None:
+        with self._condition:
+            self._in_use -= 1
+
+            if connection is not None:
+                self._idle.append((monotonic(), connection))
+
+            self._update_metrics()
+            self._condition.notify()
+
+    def _reap(self) -> None:
+        expired_at = monotonic() - self._idle_seconds
+
+        while self._idle and self._idle[0][0] <= expired_at:
+            self._discard(self._idle.pop(0)[1])
+
+    def _is_healthy(self, connection: Any, released_at: float) -> bool:
+        if connection.closed:
+            return False
+
+        if monotonic() - released_at < self._health_check_seconds:
+            return True
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+
+            return self._reset(connection)
+        except psycopg2.Error:
+            logger.warning("Dropping broken connection from pool %s", self._name)
+            self._discard(connection)
+
+            return False
+
+    def _reset(self, connection: Any) -> bool:
+        if connection.closed:
+            return False
+
+        status = connection.get_transaction_status()
+
+        if status == TRANSACTION_STATUS_IDLE:
+            return True
+
+        if status != TRANSACTION_STATUS_UNKNOWN:
+            try:
+                connection.rollback()
+                return True
+            except psycopg2.Error:
+                pass
+
+        self._discard(connection)
+
+        return False
+
+    def _discard(self, connection: Any) -> None:
+        try:
+            connection.close()
+        except psycopg2.Error:
+            pass
+
+    def _update_metrics(self) -> None:
+        DATABASE_POOL_CONNECTIONS.labels(self._name, "in_use").set(self._in_use)
+        DATABASE_POOL_CONNECTIONS.labels(self._name, "idle").set(len(self._idle))
@@ -0,0 +1,19 @@
+from typing import Iterable, Iterator
+
+from django.db import connections
+from prometheus_client.metrics_core import Metric
+from prometheus_client.registry import CollectorRegistry
+
+
+class ConnectionReleasingRegistry:
+    def __init__(self, registry: CollectorRegistry):
+        self._registry = registry
+
+    def collect(self) -> Iterator[Metric]:
+        try:
+            yield from self._registry.collect()
+        finally:
+            connections.close_all()
+
+    def restricted_registry(self, names: Iterable[str]) -> "ConnectionReleasingRegistry":
+        return ConnectionReleasingRegistry(self._registry.restricted_registry(names))
@@ -0,0 +1,43 @@
+from typing import Generic, List, Optional, TypeVar
+
+from django.db.models import QuerySet
+
+T = TypeVar("T")
+
+
+class KeysetPage(Generic[T]):
+    def __init__(self, items: List[T], has_previous: bool, has_next: bool, key: str):
+        self.items = items
+        self.has_previous = has_previous
+        self.has_next = has_next
+        self.key = key
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def previous_cursor(self) -> Optional[str]:
+        return self._get_cursor(self.items[0]) if self.has_previous and self.items else None
+
+    @property
+    def next_cursor(self) -> Optional[str]:
+        return self._get_cursor(self.items[-1]) if self.has_next and self.items else None
+
+    @classmethod
+    def from_queryset(
+        cls, queryset: QuerySet, key: str, size: int, after: Optional[str] = None, before: Optional[str] = None
+    ) -> "KeysetPage":
+        if before is not None:
+            items = list(queryset.filter(**{f"{key}__lt": before}).order_by(f"-{key}")[: size + 1])
+
+            return cls(items[:size][::-1], len(items) > size, True, key)
+
+        if after is not None:
+            queryset = queryset.filter(**{f"{key}__gt": after})
+
+        items = list(queryset.order_by(key)[: size + 1])
+
+        return cls(items[:size], after is not None, len(items) > size, key)
+
+    def _get_cursor(self, item: T) -> str:
+        return item[self.key] if isinstance(item, dict) else getattr(item, self.key)
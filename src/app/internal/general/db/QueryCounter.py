@@ -0,0 +1,17 @@
+from time import perf_counter
+from typing import Callable
+
+
+class QueryCounter:
+    def __init__(self):
+        self.amount = 0
+        self.duration = 0.0
+
+    def __call__(self, execute: Callable, sql: str, params, many: bool, context: dict):
+        started = perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.amount += 1
+            self.duration += perf_counter() - started
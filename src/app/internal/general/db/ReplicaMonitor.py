@@ -0,0 +1,69 @@
+import logging
+from itertools import count
+from threading import Lock
+from time import monotonic
+from typing import Iterable, List, Optional
+
+from django.db import DatabaseError, connections
+
+from app.internal.metrics import DATABASE_REPLICA_LAG
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaMonitor:
+    _LAG_QUERY = (
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+    )
+
+    def __init__(self, aliases: Iterable[str], max_lag_seconds: float, check_interval_seconds: float):
+        self._aliases = list(aliases)
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._healthy: List[str] = []
+        self._checked_at = float("-inf")
+        self._lock = Lock()
+        self._turn = count()
+
+    def choose(self) -> Optional[str]:
+        healthy = self.get_healthy()
+
+        return healthy[next(self._turn) % len(healthy)] if healthy else None
+
+    def get_healthy(self) -> List[str]:
+        if self._aliases and monotonic() - self._checked_at >= self._check_interval_seconds:
+            self._check()
+
+        return self._healthy
+
+    def _check(self) -> None:
+        if not self._lock.acquire(blocking=False):
+            return
+
+        try:
+            self._healthy = [alias for alias in self._aliases if self._is_healthy(alias)]
+            self._checked_at = monotonic()
+        finally:
+            self._lock.release()
+
+    def _is_healthy(self, alias: str) -> bool:
+        try:
+            lag = self._get_lag(alias)
+        except DatabaseError as error:
+            logger.warning("Replica %s is unavailable: %s", alias, error)
+            return False
+
+        DATABASE_REPLICA_LAG.labels(alias).set(lag)
+
+        if lag > self._max_lag_seconds:
+            logger.warning("Replica %s lags by %.1fs", alias, lag)
+            return False
+
+        return True
+
+    def _get_lag(self, alias: str) -> float:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(self._LAG_QUERY)
+
+            return float(cursor.fetchone()[0])
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+from app.internal.general.db.ReplicaMonitor import ReplicaMonitor
+from app.internal.general.db.replicas import is_replica_allowed, pin_database_user
+from app.internal.metrics import DATABASE_REPLICA_READS
+
+
+class ReplicaRouter:
+    def __init__(self):
+        self.monitor = ReplicaMonitor(
+            settings.DATABASE_REPLICAS,
+            settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+            settings.DATABASE_REPLICA_CHECK_SECONDS,
+        )
+
+    def db_for_read(self, model, **hints) -> str:
+        if not is_replica_allowed():
+            return DEFAULT_DB_ALIAS
+
+        alias = self.monitor.choose() or DEFAULT_DB_ALIAS
+        DATABASE_REPLICA_READS.labels(alias).inc()
+
+        return alias
+
+    def db_for_write(self, model, **hints) -> str:
+        pin_database_user()
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name=None, **hints) -> bool:
+        return db == DEFAULT_DB_ALIAS
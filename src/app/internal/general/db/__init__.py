@@ -0,0 +1 @@
+from .QueryCounter import QueryCounter
@@ -0,0 +1,62 @@
+import weakref
+from threading import Lock
+from typing import Dict
+
+from django.conf import settings
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.creation import DatabaseCreation as BaseDatabaseCreation
+
+from app.internal.general.db.ConnectionPool import ConnectionPool
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = Lock()
+
+
+def get_pool(alias: str, conn_params: dict) -> ConnectionPool:
+    key = f"{alias}:{conn_params.get('host')}:{conn_params.get('port')}/{conn_params.get('database')}"
+
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(
+                alias,
+                settings.DATABASE_POOL_MAX_SIZE,
+                settings.DATABASE_POOL_WAIT_SECONDS,
+                settings.DATABASE_POOL_IDLE_SECONDS,
+                settings.DATABASE_POOL_HEALTH_CHECK_SECONDS,
+            )
+
+        return _pools[key]
+
+
+def close_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+
+    for pool in pools:
+        pool.close()
+
+
+class DatabaseCreation(BaseDatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        close_pools()
+
+        super()._destroy_test_db(test_database_name, verbosity)
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    def get_new_connection(self, conn_params):
+        self._pool = get_pool(self.alias, conn_params)
+
+        connection = self._pool.acquire(lambda: super(DatabaseWrapper, self).get_new_connection(conn_params))
+        self._release = weakref.finalize(self, self._pool.release, connection)
+        self._release.atexit = False
+        self.isolation_level = self.settings_dict["OPTIONS"].get("isolation_level", connection.isolation_level)
+
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self._release()
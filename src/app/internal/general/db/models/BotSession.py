@@ -0,0 +1,13 @@
+from django.db import models
+
+
+class BotSession(models.Model):
+    user_id = models.PositiveBigIntegerField(primary_key=True)
+    data = models.JSONField(default=dict)
+    states = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        db_table = "bot_sessions"
+        verbose_name = "Bot Session"
+        verbose_name_plural = "Bot Sessions"
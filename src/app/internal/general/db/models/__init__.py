@@ -0,0 +1 @@
+from .BotSession import BotSession
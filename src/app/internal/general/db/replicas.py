@@ -0,0 +1,54 @@
+from contextlib import contextmanager
+from threading import local
+from typing import Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+_PRIMARY_KEY = "db:primary:{id}"
+
+_state = local()
+
+
+@contextmanager
+def read_replica() -> Iterator[None]:
+    previous = getattr(_state, "replica", False)
+    _state.replica = True
+
+    try:
+        yield
+    finally:
+        _state.replica = previous
+
+
+def set_database_user(user_id: Optional[int]) -> None:
+    _state.user_id = user_id
+    _state.wrote = False
+    _state.pinned = user_id is not None and bool(cache.get(_PRIMARY_KEY.format(id=user_id)))
+
+
+def reset_database_user(**kwargs) -> None:
+    set_database_user(None)
+
+
+def get_database_user() -> Optional[int]:
+    return getattr(_state, "user_id", None)
+
+
+def pin_database_user() -> None:
+    user_id = get_database_user()
+
+    if user_id is None or _state.wrote:
+        return
+
+    _state.wrote = _state.pinned = True
+    cache.set(_PRIMARY_KEY.format(id=user_id), True, settings.DATABASE_REPLICA_STICKY_SECONDS)
+
+
+def is_replica_allowed() -> bool:
+    return (
+        getattr(_state, "replica", False)
+        and not getattr(_state, "pinned", False)
+        and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+    )
@@ -0,0 +1,27 @@
+from datetime import timedelta
+from typing import Dict, Optional
+
+from django.db import transaction
+from django.utils.timezone import now
+
+from app.internal.general.db.models import BotSession
+from app.internal.general.domain.interfaces import IBotSessionRepository
+
+
+class BotSessionRepository(IBotSessionRepository):
+    def get_alive(self, user_id: int, ttl: timedelta) -> Optional[BotSession]:
+        return BotSession.objects.filter(user_id=user_id, updated_at__gte=now() - ttl).first()
+
+    def save(self, user_id: int, data: dict, changes: Dict[str, Optional[int]], ttl: timedelta) -> None:
+        with transaction.atomic():
+            stored = BotSession.objects.select_for_update().filter(user_id=user_id).first()
+            states = stored.states if stored and stored.updated_at >= now() - ttl else {}
+            states = {key: state for key, state in {**states, **changes}.items() if state is not None}
+
+            if data or states:
+                BotSession.objects.update_or_create(user_id=user_id, defaults={"data": data, "states": states})
+            elif stored:
+                stored.delete()
+
+    def remove_idle(self, ttl: timedelta) -> int:
+        return BotSession.objects.filter(updated_at__lt=now() - ttl).delete()[0]
@@ -0,0 +1 @@
+from .BotSessionRepository import BotSessionRepository
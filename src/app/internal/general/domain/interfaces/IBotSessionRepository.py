@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import Dict, Optional
+
+from app.internal.general.db.models import BotSession
+
+
+class IBotSessionRepository(ABC):
+    @abstractmethod
+    def get_alive(self, user_id: int, ttl: timedelta) -> Optional[BotSession]:
+        pass
+
+    @abstractmethod
+    def save(self, user_id: int, data: dict, changes: Dict[str, Optional[int]], ttl: timedelta) -> None:
+        pass
+
+    @abstractmethod
+    def remove_idle(self, ttl: timedelta) -> int:
+        pass
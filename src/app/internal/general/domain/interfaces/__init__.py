@@ -0,0 +1 @@
+from .IBotSessionRepository import IBotSessionRepository
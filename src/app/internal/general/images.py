@@ -0,0 +1,21 @@
+from io import BytesIO
+from typing import Dict
+
+from PIL import Image, ImageOps
+
+
+def render_variants(content: bytes, sides: Dict[str, int], format_: str, quality: int) -> Dict[str, bytes]:
+    with Image.open(BytesIO(content)) as original:
+        image = ImageOps.exif_transpose(original).convert("RGB")
+
+    variants = {}
+
+    for variant, side in sides.items():
+        resized = image.copy()
+        resized.thumbnail((side, side), Image.LANCZOS)
+
+        buffer = BytesIO()
+        resized.save(buffer, format_, quality=quality, optimize=True)
+        variants[variant] = buffer.getvalue()
+
+    return variants
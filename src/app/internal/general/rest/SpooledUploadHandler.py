@@ -0,0 +1,60 @@
+from tempfile import SpooledTemporaryFile
+from typing import Optional
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django.http import HttpRequest
+
+from app.internal.general.rest.exceptions import BadRequestException
+
+
+class SpooledUploadHandler(FileUploadHandler):
+    BODY_TOO_LARGE = "Request body is too large"
+    INVALID_FILE = "Invalid photo type or size"
+
+    def __init__(self, request: HttpRequest, max_size: int, content_type: str):
+        super().__init__(request)
+
+        self.max_size = max_size
+        self.expected_content_type = content_type
+        self.file: Optional[SpooledTemporaryFile] = None
+        self.received = 0
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None) -> None:
+        if content_length > self.max_size + settings.DATA_UPLOAD_MAX_MEMORY_SIZE:
+            raise BadRequestException(self.BODY_TOO_LARGE)
+
+    def new_file(self, *args, **kwargs) -> None:
+        super().new_file(*args, **kwargs)
+
+        if not (self.content_type or "").startswith(self.expected_content_type):
+            raise BadRequestException(self.INVALID_FILE)
+
+        self.file = SpooledTemporaryFile(max_size=settings.UPLOAD_SPOOL_MEMORY_BYTES)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> None:
+        self.received += len(raw_data)
+
+        if self.received > self.max_size:
+            self.file.close()
+            raise BadRequestException(self.INVALID_FILE)
+
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size: int) -> UploadedFile:
+        self.file.seek(0)
+
+        return UploadedFile(
+            file=self.file,
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            content_type_extra=self.content_type_extra,
+        )
+
+    def upload_interrupted(self) -> None:
+        if self.file:
+            self.file.close()
@@ -0,0 +1,30 @@
+import functools
+from typing import Callable
+
+from django.http import HttpRequest
+
+from app.internal.general.rest.SpooledUploadHandler import SpooledUploadHandler
+
+
+def spooled_upload(max_size: int, content_type: str) -> Callable:
+    def decorator(handler: Callable) -> Callable:
+        @functools.wraps(handler)
+        def wrapper(*args, **kwargs):
+            return handler(*args, **kwargs)
+
+        def contribute_to_operation(operation) -> None:
+            run = operation.run
+
+            @functools.wraps(run)
+            def spooled_run(request: HttpRequest, *args, **kwargs):
+                request.upload_handlers = [SpooledUploadHandler(request, max_size, content_type)]
+
+                return run(request, *args, **kwargs)
+
+            operation.run = spooled_run
+
+        wrapper._ninja_contribute_to_operation = contribute_to_operation
+
+        return wrapper
+
+    return decorator
@@ -1,21 +1,63 @@
+from django.conf import settings
+
 from app.internal.authentication.db.repositories import AuthRepository
 from app.internal.authentication.domain.services import JWTService
-from app.internal.bank.db.repositories import BankAccountRepository, BankCardRepository, TransactionRepository
-from app.internal.bank.domain.services import BankObjectService, TransactionService, TransferService
-from app.internal.user.db.repositories import FriendRequestRepository, SecretKeyRepository, TelegramUserRepository
-from app.internal.user.domain.services import FriendRequestService, FriendService, TelegramUserService
+from app.internal.bank.db.repositories import (
+    BankAccountRepository,
+    BankCardRepository,
+    PhotoRepository,
+    TransactionArchiveRepository,
+    TransactionRepository,
+)
+from app.internal.bank.domain.services import (
+    BankObjectService,
+    PhotoPipeline,
+    PhotoUrlService,
+    TransactionPartitionService,
+    TransactionService,
+    TransferService,
+)
+from app.internal.general.bot.SessionPersistence import SessionPersistence
+from app.internal.general.db.repositories import BotSessionRepository
+from app.internal.user.db.repositories import (
+    CounterpartyRepository,
+    FriendRequestRepository,
+    FriendSuggestionRepository,
+    SecretKeyRepository,
+    TelegramUserRepository,
+)
+from app.internal.user.domain.services import (
+    FriendRequestService,
+    FriendService,
+    FriendSuggestionService,
+    TelegramUserService,
+)
 
 _user_repo = TelegramUserRepository()
 _secret_repo = SecretKeyRepository()
 _account_repo = BankAccountRepository()
 _card_repo = BankCardRepository()
 _transaction_repo = TransactionRepository()
+_archive_repo = TransactionArchiveRepository()
+_photo_repo = PhotoRepository()
 _request_repo = FriendRequestRepository()
+_counterparty_repo = CounterpartyRepository()
+_suggestion_repo = FriendSuggestionRepository()
 
 user_service = TelegramUserService(_user_repo, _secret_repo)
-friend_service = FriendService(friend_repo=_user_repo)
-request_service = FriendRequestService(_request_repo)
+friend_service = FriendService(friend_repo=_user_repo, counterparty_repo=_counterparty_repo)
+request_service = FriendRequestService(request_repo=_request_repo, friend_repo=_user_repo)
+suggestion_service = FriendSuggestionService(suggestion_repo=_suggestion_repo, user_repo=_user_repo)
 bank_object_service = BankObjectService(_account_repo, _card_repo)
-transfer_service = TransferService(_account_repo, _card_repo, _transaction_repo)
-transaction_service = TransactionService(_transaction_repo)
+photo_pipeline = PhotoPipeline(_photo_repo, settings.PHOTO_PIPELINE_WORKERS)
+transfer_service = TransferService(
+    _account_repo, _card_repo, _transaction_repo, _counterparty_repo, _photo_repo, photo_pipeline
+)
+photo_url_service = PhotoUrlService(settings.PHOTO_URL_PREFIX, settings.PHOTO_URL_EXPIRY_MARGIN_SECONDS)
+transaction_service = TransactionService(_transaction_repo, _archive_repo, _counterparty_repo, photo_url_service)
+transaction_partition_service = TransactionPartitionService(_archive_repo)
 auth_service = JWTService(auth_repo=AuthRepository(), user_repo=TelegramUserRepository())
+
+session_persistence = SessionPersistence(
+    BotSessionRepository(), settings.BOT_SESSION_TTL, settings.BOT_SESSION_EVICTION_INTERVAL
+)
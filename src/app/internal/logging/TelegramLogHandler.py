@@ -1,15 +1,128 @@
 from logging import NOTSET, Handler, LogRecord
-from typing import Union
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import List, Optional, Tuple, Union
 
 from telegram import Bot
 
+from app.internal.metrics import LOG_RECORDS_DROPPED
+
 
 class TelegramLogHandler(Handler):
-    def __init__(self, token: str, chat_id: Union[str, int], level=NOTSET):
+    MAX_MESSAGE_LENGTH = 4096
+    _STOP_TIMEOUT_SECONDS = 10
+
+    def __init__(
+        self,
+        token: str,
+        chat_id: Union[str, int],
+        level=NOTSET,
+        flush_interval: float = 5,
+        queue_size: int = 1000,
+    ):
         super().__init__(level)
 
         self.chat_id = chat_id
         self.bot = Bot(token)
+        self.flush_interval = flush_interval
+
+        self._queue: Queue = Queue(maxsize=queue_size)
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+        self._thread_lock = Lock()
 
     def emit(self, record: LogRecord) -> None:
-        self.bot.send_message(chat_id=self.chat_id, text=self.format(record))
+        try:
+            text = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        self._start()
+
+        try:
+            self._queue.put_nowait(text)
+        except Full:
+            LOG_RECORDS_DROPPED.inc()
+
+    def close(self) -> None:
+        with self._thread_lock:
+            thread, self._thread = self._thread, None
+
+        if thread:
+            self._stopped.set()
+
+            try:
+                self._queue.put_nowait(None)
+            except Full:
+                pass
+
+            thread.join(self._STOP_TIMEOUT_SECONDS)
+
+        super().close()
+
+    def _start(self) -> None:
+        if self._thread or self._stopped.is_set():
+            return
+
+        with self._thread_lock:
+            if self._thread:
+                return
+
+            self._thread = Thread(target=self._work, name="telegram-log-handler", daemon=True)
+            self._thread.start()
+
+    def _work(self) -> None:
+        texts: List[str] = []
+        deadline = monotonic()
+
+        while not self._stopped.is_set():
+            try:
+                text = self._queue.get(timeout=max(deadline - monotonic(), 0) if texts else None)
+            except Empty:
+                text = None
+
+            if text is not None:
+                if not texts:
+                    deadline = monotonic() + self.flush_interval
+
+                texts.append(text)
+
+            if texts and monotonic() >= deadline:
+                self._send(texts)
+                texts = []
+
+        while not self._queue.empty():
+            text = self._queue.get_nowait()
+
+            if text is not None:
+                texts.append(text)
+
+        self._send(texts)
+
+    def _send(self, texts: List[str]) -> None:
+        for message, amount in self._split(texts):
+            try:
+                self.bot.send_message(chat_id=self.chat_id, text=message)
+            except Exception:
+                LOG_RECORDS_DROPPED.inc(amount)
+
+    def _split(self, texts: List[str]) -> List[Tuple[str, int]]:
+        messages = []
+        current, amount = "", 0
+
+        for text in texts:
+            text = text[: self.MAX_MESSAGE_LENGTH]
+
+            if current and len(current) + len(text) + 1 > self.MAX_MESSAGE_LENGTH:
+                messages.append((current, amount))
+                current, amount = "", 0
+
+            current = f"{current}\n{text}" if current else text
+            amount += 1
+
+        if current:
+            messages.append((current, amount))
+
+        return messages
@@ -1,10 +1,40 @@
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
 USER_AMOUNT = Gauge("user_amount", "")
 
 TRANSFER_AMOUNT = Gauge("transfer_amount", "")
 TRANSFER_ERRORS = Counter("transfer_errors", "")
 
+PHOTO_UPLOADS_AVOIDED = Counter("photo_uploads_avoided", "")
+PHOTO_STORAGE_SAVED = Gauge("photo_storage_saved_bytes", "")
+PHOTO_VARIANTS_STORED = Counter("photo_variants_stored", "")
+PHOTO_VARIANT_ERRORS = Counter("photo_variant_errors", "")
+PHOTO_URLS_SIGNED = Counter("photo_urls_signed", "")
+
+TRANSACTIONS_ARCHIVED = Counter("transactions_archived", "")
+TRANSACTION_PARTITIONS_CREATED = Counter("transaction_partitions_created", "")
+
+FRIEND_SUGGESTIONS_BUILT = Counter("friend_suggestions_built", "")
+
+DATABASE_REPLICA_READS = Counter("database_replica_reads", "", ["database"])
+DATABASE_REPLICA_LAG = Gauge("database_replica_lag_seconds", "", ["database"])
+DATABASE_POOL_CONNECTIONS = Gauge("database_pool_connections", "", ["database", "state"])
+DATABASE_POOL_WAIT = Histogram("database_pool_wait_seconds", "", ["database"])
+DATABASE_POOL_TIMEOUTS = Counter("database_pool_timeouts", "", ["database"])
+
 ACCOUNT_AMOUNT = Gauge("account_amount", "")
 CARD_AMOUNT = Gauge("card_amount", "")
 BALANCE_TOTAL = Gauge("balance_total", "")
+
+BOT_QUEUE_DEPTH = Gauge("bot_queue_depth", "", ["mode"])
+BOT_UPDATE_LAG = Histogram("bot_update_lag_seconds", "", ["mode"])
+BOT_UPDATES_DUPLICATED = Counter("bot_updates_duplicated", "", ["mode"])
+BOT_UPDATES_REJECTED = Counter("bot_updates_rejected", "", ["mode"])
+BOT_UPDATES_PROCESSED = Counter("bot_updates_processed", "", ["mode"])
+BOT_UPDATE_PROCESSING = Histogram("bot_update_processing_seconds", "", ["mode"])
+
+LOG_RECORDS_DROPPED = Counter("log_records_dropped", "")
+
+HANDLER_QUERIES = Histogram("handler_queries", "", ["handler"], buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89))
+HANDLER_QUERY_DURATION = Histogram("handler_query_duration_seconds", "", ["handler"])
+QUERY_BUDGET_EXCEEDED = Counter("query_budget_exceeded", "", ["handler"])
@@ -0,0 +1,69 @@
+import logging
+from threading import Event
+from typing import Optional
+
+from django.conf import settings
+from telegram import Update
+from telegram.error import RetryAfter, TelegramError, TimedOut
+
+from app.internal.bot import create_bot, create_dispatcher
+from app.internal.general.bot.UpdateWorkerPool import UpdateWorkerPool
+
+logger = logging.getLogger(__name__)
+
+
+class BotPollingService:
+    def __init__(self, token: str, workers: int):
+        self.bot = create_bot(token)
+        self.dispatcher = create_dispatcher(self.bot)
+        self.pool = UpdateWorkerPool(
+            self.handle, workers, settings.BOT_QUEUE_SIZE, settings.BOT_DEDUPLICATION_WINDOW, mode="polling"
+        )
+
+        self._stopped = Event()
+        self._offset: Optional[int] = None
+
+    def run(self) -> None:
+        self.bot.delete_webhook()
+        self.pool.start()
+
+        while not self._stopped.is_set():
+            self.poll()
+
+        self._shutdown()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def poll(self) -> None:
+        try:
+            updates = self.bot.get_updates(offset=self._offset, timeout=settings.BOT_POLLING_TIMEOUT_SECONDS)
+        except TimedOut:
+            return
+        except RetryAfter as error:
+            self._stopped.wait(error.retry_after)
+            return
+        except TelegramError:
+            logger.exception("Updates were not fetched")
+            self._stopped.wait(settings.BOT_POLLING_RETRY_SECONDS)
+            return
+
+        for update in updates:
+            self.pool.submit(update.to_dict())
+            self._offset = update.update_id + 1
+
+    def handle(self, json: dict) -> None:
+        update = Update.de_json(json, self.bot)
+        self.dispatcher.process_update(update)
+
+    def _shutdown(self) -> None:
+        self.pool.stop(settings.BOT_STOP_TIMEOUT_SECONDS)
+        self.dispatcher.stop()
+
+        if self._offset is None:
+            return
+
+        try:
+            self.bot.get_updates(offset=self._offset, timeout=0, limit=1)
+        except TelegramError:
+            logger.exception("Offset %s was not confirmed", self._offset)
@@ -1,13 +1,17 @@
+import signal
+from typing import Optional
+
 from django.conf import settings
-from telegram.ext import Updater
 
-from app.internal.bot import handlers
+from app.internal.polling.BotPollingService import BotPollingService
+
+_STOP_SIGNALS = (signal.SIGINT, signal.SIGTERM, signal.SIGABRT)
+
 
+def start_polling(workers: Optional[int] = None) -> None:
+    service = BotPollingService(settings.TELEGRAM_BOT_TOKEN, workers or settings.BOT_WORKERS)
 
-def start_polling() -> None:
-    updater = Updater(settings.TELEGRAM_BOT_TOKEN)
-    for handler in handlers:
-        updater.dispatcher.add_handler(handler)
+    for signum in _STOP_SIGNALS:
+        signal.signal(signum, lambda *args: service.stop())
 
-    updater.start_polling()
-    updater.idle()
+    service.run()
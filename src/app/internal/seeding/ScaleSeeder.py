@@ -0,0 +1,300 @@
+from array import array
+from datetime import datetime, timedelta
+from io import StringIO
+from itertools import accumulate, islice
+from random import Random
+from typing import Callable, Dict, Iterable, Iterator, List, Set, Tuple, Type
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.backends.utils import CursorWrapper
+from django.db.models import Model
+from django.utils.timezone import now
+
+from app.internal.authentication.db.models import RefreshToken
+from app.internal.bank.db.models import BankAccount, BankCard, Transaction, TransactionTypes
+from app.internal.general.db.models import BotSession
+from app.internal.general.services import transaction_partition_service
+from app.internal.user.db.models import Counterparty, FriendRequest, FriendSuggestion, SecretKey, TelegramUser
+
+Friendship = TelegramUser.friends.through
+
+
+class ScaleSeeder:
+    FIRST_USER_ID = 7 * 10**12
+    LAST_USER_ID = 8 * 10**12 - 1
+    FIRST_ACCOUNT_NUMBER = 7 * 10**19
+    FIRST_CARD_NUMBER = 7 * 10**15
+    USERNAME = "seed_{number}"
+    PASSWORD = "seed"
+
+    _USERS_PER_SCALE = 10_000
+    _TRANSACTIONS_PER_SCALE = 1_000_000
+    _HISTORY = timedelta(days=365)
+    _UNVIEWED = timedelta(days=1)
+    _PHONE = "+70000000000"
+    _MIN_ACCRUAL_CENTS = 100
+    _MAX_ACCRUAL_CENTS = 10**6
+    _MAX_SPARE_CENTS = 10**7
+    _REQUEST_CANDIDATES = 4
+    _CHUNK_SIZE = 100_000
+
+    _USER_FIELDS = ("id", "username", "first_name", "phone", "password")
+    _ACCOUNT_FIELDS = ("number", "owner", "balance")
+    _CARD_FIELDS = ("number", "bank_account")
+    _FRIENDSHIP_FIELDS = ("from_telegramuser", "to_telegramuser")
+    _REQUEST_FIELDS = ("source", "destination")
+    _TRANSACTION_FIELDS = (
+        "type",
+        "source",
+        "destination",
+        "accrual",
+        "photo",
+        "was_source_viewed",
+        "was_destination_viewed",
+        "created_at",
+    )
+    _COUNTERPARTIES = (
+        f"INSERT INTO {Counterparty._meta.db_table} (user_id, counterparty_id, last_interaction, count) "
+        "SELECT pair.user_id, pair.counterparty_id, MAX(transactions.created_at), COUNT(*) "
+        f"FROM {Transaction._meta.db_table} transactions "
+        f"JOIN {BankAccount._meta.db_table} source ON source.number = transactions.source_id "
+        f"JOIN {BankAccount._meta.db_table} destination ON destination.number = transactions.destination_id "
+        "CROSS JOIN LATERAL (VALUES (source.owner_id, destination.owner_id), (destination.owner_id, source.owner_id)) "
+        "AS pair (user_id, counterparty_id) "
+        "WHERE source.owner_id <> destination.owner_id AND source.owner_id BETWEEN %s AND %s "
+        "GROUP BY pair.user_id, pair.counterparty_id"
+    )
+
+    def __init__(
+        self,
+        scale: float = 1,
+        seed: int = 0,
+        accounts_per_user: int = 2,
+        cards_per_account: int = 1,
+        friends_per_user: int = 20,
+        requests_per_user: int = 2,
+        skew: float = 1.1,
+        report: Callable[[str], None] = lambda message: None,
+    ):
+        self.users = max(int(self._USERS_PER_SCALE * scale), 2)
+        self.accounts = self.users * accounts_per_user
+        self.cards = self.accounts * cards_per_account
+        self.transactions = int(self._TRANSACTIONS_PER_SCALE * scale)
+        self.friends_per_user = min(friends_per_user, self.users - 1)
+        self.requests_per_user = requests_per_user
+        self.skew = skew
+
+        self._seed = seed
+        self._accounts_per_user = accounts_per_user
+        self._cards_per_account = cards_per_account
+        self._report = report
+
+    def get_user_id(self, number: int) -> int:
+        return self.FIRST_USER_ID + number
+
+    def get_account_number(self, number: int) -> str:
+        return str(self.FIRST_ACCOUNT_NUMBER + number)
+
+    def get_card_number(self, number: int) -> str:
+        return str(self.FIRST_CARD_NUMBER + number)
+
+    def seed(self) -> Dict[str, int]:
+        random = Random(self._seed)
+        sources, destinations, accruals = self._plan_transactions(random)
+        friendships = self._plan_friendships(random)
+        requests = self._plan_requests(random, friendships)
+        balances = self._get_balances(random, sources, destinations, accruals)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            self._delete(cursor)
+
+            transaction_partition_service.create_partitions(
+                now() - self._HISTORY, settings.TRANSACTION_PARTITIONS_AHEAD
+            )
+
+            self._copy(cursor, TelegramUser, self._USER_FIELDS, self._get_users())
+            self._copy(cursor, BankAccount, self._ACCOUNT_FIELDS, self._get_accounts(balances))
+            self._copy(cursor, BankCard, self._CARD_FIELDS, self._get_cards())
+            self._copy(cursor, Friendship, self._FRIENDSHIP_FIELDS, self._get_friendships(friendships))
+            self._copy(cursor, FriendRequest, self._REQUEST_FIELDS, self._get_requests(requests))
+            self._copy(
+                cursor, Transaction, self._TRANSACTION_FIELDS, self._get_transactions(sources, destinations, accruals)
+            )
+            cursor.execute(self._COUNTERPARTIES, (self.FIRST_USER_ID, self.LAST_USER_ID))
+            counterparties = cursor.rowcount
+
+            for model in (TelegramUser, BankAccount, BankCard, Friendship, FriendRequest, Transaction, Counterparty):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+        return {
+            "users": self.users,
+            "accounts": self.accounts,
+            "cards": self.cards,
+            "friendships": len(friendships),
+            "friend_requests": len(requests),
+            "transactions": self.transactions,
+            "counterparties": counterparties,
+        }
+
+    def clear(self) -> None:
+        with transaction.atomic(), connection.cursor() as cursor:
+            self._delete(cursor)
+
+    def _plan_transactions(self, random: Random) -> Tuple[array, array, array]:
+        ranks = list(range(self.accounts))
+        random.shuffle(ranks)
+        weights = list(accumulate(1 / rank**self.skew for rank in range(1, self.accounts + 1)))
+
+        sources, destinations, accruals = array("I"), array("I"), array("Q")
+
+        for start in range(0, self.transactions, self._CHUNK_SIZE):
+            size = min(self._CHUNK_SIZE, self.transactions - start)
+            chosen_sources = random.choices(ranks, cum_weights=weights, k=size)
+            chosen_destinations = random.choices(ranks, cum_weights=weights, k=size)
+
+            sources.extend(chosen_sources)
+            destinations.extend(
+                (destination + 1) % self.accounts if destination == source else destination
+                for source, destination in zip(chosen_sources, chosen_destinations)
+            )
+            accruals.extend(random.randrange(self._MIN_ACCRUAL_CENTS, self._MAX_ACCRUAL_CENTS) for _ in range(size))
+
+            self._report(f"planned {start + size} of {self.transactions} transactions")
+
+        return sources, destinations, accruals
+
+    def _plan_friendships(self, random: Random) -> Set[Tuple[int, int]]:
+        friendships = set()
+
+        for user in range(self.users):
+            for friend in random.sample(range(self.users - 1), self.friends_per_user // 2):
+                friend = friend if friend < user else friend + 1
+                friendships.add((min(user, friend), max(user, friend)))
+
+        return friendships
+
+    def _plan_requests(self, random: Random, friendships: Set[Tuple[int, int]]) -> Set[Tuple[int, int]]:
+        requests = set()
+        candidates = min(self.users, self.requests_per_user * self._REQUEST_CANDIDATES)
+
+        for user in range(self.users):
+            sent = 0
+
+            for destination in random.sample(range(self.users), candidates):
+                if sent == self.requests_per_user:
+                    break
+
+                pair = (min(user, destination), max(user, destination))
+                if destination == user or pair in friendships or (destination, user) in requests:
+                    continue
+
+                requests.add((user, destination))
+                sent += 1
+
+        return requests
+
+    def _get_balances(self, random: Random, sources: array, destinations: array, accruals: array) -> List[int]:
+        balances = [0] * self.accounts
+
+        for source, destination, accrual in zip(sources, destinations, accruals):
+            balances[source] -= accrual
+            balances[destination] += accrual
+
+        return [max(balance, 0) + random.randrange(self._MAX_SPARE_CENTS) for balance in balances]
+
+    def _get_users(self) -> Iterator[tuple]:
+        password = settings.HASHER.encode(self.PASSWORD, settings.SALT)
+
+        for number in range(self.users):
+            yield self.get_user_id(number), self.USERNAME.format(number=number), "Seed", self._PHONE, password
+
+    def _get_accounts(self, balances: List[int]) -> Iterator[tuple]:
+        for number, balance in enumerate(balances):
+            owner = self.get_user_id(number // self._accounts_per_user)
+            yield self.get_account_number(number), owner, self._format_cents(balance)
+
+    def _get_cards(self) -> Iterator[tuple]:
+        for number in range(self.cards):
+            yield self.get_card_number(number), self.get_account_number(number // self._cards_per_account)
+
+    def _get_friendships(self, friendships: Set[Tuple[int, int]]) -> Iterator[tuple]:
+        for user, friend in sorted(friendships):
+            yield self.get_user_id(user), self.get_user_id(friend)
+            yield self.get_user_id(friend), self.get_user_id(user)
+
+    def _get_requests(self, requests: Set[Tuple[int, int]]) -> Iterator[tuple]:
+        for source, destination in sorted(requests):
+            yield self.get_user_id(source), self.get_user_id(destination)
+
+    def _get_transactions(self, sources: array, destinations: array, accruals: array) -> Iterator[tuple]:
+        end = now().replace(hour=0, minute=0, second=0, microsecond=0)
+        start = end - self._HISTORY
+        step = self._HISTORY / max(self.transactions, 1)
+        viewed_until = end - self._UNVIEWED
+
+        for number, (source, destination, accrual) in enumerate(zip(sources, destinations, accruals)):
+            created_at: datetime = start + step * number
+            viewed = created_at < viewed_until
+
+            yield (
+                TransactionTypes.TRANSFER.value,
+                self.get_account_number(source),
+                self.get_account_number(destination),
+                self._format_cents(accrual),
+                None,
+                viewed,
+                viewed,
+                created_at,
+            )
+
+    def _copy(self, cursor: CursorWrapper, model: Type[Model], fields: Tuple[str, ...], rows: Iterable[tuple]) -> None:
+        columns = ", ".join(model._meta.get_field(field).column for field in fields)
+        statement = f"COPY {model._meta.db_table} ({columns}) FROM STDIN"
+        rows = iter(rows)
+        amount = 0
+
+        while chunk := list(islice(rows, self._CHUNK_SIZE)):
+            buffer = StringIO("".join("\t".join(map(self._format_value, row)) + "\n" for row in chunk))
+            cursor.copy_expert(statement, buffer)
+
+            amount += len(chunk)
+            self._report(f"copied {amount} rows into {model._meta.db_table}")
+
+    def _delete(self, cursor: CursorWrapper) -> None:
+        users = (self.FIRST_USER_ID, self.LAST_USER_ID)
+        accounts = f"SELECT number FROM {BankAccount._meta.db_table} WHERE owner_id BETWEEN %s AND %s"
+
+        statements = [
+            (Transaction, f"source_id IN ({accounts}) OR destination_id IN ({accounts})", users * 2),
+            (BankCard, f"bank_account_id IN ({accounts})", users),
+            (BankAccount, "owner_id BETWEEN %s AND %s", users),
+            (FriendRequest, "source_id BETWEEN %s AND %s OR destination_id BETWEEN %s AND %s", users * 2),
+            (Counterparty, "user_id BETWEEN %s AND %s OR counterparty_id BETWEEN %s AND %s", users * 2),
+            (FriendSuggestion, "user_id BETWEEN %s AND %s OR suggestion_id BETWEEN %s AND %s", users * 2),
+            (Friendship, "from_telegramuser_id BETWEEN %s AND %s OR to_telegramuser_id BETWEEN %s AND %s", users * 2),
+            (RefreshToken, "telegram_user_id BETWEEN %s AND %s", users),
+            (SecretKey, "telegram_user_id BETWEEN %s AND %s", users),
+            (BotSession, "user_id BETWEEN %s AND %s", users),
+            (TelegramUser, "id BETWEEN %s AND %s", users),
+        ]
+
+        for model, condition, params in statements:
+            cursor.execute(f"DELETE FROM {model._meta.db_table} WHERE {condition}", params)
+
+    @staticmethod
+    def _format_cents(cents: int) -> str:
+        return f"{cents // 100}.{cents % 100:02d}"
+
+    @staticmethod
+    def _format_value(value: object) -> str:
+        if value is None:
+            return "\\N"
+
+        if isinstance(value, bool):
+            return "t" if value else "f"
+
+        if isinstance(value, datetime):
+            return value.isoformat()
+
+        return str(value)
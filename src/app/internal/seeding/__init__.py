@@ -0,0 +1 @@
+from .ScaleSeeder import ScaleSeeder
@@ -1,6 +1,6 @@
 from ninja import NinjaAPI
 
-from app.internal.general.services import friend_service, request_service, user_service
+from app.internal.general.services import friend_service, request_service, suggestion_service, user_service
 from app.internal.user.presentation.handlers import FriendHandlers, TelegramUserHandlers
 from app.internal.user.presentation.routers import get_friends_router, get_user_router
 
@@ -12,6 +12,6 @@ def register_user_api(api: NinjaAPI) -> None:
 
 
 def register_friends_api(api: NinjaAPI) -> None:
-    friend_handlers = FriendHandlers(user_service, friend_service, request_service)
+    friend_handlers = FriendHandlers(user_service, friend_service, request_service, suggestion_service)
 
     api.add_router(prefix="/friends", router=get_friends_router(friend_handlers))
@@ -0,0 +1,17 @@
+from django.db import models
+
+from app.internal.user.db.models.TelegramUser import TelegramUser
+
+
+class Counterparty(models.Model):
+    user = models.ForeignKey(TelegramUser, on_delete=models.CASCADE, related_name="counterparties", db_index=False)
+    counterparty = models.ForeignKey(TelegramUser, on_delete=models.CASCADE, related_name="+")
+    last_interaction = models.DateTimeField()
+    count = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ("user", "counterparty")
+        indexes = [models.Index(fields=("user", "-last_interaction"), name="counterparties_recent")]
+        db_table = "counterparties"
+        verbose_name = "Counterparty"
+        verbose_name_plural = "Counterparties"
@@ -0,0 +1,19 @@
+from django.db import models
+
+from app.internal.user.db.models.TelegramUser import TelegramUser
+
+
+class FriendSuggestion(models.Model):
+    user = models.ForeignKey(TelegramUser, on_delete=models.CASCADE, related_name="suggestions", db_index=False)
+    suggestion = models.ForeignKey(TelegramUser, on_delete=models.CASCADE, related_name="+")
+    mutual_friends = models.PositiveIntegerField(default=0)
+    interactions = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("user", "suggestion")
+        indexes = [
+            models.Index(fields=("user", "-mutual_friends", "-interactions"), name="friend_suggestions_top"),
+        ]
+        db_table = "friend_suggestions"
+        verbose_name = "Friend suggestion"
+        verbose_name_plural = "Friend suggestions"
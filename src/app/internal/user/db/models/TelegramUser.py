@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class TelegramUser(models.Model):
@@ -15,5 +17,6 @@ class TelegramUser(models.Model):
 
     class Meta:
         db_table = "telegram_users"
+        indexes = [models.Index(OpClass(Upper("username"), name="text_pattern_ops"), name="telegram_users_prefix")]
         verbose_name = "Telegram User"
         verbose_name_plural = "Telegram Users"
@@ -1,3 +1,5 @@
+from .Counterparty import Counterparty
 from .FriendRequest import FriendRequest
+from .FriendSuggestion import FriendSuggestion
 from .SecretKey import SecretKey
 from .TelegramUser import TelegramUser
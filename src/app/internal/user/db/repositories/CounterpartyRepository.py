@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import List, Union
+
+from django.db import connection
+
+from app.internal.bank.db.models import BankAccount
+from app.internal.user.db.models import Counterparty, TelegramUser
+from app.internal.user.domain.interfaces import ICounterpartyRepository
+
+
+class CounterpartyRepository(ICounterpartyRepository):
+    _RECORD = (
+        f"INSERT INTO {Counterparty._meta.db_table} (user_id, counterparty_id, last_interaction, count) "
+        "SELECT pair.user_id, pair.counterparty_id, %s, 1 "
+        f"FROM {BankAccount._meta.db_table} source "
+        f"JOIN {BankAccount._meta.db_table} destination ON destination.number = %s "
+        "CROSS JOIN LATERAL (VALUES (source.owner_id, destination.owner_id), (destination.owner_id, source.owner_id)) "
+        "AS pair (user_id, counterparty_id) "
+        "WHERE source.number = %s AND source.owner_id <> destination.owner_id "
+        "ON CONFLICT (user_id, counterparty_id) DO UPDATE SET "
+        f"count = {Counterparty._meta.db_table}.count + 1, "
+        f"last_interaction = GREATEST({Counterparty._meta.db_table}.last_interaction, EXCLUDED.last_interaction)"
+    )
+
+    def record(self, source_number: str, destination_number: str, moment: datetime) -> None:
+        with connection.cursor() as cursor:
+            cursor.execute(self._RECORD, [moment, destination_number, source_number])
+
+    def get_counterparty_usernames(self, user_id: Union[int, str]) -> List[str]:
+        return list(
+            Counterparty.objects.filter(user_id=user_id)
+            .order_by("-last_interaction")
+            .values_list("counterparty__username", flat=True)
+        )
+
+    def get_recent_recipients(self, user_id: Union[int, str], limit: int) -> List[TelegramUser]:
+        counterparties = (
+            Counterparty.objects.filter(user_id=user_id, counterparty__friends__id=user_id)
+            .select_related("counterparty")
+            .order_by("-last_interaction")[:limit]
+        )
+
+        return [counterparty.counterparty for counterparty in counterparties]
@@ -1,12 +1,22 @@
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 
+from django.db import connection
 from django.db.models import QuerySet
 
+from app.internal.general.db.KeysetPage import KeysetPage
 from app.internal.user.db.models import FriendRequest, TelegramUser
+from app.internal.user.db.repositories.TelegramUserFields import TelegramUserFields
 from app.internal.user.domain.interfaces import IFriendRequestRepository
 
 
 class FriendRequestRepository(IFriendRequestRepository):
+    _REMOVE_ALL = (
+        f"DELETE FROM {FriendRequest._meta.db_table} request USING {TelegramUser._meta.db_table} source "
+        "WHERE request.destination_id = %s AND source.id = request.source_id{condition} "
+        "RETURNING source.id, source.username"
+    )
+    _USERNAME_CONDITION = " AND source.username = ANY(%s)"
+
     def create(self, source: TelegramUser, destination: TelegramUser) -> FriendRequest:
         return FriendRequest.objects.create(source=source, destination=destination)
 
@@ -19,8 +29,43 @@ class FriendRequestRepository(IFriendRequestRepository):
     def remove(self, source: TelegramUser, destination: TelegramUser) -> bool:
         return self._get(source, destination).delete()[0] > 0
 
-    def get_usernames_to_friends(self, user_id: Union[int, str]) -> QuerySet[str]:
-        return FriendRequest.objects.filter(destination__id=user_id).values_list("source__username", flat=True)
+    def remove_all(self, destination_id: Union[int, str], usernames: Optional[List[str]] = None) -> Dict[int, str]:
+        condition, params = (
+            ("", [destination_id]) if usernames is None else (self._USERNAME_CONDITION, [destination_id, usernames])
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(self._REMOVE_ALL.format(condition=condition), params)
+
+            return dict(cursor.fetchall())
+
+    def get_requesters_page(
+        self, user_id: Union[int, str], size: int, after: Optional[str] = None, before: Optional[str] = None
+    ) -> KeysetPage[TelegramUser]:
+        return KeysetPage.from_queryset(
+            TelegramUser.objects.filter(friend_request_from_me__destination_id=user_id),
+            TelegramUserFields.USERNAME,
+            size,
+            after,
+            before,
+        )
+
+    def search_requesters(
+        self,
+        user_id: Union[int, str],
+        size: int,
+        prefix: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage[dict]:
+        requesters = TelegramUser.objects.filter(friend_request_from_me__destination_id=user_id)
+
+        if prefix:
+            requesters = requesters.filter(username__istartswith=prefix)
+
+        return KeysetPage.from_queryset(
+            requesters.values(TelegramUserFields.USERNAME), TelegramUserFields.USERNAME, size, after, before
+        )
 
     def _get(self, source: TelegramUser, destination: TelegramUser) -> QuerySet:
         return FriendRequest.objects.filter(source=source, destination=destination)
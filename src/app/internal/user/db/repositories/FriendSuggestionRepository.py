@@ -0,0 +1,66 @@
+from typing import List, Union
+
+from django.db import connection
+from django.db.models import Exists, OuterRef
+
+from app.internal.user.db.models import Counterparty, FriendRequest, FriendSuggestion, TelegramUser
+from app.internal.user.domain.interfaces import IFriendSuggestionRepository
+
+_FRIENDS = TelegramUser.friends.through._meta.db_table
+
+
+class FriendSuggestionRepository(IFriendSuggestionRepository):
+    _CLEAR = f"DELETE FROM {FriendSuggestion._meta.db_table} WHERE user_id = ANY(%s)"
+    _BUILD = (
+        f"INSERT INTO {FriendSuggestion._meta.db_table} (user_id, suggestion_id, mutual_friends, interactions) "
+        "SELECT user_id, suggestion_id, mutual_friends, interactions FROM ("
+        "SELECT candidate.user_id, candidate.suggestion_id, "
+        "SUM(candidate.mutual_friends) AS mutual_friends, SUM(candidate.interactions) AS interactions, "
+        "ROW_NUMBER() OVER (PARTITION BY candidate.user_id "
+        "ORDER BY SUM(candidate.mutual_friends) DESC, SUM(candidate.interactions) DESC, candidate.suggestion_id) "
+        "AS position "
+        "FROM ("
+        "SELECT mine.from_telegramuser_id AS user_id, theirs.to_telegramuser_id AS suggestion_id, "
+        "COUNT(*) AS mutual_friends, 0 AS interactions "
+        f"FROM {_FRIENDS} mine "
+        f"JOIN {_FRIENDS} theirs ON theirs.from_telegramuser_id = mine.to_telegramuser_id "
+        "WHERE mine.from_telegramuser_id = ANY(%s) AND theirs.to_telegramuser_id <> mine.from_telegramuser_id "
+        "GROUP BY mine.from_telegramuser_id, theirs.to_telegramuser_id "
+        "UNION ALL "
+        "SELECT user_id, counterparty_id, 0, count "
+        f"FROM {Counterparty._meta.db_table} WHERE user_id = ANY(%s)"
+        ") candidate "
+        f"WHERE NOT EXISTS (SELECT 1 FROM {_FRIENDS} friend "
+        "WHERE friend.from_telegramuser_id = candidate.user_id AND friend.to_telegramuser_id = candidate.suggestion_id) "
+        f"AND NOT EXISTS (SELECT 1 FROM {FriendRequest._meta.db_table} request "
+        "WHERE request.source_id = candidate.user_id AND request.destination_id = candidate.suggestion_id) "
+        "GROUP BY candidate.user_id, candidate.suggestion_id"
+        ") ranked "
+        "WHERE position <= %s"
+    )
+
+    def rebuild(self, user_ids: List[int], limit: int) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(self._CLEAR, [user_ids])
+            cursor.execute(self._BUILD, [user_ids, user_ids, limit])
+
+            return cursor.rowcount
+
+    def get_suggestions(self, user_id: Union[int, str], limit: int) -> List[FriendSuggestion]:
+        return list(
+            FriendSuggestion.objects.filter(user_id=user_id)
+            .filter(
+                ~Exists(
+                    TelegramUser.friends.through.objects.filter(
+                        from_telegramuser_id=OuterRef("user_id"), to_telegramuser_id=OuterRef("suggestion_id")
+                    )
+                ),
+                ~Exists(
+                    FriendRequest.objects.filter(
+                        source_id=OuterRef("user_id"), destination_id=OuterRef("suggestion_id")
+                    )
+                ),
+            )
+            .select_related("suggestion")
+            .order_by("-mutual_friends", "-interactions")[:limit]
+        )
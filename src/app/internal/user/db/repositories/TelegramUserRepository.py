@@ -1,24 +1,50 @@
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Set, Tuple, Union
 
 from django.conf import settings
+from django.db import connection
 from django.db.models import QuerySet
 
+from app.internal.general.db.KeysetPage import KeysetPage
+from app.internal.general.db.replicas import read_replica
 from app.internal.user.db.models import TelegramUser
 from app.internal.user.db.repositories.TelegramUserFields import TelegramUserFields
 from app.internal.user.domain.interfaces import IFriendRepository, ITelegramUserRepository
 
 
 class TelegramUserRepository(ITelegramUserRepository, IFriendRepository):
+    _FRIEND_PROJECTION = (
+        TelegramUserFields.ID,
+        TelegramUserFields.USERNAME,
+        TelegramUserFields.FIRST_NAME,
+        TelegramUserFields.LAST_NAME,
+        TelegramUserFields.PHONE,
+    )
+    _UPSERT = (
+        f"INSERT INTO {TelegramUser._meta.db_table} AS users (id, username, first_name, last_name) VALUES {{values}} "
+        "ON CONFLICT (id) DO UPDATE SET "
+        "username = EXCLUDED.username, first_name = EXCLUDED.first_name, last_name = EXCLUDED.last_name "
+        "WHERE (users.username, users.first_name, users.last_name) "
+        "IS DISTINCT FROM (EXCLUDED.username, EXCLUDED.first_name, EXCLUDED.last_name) "
+        "RETURNING users.id, users.xmax = 0"
+    )
+    _UPSERT_VALUES = "(%s, %s, %s, %s)"
+
     def try_add_or_update_user(self, user_id: Union[int, str], username: str, first_name: str, last_name: str) -> bool:
-        attributes = {
-            TelegramUserFields.USERNAME: username,
-            TelegramUserFields.FIRST_NAME: first_name,
-            TelegramUserFields.LAST_NAME: last_name,
-        }
+        return int(user_id) in self.add_or_update_users([(int(user_id), username, first_name, last_name)])
+
+    def add_or_update_users(self, profiles: Iterable[Tuple[int, str, str, Optional[str]]]) -> Set[int]:
+        latest = {profile[0]: profile for profile in profiles}
+
+        if not latest:
+            return set()
+
+        values = ", ".join([self._UPSERT_VALUES] * len(latest))
+        params = [value for profile in latest.values() for value in profile]
 
-        obj, was_added = TelegramUser.objects.update_or_create(id=user_id, defaults=attributes)
+        with connection.cursor() as cursor:
+            cursor.execute(self._UPSERT.format(values=values), params)
 
-        return was_added
+            return {user_id for user_id, was_added in cursor.fetchall() if was_added}
 
     def get_user(self, identifier: Union[int, str]) -> TelegramUser:
         param = (
@@ -44,9 +70,45 @@ class TelegramUserRepository(ITelegramUserRepository, IFriendRepository):
     def get_friends(self, user_id: Union[int, str]) -> QuerySet[TelegramUser]:
         return TelegramUser.objects.filter(friends__id=user_id).all()
 
+    def get_friends_page(
+        self, user_id: Union[int, str], size: int, after: Optional[str] = None, before: Optional[str] = None
+    ) -> KeysetPage[TelegramUser]:
+        return KeysetPage.from_queryset(
+            TelegramUser.objects.filter(friends__id=user_id), TelegramUserFields.USERNAME, size, after, before
+        )
+
+    def search_friends(
+        self,
+        user_id: Union[int, str],
+        size: int,
+        prefix: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage[dict]:
+        friends = TelegramUser.objects.filter(friends__id=user_id)
+
+        if prefix:
+            friends = friends.filter(username__istartswith=prefix)
+
+        return KeysetPage.from_queryset(
+            friends.values(*self._FRIEND_PROJECTION), TelegramUserFields.USERNAME, size, after, before
+        )
+
     def is_friend_exists(self, user_id: Union[int, str], friend_id: Union[int, str]) -> bool:
         return TelegramUser.objects.filter(id=user_id, friends__id=friend_id).exists()
 
+    def add_all(self, user_id: Union[int, str], friend_ids: Iterable[int]) -> None:
+        friendship = TelegramUser.friends.through
+
+        friendship.objects.bulk_create(
+            (
+                friendship(from_telegramuser_id=source_id, to_telegramuser_id=destination_id)
+                for friend_id in friend_ids
+                for source_id, destination_id in ((user_id, friend_id), (friend_id, user_id))
+            ),
+            ignore_conflicts=True,
+        )
+
     def remove(self, source: TelegramUser, friend: TelegramUser) -> None:
         source.friends.remove(friend)
 
@@ -56,9 +118,18 @@ class TelegramUserRepository(ITelegramUserRepository, IFriendRepository):
     def update_password(self, user_id: Union[int, str], value: str) -> None:
         TelegramUser.objects.filter(id=user_id).update(password=self._hash(value))
 
+    @read_replica()
     def get_user_amount(self) -> int:
         return TelegramUser.objects.count()
 
+    def get_user_ids(self, size: int, after: Optional[int] = None) -> List[int]:
+        users = TelegramUser.objects.order_by("id")
+
+        if after is not None:
+            users = users.filter(id__gt=after)
+
+        return list(users.values_list("id", flat=True)[:size])
+
     @staticmethod
     def _hash(password: str) -> str:
         return settings.HASHER.encode(password, settings.SALT)
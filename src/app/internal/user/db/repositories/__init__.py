@@ -1,3 +1,5 @@
+from .CounterpartyRepository import CounterpartyRepository
 from .FriendRequestRepository import FriendRequestRepository
+from .FriendSuggestionRepository import FriendSuggestionRepository
 from .SecretKeyRepository import SecretKeyRepository
 from .TelegramUserRepository import TelegramUserRepository
@@ -1,5 +1,42 @@
+from typing import List, Optional
+
+from django.conf import settings
 from ninja import Schema
+from pydantic import Field, conint
+
+from app.internal.user.domain.entities.user import TelegramUserOut
+
+FriendPageLimit = conint(ge=1, le=settings.REST_FRIENDS_MAX_PAGE_SIZE)
 
 
 class FriendRequestOut(Schema):
     username: str
+
+
+class FriendRequestsIn(Schema):
+    usernames: Optional[List[str]] = Field(None, max_items=settings.REST_FRIENDS_MAX_PAGE_SIZE)
+
+
+class FriendRequestsOut(Schema):
+    usernames: List[str]
+
+
+class FriendSuggestionOut(Schema):
+    id: int
+    username: str
+    first_name: str
+    last_name: Optional[str]
+    mutual_friends: int
+    interactions: int
+
+
+class FriendPageOut(Schema):
+    items: List[TelegramUserOut]
+    previous: Optional[str]
+    next: Optional[str]
+
+
+class FriendRequestPageOut(Schema):
+    items: List[FriendRequestOut]
+    previous: Optional[str]
+    next: Optional[str]
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Union
+
+from app.internal.user.db.models import TelegramUser
+
+
+class ICounterpartyRepository(ABC):
+    @abstractmethod
+    def record(self, source_number: str, destination_number: str, moment: datetime) -> None:
+        pass
+
+    @abstractmethod
+    def get_counterparty_usernames(self, user_id: Union[int, str]) -> List[str]:
+        pass
+
+    @abstractmethod
+    def get_recent_recipients(self, user_id: Union[int, str], limit: int) -> List[TelegramUser]:
+        pass
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 from django.db.models import QuerySet
 
+from app.internal.general.db.KeysetPage import KeysetPage
 from app.internal.user.db.models import TelegramUser
 
 
@@ -15,10 +16,31 @@ class IFriendRepository(ABC):
     def get_friends(self, user_id: Union[int, str]) -> QuerySet[TelegramUser]:
         pass
 
+    @abstractmethod
+    def get_friends_page(
+        self, user_id: Union[int, str], size: int, after: Optional[str] = None, before: Optional[str] = None
+    ) -> KeysetPage[TelegramUser]:
+        pass
+
+    @abstractmethod
+    def search_friends(
+        self,
+        user_id: Union[int, str],
+        size: int,
+        prefix: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage[dict]:
+        pass
+
     @abstractmethod
     def is_friend_exists(self, user_id: Union[int, str], friend_id: Union[int, str]) -> bool:
         pass
 
+    @abstractmethod
+    def add_all(self, user_id: Union[int, str], friend_ids: Iterable[int]) -> None:
+        pass
+
     @abstractmethod
     def remove(self, source: TelegramUser, friend: TelegramUser) -> None:
         pass
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 
 from django.db.models import QuerySet
 
+from app.internal.general.db.KeysetPage import KeysetPage
 from app.internal.user.db.models import FriendRequest, TelegramUser
 
 
@@ -24,5 +25,22 @@ class IFriendRequestRepository(ABC):
         pass
 
     @abstractmethod
-    def get_usernames_to_friends(self, user_id: Union[int, str]) -> QuerySet[str]:
+    def remove_all(self, destination_id: Union[int, str], usernames: Optional[List[str]] = None) -> Dict[int, str]:
+        pass
+
+    @abstractmethod
+    def get_requesters_page(
+        self, user_id: Union[int, str], size: int, after: Optional[str] = None, before: Optional[str] = None
+    ) -> KeysetPage[TelegramUser]:
+        pass
+
+    @abstractmethod
+    def search_requesters(
+        self,
+        user_id: Union[int, str],
+        size: int,
+        prefix: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage[dict]:
         pass
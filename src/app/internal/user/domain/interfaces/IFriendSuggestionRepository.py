@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import List, Union
+
+from app.internal.user.db.models import FriendSuggestion
+
+
+class IFriendSuggestionRepository(ABC):
+    @abstractmethod
+    def rebuild(self, user_ids: List[int], limit: int) -> int:
+        pass
+
+    @abstractmethod
+    def get_suggestions(self, user_id: Union[int, str], limit: int) -> List[FriendSuggestion]:
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Set, Tuple, Union
 
 from app.internal.user.db.models import TelegramUser
 
@@ -9,6 +9,10 @@ class ITelegramUserRepository(ABC):
     def try_add_or_update_user(self, user_id: Union[int, str], username: str, first_name: str, last_name: str) -> bool:
         pass
 
+    @abstractmethod
+    def add_or_update_users(self, profiles: Iterable[Tuple[int, str, str, Optional[str]]]) -> Set[int]:
+        pass
+
     @abstractmethod
     def get_user(self, identifier: Union[int, str]) -> Optional[TelegramUser]:
         pass
@@ -24,3 +28,7 @@ class ITelegramUserRepository(ABC):
     @abstractmethod
     def get_user_amount(self) -> int:
         pass
+
+    @abstractmethod
+    def get_user_ids(self, size: int, after: Optional[int] = None) -> List[int]:
+        pass
@@ -1,4 +1,6 @@
+from .ICounterpartyRepository import ICounterpartyRepository
 from .IFriendRepository import IFriendRepository
 from .IFriendRequestRepository import IFriendRequestRepository
+from .IFriendSuggestionRepository import IFriendSuggestionRepository
 from .ISecretKeyRepository import ISecretKeyRepository
 from .ITelegramUserRepository import ITelegramUserRepository
@@ -1,19 +1,33 @@
-from typing import Union
+from typing import Dict, List, Optional, Union
 
 from django.db import IntegrityError, transaction
 from django.db.models import QuerySet
 from telegram import User
 
+from app.internal.general.db.KeysetPage import KeysetPage
 from app.internal.user.db.models import TelegramUser
-from app.internal.user.domain.interfaces import IFriendRequestRepository
+from app.internal.user.domain.interfaces import IFriendRepository, IFriendRequestRepository
 
 
 class FriendRequestService:
-    def __init__(self, request_repo: IFriendRequestRepository):
+    def __init__(self, request_repo: IFriendRequestRepository, friend_repo: IFriendRepository):
         self._request_repo = request_repo
+        self._friend_repo = friend_repo
 
-    def get_usernames_to_friends(self, user: Union[User, TelegramUser]) -> QuerySet[str]:
-        return self._request_repo.get_usernames_to_friends(user.id)
+    def get_requesters_page(
+        self, user: Union[User, TelegramUser], size: int, after: Optional[str] = None, before: Optional[str] = None
+    ) -> KeysetPage[TelegramUser]:
+        return self._request_repo.get_requesters_page(user.id, size, after, before)
+
+    def search_requesters(
+        self,
+        user: Union[User, TelegramUser],
+        size: int,
+        prefix: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage[dict]:
+        return self._request_repo.search_requesters(user.id, size, prefix, after, before)
 
     def try_create(self, source: TelegramUser, destination: TelegramUser) -> bool:
         if self._request_repo.exists(source, destination):
@@ -40,3 +54,13 @@ class FriendRequestService:
             return False
 
         return True
+
+    def accept_all(self, user: Union[User, TelegramUser], usernames: Optional[List[str]] = None) -> Dict[int, str]:
+        with transaction.atomic():
+            accepted = self._request_repo.remove_all(user.id, usernames)
+            self._friend_repo.add_all(user.id, accepted)
+
+        return accepted
+
+    def reject_all(self, user: Union[User, TelegramUser], usernames: Optional[List[str]] = None) -> Dict[int, str]:
+        return self._request_repo.remove_all(user.id, usernames)
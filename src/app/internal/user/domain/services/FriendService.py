@@ -1,23 +1,41 @@
-from typing import Dict, Union
+from typing import List, Optional, Union
 
 from django.db.models import QuerySet
+from telegram import User
 
+from app.internal.general.db.KeysetPage import KeysetPage
 from app.internal.user.db.models import TelegramUser
-from app.internal.user.domain.interfaces import IFriendRepository
+from app.internal.user.domain.interfaces import ICounterpartyRepository, IFriendRepository
 
 
 class FriendService:
-    def __init__(self, friend_repo: IFriendRepository):
+    def __init__(self, friend_repo: IFriendRepository, counterparty_repo: ICounterpartyRepository):
         self._friend_repo = friend_repo
+        self._counterparty_repo = counterparty_repo
 
-    def get_friend(self, user: TelegramUser, friend_identifier: Union[int, str]):
+    def get_friend(self, user: Union[User, TelegramUser], friend_identifier: Union[int, str]):
         return self._friend_repo.get_friend(user.id, friend_identifier)
 
-    def get_friends(self, user: TelegramUser) -> QuerySet[TelegramUser]:
+    def get_friends(self, user: Union[User, TelegramUser]) -> QuerySet[TelegramUser]:
         return self._friend_repo.get_friends(user.id)
 
-    def get_friends_as_dict(self, user: TelegramUser) -> Dict[int, TelegramUser]:
-        return dict((num, friend) for num, friend in enumerate(self._friend_repo.get_friends(user.id), 1))
+    def get_friends_page(
+        self, user: Union[User, TelegramUser], size: int, after: Optional[str] = None, before: Optional[str] = None
+    ) -> KeysetPage[TelegramUser]:
+        return self._friend_repo.get_friends_page(user.id, size, after, before)
+
+    def search_friends(
+        self,
+        user: Union[User, TelegramUser],
+        size: int,
+        prefix: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> KeysetPage[dict]:
+        return self._friend_repo.search_friends(user.id, size, prefix, after, before)
+
+    def get_recent_recipients(self, user: Union[User, TelegramUser], limit: int) -> List[TelegramUser]:
+        return self._counterparty_repo.get_recent_recipients(user.id, limit)
 
     def remove_from_friends(self, source: TelegramUser, friend: TelegramUser) -> None:
         self._friend_repo.remove(source, friend)
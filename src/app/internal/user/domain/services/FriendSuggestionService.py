@@ -0,0 +1,31 @@
+from typing import List, Union
+
+from django.db import transaction
+from telegram import User
+
+from app.internal.metrics import FRIEND_SUGGESTIONS_BUILT
+from app.internal.user.db.models import FriendSuggestion, TelegramUser
+from app.internal.user.domain.interfaces import IFriendSuggestionRepository, ITelegramUserRepository
+
+
+class FriendSuggestionService:
+    def __init__(self, suggestion_repo: IFriendSuggestionRepository, user_repo: ITelegramUserRepository):
+        self._suggestion_repo = suggestion_repo
+        self._user_repo = user_repo
+
+    def rebuild(self, batch_size: int, limit: int) -> int:
+        built = 0
+        user_ids = self._user_repo.get_user_ids(batch_size)
+
+        while user_ids:
+            with transaction.atomic():
+                built += self._suggestion_repo.rebuild(user_ids, limit)
+
+            user_ids = self._user_repo.get_user_ids(batch_size, after=user_ids[-1])
+
+        FRIEND_SUGGESTIONS_BUILT.inc(built)
+
+        return built
+
+    def get_suggestions(self, user: Union[User, TelegramUser], limit: int) -> List[FriendSuggestion]:
+        return self._suggestion_repo.get_suggestions(user.id, limit)
@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Iterable, Optional, Set, Tuple, Union
 
 from django.conf import settings
 from django.db import IntegrityError, transaction
@@ -20,6 +20,22 @@ class TelegramUserService:
     def try_add_or_update_user(self, user: User) -> bool:
         return self._user_repo.try_add_or_update_user(user.id, user.username, user.first_name, user.last_name)
 
+    def refresh_users(self, users: Iterable[User]) -> Set[int]:
+        profiles = [(user.id, user.username, user.first_name, user.last_name) for user in users if user.username]
+
+        try:
+            with transaction.atomic():
+                return self._user_repo.add_or_update_users(profiles)
+        except IntegrityError:
+            return {user_id for profile in profiles for user_id in self._try_refresh_user(profile)}
+
+    def _try_refresh_user(self, profile: Tuple[int, str, str, Optional[str]]) -> Set[int]:
+        try:
+            with transaction.atomic():
+                return self._user_repo.add_or_update_users([profile])
+        except IntegrityError:
+            return set()
+
     def get_user(self, identifier: Union[int, str]) -> Optional[TelegramUser]:
         return self._user_repo.get_user(identifier)
 
@@ -1,3 +1,4 @@
 from .FriendRequestService import FriendRequestService
 from .FriendService import FriendService
+from .FriendSuggestionService import FriendSuggestionService
 from .TelegramUserService import TelegramUserService
@@ -1,33 +1,83 @@
-from typing import List
+from typing import List, Optional
 
+from django.conf import settings
 from django.http import HttpRequest
 
+from app.internal.general.budget import query_budget
+from app.internal.general.db.replicas import read_replica
 from app.internal.general.rest.exceptions import BadRequestException, NotFoundException
 from app.internal.general.rest.responses import SuccessResponse
 from app.internal.user.db.models import TelegramUser
-from app.internal.user.domain.entities.friends import FriendRequestOut
+from app.internal.user.domain.entities.friends import (
+    FriendPageLimit,
+    FriendPageOut,
+    FriendRequestPageOut,
+    FriendRequestsIn,
+    FriendRequestsOut,
+    FriendSuggestionOut,
+)
 from app.internal.user.domain.entities.user import TelegramUserOut
-from app.internal.user.domain.services import FriendRequestService, FriendService, TelegramUserService
+from app.internal.user.domain.services import (
+    FriendRequestService,
+    FriendService,
+    FriendSuggestionService,
+    TelegramUserService,
+)
 
 
 class FriendHandlers:
     def __init__(
-        self, user_service: TelegramUserService, friend_service: FriendService, request_service: FriendRequestService
+        self,
+        user_service: TelegramUserService,
+        friend_service: FriendService,
+        request_service: FriendRequestService,
+        suggestion_service: FriendSuggestionService,
     ):
         self._user_service = user_service
         self._friend_service = friend_service
         self._request_service = request_service
-
-    def get_friends(self, request: HttpRequest) -> List[TelegramUserOut]:
-        friends = self._friend_service.get_friends(request.telegram_user)
-
-        return [TelegramUserOut.from_orm(friend) for friend in friends]
-
+        self._suggestion_service = suggestion_service
+
+    @query_budget(2)
+    @read_replica()
+    def get_friends(
+        self,
+        request: HttpRequest,
+        prefix: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        limit: FriendPageLimit = settings.REST_FRIENDS_PAGE_SIZE,
+    ) -> FriendPageOut:
+        page = self._friend_service.search_friends(request.telegram_user, limit, prefix, after, before)
+
+        return FriendPageOut(items=page.items, previous=page.previous_cursor, next=page.next_cursor)
+
+    @query_budget(2)
+    @read_replica()
+    def get_friend_suggestions(self, request: HttpRequest) -> List[FriendSuggestionOut]:
+        suggestions = self._suggestion_service.get_suggestions(
+            request.telegram_user, settings.FRIEND_SUGGESTIONS_PER_USER
+        )
+
+        return [
+            FriendSuggestionOut(
+                id=suggestion.suggestion.id,
+                username=suggestion.suggestion.username,
+                first_name=suggestion.suggestion.first_name,
+                last_name=suggestion.suggestion.last_name,
+                mutual_friends=suggestion.mutual_friends,
+                interactions=suggestion.interactions,
+            )
+            for suggestion in suggestions
+        ]
+
+    @query_budget(2)
     def get_friend(self, request: HttpRequest, identifier: str) -> TelegramUserOut:
         friend = self._try_get_friend(request, identifier)
 
         return TelegramUserOut.from_orm(friend)
 
+    @query_budget(3)
     def remove_friend(self, request: HttpRequest, identifier: str) -> SuccessResponse:
         friend = self._try_get_friend(request, identifier)
 
@@ -35,6 +85,7 @@ class FriendHandlers:
 
         return SuccessResponse()
 
+    @query_budget(5)
     def add_friend(self, request: HttpRequest, identifier: str) -> SuccessResponse:
         user = self._try_get_user(identifier)
 
@@ -46,11 +97,21 @@ class FriendHandlers:
 
         return SuccessResponse()
 
-    def get_friend_requests(self, request: HttpRequest) -> List[FriendRequestOut]:
-        usernames = self._request_service.get_usernames_to_friends(request.telegram_user)
-
-        return [FriendRequestOut(username=username) for username in usernames]
-
+    @query_budget(2)
+    @read_replica()
+    def get_friend_requests(
+        self,
+        request: HttpRequest,
+        prefix: Optional[str] = None,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        limit: FriendPageLimit = settings.REST_FRIENDS_PAGE_SIZE,
+    ) -> FriendRequestPageOut:
+        page = self._request_service.search_requesters(request.telegram_user, limit, prefix, after, before)
+
+        return FriendRequestPageOut(items=page.items, previous=page.previous_cursor, next=page.next_cursor)
+
+    @query_budget(8)
     def accept_friend_request(self, request: HttpRequest, identifier: str) -> SuccessResponse:
         user = self._try_get_user(identifier)
 
@@ -59,6 +120,19 @@ class FriendHandlers:
 
         return SuccessResponse()
 
+    @query_budget(5)
+    def accept_friend_requests(self, request: HttpRequest, requests: FriendRequestsIn) -> FriendRequestsOut:
+        accepted = self._request_service.accept_all(request.telegram_user, requests.usernames)
+
+        return FriendRequestsOut(usernames=list(accepted.values()))
+
+    @query_budget(2)
+    def reject_friend_requests(self, request: HttpRequest, requests: FriendRequestsIn) -> FriendRequestsOut:
+        rejected = self._request_service.reject_all(request.telegram_user, requests.usernames)
+
+        return FriendRequestsOut(usernames=list(rejected.values()))
+
+    @query_budget(3)
     def reject_friend_request(self, request: HttpRequest, identifier: str) -> SuccessResponse:
         user = self._try_get_user(identifier)
 
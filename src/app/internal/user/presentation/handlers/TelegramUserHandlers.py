@@ -1,6 +1,7 @@
 from django.http import HttpRequest
 from ninja import Body
 
+from app.internal.general.budget import query_budget
 from app.internal.general.rest.exceptions import BadRequestException, IntegrityException
 from app.internal.general.rest.responses import SuccessResponse
 from app.internal.user.domain.entities.user import PasswordIn, PhoneIn, TelegramUserOut
@@ -11,11 +12,13 @@ class TelegramUserHandlers:
     def __init__(self, user_service: TelegramUserService):
         self._user_service = user_service
 
+    @query_budget(2)
     def get_about_me(self, request: HttpRequest) -> TelegramUserOut:
         user = self._user_service.get_user(request.telegram_user.id)
 
         return TelegramUserOut.from_orm(user)
 
+    @query_budget(4)
     def update_phone(self, request: HttpRequest, body: PhoneIn = Body(...)) -> PhoneIn:
         if not self._user_service.try_set_phone(request.telegram_user.id, body.phone):
             raise BadRequestException("Invalid phone")
@@ -24,6 +27,7 @@ class TelegramUserHandlers:
 
         return PhoneIn.from_orm(user)
 
+    @query_budget(3)
     def update_password(self, request: HttpRequest, body: PasswordIn = Body(...)) -> SuccessResponse:
         if not self._user_service.is_secret_key_correct(request.telegram_user, body.key):
             raise BadRequestException("Wrong secret key")
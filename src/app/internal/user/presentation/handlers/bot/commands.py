@@ -1,7 +1,10 @@
 from telegram import Update
 from telegram.ext import CallbackContext, CommandHandler
 
+from app.internal.general.bot.BotContext import BotContext
 from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
+from app.internal.general.budget import query_budget
+from app.internal.general.db.replicas import read_replica
 from app.internal.general.services import transaction_service, user_service
 from app.internal.user.db.models import TelegramUser
 
@@ -14,6 +17,7 @@ _RELATION_POINT = "{number}) {username}"
 _RELATION_LIST_EMPTY = "Похоже, что вы в танке... и ни с кеми не взаимодействовали"
 
 
+@query_budget(1)
 @is_message_defined
 def handle_start(update: Update, context: CallbackContext) -> None:
     user = update.effective_user
@@ -25,20 +29,23 @@ def handle_start(update: Update, context: CallbackContext) -> None:
     update.message.reply_text(message)
 
 
+@query_budget(2)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
-def handle_me(update: Update, context: CallbackContext) -> None:
-    user = user_service.get_user(update.effective_user.id)
+def handle_me(update: Update, context: BotContext) -> None:
+    user = context.telegram_user
 
     message = get_user_details(user)
 
     update.message.reply_text(message)
 
 
+@query_budget(2)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
+@read_replica()
 def handle_relations(update: Update, context: CallbackContext) -> None:
     usernames = list(enumerate(transaction_service.get_related_usernames(update.effective_user.id), start=1))
 
@@ -1,9 +1,11 @@
 from telegram import Update
 from telegram.ext import CallbackContext, CommandHandler, ConversationHandler, MessageHandler
 
+from app.internal.general.bot.BotContext import BotContext
 from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
 from app.internal.general.bot.filters import TEXT
 from app.internal.general.bot.handlers import cancel, mark_conversation_end, mark_conversation_start
+from app.internal.general.budget import query_budget
 from app.internal.general.services import friend_service, request_service, user_service
 from app.internal.user.db.models import TelegramUser
 from app.internal.user.presentation.handlers.bot.friends.FriendStates import FriendStates
@@ -17,6 +19,7 @@ _REQUEST_SUCCESS = "Заявка отправлена! Да прибудет д
 _NOTIFICATION_MESSAGE = "С вами хочет познакомиться {username} ({name}). Используйте команду /accept"
 
 
+@query_budget(1)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
@@ -28,11 +31,12 @@ def handle_add_friend_start(update: Update, context: CallbackContext) -> int:
     return FriendStates.INPUT
 
 
+@query_budget(5)
 @is_message_defined
-def handle_add_friend(update: Update, context: CallbackContext) -> int:
+def handle_add_friend(update: Update, context: BotContext) -> int:
     friend_identifier = "".join(update.message.text)
 
-    user = user_service.get_user(update.effective_user.id)
+    user = context.telegram_user
     friend = user_service.get_user(friend_identifier)
 
     if user == friend:
@@ -74,4 +78,6 @@ add_friend_conversation = ConversationHandler(
     entry_points=[entry_point],
     states={FriendStates.INPUT: [MessageHandler(TEXT, handle_add_friend)]},
     fallbacks=[cancel],
+    name="add",
+    persistent=True,
 )
@@ -1,43 +1,190 @@
-from telegram import Update
-from telegram.ext import CallbackContext, CommandHandler
+import logging
+from functools import partial
+from time import sleep
+from typing import Dict
 
-from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
-from app.internal.general.services import friend_service, request_service, user_service
+from django.conf import settings
+from telegram import Bot, Update
+from telegram.error import RetryAfter, TelegramError
+from telegram.ext import CallbackContext, CallbackQueryHandler, CommandHandler
+
+from app.internal.general.bot.decorators import (
+    authorize_user,
+    is_callback_query_defined,
+    is_message_defined,
+    is_not_user_in_conversation,
+)
+from app.internal.general.bot.handlers import run_in_background
+from app.internal.general.bot.pagination import fetch_page, get_page_pattern, send_page, send_text
+from app.internal.general.budget import query_budget
+from app.internal.general.services import friend_service, request_service, suggestion_service
 from app.internal.user.presentation.handlers.bot.commands import get_user_details
+from app.internal.user.presentation.handlers.bot.friends.accept_conversation import (
+    get_notification as get_accept_notification,
+)
+from app.internal.user.presentation.handlers.bot.friends.reject_conversation import (
+    get_notification as get_reject_notification,
+)
+
+logger = logging.getLogger(__name__)
+
+_NOTIFY_ATTEMPTS = 3
 
 _USER_NOT_FOUND_ERROR = "В нашей базе нет такого пользователя!"
 _LIST_EMPTY_ERROR = "У вас пока что нет друзей:("
+_FRIENDS_WELCOME = "Ваши друзья:\n\n"
 _STUPID_CHOICE_SELF_ERROR = "Это же ваш профиль!"
 
 _FRIENDSHIP_WELCOME = "Список заявок в друзья:\n\n"
 _FRIENDSHIPS_EMPTY = "На данный момент нет заявок в друзья :("
 
+_ACCEPT_ALL_SUCCESS = "Ураа. Теперь вы друзья с:\n\n{usernames}"
+_REJECT_ALL_SUCCESS = "Заявки улетели в далёкие края:\n\n{usernames}"
+
+_SUGGESTIONS_WELCOME = "Возможно, вы знакомы (добавить можно через /add):\n\n"
+_SUGGESTION_POINT = "{username} — общих друзей: {mutual_friends}, переводов: {interactions}"
+_SUGGESTIONS_EMPTY = "Пока некого предложить :("
 
+_FRIENDS_PREFIX = "friends"
+_FRIENDSHIPS_PREFIX = "friendships"
+
+
+@query_budget(2)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
 def handle_friends(update: Update, context: CallbackContext) -> None:
-    user = user_service.get_user(update.effective_user.id)
+    _send_friends_page(update, context)
 
-    friends = friend_service.get_friends(user)
-    if len(friends) == 0:
-        update.message.reply_text(_LIST_EMPTY_ERROR)
-        return
 
-    for details in map(get_user_details, friends):
-        update.message.reply_text(details)
+@query_budget(2)
+@is_callback_query_defined
+@is_not_user_in_conversation
+def handle_friends_page(update: Update, context: CallbackContext) -> None:
+    _send_friends_page(update, context)
 
 
+@query_budget(2)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
 def handle_friendships(update: Update, context: CallbackContext) -> None:
-    usernames = request_service.get_usernames_to_friends(update.effective_user)
+    _send_friendships_page(update, context)
+
+
+@query_budget(2)
+@is_callback_query_defined
+@is_not_user_in_conversation
+def handle_friendships_page(update: Update, context: CallbackContext) -> None:
+    _send_friendships_page(update, context)
+
+
+@query_budget(2)
+@is_message_defined
+@authorize_user()
+@is_not_user_in_conversation
+def handle_suggestions(update: Update, context: CallbackContext) -> None:
+    suggestions = suggestion_service.get_suggestions(update.effective_user, settings.FRIEND_SUGGESTIONS_PER_USER)
+
+    if not suggestions:
+        update.message.reply_text(_SUGGESTIONS_EMPTY)
+        return
+
+    points = (
+        _SUGGESTION_POINT.format(
+            username=suggestion.suggestion.username,
+            mutual_friends=suggestion.mutual_friends,
+            interactions=suggestion.interactions,
+        )
+        for suggestion in suggestions
+    )
+
+    update.message.reply_text(_SUGGESTIONS_WELCOME + "\n".join(points))
+
+
+@query_budget(5)
+@is_message_defined
+@authorize_user()
+@is_not_user_in_conversation
+def handle_accept_all(update: Update, context: CallbackContext) -> None:
+    accepted = request_service.accept_all(update.effective_user, context.args or None)
+
+    if not accepted:
+        update.message.reply_text(_FRIENDSHIPS_EMPTY)
+        return
+
+    update.message.reply_text(_ACCEPT_ALL_SUCCESS.format(usernames="\n".join(accepted.values())))
+
+    text = get_accept_notification(update.effective_user)
+    run_in_background(_notify, context.bot, accepted, text)
+
+
+@query_budget(2)
+@is_message_defined
+@authorize_user()
+@is_not_user_in_conversation
+def handle_reject_all(update: Update, context: CallbackContext) -> None:
+    rejected = request_service.reject_all(update.effective_user, context.args or None)
+
+    if not rejected:
+        update.message.reply_text(_FRIENDSHIPS_EMPTY)
+        return
+
+    update.message.reply_text(_REJECT_ALL_SUCCESS.format(usernames="\n".join(rejected.values())))
+
+    text = get_reject_notification(update.effective_user)
+    run_in_background(_notify, context.bot, rejected, text)
+
+
+def _send_friends_page(update: Update, context: CallbackContext) -> None:
+    fetch = partial(friend_service.get_friends_page, update.effective_user, settings.BOT_FRIENDS_PAGE_SIZE)
+    page = fetch_page(update, context, fetch)
+
+    if not page:
+        send_text(update, _LIST_EMPTY_ERROR)
+        return
+
+    text = _FRIENDS_WELCOME + "\n".join(map(get_user_details, page.items))
+    send_page(update, context, _FRIENDS_PREFIX, text, page, [])
+
+
+def _send_friendships_page(update: Update, context: CallbackContext) -> None:
+    fetch = partial(request_service.get_requesters_page, update.effective_user, settings.BOT_FRIENDS_PAGE_SIZE)
+    page = fetch_page(update, context, fetch)
+
+    if not page:
+        send_text(update, _FRIENDSHIPS_EMPTY)
+        return
+
+    text = _FRIENDSHIP_WELCOME + "\n".join(user.username for user in page.items)
+    send_page(update, context, _FRIENDSHIPS_PREFIX, text, page, [])
+
+
+def _notify(bot: Bot, users: Dict[int, str], text: str) -> None:
+    for chat_id in users:
+        _try_notify(bot, chat_id, text)
+
+
+def _try_notify(bot: Bot, chat_id: int, text: str) -> None:
+    for _ in range(_NOTIFY_ATTEMPTS):
+        try:
+            bot.send_message(chat_id=chat_id, text=text)
+            return
+        except RetryAfter as error:
+            sleep(error.retry_after)
+        except TelegramError:
+            logger.warning("Could not notify chat id=%s", chat_id, exc_info=True)
+            return
 
-    update.message.reply_text(_FRIENDSHIP_WELCOME + "\n".join(usernames) if usernames else _FRIENDSHIPS_EMPTY)
+    logger.warning("Gave up notifying chat id=%s after %d attempts", chat_id, _NOTIFY_ATTEMPTS)
 
 
 friends_commands = [
     CommandHandler("friends", handle_friends),
+    CallbackQueryHandler(handle_friends_page, pattern=get_page_pattern(_FRIENDS_PREFIX)),
     CommandHandler("friendships", handle_friendships),
+    CallbackQueryHandler(handle_friendships_page, pattern=get_page_pattern(_FRIENDSHIPS_PREFIX)),
+    CommandHandler("suggestions", handle_suggestions),
+    CommandHandler("accept_all", handle_accept_all),
+    CommandHandler("reject_all", handle_reject_all),
 ]
@@ -1,28 +1,25 @@
+from functools import partial
+
+from django.conf import settings
 from telegram import Update
 from telegram.ext import CallbackContext
 
 from app.internal.general.bot.handlers import mark_conversation_end
+from app.internal.general.bot.pagination import fetch_page, get_choice_buttons, send_page, send_text
 from app.internal.general.services import request_service
 from app.internal.user.presentation.handlers.bot.friends.FriendStates import FriendStates
 
-_USERNAME_VARIANT = "{num}) {username}"
-
 
-def send_username_list(
-    update: Update, context: CallbackContext, list_empty_message: str, usernames_session: str, welcome: str
+def send_requester_page(
+    update: Update, context: CallbackContext, prefix: str, list_empty_message: str, welcome: str
 ) -> int:
-    usernames = request_service.get_usernames_to_friends(update.effective_user)
+    fetch = partial(request_service.get_requesters_page, update.effective_user, settings.BOT_FRIENDS_PAGE_SIZE)
+    page = fetch_page(update, context, fetch)
 
-    if not usernames:
-        update.message.reply_text(list_empty_message)
+    if not page:
+        send_text(update, list_empty_message)
         return mark_conversation_end(context)
 
-    username_list = dict((num, username) for num, username in enumerate(usernames, start=1))
-    context.user_data[usernames_session] = username_list
-
-    update.message.reply_text(
-        welcome
-        + "\n".join(_USERNAME_VARIANT.format(num=num, username=username) for num, username in username_list.items())
-    )
+    send_page(update, context, prefix, welcome, page, get_choice_buttons(prefix, page.items))
 
     return FriendStates.INPUT
@@ -1,47 +1,64 @@
 from telegram import Update
-from telegram.ext import CallbackContext, CommandHandler, ConversationHandler, MessageHandler
-
-from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
-from app.internal.general.bot.filters import INT
+from telegram.ext import CallbackContext, CallbackQueryHandler, CommandHandler, ConversationHandler
+
+from app.internal.general.bot.BotContext import BotContext
+from app.internal.general.bot.decorators import (
+    authorize_user,
+    is_callback_query_defined,
+    is_message_defined,
+    is_not_user_in_conversation,
+)
 from app.internal.general.bot.handlers import cancel, mark_conversation_end, mark_conversation_start
+from app.internal.general.bot.pagination import get_choice, get_choice_pattern, get_page_pattern
+from app.internal.general.budget import query_budget
 from app.internal.general.services import request_service, user_service
 from app.internal.user.db.models import TelegramUser
 from app.internal.user.presentation.handlers.bot.friends.FriendStates import FriendStates
-from app.internal.user.presentation.handlers.bot.friends.general import send_username_list
+from app.internal.user.presentation.handlers.bot.friends.general import send_requester_page
 
-_WELCOME = "Выберите из списка того, с кем не хотите иметь дело, либо /cancel:\n\n"
+_WELCOME = "Выберите из списка того, с кем не хотите иметь дело, либо /cancel:"
 _LIST_EMPTY = "На данный момент нет заявок в друзья :("
 _STUPID_CHOICE = "Нет такого в списке. Повторите попытку, либо /cancel"
 _FRIEND_CANCEL = "Приятель уже не хочет с вами дружить :( Выберите другого пользователя, либо /cancel"
 _REJECT_SUCCESS = "Заявка улетела в далёкие края"
 _REJECT_MESSAGE = "Пользователь {username} отменил вашу заявку в друзья :("
 
-_USERNAMES_SESSION = "username_list"
+_PREFIX = "reject"
 
 
+@query_budget(2)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
 def handle_reject_start(update: Update, context: CallbackContext) -> int:
     mark_conversation_start(context, entry_point.command)
 
-    return send_username_list(update, context, _LIST_EMPTY, _USERNAMES_SESSION, _WELCOME)
+    return send_requester_page(update, context, _PREFIX, _LIST_EMPTY, _WELCOME)
 
 
-@is_message_defined
-def handle_reject(update: Update, context: CallbackContext) -> int:
-    username = context.user_data[_USERNAMES_SESSION].get(int(update.message.text))
+@query_budget(2)
+@is_callback_query_defined
+def handle_reject_page(update: Update, context: CallbackContext) -> int:
+    return send_requester_page(update, context, _PREFIX, _LIST_EMPTY, _WELCOME)
+
+
+@query_budget(3)
+@is_callback_query_defined
+def handle_reject(update: Update, context: BotContext) -> int:
+    friend = user_service.get_user(get_choice(update))
+
+    update.callback_query.answer()
 
-    if not username:
-        update.message.reply_text(_STUPID_CHOICE)
+    if not friend:
+        update.effective_message.reply_text(_STUPID_CHOICE)
         return FriendStates.INPUT
 
-    user = user_service.get_user(update.effective_user.id)
-    friend = user_service.get_user(username)
+    user = context.telegram_user
 
     request_service.try_reject(friend, user)
 
-    update.message.reply_text(_REJECT_SUCCESS)
+    update.callback_query.edit_message_reply_markup(reply_markup=None)
+    update.effective_message.reply_text(_REJECT_SUCCESS)
     context.bot.send_message(chat_id=friend.id, text=get_notification(user))
 
     return mark_conversation_end(context)
@@ -57,7 +74,12 @@ entry_point = CommandHandler("reject", handle_reject_start)
 reject_conversation = ConversationHandler(
     entry_points=[entry_point],
     states={
-        FriendStates.INPUT: [MessageHandler(INT, handle_reject)],
+        FriendStates.INPUT: [
+            CallbackQueryHandler(handle_reject_page, pattern=get_page_pattern(_PREFIX)),
+            CallbackQueryHandler(handle_reject, pattern=get_choice_pattern(_PREFIX)),
+        ],
     },
     fallbacks=[cancel],
+    name="reject",
+    persistent=True,
 )
@@ -1,56 +1,73 @@
-from telegram import Update
-from telegram.ext import CallbackContext, CommandHandler, ConversationHandler, MessageHandler
+from functools import partial
 
-from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
-from app.internal.general.bot.filters import INT
+from django.conf import settings
+from telegram import Update
+from telegram.ext import CallbackContext, CallbackQueryHandler, CommandHandler, ConversationHandler
+
+from app.internal.general.bot.BotContext import BotContext
+from app.internal.general.bot.decorators import (
+    authorize_user,
+    is_callback_query_defined,
+    is_message_defined,
+    is_not_user_in_conversation,
+)
 from app.internal.general.bot.handlers import cancel, mark_conversation_end, mark_conversation_start
-from app.internal.general.services import friend_service, user_service
+from app.internal.general.bot.pagination import (
+    fetch_page,
+    get_choice,
+    get_choice_buttons,
+    get_choice_pattern,
+    get_page_pattern,
+    send_page,
+    send_text,
+)
+from app.internal.general.budget import query_budget
+from app.internal.general.services import friend_service
 from app.internal.user.db.models import TelegramUser
 from app.internal.user.presentation.handlers.bot.friends.FriendStates import FriendStates
 
-_WELCOME = "Выберите пользователя, который плохо себя ведёт, либо /cancel:\n\n"
+_WELCOME = "Выберите пользователя, который плохо себя ведёт, либо /cancel:"
 _LIST_EMPTY = "К сожалению, у вас нет друзей :("
 _REMOVE_SUCCESS = "Товарищ покинул ваш чат..."
 _REMOVE_MESSAGE = "Товарищ {username} оставил вас за бортом... Вы больше не друзья:("
 _STUPID_CHOICE = "Проверьте свои кракозябры и повторите попытку, либо /cancel"
-_FRIEND_VARIANT = "{num}) {username}"
 _REMOVE_ERROR = "Произошла ошибка"
 
-_USERNAMES_SESSION = "usernames"
-_USER_SESSION = "user"
+_PREFIX = "rm"
 
 
+@query_budget(2)
 @is_message_defined
 @authorize_user()
 @is_not_user_in_conversation
 def handle_rm_friend_start(update: Update, context: CallbackContext) -> int:
     mark_conversation_start(context, entry_point.command)
 
-    user = user_service.get_user(update.effective_user.id)
-    friends = friend_service.get_friends_as_dict(user)
+    return _send_friend_page(update, context)
 
-    context.user_data[_USERNAMES_SESSION] = friends
-    context.user_data[_USER_SESSION] = user
 
-    update.message.reply_text(
-        _WELCOME
-        + "\n".join(_FRIEND_VARIANT.format(num=num, username=friend.username) for num, friend in friends.items())
-    )
+@query_budget(2)
+@is_callback_query_defined
+def handle_rm_friend_page(update: Update, context: CallbackContext) -> int:
+    return _send_friend_page(update, context)
 
-    return FriendStates.INPUT
 
+@query_budget(3)
+@is_callback_query_defined
+def handle_rm_friend(update: Update, context: BotContext) -> int:
+    friend = friend_service.get_friend(update.effective_user, get_choice(update))
 
-@is_message_defined
-def handle_rm_friend(update: Update, context: CallbackContext) -> int:
-    user: TelegramUser = context.user_data[_USER_SESSION]
-    friend: TelegramUser = context.user_data[_USERNAMES_SESSION].get(int(update.message.text))
+    update.callback_query.answer()
 
     if not friend:
-        update.message.reply_text(_STUPID_CHOICE)
+        update.effective_message.reply_text(_STUPID_CHOICE)
         return FriendStates.INPUT
 
+    user = context.telegram_user
+
     friend_service.remove_from_friends(user, friend)
-    update.message.reply_text(_REMOVE_SUCCESS)
+    update.callback_query.edit_message_reply_markup(reply_markup=None)
+    update.effective_message.reply_text(_REMOVE_SUCCESS)
 
     context.bot.send_message(chat_id=friend.id, text=get_notification(user))
 
@@ -61,13 +78,31 @@ def get_notification(source: TelegramUser) -> str:
     return _REMOVE_MESSAGE.format(username=source.username)
 
 
+def _send_friend_page(update: Update, context: CallbackContext) -> int:
+    fetch = partial(friend_service.get_friends_page, update.effective_user, settings.BOT_FRIENDS_PAGE_SIZE)
+    page = fetch_page(update, context, fetch)
+
+    if not page:
+        send_text(update, _LIST_EMPTY)
+        return mark_conversation_end(context)
+
+    send_page(update, context, _PREFIX, _WELCOME, page, get_choice_buttons(_PREFIX, page.items))
+
+    return FriendStates.INPUT
+
+
 entry_point = CommandHandler("rm", handle_rm_friend_start)
 
 
 rm_friend_conversation = ConversationHandler(
     entry_points=[entry_point],
     states={
-        FriendStates.INPUT: [MessageHandler(INT, handle_rm_friend)],
+        FriendStates.INPUT: [
+            CallbackQueryHandler(handle_rm_friend_page, pattern=get_page_pattern(_PREFIX)),
+            CallbackQueryHandler(handle_rm_friend, pattern=get_choice_pattern(_PREFIX)),
+        ],
     },
     fallbacks=[cancel],
+    name="rm",
+    persistent=True,
 )
@@ -1,9 +1,11 @@
 from telegram import Update
 from telegram.ext import CallbackContext, CommandHandler, ConversationHandler, MessageHandler
 
+from app.internal.general.bot.BotContext import BotContext
 from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
 from app.internal.general.bot.filters import TEXT
 from app.internal.general.bot.handlers import cancel, mark_conversation_end, mark_conversation_start
+from app.internal.general.budget import query_budget
 from app.internal.general.services import user_service
 from app.internal.user.presentation.handlers.bot.password.PasswordStates import PasswordStates
 
@@ -25,13 +27,14 @@ _TIP_SESSION = "tip"
 _PASSWORD_SESSION = "password"
 
 
+@query_budget(2)
 @is_message_defined
 @authorize_user(phone=False)
 @is_not_user_in_conversation
-def handle_start(update: Update, context: CallbackContext) -> int:
+def handle_start(update: Update, context: BotContext) -> int:
     mark_conversation_start(context, entry_point.command)
 
-    user = user_service.get_user(update.effective_user.id)
+    user = context.telegram_user
 
     if user.password:
         update.message.reply_text(_UPDATING_WELCOME.format(tip=user.secret_key.tip))
@@ -41,6 +44,7 @@ def handle_start(update: Update, context: CallbackContext) -> int:
     return PasswordStates.SECRET_CREATING
 
 
+@query_budget(1)
 @is_message_defined
 def handle_confirmation_secret_key(update: Update, context: CallbackContext) -> int:
     update.message.delete()
@@ -54,6 +58,7 @@ def handle_confirmation_secret_key(update: Update, context: CallbackContext) ->
     return PasswordStates.PASSWORD_ENTERING_IN_UPDATING
 
 
+@query_budget(0)
 @is_message_defined
 def handle_entering_in_updating(update: Update, context: CallbackContext) -> int:
     _handle_entering(update, context)
@@ -61,6 +66,7 @@ def handle_entering_in_updating(update: Update, context: CallbackContext) -> int
     return PasswordStates.PASSWORD_CONFIRMATION_IN_UPDATING
 
 
+@query_budget(1)
 @is_message_defined
 def handle_confirmation_in_updating(update: Update, context: CallbackContext) -> int:
     status = _handle_confirmation(update, context)
@@ -73,6 +79,7 @@ def handle_confirmation_in_updating(update: Update, context: CallbackContext) ->
     return mark_conversation_end(context)
 
 
+@query_budget(0)
 @is_message_defined
 def handle_saving_secret_key(update: Update, context: CallbackContext) -> int:
     _handle_saving_secret_parameter(update, context, _SECRET_KEY_SESSION, update.message.text, _CREATE_TIP)
@@ -80,6 +87,7 @@ def handle_saving_secret_key(update: Update, context: CallbackContext) -> int:
     return PasswordStates.TIP_CREATING
 
 
+@query_budget(0)
 @is_message_defined
 def handle_saving_tip(update: Update, context: CallbackContext) -> int:
     _handle_saving_secret_parameter(update, context, _TIP_SESSION, update.message.text, _INPUT_PASSWORD)
@@ -87,6 +95,7 @@ def handle_saving_tip(update: Update, context: CallbackContext) -> int:
     return PasswordStates.PASSWORD_ENTERING_IN_CREATING
 
 
+@query_budget(0)
 @is_message_defined
 def handle_entering_in_creating(update: Update, context: CallbackContext) -> int:
     _handle_entering(update, context)
@@ -94,6 +103,7 @@ def handle_entering_in_creating(update: Update, context: CallbackContext) -> int
     return PasswordStates.PASSWORD_CONFIRMATION_IN_CREATING
 
 
+@query_budget(4)
 @is_message_defined
 def handle_confirmation_in_creating(update: Update, context: CallbackContext) -> int:
     status = _handle_confirmation(update, context)
@@ -156,4 +166,6 @@ password_conversation = ConversationHandler(
         PasswordStates.PASSWORD_CONFIRMATION_IN_CREATING: [MessageHandler(TEXT, handle_confirmation_in_creating)],
     },
     fallbacks=[cancel],
+    name="password",
+    persistent=True,
 )
@@ -4,6 +4,7 @@ from telegram.ext import CallbackContext, CommandHandler, ConversationHandler, M
 from app.internal.general.bot.decorators import authorize_user, is_message_defined, is_not_user_in_conversation
 from app.internal.general.bot.filters import TEXT
 from app.internal.general.bot.handlers import cancel, mark_conversation_end, mark_conversation_start
+from app.internal.general.budget import query_budget
 from app.internal.general.services import user_service
 from app.internal.user.presentation.handlers.bot.phone.PhoneStates import PhoneStates
 
@@ -12,6 +13,7 @@ _UPDATING_PHONE = "Телефон обновил! Готовьтесь к зах
 _INVALID_PHONE = "Я не могу сохранить эти кракозябры. Повторите попытку, либо /cancel"
 
 
+@query_budget(1)
 @is_message_defined
 @authorize_user(phone=False)
 @is_not_user_in_conversation
@@ -23,6 +25,7 @@ def handle_phone_start(update: Update, context: CallbackContext) -> int:
     return PhoneStates.INPUT
 
 
+@query_budget(2)
 @is_message_defined
 def handle_phone(update: Update, context: CallbackContext) -> int:
     phone = update.message.text
@@ -44,4 +47,6 @@ phone_conversation = ConversationHandler(
     entry_points=[entry_point],
     states={PhoneStates.INPUT: [MessageHandler(TEXT, handle_phone)]},
     fallbacks=[cancel],
+    name="phone",
+    persistent=True,
 )
@@ -4,7 +4,12 @@ from ninja import Router
 
 from app.internal.authentication.presentation import JWTAuthentication
 from app.internal.general.rest.responses import ErrorResponse, SuccessResponse
-from app.internal.user.domain.entities.friends import FriendRequestOut
+from app.internal.user.domain.entities.friends import (
+    FriendPageOut,
+    FriendRequestPageOut,
+    FriendRequestsOut,
+    FriendSuggestionOut,
+)
 from app.internal.user.domain.entities.user import PhoneIn, TelegramUserOut
 from app.internal.user.presentation.handlers import FriendHandlers, TelegramUserHandlers
 
@@ -41,14 +46,35 @@ def get_friends_router(friend_handlers: FriendHandlers) -> Router:
     router = Router(tags=["friends"], auth=[JWTAuthentication()])
 
     router.add_api_operation(
-        path="", methods=["GET"], view_func=friend_handlers.get_friends, response={200: List[TelegramUserOut]}
+        path="", methods=["GET"], view_func=friend_handlers.get_friends, response={200: FriendPageOut}
     )
 
     router.add_api_operation(
         path="/requests",
         methods=["GET"],
         view_func=friend_handlers.get_friend_requests,
-        response={200: List[FriendRequestOut]},
+        response={200: FriendRequestPageOut},
+    )
+
+    router.add_api_operation(
+        path="/suggestions",
+        methods=["GET"],
+        view_func=friend_handlers.get_friend_suggestions,
+        response={200: List[FriendSuggestionOut]},
+    )
+
+    router.add_api_operation(
+        path="/requests/accept",
+        methods=["POST"],
+        view_func=friend_handlers.accept_friend_requests,
+        response={200: FriendRequestsOut},
+    )
+
+    router.add_api_operation(
+        path="/requests/reject",
+        methods=["POST"],
+        view_func=friend_handlers.reject_friend_requests,
+        response={200: FriendRequestsOut},
     )
 
     router.add_api_operation(
@@ -1,4 +1,5 @@
 from json import loads
+from queue import Full
 
 from django.conf import settings
 from django.http import HttpRequest, HttpResponse
@@ -12,6 +13,10 @@ class BotWebhook(View):
 
     def post(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
         json = loads(request.body)
-        self._service.handle(json)
+
+        try:
+            self._service.enqueue(json)
+        except Full:
+            return HttpResponse(status=503)
 
         return HttpResponse(status=200)
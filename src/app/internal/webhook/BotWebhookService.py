@@ -1,16 +1,22 @@
-from telegram import Bot, Update
-from telegram.ext import Dispatcher
+from django.conf import settings
+from telegram import Update
 
-from app.internal.bot import handlers
+from app.internal.bot import create_bot, create_dispatcher
+from app.internal.general.bot.UpdateWorkerPool import UpdateWorkerPool
 
 
 class BotWebhookService:
     def __init__(self, token: str):
-        self.bot = Bot(token)
-        self.dispatcher = Dispatcher(self.bot, update_queue=None)
+        self.bot = create_bot(token)
+        self.dispatcher = create_dispatcher(self.bot)
+        self.pool = UpdateWorkerPool(
+            self.handle, settings.BOT_WORKERS, settings.BOT_QUEUE_SIZE, settings.BOT_DEDUPLICATION_WINDOW
+        )
 
-        for handler in handlers:
-            self.dispatcher.add_handler(handler)
+    def enqueue(self, json: dict) -> bool:
+        self.pool.start()
+
+        return self.pool.submit(json, timeout=settings.BOT_ENQUEUE_TIMEOUT_SECONDS)
 
     def handle(self, json: dict) -> None:
         update = Update.de_json(json, self.bot)
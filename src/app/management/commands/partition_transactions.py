@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+
+from app.internal.general.services import transaction_partition_service
+
+
+class Command(BaseCommand):
+    help = "Creates upcoming monthly transaction partitions and archives old ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ahead", type=int, default=settings.TRANSACTION_PARTITIONS_AHEAD, help="months to create")
+        parser.add_argument("--archive", action="store_true", help="detach and export partitions older than --keep")
+        parser.add_argument("--keep", type=int, default=settings.TRANSACTION_PARTITIONS_KEEP_MONTHS, help="months")
+
+    def handle(self, *args, **options):
+        for month in transaction_partition_service.create_partitions(now(), options["ahead"]):
+            self.stdout.write(f"Created partition {month:%Y-%m}")
+
+        if not options["archive"]:
+            return
+
+        for archive in transaction_partition_service.archive_partitions(options["keep"]):
+            self.stdout.write(f"Archived {archive.rows} transactions of {archive.month:%Y-%m} to {archive.name}")
@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from app.internal.general.services import suggestion_service
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the friend suggestion index from mutual friends and transaction counterparties"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=settings.FRIEND_SUGGESTIONS_BATCH_SIZE, help="users")
+        parser.add_argument("--limit", type=int, default=settings.FRIEND_SUGGESTIONS_PER_USER, help="per user")
+
+    def handle(self, *args, **options):
+        built = suggestion_service.rebuild(options["batch_size"], options["limit"])
+
+        self.stdout.write(f"Built {built} friend suggestions")
@@ -4,5 +4,8 @@ from app.internal.polling import start_polling
 
 
 class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=None)
+
     def handle(self, *args, **options):
-        start_polling()
+        start_polling(options["workers"])
@@ -0,0 +1,44 @@
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+
+from app.internal.seeding import ScaleSeeder
+
+
+class Command(BaseCommand):
+    help = "Generates a deterministic dataset for scale testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", type=float, default=1, help="1 is 10k users and 1M transactions")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--accounts-per-user", type=int, default=2)
+        parser.add_argument("--cards-per-account", type=int, default=1)
+        parser.add_argument("--friends-per-user", type=int, default=20)
+        parser.add_argument("--requests-per-user", type=int, default=2)
+        parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of transfer activity, 0 is uniform")
+        parser.add_argument("--clear", action="store_true", help="only remove a previously generated dataset")
+
+    def handle(self, *args, **options):
+        seeder = ScaleSeeder(
+            scale=options["scale"],
+            seed=options["seed"],
+            accounts_per_user=options["accounts_per_user"],
+            cards_per_account=options["cards_per_account"],
+            friends_per_user=options["friends_per_user"],
+            requests_per_user=options["requests_per_user"],
+            skew=options["skew"],
+            report=self.stdout.write if options["verbosity"] > 1 else lambda message: None,
+        )
+        started = perf_counter()
+
+        if options["clear"]:
+            seeder.clear()
+            self.stdout.write(f"Removed the generated dataset in {perf_counter() - started:.1f} s")
+            return
+
+        counts = seeder.seed()
+
+        for name, amount in counts.items():
+            self.stdout.write(f"{name}: {amount}")
+
+        self.stdout.write(f"Generated in {perf_counter() - started:.1f} s")
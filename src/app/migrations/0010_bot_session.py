@@ -0,0 +1,27 @@
+# Generated by Django 3.2.25 on 2026-10-19 14:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0009_alter_transactions_table"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BotSession",
+            fields=[
+                ("user_id", models.PositiveBigIntegerField(primary_key=True, serialize=False)),
+                ("data", models.JSONField(default=dict)),
+                ("states", models.JSONField(default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+            ],
+            options={
+                "verbose_name": "Bot Session",
+                "verbose_name_plural": "Bot Sessions",
+                "db_table": "bot_sessions",
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-19 15:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0011_photoblob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="photoblob",
+            name="has_variants",
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,106 @@
+from django.db import migrations, models
+
+PARTITION = """
+ALTER TABLE transactions RENAME TO transactions_unpartitioned;
+
+DO $$
+BEGIN
+    EXECUTE format(
+        'ALTER TABLE transactions_unpartitioned RENAME CONSTRAINT %I TO transactions_unpartitioned_pkey',
+        (SELECT conname FROM pg_constraint WHERE conrelid = 'transactions_unpartitioned'::regclass AND contype = 'p')
+    );
+END $$;
+
+CREATE TABLE transactions (LIKE transactions_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS)
+    PARTITION BY RANGE (created_at);
+
+ALTER TABLE transactions ADD CONSTRAINT transactions_pkey PRIMARY KEY (id, created_at);
+ALTER TABLE transactions ADD CONSTRAINT transactions_source_id_fk_bank_accounts_number
+    FOREIGN KEY (source_id) REFERENCES bank_accounts (number) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE transactions ADD CONSTRAINT transactions_destination_id_fk_bank_accounts_number
+    FOREIGN KEY (destination_id) REFERENCES bank_accounts (number) DEFERRABLE INITIALLY DEFERRED;
+CREATE INDEX transactions_source_id_created_at ON transactions (source_id, created_at);
+CREATE INDEX transactions_destination_id_created_at ON transactions (destination_id, created_at);
+
+CREATE TABLE transactions_default PARTITION OF transactions DEFAULT;
+
+DO $$
+DECLARE
+    month timestamptz;
+BEGIN
+    FOR month IN
+        SELECT generate_series(
+            date_trunc('month', LEAST(COALESCE(MIN(created_at), now()), now()) AT TIME ZONE 'UTC'),
+            date_trunc('month', now() AT TIME ZONE 'UTC') + interval '3 months',
+            interval '1 month'
+        ) AT TIME ZONE 'UTC'
+        FROM transactions_unpartitioned
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF transactions FOR VALUES FROM (%L) TO (%L)',
+            'transactions_p' || to_char(month AT TIME ZONE 'UTC', 'YYYY_MM'),
+            month,
+            (month AT TIME ZONE 'UTC' + interval '1 month') AT TIME ZONE 'UTC'
+        );
+    END LOOP;
+
+    EXECUTE format(
+        'ALTER SEQUENCE %s OWNED BY transactions.id', pg_get_serial_sequence('transactions_unpartitioned', 'id')
+    );
+END $$;
+
+INSERT INTO transactions SELECT * FROM transactions_unpartitioned;
+
+DROP TABLE transactions_unpartitioned;
+"""
+
+UNPARTITION = """
+ALTER TABLE transactions RENAME TO transactions_partitioned;
+
+CREATE TABLE transactions (LIKE transactions_partitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+
+INSERT INTO transactions SELECT * FROM transactions_partitioned;
+
+DO $$
+BEGIN
+    EXECUTE format(
+        'ALTER SEQUENCE %s OWNED BY transactions.id', pg_get_serial_sequence('transactions_partitioned', 'id')
+    );
+END $$;
+
+DROP TABLE transactions_partitioned;
+
+ALTER TABLE transactions ADD CONSTRAINT transactions_pkey PRIMARY KEY (id);
+ALTER TABLE transactions ADD CONSTRAINT transactions_source_id_fk_bank_accounts_number
+    FOREIGN KEY (source_id) REFERENCES bank_accounts (number) DEFERRABLE INITIALLY DEFERRED;
+ALTER TABLE transactions ADD CONSTRAINT transactions_destination_id_fk_bank_accounts_number
+    FOREIGN KEY (destination_id) REFERENCES bank_accounts (number) DEFERRABLE INITIALLY DEFERRED;
+CREATE INDEX transactions_source_id ON transactions (source_id);
+CREATE INDEX transactions_destination_id ON transactions (destination_id);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0012_photoblob_has_variants"),
+    ]
+
+    operations = [
+        migrations.RunSQL(PARTITION, UNPARTITION),
+        migrations.CreateModel(
+            name="TransactionArchive",
+            fields=[
+                ("month", models.DateField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("rows", models.PositiveIntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "Transaction Archive",
+                "verbose_name_plural": "Transaction Archives",
+                "db_table": "transaction_archives",
+                "ordering": ("month",),
+            },
+        ),
+    ]
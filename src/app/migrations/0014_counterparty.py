@@ -0,0 +1,64 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL = """
+INSERT INTO counterparties (user_id, counterparty_id, last_interaction, count)
+SELECT pair.user_id, pair.counterparty_id, MAX(transactions.created_at), COUNT(*)
+FROM transactions
+JOIN bank_accounts source ON source.number = transactions.source_id
+JOIN bank_accounts destination ON destination.number = transactions.destination_id
+CROSS JOIN LATERAL (
+    VALUES (source.owner_id, destination.owner_id), (destination.owner_id, source.owner_id)
+) AS pair (user_id, counterparty_id)
+WHERE source.owner_id <> destination.owner_id
+GROUP BY pair.user_id, pair.counterparty_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0013_transaction_partitions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Counterparty",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("last_interaction", models.DateTimeField()),
+                ("count", models.PositiveIntegerField(default=1)),
+                (
+                    "counterparty",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="app.telegramuser"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="counterparties",
+                        to="app.telegramuser",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Counterparty",
+                "verbose_name_plural": "Counterparties",
+                "db_table": "counterparties",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="counterparty",
+            index=models.Index(fields=["user", "-last_interaction"], name="counterparties_recent"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="counterparty",
+            unique_together={("user", "counterparty")},
+        ),
+        migrations.RunSQL(BACKFILL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:23
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+CREATE_INDEX = 'CREATE INDEX "telegram_users_prefix" ON "telegram_users" (UPPER("username") text_pattern_ops);'
+DROP_INDEX = 'DROP INDEX "telegram_users_prefix";'
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0014_counterparty"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[migrations.RunSQL(CREATE_INDEX, DROP_INDEX)],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="telegramuser",
+                    index=models.Index(
+                        django.contrib.postgres.indexes.OpClass(
+                            django.db.models.functions.text.Upper("username"), name="text_pattern_ops"
+                        ),
+                        name="telegram_users_prefix",
+                    ),
+                ),
+            ],
+        ),
+    ]
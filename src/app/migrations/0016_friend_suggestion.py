@@ -0,0 +1,50 @@
+# Generated by Django 3.2.25 on 2026-10-19 16:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0015_telegram_user_prefix_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FriendSuggestion",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("mutual_friends", models.PositiveIntegerField(default=0)),
+                ("interactions", models.PositiveIntegerField(default=0)),
+                (
+                    "suggestion",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="app.telegramuser"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="suggestions",
+                        to="app.telegramuser",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Friend suggestion",
+                "verbose_name_plural": "Friend suggestions",
+                "db_table": "friend_suggestions",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="friendsuggestion",
+            index=models.Index(fields=["user", "-mutual_friends", "-interactions"], name="friend_suggestions_top"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="friendsuggestion",
+            unique_together={("user", "suggestion")},
+        ),
+    ]
@@ -1,3 +1,4 @@
 from app.internal.authentication.db.models import AdminUser, RefreshToken
-from app.internal.bank.db.models import BankAccount, BankCard, Transaction
+from app.internal.bank.db.models import BankAccount, BankCard, PhotoBlob, Transaction
+from app.internal.general.db.models import BotSession
 from app.internal.user.db.models import FriendRequest, SecretKey, TelegramUser
@@ -9,6 +9,7 @@ https://docs.djangoproject.com/en/4.0/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/4.0/ref/settings/
 """
+
 import base64
 import logging.config
 import os
@@ -18,6 +19,7 @@ from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
 
 from django.contrib.auth.hashers import BCryptSHA256PasswordHasher
+from django.core.exceptions import ImproperlyConfigured
 from environ import Env
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -25,7 +27,25 @@ from app.internal.logging import TelegramLogHandler
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-env = Env(LOGGING=(bool, False), DEBUG=(bool, False), METRICS=(bool, False))
+env = Env(
+    LOGGING=(bool, False),
+    DEBUG=(bool, False),
+    METRICS=(bool, False),
+    QUERY_BUDGET_MONITORING=(bool, True),
+    QUERY_BUDGET_STRICT=(bool, False),
+    BOT_WORKERS=(int, 4),
+    BOT_QUEUE_SIZE=(int, 1000),
+    BOT_ASYNC_WORKERS=(int, 4),
+    BOT_PHOTO_MIN_SIDE=(int, 800),
+    PHOTO_PIPELINE_WORKERS=(int, 2),
+    PHOTO_URL_PREFIX=(str, ""),
+    POSTGRES_REPLICA_HOSTS=(list, []),
+    CACHE_URL=(str, "locmemcache://?max_entries=10000"),
+    DATABASE_POOL_MAX_SIZE=(int, 20),
+    TRANSACTION_ARCHIVE_ROOT=(str, os.path.join(BASE_DIR, "archive")),
+    TELEGRAM_API_URL=(str, "https://api.telegram.org/bot"),
+    TELEGRAM_FILE_URL=(str, "https://api.telegram.org/file/bot"),
+)
 Env.read_env()
 
 # Quick-start development settings - unsuitable for production
@@ -91,7 +111,7 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql_psycopg2",
+        "ENGINE": "app.internal.general.db.backends.postgresql",
         "NAME": env("POSTGRES_DB"),
         "USER": env("POSTGRES_USER"),
         "PASSWORD": env("POSTGRES_PASSWORD"),
@@ -100,6 +120,39 @@ DATABASES = {
     }
 }
 
+DATABASE_REPLICAS = []
+
+for number, address in enumerate(env("POSTGRES_REPLICA_HOSTS")):
+    host, _, port = address.partition(":")
+    alias = f"replica_{number}"
+
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "OPTIONS": {"connect_timeout": 2},
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_POOL_MAX_SIZE = env("DATABASE_POOL_MAX_SIZE")
+DATABASE_POOL_WAIT_SECONDS = 5
+DATABASE_POOL_IDLE_SECONDS = 5 * 60
+DATABASE_POOL_HEALTH_CHECK_SECONDS = 30
+
+DATABASE_ROUTERS = ["app.internal.general.db.ReplicaRouter.ReplicaRouter"]
+DATABASE_REPLICA_MAX_LAG_SECONDS = 5
+DATABASE_REPLICA_CHECK_SECONDS = 5
+DATABASE_REPLICA_STICKY_SECONDS = 10
+
+CACHES = {"default": env.cache("CACHE_URL")}
+
+if DATABASE_REPLICAS and CACHES["default"]["BACKEND"] in (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+):
+    raise ImproperlyConfigured("POSTGRES_REPLICA_HOSTS requires a CACHE_URL shared by all processes")
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
@@ -150,12 +203,20 @@ REFRESH_TOKEN_COOKIE = "refresh_token"
 
 MAX_TRANSFER_DURATION_SECONDS = 2
 LOGS_LIFETIME = 14
+LOGGING_FLUSH_INTERVAL_SECONDS = 5
+LOGGING_QUEUE_SIZE = 1000
 
 if env("LOGGING"):
     formatter = Formatter(fmt="[{levelname}][{asctime}] {message}", datefmt="%Y-%m-%d %H:%M:%S", style="{")
 
     # Transfer
-    bot_handler = TelegramLogHandler(token=env("LOGGING_BOT_TOKEN"), chat_id=env("LOGGING_CHANEL_ID"), level=INFO)
+    bot_handler = TelegramLogHandler(
+        token=env("LOGGING_BOT_TOKEN"),
+        chat_id=env("LOGGING_CHANEL_ID"),
+        level=INFO,
+        flush_interval=LOGGING_FLUSH_INTERVAL_SECONDS,
+        queue_size=LOGGING_QUEUE_SIZE,
+    )
     bot_handler.setFormatter(formatter)
 
     transfer_file_handler = TimedRotatingFileHandler(
@@ -176,6 +237,11 @@ if env("LOGGING"):
 METRICS = env("METRICS")
 METRICS_PORT = int(env("METRICS_PORT"))
 
+# Query budgets
+
+QUERY_BUDGET_MONITORING = env("QUERY_BUDGET_MONITORING")
+QUERY_BUDGET_STRICT = env("QUERY_BUDGET_STRICT")
+
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/4.0/howto/static-files/
 
@@ -194,6 +260,18 @@ AWS_S3_ENDPOINT_URL = "https://storage.yandexcloud.net"
 
 MAX_SIZE_PHOTO_KB = 1024
 MAX_SIZE_PHOTO_BYTES = MAX_SIZE_PHOTO_KB * 1024
+UPLOAD_SPOOL_MEMORY_BYTES = 64 * 1024
+
+PHOTO_VARIANT_SIDES = {"thumbnail": 160, "medium": 800}
+PHOTO_VARIANT_FORMAT = "WEBP"
+PHOTO_VARIANT_QUALITY = 80
+PHOTO_PIPELINE_WORKERS = env("PHOTO_PIPELINE_WORKERS")
+PHOTO_URL_PREFIX = env("PHOTO_URL_PREFIX")
+PHOTO_URL_EXPIRY_MARGIN_SECONDS = 5 * 60
+
+TRANSACTION_ARCHIVE_ROOT = env("TRANSACTION_ARCHIVE_ROOT")
+TRANSACTION_PARTITIONS_AHEAD = 3
+TRANSACTION_PARTITIONS_KEEP_MONTHS = 12
 
 
 # Default primary key field type
@@ -207,3 +285,28 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "app.AdminUser"
 
 TELEGRAM_BOT_TOKEN = env("TELEGRAM_BOT_TOKEN")
+TELEGRAM_API_URL = env("TELEGRAM_API_URL")
+TELEGRAM_FILE_URL = env("TELEGRAM_FILE_URL")
+
+# Bot updates processing
+
+BOT_WORKERS = env("BOT_WORKERS")
+BOT_QUEUE_SIZE = env("BOT_QUEUE_SIZE")
+BOT_ENQUEUE_TIMEOUT_SECONDS = 1
+BOT_DEDUPLICATION_WINDOW = 10000
+BOT_ASYNC_WORKERS = env("BOT_ASYNC_WORKERS")
+BOT_PHOTO_MIN_SIDE = env("BOT_PHOTO_MIN_SIDE")
+BOT_PHOTO_PREFETCH_LIMIT = 100
+TRANSFER_RECENT_RECIPIENTS = 5
+BOT_FRIENDS_PAGE_SIZE = 10
+REST_FRIENDS_PAGE_SIZE = 50
+REST_FRIENDS_MAX_PAGE_SIZE = 500
+FRIEND_SUGGESTIONS_PER_USER = 20
+FRIEND_SUGGESTIONS_BATCH_SIZE = 1000
+BOT_POLLING_TIMEOUT_SECONDS = 10
+BOT_POLLING_RETRY_SECONDS = 5
+BOT_STOP_TIMEOUT_SECONDS = 30
+
+BOT_SESSION_TTL = timedelta(hours=1)
+BOT_SESSION_EVICTION_INTERVAL = timedelta(minutes=5)
+BOT_AUTHORIZATION_TTL_SECONDS = 5
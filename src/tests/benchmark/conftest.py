@@ -0,0 +1,31 @@
+import os
+from typing import Iterator
+
+import pytest
+
+from app.internal.authentication.domain.services.TokenTypes import TokenTypes
+from app.internal.general.services import auth_service
+from tests.performance.BankDataset import BankDataset
+
+
+@pytest.fixture(scope="module")
+def dataset(django_db_setup, django_db_blocker) -> Iterator[BankDataset]:
+    dataset = BankDataset(
+        users=int(os.environ.get("BENCHMARK_USERS", 200)),
+        accounts_per_user=int(os.environ.get("BENCHMARK_ACCOUNTS_PER_USER", 2)),
+        transactions=int(os.environ.get("BENCHMARK_TRANSACTIONS", 20_000)),
+    )
+
+    with django_db_blocker.unblock():
+        dataset.create()
+
+        yield dataset
+
+        dataset.remove()
+
+
+@pytest.fixture(scope="function")
+def authorization(dataset: BankDataset) -> dict:
+    token = auth_service.generate_token(dataset.get_owner_id(dataset.get_hottest_account()), TokenTypes.ACCESS)
+
+    return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
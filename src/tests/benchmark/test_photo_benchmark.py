@@ -0,0 +1,42 @@
+import pytest
+from django.conf import settings
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from app.internal.bank.db.models import Transaction
+from app.internal.general.images import render_variants
+from app.internal.general.services import photo_url_service
+
+HISTORY_PAGE = [f"photos/{number % 256:02x}/{number:064x}.jpg" for number in range(1000)]
+
+
+@pytest.mark.benchmark(group="photos")
+def test_render_variants(benchmark, photo_content: bytes) -> None:
+    variants = benchmark(
+        render_variants,
+        photo_content,
+        settings.PHOTO_VARIANT_SIDES,
+        settings.PHOTO_VARIANT_FORMAT,
+        settings.PHOTO_VARIANT_QUALITY,
+    )
+
+    assert variants.keys() == settings.PHOTO_VARIANT_SIDES.keys()
+
+
+@pytest.fixture(scope="function")
+def s3_storage(monkeypatch) -> S3Boto3Storage:
+    storage = S3Boto3Storage(access_key="key", secret_key="secret", bucket_name="bucket")
+    monkeypatch.setattr(Transaction._meta.get_field("photo"), "storage", storage)
+
+    return storage
+
+
+@pytest.mark.benchmark(group="photo_urls")
+def test_sign_history_page(benchmark, s3_storage: S3Boto3Storage) -> None:
+    assert len(benchmark(lambda: [s3_storage.url(name) for name in HISTORY_PAGE])) == len(HISTORY_PAGE)
+
+
+@pytest.mark.benchmark(group="photo_urls")
+def test_get_cached_history_page_urls(benchmark, s3_storage: S3Boto3Storage) -> None:
+    photo_url_service.get_urls(HISTORY_PAGE)
+
+    assert len(benchmark(photo_url_service.get_urls, HISTORY_PAGE)) == len(HISTORY_PAGE)
@@ -0,0 +1,49 @@
+import pytest
+from django.test import Client
+
+from tests.performance.BankDataset import PASSWORD, BankDataset
+
+LOGIN_URL = "/api/auth/login"
+ACCOUNTS_URL = "/api/bank/accounts"
+HISTORY_URL = "/api/bank/accounts/{number}/history"
+TRANSFER_URL = "/api/bank/transfer"
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="rest")
+def test_login(benchmark, client: Client, dataset: BankDataset) -> None:
+    credentials = {"username": dataset.get_username(dataset.user_ids[0]), "password": PASSWORD}
+
+    response = benchmark(client.post, LOGIN_URL, credentials, content_type="application/json")
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="rest")
+def test_accounts(benchmark, client: Client, authorization: dict) -> None:
+    response = benchmark(client.get, ACCOUNTS_URL, **authorization)
+
+    assert response.status_code == 200
+    assert len(response.json()) > 0
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="rest")
+def test_history(benchmark, client: Client, dataset: BankDataset, authorization: dict) -> None:
+    url = HISTORY_URL.format(number=dataset.get_hottest_account())
+
+    response = benchmark(client.get, url, **authorization)
+
+    assert response.status_code == 200
+    assert len(response.json()) > 0
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="rest")
+def test_transfer(benchmark, client: Client, dataset: BankDataset, authorization: dict) -> None:
+    transfer = {"source": dataset.get_hottest_account(), "destination": dataset.account_numbers[-1], "accrual": 1}
+
+    response = benchmark(client.post, TRANSFER_URL, transfer, **authorization)
+
+    assert response.status_code == 200
@@ -0,0 +1,103 @@
+from decimal import Decimal
+from typing import List
+
+import pytest
+from telegram import User
+
+from app.internal.bank.db.models import BankAccount
+from app.internal.general.services import (
+    auth_service,
+    bank_object_service,
+    request_service,
+    transaction_service,
+    transfer_service,
+    user_service,
+)
+from app.internal.user.db.models import FriendRequest, TelegramUser
+from tests.performance.BankDataset import PASSWORD, BankDataset
+
+
+@pytest.fixture(scope="function")
+def account(dataset: BankDataset) -> BankAccount:
+    return BankAccount.objects.get(number=dataset.get_hottest_account())
+
+
+@pytest.fixture(scope="function")
+def requesters(dataset: BankDataset) -> List[TelegramUser]:
+    return list(TelegramUser.objects.filter(id__in=dataset.user_ids[1:]))
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="services")
+def test_get_user_by_credentials(benchmark, dataset: BankDataset) -> None:
+    username = dataset.get_username(dataset.user_ids[0])
+
+    assert benchmark(auth_service.get_user_by_credentials, username, PASSWORD)
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="services")
+def test_try_add_or_update_user__unchanged(benchmark, dataset: BankDataset) -> None:
+    user = User(
+        id=dataset.user_ids[0], first_name="Bench", username=dataset.get_username(dataset.user_ids[0]), is_bot=False
+    )
+    user_service.try_add_or_update_user(user)
+
+    assert not benchmark(user_service.try_add_or_update_user, user)
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="services")
+def test_get_document_catalog(benchmark, dataset: BankDataset) -> None:
+    user = user_service.get_user(dataset.user_ids[0])
+
+    assert benchmark(bank_object_service.get_document_catalog, user)
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="services")
+def test_get_transactions(benchmark, account: BankAccount) -> None:
+    assert benchmark(lambda: list(transaction_service.get_transactions(account)))
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="services")
+def test_get_history_html(benchmark, account: BankAccount) -> None:
+    assert benchmark(transaction_service.get_history_html, account.number)
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="services")
+def test_try_transfer(benchmark, dataset: BankDataset, account: BankAccount) -> None:
+    destination = BankAccount.objects.get(number=dataset.account_numbers[-1])
+
+    assert benchmark(transfer_service.try_transfer, account, destination, Decimal(1), None)
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="friend_requests")
+def test_accept_friend_requests_one_by_one(benchmark, dataset: BankDataset, requesters: List[TelegramUser]) -> None:
+    user = user_service.get_user(dataset.user_ids[0])
+
+    def accept() -> int:
+        return sum(request_service.try_accept(requester, user) for requester in requesters)
+
+    assert benchmark.pedantic(accept, setup=lambda: _send_requests(user, requesters), rounds=5) == len(requesters)
+
+
+@pytest.mark.django_db
+@pytest.mark.benchmark(group="friend_requests")
+def test_accept_friend_requests_in_bulk(benchmark, dataset: BankDataset, requesters: List[TelegramUser]) -> None:
+    user = user_service.get_user(dataset.user_ids[0])
+
+    def accept() -> int:
+        return len(request_service.accept_all(user))
+
+    assert benchmark.pedantic(accept, setup=lambda: _send_requests(user, requesters), rounds=5) == len(requesters)
+
+
+def _send_requests(user: TelegramUser, requesters: List[TelegramUser]) -> None:
+    user.friends.clear()
+    FriendRequest.objects.bulk_create(
+        (FriendRequest(source=requester, destination=user) for requester in requesters), ignore_conflicts=True
+    )
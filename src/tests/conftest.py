@@ -1,16 +1,21 @@
 import logging
 from decimal import Decimal
+from io import BytesIO
 from itertools import chain
+from pathlib import Path
 from typing import List
-from unittest.mock import MagicMock
 
 import pytest
 from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.db.models import QuerySet
 from ninja import UploadedFile
+from PIL import Image
 from telegram import User
 
-from app.internal.bank.db.models import BankAccount, BankCard
+from app.internal.bank.db.models import BankAccount, BankCard, Transaction
 from app.internal.user.db.models import FriendRequest, SecretKey, TelegramUser
 from app.internal.user.db.repositories import SecretKeyRepository, TelegramUserRepository
 
@@ -21,6 +26,7 @@ PHONE = "+78005553535"
 KEY = "noob"
 WRONG_KEY = "pro"
 TIP = "Who am i?"
+EXIF_MAKE = 0x010F
 
 CORRECT_PHONE_NUMBERS = list(
     chain(
@@ -67,6 +73,16 @@ def pytest_configure(config):
     logging.disable()
 
 
+@pytest.fixture(autouse=True)
+def strict_query_budgets(settings) -> None:
+    settings.QUERY_BUDGET_STRICT = True
+
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> None:
+    cache.clear()
+
+
 @pytest.fixture(scope="function")
 def user(user_id=1337, first_name="Вася", last_name="Пупкин", username="geroj") -> User:
     return User(id=user_id, first_name=first_name, last_name=last_name, username=username, is_bot=False)
@@ -238,13 +254,33 @@ def friend_requests(telegram_user: TelegramUser, telegram_users: List[TelegramUs
 
 @pytest.fixture(scope="function")
 def uploaded_image() -> UploadedFile:
-    image = MagicMock()
-
-    read = MagicMock()
-    read.return_value = b"228"
-
-    image.read = read
-    image.content_type = "image/jpg"
+    image = SimpleUploadedFile("image.jpg", b"228", content_type="image/jpg")
     image.size = settings.MAX_SIZE_PHOTO_BYTES - 1
 
     return image
+
+
+@pytest.fixture(scope="function")
+def storage(monkeypatch, tmp_path) -> FileSystemStorage:
+    storage = FileSystemStorage(location=str(tmp_path))
+    monkeypatch.setattr(Transaction._meta.get_field("photo"), "storage", storage)
+
+    return storage
+
+
+@pytest.fixture(scope="function")
+def archive_root(settings, tmp_path) -> Path:
+    settings.TRANSACTION_ARCHIVE_ROOT = str(tmp_path / "archive")
+
+    return tmp_path / "archive"
+
+
+@pytest.fixture(scope="function")
+def photo_content() -> bytes:
+    exif = Image.Exif()
+    exif[EXIF_MAKE] = "Camera"
+
+    buffer = BytesIO()
+    Image.new("RGB", (1280, 960), "red").save(buffer, "JPEG", exif=exif)
+
+    return buffer.getvalue()
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import List
 
 import pytest
@@ -5,16 +6,19 @@ from telegram import Update
 from telegram.ext import CallbackContext, ConversationHandler
 
 from app.internal.bank.db.models import BankAccount, BankCard, BankObject
+from app.internal.bank.domain.services.Document import Document
+from app.internal.bank.domain.services.DocumentCatalog import DocumentCatalog
 from app.internal.bank.presentation.handlers.bot.balance.handlers import (
     _BALANCE_BY_BANK_ACCOUNT,
     _BALANCE_BY_CARD,
-    _DOCUMENTS_SESSION,
     _LIST_EMPTY_MESSAGE,
     _STUPID_CHOICE,
     BalanceStates,
     handle_choice,
     handle_start,
 )
+from app.internal.bank.presentation.handlers.bot.document import CATALOG_SESSION
+from app.internal.general.services import bank_object_service
 from app.internal.user.db.models import TelegramUser
 
 
@@ -30,9 +34,11 @@ def test_start(
     next_state = handle_start(update, context)
 
     assert next_state == BalanceStates.CHOICE
-    assert _DOCUMENTS_SESSION in context.user_data
-    assert type(context.user_data[_DOCUMENTS_SESSION]) is dict
-    assert sorted(context.user_data[_DOCUMENTS_SESSION].values(), key=str) == sorted([*bank_accounts, *cards], key=str)
+    assert CATALOG_SESSION in context.user_data
+    assert type(context.user_data[CATALOG_SESSION]) is list
+    assert sorted(row[0] for row in context.user_data[CATALOG_SESSION]) == sorted(
+        document.number_field for document in [*bank_accounts, *cards]
+    )
 
 
 @pytest.mark.django_db
@@ -43,7 +49,7 @@ def test_start__documents_len_is_zero(
     next_state = handle_start(update, context)
 
     assert next_state == ConversationHandler.END
-    assert _DOCUMENTS_SESSION not in context.user_data
+    assert CATALOG_SESSION not in context.user_data
     update.message.reply_text.assert_called_once_with(_LIST_EMPTY_MESSAGE)
     assert len(context.user_data) == 0
 
@@ -62,9 +68,10 @@ def test_choice__card(update: Update, context: CallbackContext, card: BankCard)
 
 def _test_balance__bank_object(update: Update, context: CallbackContext, obj: BankObject, details: str) -> None:
     update.message.text = "1"
-    context.user_data[_DOCUMENTS_SESSION] = {1: obj}
+    context.user_data[CATALOG_SESSION] = _get_rows(obj)
 
     next_state = handle_choice(update, context)
+    obj.refresh_from_db()
 
     assert next_state == ConversationHandler.END
     update.message.reply_text.assert_called_once_with(
@@ -77,9 +84,15 @@ def _test_balance__bank_object(update: Update, context: CallbackContext, obj: Ba
 @pytest.mark.integration
 def test_choice__stupid(update: Update, context: CallbackContext, bank_account: BankAccount) -> None:
     update.message.text = "-1"
-    context.user_data[_DOCUMENTS_SESSION] = {1: bank_account}
+    context.user_data[CATALOG_SESSION] = _get_rows(bank_account)
 
     next_state = handle_choice(update, context)
 
     assert next_state == BalanceStates.CHOICE
     update.message.reply_text.assert_called_once_with(_STUPID_CHOICE)
+
+
+def _get_rows(obj: BankObject) -> list:
+    account = bank_object_service.get_bank_account_from_document(obj)
+
+    return DocumentCatalog([Document.create(obj.number_field, account.number, Decimal(0))]).to_rows()
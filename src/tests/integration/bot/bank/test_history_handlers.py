@@ -5,14 +5,15 @@ from telegram import Update
 from telegram.ext import CallbackContext
 
 from app.internal.bank.db.models import BankAccount
+from app.internal.bank.presentation.handlers.bot.document import CATALOG_SESSION
 from app.internal.bank.presentation.handlers.bot.history.handlers import (
-    _DOCUMENTS_SESSION,
     _LIST_EMPTY_MESSAGE,
     _STUPID_CHOICE,
     handle_getting_document,
     handle_start,
 )
 from app.internal.bank.presentation.handlers.bot.history.HistoryStates import HistoryStates
+from app.internal.general.services import bank_object_service
 from app.internal.user.db.models import TelegramUser
 from tests.integration.bot.conftest import assert_conversation_end, assert_conversation_start
 
@@ -27,8 +28,10 @@ def test_start(
     assert next_state == HistoryStates.DOCUMENT
     assert_conversation_start(context)
     update.message.reply_text.assert_called_once()
-    assert _DOCUMENTS_SESSION in context.user_data
-    assert sorted(context.user_data[_DOCUMENTS_SESSION].values(), key=str) == sorted(bank_accounts, key=str)
+    assert CATALOG_SESSION in context.user_data
+    assert sorted(row[0] for row in context.user_data[CATALOG_SESSION]) == sorted(
+        account.number for account in bank_accounts
+    )
 
 
 @pytest.mark.django_db
@@ -39,7 +42,7 @@ def test_start__documents_is_empty(
     next_state = handle_start(update, context)
 
     assert_conversation_end(next_state, context)
-    assert _DOCUMENTS_SESSION not in context.user_data
+    assert CATALOG_SESSION not in context.user_data
     update.message.reply_text.assert_called_once_with(_LIST_EMPTY_MESSAGE)
 
 
@@ -49,7 +52,7 @@ def test_getting_document(
     update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser, bank_account: BankAccount
 ) -> None:
     update.message.text = "1"
-    context.user_data[_DOCUMENTS_SESSION] = {int(update.message.text): bank_account}
+    context.user_data[CATALOG_SESSION] = bank_object_service.get_document_catalog(telegram_user_with_phone).to_rows()
 
     next_state = handle_getting_document(update, context)
 
@@ -63,7 +66,7 @@ def test_getting_document__stupid_choice(
     update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser, bank_account: BankAccount
 ) -> None:
     update.message.text = "-1"
-    context.user_data[_DOCUMENTS_SESSION] = {1: bank_account}
+    context.user_data[CATALOG_SESSION] = bank_object_service.get_document_catalog(telegram_user_with_phone).to_rows()
 
     next_state = handle_getting_document(update, context)
 
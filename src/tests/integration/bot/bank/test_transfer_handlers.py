@@ -3,12 +3,21 @@ from typing import List, Optional
 
 import pytest
 from django.conf import settings
-from telegram import PhotoSize, Update
+from telegram import CallbackQuery, PhotoSize, Update
 from telegram.ext import CallbackContext
 
+import app.internal.bank.presentation.handlers.bot.transfer.handlers as transfer_handlers
 from app.internal.bank.db.models import BankAccount, BankCard, BankObject, Transaction
-from app.internal.bank.db.repositories import BankAccountRepository, BankCardRepository, TransactionRepository
+from app.internal.bank.db.repositories import (
+    BankAccountRepository,
+    BankCardRepository,
+    PhotoRepository,
+    TransactionRepository,
+)
 from app.internal.bank.domain.services import TransferService
+from app.internal.bank.domain.services.Document import Document
+from app.internal.bank.domain.services.DocumentCatalog import DocumentCatalog
+from app.internal.bank.presentation.handlers.bot.document import CATALOG_SESSION
 from app.internal.bank.presentation.handlers.bot.transfer.handlers import (
     _ACCRUAL_GREATER_BALANCE_ERROR,
     _ACCRUAL_PARSE_ERROR,
@@ -20,12 +29,11 @@ from app.internal.bank.presentation.handlers.bot.transfer.handlers import (
     _DESTINATION_SESSION,
     _FRIEND_DOCUMENT_LIST_EMPTY_ERROR,
     _FRIEND_LIST_EMPTY_ERROR,
-    _FRIEND_VARIANTS_SESSION,
     _PHOTO_SESSION,
     _PHOTO_SIZE_ERROR,
     _PHOTO_WELCOME,
+    _RECENT_RECIPIENT,
     _SOURCE_DOCUMENT_LIST_EMPTY_ERROR,
-    _SOURCE_DOCUMENTS_SESSION,
     _SOURCE_SESSION,
     _STUPID_CHOICE_ERROR,
     _TRANSFER_FAIL,
@@ -35,19 +43,37 @@ from app.internal.bank.presentation.handlers.bot.transfer.handlers import (
     handle_getting_destination_document,
     handle_getting_photo,
     handle_getting_source_document,
+    handle_skip_getting_photo,
     handle_start,
     handle_transfer,
 )
 from app.internal.bank.presentation.handlers.bot.transfer.TransferStates import TransferStates
+from app.internal.general.bot.FilePrefetcher import FilePrefetcher
+from app.internal.general.bot.pagination import _PAGE_CURSOR_SESSION
+from app.internal.general.services import bank_object_service, photo_pipeline
 from app.internal.user.db.models import TelegramUser
+from app.internal.user.db.repositories import CounterpartyRepository
 from tests.conftest import BALANCE
 from tests.integration.bot.conftest import assert_conversation_end, assert_conversation_start
 
 service = TransferService(
-    account_repo=BankAccountRepository(), card_repo=BankCardRepository(), transaction_repo=TransactionRepository()
+    account_repo=BankAccountRepository(),
+    card_repo=BankCardRepository(),
+    transaction_repo=TransactionRepository(),
+    counterparty_repo=CounterpartyRepository(),
+    photo_repo=PhotoRepository(),
+    photo_pipeline=photo_pipeline,
 )
 
 
+@pytest.fixture(autouse=True)
+def photo_prefetcher(monkeypatch) -> FilePrefetcher:
+    prefetcher = FilePrefetcher(settings.BOT_PHOTO_PREFETCH_LIMIT)
+    monkeypatch.setattr(transfer_handlers, "_photo_prefetcher", prefetcher)
+
+    return prefetcher
+
+
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_start(
@@ -61,13 +87,33 @@ def test_start(
 
     assert_conversation_start(context)
     assert next_state == TransferStates.DESTINATION
-    assert _SOURCE_DOCUMENTS_SESSION in context.user_data
-    assert _FRIEND_VARIANTS_SESSION in context.user_data
-    assert type(context.user_data[_SOURCE_DOCUMENTS_SESSION]) is dict
-    assert type(context.user_data[_FRIEND_VARIANTS_SESSION]) is dict
-    assert sorted(context.user_data[_SOURCE_DOCUMENTS_SESSION].values(), key=str) == sorted(bank_accounts, key=str)
-    assert sorted(context.user_data[_FRIEND_VARIANTS_SESSION].values(), key=str) == sorted(friends, key=str)
-    update.message.reply_text.assert_called_once()
+    assert context.user_data[_PAGE_CURSOR_SESSION] == sorted(friend.username for friend in friends)
+    assert _get_choices(update) == [
+        f"transfer:{friend.id}" for friend in sorted(friends, key=lambda friend: friend.username)
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_start__recent_recipients_come_first(
+    update: Update,
+    context: CallbackContext,
+    telegram_user_with_phone: TelegramUser,
+    friends: List[TelegramUser],
+    bank_account: BankAccount,
+) -> None:
+    recipient = friends[-1]
+    service.try_transfer(bank_account, BankAccount.objects.create(owner=recipient), Decimal(1), None)
+
+    handle_start(update, context)
+
+    markup = update.message.reply_text.call_args.kwargs["reply_markup"]
+
+    assert _get_choices(update)[0] == f"transfer:{recipient.id}"
+    assert sorted(_get_choices(update)[1:]) == sorted(f"transfer:{friend.id}" for friend in friends)
+    assert markup.inline_keyboard[0][0].text == _RECENT_RECIPIENT.format(
+        username=recipient.username, first_name=recipient.first_name
+    )
 
 
 @pytest.mark.django_db
@@ -100,31 +146,29 @@ def test_start__source_documents_list_is_empty(
 def test_getting_destination(
     update: Update,
     context: CallbackContext,
+    callback_query: CallbackQuery,
     telegram_user: TelegramUser,
     friend_with_account: TelegramUser,
     friend_account: BankAccount,
 ) -> None:
-    context.user_data[_FRIEND_VARIANTS_SESSION] = {1: friend_with_account}
-    update.message.text = "1"
+    callback_query.data = f"transfer:{friend_with_account.id}"
 
     next_state = handle_getting_destination(update, context)
 
     assert next_state == TransferStates.DESTINATION_DOCUMENT
     assert _CHOSEN_FRIEND_SESSION in context.user_data
     assert _DESTINATION_DOCUMENTS_SESSION in context.user_data
-    assert context.user_data[_CHOSEN_FRIEND_SESSION] == friend_with_account
-    assert type(context.user_data[_DESTINATION_DOCUMENTS_SESSION]) is dict
-    assert list(context.user_data[_DESTINATION_DOCUMENTS_SESSION].values()) == [friend_account]
+    assert context.user_data[_CHOSEN_FRIEND_SESSION] == friend_with_account.id
+    assert [row[0] for row in context.user_data[_DESTINATION_DOCUMENTS_SESSION]] == [friend_account.number]
     update.message.reply_text.assert_called_once()
 
 
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_getting_destination__stupid_choice(
-    update: Update, context: CallbackContext, telegram_user: TelegramUser
+    update: Update, context: CallbackContext, callback_query: CallbackQuery, telegram_user: TelegramUser
 ) -> None:
-    context.user_data[_FRIEND_VARIANTS_SESSION] = {}
-    update.message.text = "1"
+    callback_query.data = "transfer:1"
     next_state = handle_getting_destination(update, context)
 
     assert next_state == TransferStates.DESTINATION
@@ -136,17 +180,20 @@ def test_getting_destination__stupid_choice(
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_getting_destination__friend_documents_list_is_empty(
-    update: Update, context: CallbackContext, telegram_user: TelegramUser, friend: TelegramUser
+    update: Update,
+    context: CallbackContext,
+    callback_query: CallbackQuery,
+    telegram_user: TelegramUser,
+    friend: TelegramUser,
 ) -> None:
-    context.user_data[_FRIEND_VARIANTS_SESSION] = {1: friend}
-    update.message.text = "1"
+    callback_query.data = f"transfer:{friend.id}"
 
     next_state = handle_getting_destination(update, context)
 
     assert next_state == TransferStates.DESTINATION
     update.message.reply_text.assert_called_once_with(_FRIEND_DOCUMENT_LIST_EMPTY_ERROR)
     assert _CHOSEN_FRIEND_SESSION in context.user_data
-    assert context.user_data[_CHOSEN_FRIEND_SESSION] == friend
+    assert context.user_data[_CHOSEN_FRIEND_SESSION] == friend.id
     assert _DESTINATION_DOCUMENTS_SESSION not in context.user_data
 
 
@@ -170,25 +217,40 @@ def _test_getting_destination_document__bank_object(
     update: Update, context: CallbackContext, bank_account: BankAccount, obj: BankObject
 ) -> None:
     update.message.text = "1"
-    context.user_data[_SOURCE_DOCUMENTS_SESSION] = {1: bank_account}
-    context.user_data[_DESTINATION_DOCUMENTS_SESSION] = {1: obj}
+    context.user_data[_DESTINATION_DOCUMENTS_SESSION] = _get_rows(obj)
 
     next_state = handle_getting_destination_document(update, context)
 
     assert next_state == TransferStates.SOURCE_DOCUMENT
     assert _DESTINATION_SESSION in context.user_data
-    assert type(context.user_data[_DESTINATION_SESSION]) is BankAccount
-    assert context.user_data[_DESTINATION_SESSION] == (obj if isinstance(obj, BankAccount) else obj.bank_account)
+    assert context.user_data[_DESTINATION_SESSION] == (obj if isinstance(obj, BankAccount) else obj.bank_account).number
+    assert bank_account.number in [row[0] for row in context.user_data[CATALOG_SESSION]]
     update.message.reply_text.assert_called_once()
 
 
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_getting_destination_document__fresh_balance(
+    update: Update, context: CallbackContext, bank_account: BankAccount, friend_account: BankAccount
+) -> None:
+    update.message.text = "1"
+    context.user_data[_DESTINATION_DOCUMENTS_SESSION] = _get_rows(friend_account)
+    context.user_data[CATALOG_SESSION] = _get_rows(bank_account)
+    bank_account.balance = 123
+    bank_account.save()
+
+    handle_getting_destination_document(update, context)
+
+    assert f"{bank_account.short_number} (123" in update.message.reply_text.call_args.args[0]
+
+
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_getting_destination_document__stupid_choice(
     update: Update, context: CallbackContext, friend_account: BankAccount
 ) -> None:
     update.message.text = "-1"
-    context.user_data[_DESTINATION_DOCUMENTS_SESSION] = {1: friend_account}
+    context.user_data[_DESTINATION_DOCUMENTS_SESSION] = _get_rows(friend_account)
 
     next_state = handle_getting_destination_document(update, context)
 
@@ -213,13 +275,13 @@ def test_getting_source_document__card(update: Update, context: CallbackContext,
 
 def _test_getting_source_document__bank_object(update: Update, context: CallbackContext, obj: BankObject) -> None:
     update.message.text = "1"
-    context.user_data[_SOURCE_DOCUMENTS_SESSION] = {1: obj}
+    context.user_data[CATALOG_SESSION] = _get_rows(obj)
 
     next_state = handle_getting_source_document(update, context)
 
     assert next_state == TransferStates.ACCRUAL
     assert _SOURCE_SESSION in context.user_data
-    assert context.user_data[_SOURCE_SESSION] == (obj if isinstance(obj, BankAccount) else obj.bank_account)
+    assert context.user_data[_SOURCE_SESSION] == (obj if isinstance(obj, BankAccount) else obj.bank_account).number
     update.message.reply_text.assert_called_once_with(_ACCRUAL_WELCOME)
 
 
@@ -229,7 +291,7 @@ def test_getting_source_document__stupid_choice(
     update: Update, context: CallbackContext, bank_account: BankAccount
 ) -> None:
     update.message.text = "-1"
-    context.user_data[_SOURCE_DOCUMENTS_SESSION] = {1: bank_account}
+    context.user_data[CATALOG_SESSION] = _get_rows(bank_account)
 
     next_state = handle_getting_source_document(update, context)
 
@@ -244,7 +306,7 @@ def test_getting_source_document__balance_is_zero(
     update: Update, context: CallbackContext, bank_account: BankAccount
 ) -> None:
     update.message.text = "1"
-    context.user_data[_SOURCE_DOCUMENTS_SESSION] = {1: bank_account}
+    context.user_data[CATALOG_SESSION] = _get_rows(bank_account)
     bank_account.balance = 0
     bank_account.save()
 
@@ -262,14 +324,14 @@ def test_getting_accrual(
 ) -> None:
     update.message.text = str(bank_account.balance)
     accrual = service.parse_accrual(update.message.text)
-    context.user_data[_SOURCE_SESSION] = bank_account
-    context.user_data[_DESTINATION_SESSION] = friend_account
+    context.user_data[_SOURCE_SESSION] = bank_account.number
+    context.user_data[_DESTINATION_SESSION] = friend_account.number
 
     next_state = handle_getting_accrual(update, context)
 
     assert next_state == TransferStates.PHOTO
     assert _ACCRUAL_SESSION in context.user_data
-    assert context.user_data[_ACCRUAL_SESSION] == accrual
+    assert Decimal(context.user_data[_ACCRUAL_SESSION]) == accrual
     update.message.reply_text.assert_called_once_with(_PHOTO_WELCOME)
 
 
@@ -293,7 +355,7 @@ def test_getting_accrual__extracting_error(
     update: Update, context: CallbackContext, bank_account: BankAccount, friend_account: BankAccount
 ) -> None:
     update.message.text = str(bank_account.balance * 2)
-    context.user_data[_SOURCE_SESSION] = bank_account
+    context.user_data[_SOURCE_SESSION] = bank_account.number
 
     next_state = handle_getting_accrual(update, context)
 
@@ -302,22 +364,78 @@ def test_getting_accrual__extracting_error(
     assert _ACCRUAL_SESSION not in context.user_data
 
 
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_getting_accrual__balance_spent(
+    update: Update, context: CallbackContext, bank_account: BankAccount, friend_account: BankAccount
+) -> None:
+    update.message.text = str(bank_account.balance)
+    context.user_data[_SOURCE_SESSION] = bank_account.number
+    BankAccount.objects.filter(number=bank_account.number).update(balance=0)
+
+    next_state = handle_getting_accrual(update, context)
+
+    assert next_state == TransferStates.ACCRUAL
+    update.message.reply_text.assert_called_once_with(_ACCRUAL_GREATER_BALANCE_ERROR)
+
+
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_getting_photo(
     update: Update, context: CallbackContext, photo: PhotoSize, bank_account: BankAccount, another_account: BankAccount
 ) -> None:
-    context.user_data[_SOURCE_SESSION] = bank_account
-    context.user_data[_DESTINATION_SESSION] = another_account
-    context.user_data[_ACCRUAL_SESSION] = 10
+    context.user_data[_SOURCE_SESSION] = bank_account.number
+    context.user_data[_DESTINATION_SESSION] = another_account.number
+    context.user_data[_ACCRUAL_SESSION] = "10"
 
     next_state = handle_getting_photo(update, context)
 
     assert next_state == TransferStates.CONFIRM
-    assert context.user_data.get(_PHOTO_SESSION) == photo
+    assert context.user_data.get(_PHOTO_SESSION) == {
+        "file_id": photo.file_id,
+        "file_unique_id": photo.file_unique_id,
+    }
+    context.bot.get_file.assert_called_once_with(photo.file_id)
     update.message.reply_text.assert_called_once()
 
 
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ["min_side", "expected"],
+    [
+        [60, "small"],
+        [240, "medium"],
+        [800, "large"],
+        [2000, "large"],
+    ],
+)
+def test_getting_photo__choosing_size(
+    update: Update,
+    context: CallbackContext,
+    settings,
+    bank_account: BankAccount,
+    another_account: BankAccount,
+    min_side: int,
+    expected: str,
+) -> None:
+    settings.BOT_PHOTO_MIN_SIDE = min_side
+    update.message.photo = [
+        _photo_size("small", 90, 67, 1000),
+        _photo_size("medium", 320, 240, 10000),
+        _photo_size("large", 1280, 960, 100000),
+        _photo_size("huge", 4000, 3000, settings.MAX_SIZE_PHOTO_BYTES + 1),
+    ]
+    context.user_data[_SOURCE_SESSION] = bank_account.number
+    context.user_data[_DESTINATION_SESSION] = another_account.number
+    context.user_data[_ACCRUAL_SESSION] = "10"
+
+    next_state = handle_getting_photo(update, context)
+
+    assert next_state == TransferStates.CONFIRM
+    assert context.user_data[_PHOTO_SESSION]["file_id"] == expected
+
+
 @pytest.mark.django_db
 @pytest.mark.integration
 @pytest.mark.parametrize(
@@ -362,6 +480,22 @@ def test_transfer_fail(
     _assert_transfer(update, context, bank_account, another_account, BALANCE * 2, None, False)
 
 
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_transfer_fail__balance_spent_after_confirmation(
+    update: Update, context: CallbackContext, bank_account: BankAccount, another_account: BankAccount
+) -> None:
+    context.user_data[_SOURCE_SESSION] = bank_account.number
+    context.user_data[_DESTINATION_SESSION] = another_account.number
+    context.user_data[_ACCRUAL_SESSION] = str(BALANCE)
+
+    handle_skip_getting_photo(update, context)
+    update.message.reply_text.reset_mock()
+    BankAccount.objects.filter(number=bank_account.number).update(balance=BALANCE - 1)
+
+    _assert_transfer(update, context, bank_account, another_account, BALANCE, None, False)
+
+
 def _assert_transfer(
     update: Update,
     context: CallbackContext,
@@ -371,14 +505,17 @@ def _assert_transfer(
     photo: Optional[PhotoSize],
     is_success: bool,
 ) -> None:
-    context.user_data[_SOURCE_SESSION] = source
-    context.user_data[_DESTINATION_SESSION] = destination
-    context.user_data[_ACCRUAL_SESSION] = accrual
-    context.user_data[_PHOTO_SESSION] = photo
-    context.user_data[_SOURCE_DOCUMENTS_SESSION] = None
+    context.user_data[_SOURCE_SESSION] = source.number
+    context.user_data[_DESTINATION_SESSION] = destination.number
+    context.user_data[_ACCRUAL_SESSION] = str(accrual)
+    context.user_data[_PHOTO_SESSION] = (
+        {"file_id": photo.file_id, "file_unique_id": photo.file_unique_id, "file_size": photo.file_size}
+        if photo
+        else None
+    )
+    context.user_data[CATALOG_SESSION] = None
     context.user_data[_DESTINATION_DOCUMENTS_SESSION] = None
-    context.user_data[_CHOSEN_FRIEND_SESSION] = None
-    context.user_data[_FRIEND_VARIANTS_SESSION] = None
+    context.user_data[_CHOSEN_FRIEND_SESSION] = destination.owner_id
 
     source_balance, destination_balance = source.balance, destination.balance
 
@@ -396,6 +533,7 @@ def _assert_transfer(
             context.bot.send_photo.assert_called_once()
         else:
             context.bot.send_message.assert_called_once()
+            assert context.bot.send_message.call_args.kwargs["chat_id"] == destination.owner_id
 
         transaction = Transaction.objects.filter(source=source, destination=destination, accrual=accrual).first()
         assert transaction is not None
@@ -408,3 +546,19 @@ def _assert_transfer(
 
         assert source.balance == source_balance - accrual
         assert destination.balance == destination_balance + accrual
+
+
+def _get_rows(obj: BankObject) -> list:
+    account = bank_object_service.get_bank_account_from_document(obj)
+
+    return DocumentCatalog([Document.create(obj.number_field, account.number, account.balance)]).to_rows()
+
+
+def _photo_size(file_id: str, width: int, height: int, file_size: int) -> PhotoSize:
+    return PhotoSize(file_id, f"{file_id} unique id", width, height, file_size)
+
+
+def _get_choices(update: Update) -> List[str]:
+    markup = update.message.reply_text.call_args.kwargs["reply_markup"]
+
+    return [button.callback_data for row in markup.inline_keyboard for button in row]
@@ -1,11 +1,29 @@
-from unittest.mock import MagicMock
+from concurrent.futures import Future
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 from django.conf import settings
-from telegram import PhotoSize, Update, User
+from telegram import CallbackQuery, PhotoSize, Update, User
 from telegram.ext import CallbackContext, ConversationHandler
 
+import app.internal.general.bot.handlers as handlers
 from app.internal.general.bot.handlers import COMMAND, IN_CONVERSATION
+from app.internal.general.services import user_service
+
+
+@pytest.fixture(autouse=True)
+def run_in_foreground(monkeypatch) -> None:
+    def submit(func, *args) -> Future:
+        future = Future()
+        future.set_result(func(*args))
+
+        return future
+
+    executor = MagicMock()
+    executor.submit.side_effect = submit
+
+    monkeypatch.setattr(handlers, "_executor", executor)
+    monkeypatch.setattr(handlers, "close_old_connections", lambda: None)
 
 
 @pytest.fixture(scope="function")
@@ -22,21 +40,38 @@ def update(user: User, photo: PhotoSize) -> Update:
 
     update = MagicMock()
     update.effective_user = user
+    update.effective_message = message
     update.message = message
+    update.callback_query = None
 
     return update
 
 
 @pytest.fixture(scope="function")
-def context() -> CallbackContext:
+def callback_query(update: Update) -> CallbackQuery:
+    callback_query = MagicMock()
+    callback_query.answer.return_value = None
+    callback_query.edit_message_text.return_value = None
+    callback_query.edit_message_reply_markup.return_value = None
+    callback_query.data = ""
+
+    update.callback_query = callback_query
+
+    return callback_query
+
+
+@pytest.fixture(scope="function")
+def context(update: Update, photo: PhotoSize) -> CallbackContext:
     bot = MagicMock()
     bot.send_message.return_value = None
     bot.send_photo.return_value = None
+    bot.get_file.return_value = photo.get_file.return_value
 
     context = MagicMock()
     context.args = []
     context.user_data = dict()
     context.bot = bot
+    type(context).telegram_user = PropertyMock(side_effect=lambda: user_service.get_user(update.effective_user.id))
 
     return context
 
@@ -49,7 +84,10 @@ def photo() -> PhotoSize:
     file.download_as_bytearray.return_value = b"123"
 
     photo.file_size = settings.MAX_SIZE_PHOTO_BYTES - 1
+    photo.width = 1280
+    photo.height = 960
     photo.get_file.return_value = file
+    photo.file_id = "Super id"
     photo.file_unique_id = "Super unique id"
 
     return photo
@@ -1,15 +1,31 @@
 from typing import List
 
 import pytest
-from telegram import Update
+from django.test import override_settings
+from telegram import CallbackQuery, Update
+from telegram.error import RetryAfter, Unauthorized
 from telegram.ext import CallbackContext
 
-from app.internal.user.db.models import TelegramUser
+from app.internal.general.bot.pagination import NEXT, PREVIOUS
+from app.internal.general.services import suggestion_service
+from app.internal.user.db.models import FriendRequest, TelegramUser
+from app.internal.user.presentation.handlers.bot.friends import commands
+from app.internal.user.presentation.handlers.bot.friends.accept_conversation import get_notification
 from app.internal.user.presentation.handlers.bot.friends.commands import (
+    _ACCEPT_ALL_SUCCESS,
+    _FRIENDS_WELCOME,
+    _FRIENDSHIP_WELCOME,
     _FRIENDSHIPS_EMPTY,
     _LIST_EMPTY_ERROR,
+    _SUGGESTIONS_EMPTY,
+    _SUGGESTIONS_WELCOME,
+    handle_accept_all,
     handle_friends,
+    handle_friends_page,
     handle_friendships,
+    handle_friendships_page,
+    handle_reject_all,
+    handle_suggestions,
 )
 
 
@@ -20,7 +36,38 @@ def test_friends(
 ) -> None:
     handle_friends(update, context)
 
-    assert update.message.reply_text.call_count == len(friends)
+    text = update.message.reply_text.call_args.args[0]
+    assert text.startswith(_FRIENDS_WELCOME)
+    assert all(friend.username in text for friend in friends)
+    assert update.message.reply_text.call_args.kwargs["reply_markup"] is None
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@override_settings(BOT_FRIENDS_PAGE_SIZE=1)
+def test_friends__pages(
+    update: Update,
+    context: CallbackContext,
+    callback_query: CallbackQuery,
+    friends: List[TelegramUser],
+    telegram_user_with_phone: TelegramUser,
+) -> None:
+    first, second = sorted(friend.username for friend in friends)
+    update.callback_query = None
+
+    handle_friends(update, context)
+
+    assert first in update.message.reply_text.call_args.args[0]
+    assert _get_navigation(update.message.reply_text) == [f"friends:{NEXT}"]
+
+    update.callback_query = callback_query
+    callback_query.data = f"friends:{NEXT}"
+
+    handle_friends_page(update, context)
+
+    text = callback_query.edit_message_text.call_args.args[0]
+    assert second in text and first not in text
+    assert _get_navigation(callback_query.edit_message_text) == [f"friends:{PREVIOUS}"]
 
 
 @pytest.mark.django_db
@@ -31,9 +78,137 @@ def test_friends__not_exist(update: Update, context: CallbackContext, telegram_u
     update.message.reply_text.assert_called_once_with(_LIST_EMPTY_ERROR)
 
 
+@pytest.mark.django_db
+@pytest.mark.integration
+@override_settings(BOT_FRIENDS_PAGE_SIZE=1)
+def test_friendships__pages(
+    update: Update,
+    context: CallbackContext,
+    callback_query: CallbackQuery,
+    telegram_user_with_phone: TelegramUser,
+    friend_requests: List[FriendRequest],
+) -> None:
+    first, second = sorted(request.source.username for request in friend_requests)
+    update.callback_query = None
+
+    handle_friendships(update, context)
+
+    assert update.message.reply_text.call_args.args[0] == _FRIENDSHIP_WELCOME + first
+    assert _get_navigation(update.message.reply_text) == [f"friendships:{NEXT}"]
+
+    update.callback_query = callback_query
+    callback_query.data = f"friendships:{NEXT}"
+
+    handle_friendships_page(update, context)
+
+    assert callback_query.edit_message_text.call_args.args[0] == _FRIENDSHIP_WELCOME + second
+    assert _get_navigation(callback_query.edit_message_text) == [f"friendships:{PREVIOUS}"]
+
+
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_friendships__empty(update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser) -> None:
     handle_friendships(update, context)
 
     update.message.reply_text.assert_called_once_with(_FRIENDSHIPS_EMPTY)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_accept_all(
+    update: Update,
+    context: CallbackContext,
+    telegram_user_with_phone: TelegramUser,
+    friend_requests: List[FriendRequest],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(commands, "run_in_background", lambda func, *args: func(*args))
+    selected = friend_requests[0].source
+    context.args = [selected.username]
+
+    handle_accept_all(update, context)
+
+    update.message.reply_text.assert_called_once_with(_ACCEPT_ALL_SUCCESS.format(usernames=selected.username))
+    context.bot.send_message.assert_called_once_with(chat_id=selected.id, text=get_notification(update.effective_user))
+    assert list(telegram_user_with_phone.friends.all()) == [selected]
+    assert FriendRequest.objects.filter(destination=telegram_user_with_phone).count() == len(friend_requests) - 1
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_reject_all(
+    update: Update,
+    context: CallbackContext,
+    telegram_user_with_phone: TelegramUser,
+    friend_requests: List[FriendRequest],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(commands, "run_in_background", lambda func, *args: func(*args))
+
+    handle_reject_all(update, context)
+
+    assert context.bot.send_message.call_count == len(friend_requests)
+    assert not FriendRequest.objects.filter(destination=telegram_user_with_phone).exists()
+    assert not telegram_user_with_phone.friends.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_reject_all__notification_errors(
+    update: Update,
+    context: CallbackContext,
+    telegram_user_with_phone: TelegramUser,
+    friend_requests: List[FriendRequest],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(commands, "run_in_background", lambda func, *args: func(*args))
+    monkeypatch.setattr(commands, "sleep", lambda seconds: None)
+    blocked, limited = friend_requests[0].source_id, friend_requests[1].source_id
+    errors = {blocked: [Unauthorized("blocked")], limited: [RetryAfter(1)]}
+
+    def send_message(chat_id: int, text: str) -> None:
+        if errors.get(chat_id):
+            raise errors[chat_id].pop()
+
+    context.bot.send_message.side_effect = send_message
+
+    handle_reject_all(update, context)
+
+    chat_ids = [call.kwargs["chat_id"] for call in context.bot.send_message.call_args_list]
+    assert sorted(chat_ids) == sorted([*(request.source_id for request in friend_requests), limited])
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_reject_all__empty(update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser) -> None:
+    handle_reject_all(update, context)
+
+    update.message.reply_text.assert_called_once_with(_FRIENDSHIPS_EMPTY)
+    context.bot.send_message.assert_not_called()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_suggestions(
+    update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser, friends: List[TelegramUser]
+) -> None:
+    stranger = TelegramUser.objects.create(id=42, username="stranger", first_name="Stranger")
+    stranger.friends.add(*friends)
+    suggestion_service.rebuild(batch_size=100, limit=10)
+
+    handle_suggestions(update, context)
+
+    text = update.message.reply_text.call_args.args[0]
+    assert text.startswith(_SUGGESTIONS_WELCOME) and stranger.username in text
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_suggestions__empty(update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser) -> None:
+    handle_suggestions(update, context)
+
+    update.message.reply_text.assert_called_once_with(_SUGGESTIONS_EMPTY)
+
+
+def _get_navigation(send) -> List[str]:
+    return [button.callback_data for button in send.call_args.kwargs["reply_markup"].inline_keyboard[-1]]
@@ -1,13 +1,13 @@
 import pytest
-from telegram import Update
+from telegram import CallbackQuery, Update
 from telegram.ext import CallbackContext
 
+from app.internal.general.bot.pagination import _PAGE_CURSOR_SESSION
 from app.internal.user.db.models import FriendRequest, TelegramUser
 from app.internal.user.presentation.handlers.bot.friends.FriendStates import FriendStates
 from app.internal.user.presentation.handlers.bot.friends.reject_conversation import (
     _REJECT_SUCCESS,
     _STUPID_CHOICE,
-    _USERNAMES_SESSION,
     get_notification,
     handle_reject,
     handle_reject_start,
@@ -29,7 +29,7 @@ def test_reject_start(
 
     assert next_state == FriendStates.INPUT
     assert_conversation_start(context)
-    assert context.user_data.get(_USERNAMES_SESSION) == {1: another_telegram_user.username}
+    assert context.user_data[_PAGE_CURSOR_SESSION] == [another_telegram_user.username] * 2
     update.message.reply_text.assert_called_once()
 
 
@@ -38,11 +38,11 @@ def test_reject_start(
 def test_reject(
     update: Update,
     context: CallbackContext,
+    callback_query: CallbackQuery,
     telegram_user_with_phone: TelegramUser,
     another_telegram_user: TelegramUser,
 ) -> None:
-    update.message.text = "1"
-    context.user_data[_USERNAMES_SESSION] = {int(update.message.text): another_telegram_user}
+    callback_query.data = f"reject:{another_telegram_user.id}"
     request = FriendRequest.objects.create(source=another_telegram_user, destination=telegram_user_with_phone)
 
     next_state = handle_reject(update, context)
@@ -64,11 +64,11 @@ def test_reject(
 def test_reject__stupid_choice(
     update: Update,
     context: CallbackContext,
+    callback_query: CallbackQuery,
     telegram_user_with_phone: TelegramUser,
     another_telegram_user: TelegramUser,
 ) -> None:
-    update.message.text = "-1"
-    context.user_data[_USERNAMES_SESSION] = {1: another_telegram_user}
+    callback_query.data = "reject:1"
 
     next_state = handle_reject(update, context)
 
@@ -0,0 +1,79 @@
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from django.test import override_settings
+from telegram import CallbackQuery, Update
+from telegram.ext import CallbackContext
+
+from app.internal.general.bot.pagination import _PAGE_CURSOR_SESSION, NEXT, PREVIOUS
+from app.internal.user.db.models import FriendRequest, TelegramUser
+from app.internal.user.presentation.handlers.bot.friends.FriendStates import FriendStates
+from app.internal.user.presentation.handlers.bot.friends.general import send_requester_page
+from tests.integration.bot.conftest import assert_conversation_end
+
+_WELCOME = "abc"
+_LIST_EMPTY = "ops"
+_PREFIX = "requests"
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_send_requester_page(
+    update: Update,
+    context: CallbackContext,
+    telegram_user_with_phone,
+    another_telegram_users: List[TelegramUser],
+    friend_requests: List[FriendRequest],
+) -> None:
+    first, second = sorted(another_telegram_users, key=lambda user: user.username)
+
+    next_state = send_requester_page(update, context, _PREFIX, _LIST_EMPTY, _WELCOME)
+
+    assert next_state == FriendStates.INPUT
+    assert context.user_data[_PAGE_CURSOR_SESSION] == [first.username, second.username]
+    assert _get_keyboard(update.message.reply_text) == [[f"{_PREFIX}:{first.id}"], [f"{_PREFIX}:{second.id}"]]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@override_settings(BOT_FRIENDS_PAGE_SIZE=1)
+def test_send_requester_page__navigation(
+    update: Update,
+    context: CallbackContext,
+    callback_query: CallbackQuery,
+    telegram_user_with_phone,
+    another_telegram_users: List[TelegramUser],
+    friend_requests: List[FriendRequest],
+) -> None:
+    first, second = sorted(another_telegram_users, key=lambda user: user.username)
+    context.user_data[_PAGE_CURSOR_SESSION] = [first.username, first.username]
+    callback_query.data = f"{_PREFIX}:{NEXT}"
+
+    next_state = send_requester_page(update, context, _PREFIX, _LIST_EMPTY, _WELCOME)
+
+    assert next_state == FriendStates.INPUT
+    assert context.user_data[_PAGE_CURSOR_SESSION] == [second.username, second.username]
+    assert _get_keyboard(callback_query.edit_message_text) == [[f"{_PREFIX}:{second.id}"], [f"{_PREFIX}:{PREVIOUS}"]]
+    callback_query.answer.assert_called_once()
+    update.message.reply_text.assert_not_called()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_send_requester_page__empty(
+    update: MagicMock,
+    context: MagicMock,
+    telegram_user_with_phone,
+    another_telegram_users: List[TelegramUser],
+) -> None:
+    next_state = send_requester_page(update, context, _PREFIX, _LIST_EMPTY, _WELCOME)
+
+    assert_conversation_end(next_state, context)
+    update.message.reply_text.assert_called_once_with(_LIST_EMPTY)
+
+
+def _get_keyboard(send: MagicMock) -> List[List[str]]:
+    markup = send.call_args.kwargs["reply_markup"]
+
+    return [[button.callback_data for button in row] for row in markup.inline_keyboard]
@@ -1,18 +1,19 @@
 from typing import List
 
 import pytest
-from telegram import Update
+from telegram import CallbackQuery, Update
 from telegram.ext import CallbackContext
 
+from app.internal.general.bot.pagination import _PAGE_CURSOR_SESSION, NEXT
 from app.internal.user.db.models import TelegramUser
 from app.internal.user.presentation.handlers.bot.friends.rm_conversation import (
+    _LIST_EMPTY,
     _REMOVE_SUCCESS,
     _STUPID_CHOICE,
-    _USER_SESSION,
-    _USERNAMES_SESSION,
     FriendStates,
     get_notification,
     handle_rm_friend,
+    handle_rm_friend_page,
     handle_rm_friend_start,
 )
 from tests.integration.bot.conftest import assert_conversation_end, assert_conversation_start
@@ -27,19 +28,51 @@ def test_rm_friend__start(
 
     assert next_state == FriendStates.INPUT
     assert_conversation_start(context)
-    assert context.user_data.get(_USER_SESSION) == telegram_user_with_phone
-    assert type(context.user_data.get(_USERNAMES_SESSION)) is dict
-    assert sorted(context.user_data[_USERNAMES_SESSION].values(), key=str) == sorted(friends, key=str)
+    assert context.user_data[_PAGE_CURSOR_SESSION] == sorted(friend.username for friend in friends)
+    update.message.reply_text.assert_called_once()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_rm_friend__start_without_friends(
+    update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser
+) -> None:
+    next_state = handle_rm_friend_start(update, context)
+
+    assert_conversation_end(next_state, context)
+    update.message.reply_text.assert_called_once_with(_LIST_EMPTY)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_rm_friend__page_falls_back_to_first(
+    update: Update,
+    context: CallbackContext,
+    callback_query: CallbackQuery,
+    telegram_user_with_phone: TelegramUser,
+    friends: List[TelegramUser],
+) -> None:
+    last = max(friend.username for friend in friends)
+    context.user_data[_PAGE_CURSOR_SESSION] = [last, last]
+    callback_query.data = f"rm:{NEXT}"
+
+    next_state = handle_rm_friend_page(update, context)
+
+    assert next_state == FriendStates.INPUT
+    assert context.user_data[_PAGE_CURSOR_SESSION] == sorted(friend.username for friend in friends)
+    callback_query.edit_message_text.assert_called_once()
 
 
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_rm_friend(
-    update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser, friend: TelegramUser
+    update: Update,
+    context: CallbackContext,
+    callback_query: CallbackQuery,
+    telegram_user_with_phone: TelegramUser,
+    friend: TelegramUser,
 ) -> None:
-    update.message.text = "1"
-    context.user_data[_USER_SESSION] = telegram_user_with_phone
-    context.user_data[_USERNAMES_SESSION] = {int(update.message.text): friend}
+    callback_query.data = f"rm:{friend.id}"
 
     next_state = handle_rm_friend(update, context)
 
@@ -53,11 +86,13 @@ def test_rm_friend(
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_rm_friend__stupid_choice(
-    update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser, friend: TelegramUser
+    update: Update,
+    context: CallbackContext,
+    callback_query: CallbackQuery,
+    telegram_user_with_phone: TelegramUser,
+    friend: TelegramUser,
 ) -> None:
-    update.message.text = "-1"
-    context.user_data[_USER_SESSION] = telegram_user_with_phone
-    context.user_data[_USERNAMES_SESSION] = {1: friend}
+    callback_query.data = "rm:1"
 
     next_state = handle_rm_friend(update, context)
 
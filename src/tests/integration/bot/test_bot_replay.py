@@ -0,0 +1,39 @@
+from typing import Iterator
+
+import pytest
+
+from app.internal.bank.db.models import Transaction
+from tests.performance.BotReplay import generate_updates, replay_to_service, seed_users
+from tests.performance.FakeBotApi import FakeBotApi
+
+USERS = 4
+
+
+@pytest.fixture(scope="function")
+def api() -> Iterator[FakeBotApi]:
+    api = FakeBotApi()
+    api.start()
+
+    yield api
+
+    api.stop()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+def test_replay_to_service(api: FakeBotApi) -> None:
+    user_ids = seed_users(USERS)
+    updates = generate_updates(user_ids, conversations=3, seed=2)
+    transfers = sum(update.get("message", {}).get("text") == "/confirm" for update in updates)
+
+    result = replay_to_service(updates, api, workers=2)
+    summary = result.get_summary()
+
+    assert summary["updates"] == len(updates)
+    assert all(row["errors"] == 0 for row in summary["labels"].values())
+    assert all(row["queries_per_update"] > 0 for row in summary["labels"].values())
+    assert Transaction.objects.count() == transfers
+    assert (
+        summary["bot_api_calls"]["sendMessage"]
+        == len(updates) - summary["bot_api_calls"].get("sendDocument", 0) + transfers
+    )
@@ -72,6 +72,27 @@ def test_authorizing_user__ignoring_phone_if_undefined(
     assert authorize_user(phone=False)(_handler)(update, context) == _handler(update, context)
 
 
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_authorizing_user__cached_verdict(
+    update: Update, context: CallbackContext, telegram_user_with_phone: TelegramUser, django_assert_num_queries
+) -> None:
+    authorize_user()(_handler)(update, context)
+
+    with django_assert_num_queries(0):
+        assert authorize_user()(_handler)(update, context) == _handler(update, context)
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_authorizing_user__cached_verdict_without_phone(
+    update: Update, context: CallbackContext, telegram_user: TelegramUser
+) -> None:
+    authorize_user(phone=False)(_handler)(update, context)
+
+    assert_authorizing_user__error(update, context, _UNDEFINED_PHONE)
+
+
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_if_user_is_not_in_conversation(update: Update, context: CallbackContext, telegram_user: TelegramUser) -> None:
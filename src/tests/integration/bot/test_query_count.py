@@ -0,0 +1,132 @@
+from collections import Counter
+from typing import Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from telegram import Bot, Update, User
+from telegram.ext import ConversationHandler, Dispatcher, Handler
+
+from app.internal.bank.db.models import BankCard
+from app.internal.bot import context_types, handlers, register_handlers
+from app.internal.general.services import session_persistence
+from app.internal.user.db.models import FriendRequest, TelegramUser
+
+COMMANDS = [
+    "start",
+    "me",
+    "relations",
+    "friends",
+    "friendships",
+    "suggestions",
+    "accept_all",
+    "reject_all",
+    "last",
+    "balance",
+    "history",
+    "transfer",
+    "add",
+    "rm",
+    "accept",
+    "reject",
+    "phone",
+    "password",
+    "cancel",
+]
+
+_USER_QUERY = 'FROM "telegram_users" LEFT OUTER JOIN "secret_keys"'
+
+
+@pytest.fixture(scope="function")
+def errors() -> List[Exception]:
+    return []
+
+
+@pytest.fixture(scope="function")
+def dispatcher(errors: List[Exception]) -> Iterator[Dispatcher]:
+    bot = MagicMock(spec=Bot)
+    bot.defaults = None
+    bot.arbitrary_callback_data = False
+
+    dispatcher = Dispatcher(bot, update_queue=None, persistence=session_persistence, context_types=context_types)
+    register_handlers(dispatcher)
+
+    dispatcher.add_error_handler(lambda update, context: errors.append(context.error))
+
+    yield dispatcher
+
+    dispatcher.stop()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize("command", COMMANDS)
+def test_command_queries(
+    dispatcher: Dispatcher,
+    errors: List[Exception],
+    user: User,
+    friends: List[TelegramUser],
+    cards: List[BankCard],
+    friend_requests: List[FriendRequest],
+    command: str,
+) -> None:
+    with CaptureQueriesContext(connection) as first:
+        dispatcher.process_update(_command_update(dispatcher.bot, user, command, 1))
+
+    dispatcher.process_update(_command_update(dispatcher.bot, user, "cancel", 2))
+
+    with CaptureQueriesContext(connection) as second:
+        dispatcher.process_update(_command_update(dispatcher.bot, user, command, 3))
+
+    assert errors == []
+    _assert_no_duplicates(first.captured_queries)
+    _assert_no_duplicates(second.captured_queries)
+    assert _count_user_queries(first.captured_queries) <= 1
+    assert _count_user_queries(second.captured_queries) <= _count_user_queries(first.captured_queries)
+
+
+@pytest.mark.integration
+def test_every_handler_has_budget() -> None:
+    callbacks = [handler.callback for handler in _get_handlers(handlers)]
+
+    assert [callback.__qualname__ for callback in callbacks if getattr(callback, "query_budget", None) is None] == []
+
+
+def _get_handlers(handlers: List[Handler]) -> Iterator[Handler]:
+    for handler in handlers:
+        if isinstance(handler, ConversationHandler):
+            yield from _get_handlers(handler.entry_points)
+            yield from _get_handlers([state for states in handler.states.values() for state in states])
+            yield from _get_handlers(handler.fallbacks)
+        else:
+            yield handler
+
+
+def _command_update(bot: Bot, user: User, command: str, update_id: int) -> Update:
+    text = f"/{command}"
+
+    return Update.de_json(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {"id": user.id, "type": "private"},
+                "from": user.to_dict(),
+                "text": text,
+                "entities": [{"type": "bot_command", "offset": 0, "length": len(text)}],
+            },
+        },
+        bot,
+    )
+
+
+def _assert_no_duplicates(queries: List[dict]) -> None:
+    selects = Counter(query["sql"] for query in queries if query["sql"].startswith("SELECT"))
+
+    assert [sql for sql, amount in selects.items() if amount > 1] == []
+
+
+def _count_user_queries(queries: List[dict]) -> int:
+    return sum(_USER_QUERY in query["sql"] for query in queries)
@@ -1,18 +1,28 @@
+from datetime import timedelta
+from pathlib import Path
 from typing import Callable, List
 
 import freezegun
 import pytest
 from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
 from django.db.models import Q
 from django.http import HttpRequest
 from django.utils import timezone
 from ninja import UploadedFile
 
-from app.internal.bank.db.models import BankAccount, BankCard, BankObject, Transaction
+from app.internal.bank.db.models import BankAccount, BankCard, BankObject, PhotoBlob, Transaction
+from app.internal.bank.db.repositories import PhotoRepository
 from app.internal.bank.domain.entities import BankAccountOut, BankCardOut, TransactionOut, TransferIn
 from app.internal.bank.presentation.handlers import BankHandlers
 from app.internal.general.rest.exceptions import BadRequestException, NotFoundException
-from app.internal.general.services import bank_object_service, transaction_service, transfer_service
+from app.internal.general.services import (
+    bank_object_service,
+    transaction_partition_service,
+    transaction_service,
+    transfer_service,
+)
 from tests.conftest import BALANCE
 
 handlers = BankHandlers(bank_object_service, transaction_service, transfer_service)
@@ -67,6 +77,54 @@ def test_getting_account_history(
         assert_transaction_with_response(transactions[i], responses[i])
 
 
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_getting_account_history__archived(
+    http_request: HttpRequest, archive_root: Path, bank_account: BankAccount, another_account: BankAccount
+) -> None:
+    old = NOW - timedelta(days=400)
+
+    archived = Transaction.objects.create(source=bank_account, destination=another_account)
+    Transaction.objects.filter(pk=archived.pk).update(created_at=old)
+    recent = Transaction.objects.create(source=bank_account, destination=another_account)
+    transaction_partition_service.create_partitions(old, 3)
+    transaction_partition_service.archive_partitions(12)
+
+    live = handlers.get_account_history(http_request, bank_account.number)
+    full = handlers.get_account_history(http_request, bank_account.number, archived=True)
+    bounded = handlers.get_account_history(http_request, bank_account.number, until=recent.created_at, archived=True)
+
+    assert [response.created_at for response in live] == [recent.created_at]
+    assert [response.created_at for response in full] == [old, recent.created_at]
+    assert [response.created_at for response in bounded] == [old]
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_getting_account_history__photo_variants(
+    http_request: HttpRequest, bank_account: BankAccount, another_account: BankAccount, storage: FileSystemStorage
+) -> None:
+    photo_repo = PhotoRepository()
+    name, *_ = photo_repo.store(ContentFile(b"photo", "photo.jpg"))
+    Transaction.objects.bulk_create(
+        Transaction(source=bank_account, destination=another_account, photo=photo) for photo in (name, None)
+    )
+
+    assert [
+        response.photo_variants for response in handlers.get_account_history(http_request, bank_account.number)
+    ] == [
+        {},
+        {},
+    ]
+
+    photo_repo.save_variants(name, {variant: b"variant" for variant in settings.PHOTO_VARIANT_SIDES})
+    responses = handlers.get_account_history(http_request, bank_account.number)
+
+    assert {variant: url for response in responses for variant, url in response.photo_variants.items()} == {
+        variant: storage.url(variant_name) for variant, variant_name in PhotoBlob.get_variant_names(name).items()
+    }
+
+
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_getting_account_history__invalid_number(
@@ -281,6 +339,9 @@ def assert_transaction_with_response(transaction: Transaction, response: Transac
     assert abs(transaction.accrual.__float__() - response.accrual) < 10**-9
     assert transaction.created_at == response.created_at
     assert (transaction.photo.url if transaction.photo else None) == response.photo
+    assert {
+        variant: transaction.photo.storage.url(name) for variant, name in transaction.get_photo_variant_names().items()
+    } == response.photo_variants
 
 
 def assert_getting_bank_object_in_handler(
@@ -5,27 +5,53 @@ from django.http import HttpRequest
 
 from app.internal.general.rest.exceptions import BadRequestException, NotFoundException
 from app.internal.general.rest.responses import SuccessResponse
-from app.internal.general.services import friend_service, request_service, user_service
+from app.internal.general.services import friend_service, request_service, suggestion_service, user_service
 from app.internal.user.db.models import FriendRequest, TelegramUser
+from app.internal.user.domain.entities.friends import FriendRequestsIn
 from app.internal.user.domain.entities.user import TelegramUserOut
 from app.internal.user.presentation.handlers import FriendHandlers
 
-handlers = FriendHandlers(user_service, friend_service, request_service)
+handlers = FriendHandlers(user_service, friend_service, request_service, suggestion_service)
 
 
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_getting_friends(http_request: HttpRequest, friends: List[TelegramUser]) -> None:
     actual = handlers.get_friends(http_request)
-    expected = http_request.telegram_user.friends.all()
+    expected = http_request.telegram_user.friends.order_by("username")
 
-    assert len(actual) == len(expected)
+    assert len(actual.items) == len(expected)
+    assert actual.previous is None and actual.next is None
 
-    actual = sorted(actual, key=lambda schema: schema.id)
-    expected = sorted(expected, key=lambda user: user.id)
+    for i in range(len(actual.items)):
+        assert_users_info(actual.items[i], expected[i])
 
-    for i in range(len(actual)):
-        assert_users_info(actual[i], expected[i])
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_getting_friends__pages(http_request: HttpRequest, friends: List[TelegramUser]) -> None:
+    first, second = sorted(friends, key=lambda friend: friend.username)
+
+    page = handlers.get_friends(http_request, limit=1)
+    next_page = handlers.get_friends(http_request, after=page.next, limit=1)
+    previous_page = handlers.get_friends(http_request, before=next_page.previous, limit=1)
+
+    assert [friend.id for friend in page.items] == [first.id]
+    assert (page.previous, page.next) == (None, first.username)
+    assert [friend.id for friend in next_page.items] == [second.id]
+    assert (next_page.previous, next_page.next) == (second.username, None)
+    assert previous_page == page
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_getting_friends__prefix(http_request: HttpRequest, friends: List[TelegramUser]) -> None:
+    friend = friends[0]
+
+    actual = handlers.get_friends(http_request, prefix=friend.username[:-1].upper())
+
+    assert [found.id for found in actual.items] == [friend.id]
+    assert handlers.get_friends(http_request, prefix="missing").items == []
 
 
 @pytest.mark.django_db
@@ -97,12 +123,26 @@ def test_adding_friend__request_exists(http_request: HttpRequest, another_telegr
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_getting_friend_requests(http_request: HttpRequest, friend_requests: List[FriendRequest]) -> None:
-    actual = sorted(map(lambda request: request.username, handlers.get_friend_requests(http_request)))
+    actual = [request.username for request in handlers.get_friend_requests(http_request).items]
     expected = sorted(map(lambda request: request.source.username, friend_requests))
 
     assert actual == expected
 
 
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_getting_friend_requests__pages(http_request: HttpRequest, friend_requests: List[FriendRequest]) -> None:
+    first, second = sorted(request.source.username for request in friend_requests)
+
+    page = handlers.get_friend_requests(http_request, limit=1)
+    next_page = handlers.get_friend_requests(http_request, after=page.next, limit=1)
+    prefixed = handlers.get_friend_requests(http_request, prefix=second)
+
+    assert ([request.username for request in page.items], page.next) == ([first], first)
+    assert ([request.username for request in next_page.items], next_page.previous) == ([second], second)
+    assert [request.username for request in prefixed.items] == [second]
+
+
 @pytest.mark.django_db
 @pytest.mark.integration
 def test_accepting_friend_request__invalid_identifier(http_request: HttpRequest) -> None:
@@ -169,6 +209,51 @@ def test_rejecting_friend_request(
     assert not telegram_user.friends.filter(id=request_2.source.id).exists()
 
 
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_accepting_friend_requests(
+    http_request: HttpRequest, telegram_user: TelegramUser, friend_requests: List[FriendRequest]
+) -> None:
+    selected = friend_requests[0].source
+
+    actual = handlers.accept_friend_requests(http_request, FriendRequestsIn(usernames=[selected.username]))
+    rest = handlers.accept_friend_requests(http_request, FriendRequestsIn())
+
+    assert actual.usernames == [selected.username]
+    assert sorted(rest.usernames) == sorted(request.source.username for request in friend_requests[1:])
+    assert telegram_user.friends.count() == len(friend_requests)
+    assert not FriendRequest.objects.filter(destination=telegram_user).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_rejecting_friend_requests(
+    http_request: HttpRequest, telegram_user: TelegramUser, friend_requests: List[FriendRequest]
+) -> None:
+    actual = handlers.reject_friend_requests(http_request, FriendRequestsIn())
+    repeated = handlers.reject_friend_requests(http_request, FriendRequestsIn())
+
+    assert sorted(actual.usernames) == sorted(request.source.username for request in friend_requests)
+    assert repeated.usernames == []
+    assert not telegram_user.friends.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_getting_friend_suggestions(
+    http_request: HttpRequest, friends: List[TelegramUser], another_telegram_users: List[TelegramUser]
+) -> None:
+    friend, stranger = friends[0], TelegramUser.objects.create(id=42, username="stranger", first_name="Stranger")
+    stranger.friends.add(friend)
+    suggestion_service.rebuild(batch_size=100, limit=10)
+
+    actual = handlers.get_friend_suggestions(http_request)
+
+    assert [(item.id, item.username, item.mutual_friends, item.interactions) for item in actual] == [
+        (stranger.id, stranger.username, 1, 0)
+    ]
+
+
 def assert_bad_request_in_adding_friend(http_request: HttpRequest, friend: TelegramUser) -> None:
     with pytest.raises(BadRequestException):
         handlers.add_friend(http_request, friend.id)
@@ -0,0 +1,113 @@
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import pytest
+from django.conf import settings
+from ninja.testing import TestClient
+
+from app.internal.bank.db.models import BankAccount, BankCard, Transaction
+from app.internal.general.services import auth_service
+from app.internal.user.db.models import FriendRequest, TelegramUser
+from config.urls import api
+from tests.conftest import KEY, PASSWORD, PHONE
+
+TRANSACTIONS_PER_ACCOUNT = 5
+
+Request = Tuple[str, str, dict]
+
+ENDPOINTS: Dict[str, Callable[[dict], Request]] = {
+    "login": lambda scene: ("POST", "/auth/login", {"json": {"username": scene["username"], "password": PASSWORD}}),
+    "refresh": lambda scene: ("POST", "/auth/refresh", {"COOKIES": {settings.REFRESH_TOKEN_COOKIE: scene["refresh"]}}),
+    "me": lambda scene: ("GET", "/user/me", {}),
+    "phone": lambda scene: ("PATCH", "/user/phone", {"json": {"phone": PHONE}}),
+    "password": lambda scene: ("PATCH", "/user/password", {"json": {"key": KEY, "password": PASSWORD}}),
+    "friends": lambda scene: ("GET", f"/friends?prefix={scene['friend'][:3]}&limit=1", {}),
+    "friend_requests": lambda scene: ("GET", f"/friends/requests?after={scene['stranger']}", {}),
+    "friend_suggestions": lambda scene: ("GET", "/friends/suggestions", {}),
+    "friend": lambda scene: ("GET", f"/friends/{scene['friend']}", {}),
+    "add_friend": lambda scene: ("POST", f"/friends/{scene['stranger']}", {}),
+    "accept_friend": lambda scene: ("POST", f"/friends/{scene['requester']}/accept", {}),
+    "reject_friend": lambda scene: ("POST", f"/friends/{scene['requester']}/reject", {}),
+    "accept_friends": lambda scene: ("POST", "/friends/requests/accept", {"json": {"usernames": [scene["requester"]]}}),
+    "reject_friends": lambda scene: ("POST", "/friends/requests/reject", {"json": {}}),
+    "remove_friend": lambda scene: ("DELETE", f"/friends/{scene['friend']}", {}),
+    "accounts": lambda scene: ("GET", "/bank/accounts", {}),
+    "account": lambda scene: ("GET", f"/bank/accounts/{scene['account']}", {}),
+    "account_history": lambda scene: ("GET", f"/bank/accounts/{scene['account']}/history", {}),
+    "cards": lambda scene: ("GET", "/bank/cards", {}),
+    "card": lambda scene: ("GET", f"/bank/cards/{scene['card']}", {}),
+    "card_history": lambda scene: ("GET", f"/bank/cards/{scene['card']}/history", {}),
+    "transfer": lambda scene: (
+        "POST",
+        "/bank/transfer",
+        {"data": {"source": scene["account"], "destination": scene["destination"], "accrual": 1}},
+    ),
+}
+
+
+@pytest.fixture(scope="function")
+def client(monkeypatch) -> Iterator[TestClient]:
+    monkeypatch.setenv("NINJA_SKIP_REGISTRY", "1")
+
+    yield TestClient(api)
+
+
+@pytest.fixture(scope="function")
+def scene(
+    telegram_user_with_password: TelegramUser,
+    cards: List[BankCard],
+    another_accounts: List[BankAccount],
+    friends: List[TelegramUser],
+) -> dict:
+    stranger = TelegramUser.objects.create(id=1, username="stranger", first_name="Stranger")
+    requester = TelegramUser.objects.create(id=2, username="requester", first_name="Requester")
+    FriendRequest.objects.create(source=requester, destination=telegram_user_with_password)
+
+    Transaction.objects.bulk_create(
+        Transaction(source=card.bank_account, destination=account, accrual=1)
+        for card in cards
+        for account in another_accounts
+        for _ in range(TRANSACTIONS_PER_ACCOUNT)
+    )
+
+    access, refresh = auth_service.create_access_and_refresh_tokens(telegram_user_with_password)
+
+    return {
+        "username": telegram_user_with_password.username,
+        "access": access,
+        "refresh": refresh,
+        "friend": friends[0].username,
+        "stranger": stranger.username,
+        "requester": requester.username,
+        "account": cards[0].bank_account_id,
+        "card": cards[0].number,
+        "destination": another_accounts[0].number,
+    }
+
+
+@pytest.mark.integration
+def test_every_operation_has_budget() -> None:
+    operations = [
+        operation
+        for _, router in api._routers
+        for path_view in router.path_operations.values()
+        for operation in path_view.operations
+    ]
+
+    assert len(operations) == len(ENDPOINTS)
+    assert [operation.view_func.__name__ for operation in operations if not _get_budget(operation)] == []
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+def test_query_budget(client: TestClient, scene: dict, endpoint: str) -> None:
+    method, path, params = ENDPOINTS[endpoint](scene)
+    headers = {"Authorization": f"Bearer {scene['access']}"}
+
+    response = client.request(method, path, headers=headers, **params)
+
+    assert response.status_code == 200
+
+
+def _get_budget(operation) -> int:
+    return getattr(operation.view_func, "query_budget", 0)
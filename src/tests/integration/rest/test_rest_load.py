@@ -0,0 +1,17 @@
+import pytest
+
+from tests.performance.BankDataset import BankDataset
+from tests.performance.RestLoad import WEIGHTS, run_load
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.integration
+def test_run_load(live_server) -> None:
+    dataset = BankDataset(users=3, transactions=30)
+    dataset.create()
+
+    summary = run_load(live_server.url, dataset, clients=2, duration=1).get_summary()
+
+    assert summary["requests"] > 0
+    assert set(summary["endpoints"]) <= set(WEIGHTS)
+    assert all(row["errors"] == 0 for row in summary["endpoints"].values())
@@ -0,0 +1,60 @@
+from typing import List, Optional
+
+import pytest
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+
+from app.internal.bank.db.models import BankAccount, BankCard, Transaction
+from app.internal.general.services import auth_service
+from app.internal.user.db.models import TelegramUser
+from tests.conftest import BALANCE
+
+
+@pytest.fixture(scope="function")
+def transfer(
+    client: Client,
+    telegram_user_with_password: TelegramUser,
+    cards: List[BankCard],
+    another_accounts: List[BankAccount],
+):
+    access, _ = auth_service.create_access_and_refresh_tokens(telegram_user_with_password)
+
+    def post(photo: Optional[SimpleUploadedFile]):
+        data = {"source": cards[0].bank_account_id, "destination": another_accounts[0].number, "accrual": 1}
+        if photo:
+            data["photo"] = photo
+
+        return client.post("/api/bank/transfer", data, HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    return post
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+def test_streaming_photo_to_storage(transfer, storage: FileSystemStorage) -> None:
+    content = b"1" * (settings.UPLOAD_SPOOL_MEMORY_BYTES * 3)
+
+    response = transfer(SimpleUploadedFile("photo.jpg", content, content_type="image/jpeg"))
+
+    assert response.status_code == 200
+    transaction = Transaction.objects.get()
+    assert storage.open(transaction.photo.name).read() == content
+
+
+@pytest.mark.django_db
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    ["size", "content_type"],
+    [
+        [settings.MAX_SIZE_PHOTO_BYTES + 1, "image/jpeg"],
+        [1, "text/plain"],
+    ],
+)
+def test_rejecting_photo(transfer, cards: List[BankCard], size: int, content_type: str) -> None:
+    response = transfer(SimpleUploadedFile("photo.jpg", b"1" * size, content_type=content_type))
+
+    assert response.status_code == 400
+    assert not Transaction.objects.exists()
+    assert BankAccount.objects.get(number=cards[0].bank_account_id).balance == BALANCE
@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from random import Random
+from typing import List
+
+from django.conf import settings
+from django.db import transaction
+
+from app.internal.bank.db.models import BankAccount, BankCard, Transaction
+from app.internal.user.db.models import TelegramUser
+
+_FIRST_USER_ID = 8 * 10**12
+_FIRST_ACCOUNT_NUMBER = 8 * 10**19
+_FIRST_CARD_NUMBER = 8 * 10**15
+_BALANCE = Decimal(10**9)
+_BATCH_SIZE = 5000
+
+PASSWORD = "benchmark"
+
+
+@dataclass
+class BankDataset:
+    users: int = 200
+    accounts_per_user: int = 2
+    cards_per_account: int = 1
+    transactions: int = 20_000
+    hot_share: float = 0.1
+    seed: int = 0
+
+    user_ids: List[int] = field(default_factory=list, init=False)
+    account_numbers: List[str] = field(default_factory=list, init=False)
+    card_numbers: List[str] = field(default_factory=list, init=False)
+
+    def __post_init__(self):
+        self.user_ids = list(range(_FIRST_USER_ID, _FIRST_USER_ID + self.users))
+        self.account_numbers = [
+            str(_FIRST_ACCOUNT_NUMBER + number) for number in range(self.users * self.accounts_per_user)
+        ]
+        self.card_numbers = [
+            str(_FIRST_CARD_NUMBER + number) for number in range(len(self.account_numbers) * self.cards_per_account)
+        ]
+
+    def get_username(self, user_id: int) -> str:
+        return f"bench_{user_id}"
+
+    def get_owner_id(self, account_number: str) -> int:
+        return self.user_ids[(int(account_number) - _FIRST_ACCOUNT_NUMBER) // self.accounts_per_user]
+
+    def get_hottest_account(self) -> str:
+        return self.account_numbers[0]
+
+    def create(self) -> None:
+        random = Random(self.seed)
+        password = settings.HASHER.encode(PASSWORD, settings.SALT)
+
+        with transaction.atomic():
+            TelegramUser.objects.bulk_create(
+                (
+                    TelegramUser(
+                        id=user_id,
+                        username=self.get_username(user_id),
+                        first_name="Bench",
+                        phone="+70000000000",
+                        password=password,
+                    )
+                    for user_id in self.user_ids
+                ),
+                batch_size=_BATCH_SIZE,
+            )
+            BankAccount.objects.bulk_create(
+                (
+                    BankAccount(number=number, owner_id=self.get_owner_id(number), balance=_BALANCE)
+                    for number in self.account_numbers
+                ),
+                batch_size=_BATCH_SIZE,
+            )
+            BankCard.objects.bulk_create(
+                (
+                    BankCard(number=number, bank_account_id=self.account_numbers[index // self.cards_per_account])
+                    for index, number in enumerate(self.card_numbers)
+                ),
+                batch_size=_BATCH_SIZE,
+            )
+            Transaction.objects.bulk_create(
+                (self._create_transaction(random) for _ in range(self.transactions)), batch_size=_BATCH_SIZE
+            )
+
+    def remove(self) -> None:
+        with transaction.atomic():
+            Transaction.objects.filter(source__owner_id__in=self.user_ids).delete()
+            Transaction.objects.filter(destination__owner_id__in=self.user_ids).delete()
+            TelegramUser.objects.filter(id__in=self.user_ids).delete()
+
+    def _create_transaction(self, random: Random) -> Transaction:
+        hottest = self.get_hottest_account()
+        source, destination = random.sample(self.account_numbers, 2)
+
+        if random.random() < self.hot_share and hottest not in (source, destination):
+            source = hottest
+
+        return Transaction(
+            source_id=source,
+            destination_id=destination,
+            accrual=Decimal(random.randrange(1, 10**6)) / 100,
+        )
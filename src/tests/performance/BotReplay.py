@@ -0,0 +1,372 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from decimal import Decimal
+from json import dumps, loads
+from random import Random
+from threading import Event, Lock
+from time import perf_counter, sleep, time
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.error import URLError
+from urllib.request import Request as HttpRequest, urlopen
+
+from django.conf import settings
+from django.db import connection
+from telegram import Bot, Update
+from telegram.ext import CallbackContext
+from telegram.utils.request import Request
+
+from app.internal.bank.db.models import BankAccount, BankCard
+from app.internal.bot import create_dispatcher
+from app.internal.general.bot.UpdateWorkerPool import UpdateWorkerPool
+from app.internal.general.db import QueryCounter
+from app.internal.general.db.models import BotSession
+from app.internal.user.db.models import TelegramUser
+from tests.performance.FakeBotApi import FakeBotApi
+from tests.performance.latency import summarize_latencies
+
+FIRST_USER_ID = 9 * 10**12
+_FIRST_ACCOUNT_NUMBER = 9 * 10**19
+_FIRST_CARD_NUMBER = 9 * 10**15
+_BALANCE = Decimal(10**9)
+_PHONE = "+70000000000"
+
+CONVERSATIONS = {
+    "transfer": ["/transfer", "transfer:{friend}", "1", "1", "1.00", "/skip", "/confirm"],
+    "history": ["/history", "1"],
+    "balance": ["/balance", "1"],
+}
+_WEIGHTS = {"transfer": 2, "history": 1, "balance": 3}
+
+_CALLBACK_SEPARATOR = ":"
+_REPLAY_MODE = "replay"
+_IDLE_SECONDS = 2
+_TIMEOUT_SECONDS = 600
+
+
+@dataclass
+class Measurement:
+    label: str
+    latency: float = 0
+    processing: Optional[float] = None
+    queries: Optional[int] = None
+    failed: bool = False
+
+
+@dataclass
+class ReplayResult:
+    updates: int
+    elapsed: float
+    measurements: List[Measurement]
+    bot_api_calls: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.updates / self.elapsed if self.elapsed else 0
+
+    def get_summary(self) -> dict:
+        groups: Dict[str, List[Measurement]] = defaultdict(list)
+        for measurement in self.measurements:
+            groups[measurement.label].append(measurement)
+
+        return {
+            "updates": self.updates,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "updates_per_second": round(self.throughput, 1),
+            "bot_api_calls": self.bot_api_calls,
+            "labels": {label: _summarize(measurements) for label, measurements in sorted(groups.items())},
+        }
+
+
+def seed_users(users: int) -> List[int]:
+    user_ids = list(range(FIRST_USER_ID, FIRST_USER_ID + users))
+
+    TelegramUser.objects.bulk_create(
+        TelegramUser(id=user_id, username=f"load_{user_id}", first_name="Load", phone=_PHONE) for user_id in user_ids
+    )
+    BankAccount.objects.bulk_create(
+        BankAccount(number=str(_FIRST_ACCOUNT_NUMBER + number), owner_id=user_id, balance=_BALANCE)
+        for number, user_id in enumerate(user_ids)
+    )
+    BankCard.objects.bulk_create(
+        BankCard(number=str(_FIRST_CARD_NUMBER + number), bank_account_id=str(_FIRST_ACCOUNT_NUMBER + number))
+        for number in range(users)
+    )
+
+    friends = TelegramUser.friends.through
+    friends.objects.bulk_create(
+        friends(from_telegramuser_id=user_id, to_telegramuser_id=friend_id)
+        for number, user_id in enumerate(user_ids)
+        for friend_id in {user_ids[number - 1], user_ids[(number + 1) % users]} - {user_id}
+    )
+
+    return user_ids
+
+
+def remove_users(user_ids: List[int]) -> None:
+    BotSession.objects.filter(user_id__in=user_ids).delete()
+    TelegramUser.objects.filter(id__in=user_ids).delete()
+
+
+def generate_updates(user_ids: List[int], conversations: int, seed: int = 0) -> List[dict]:
+    random = Random(seed)
+    names = list(_WEIGHTS)
+    weights = list(_WEIGHTS.values())
+
+    scripts = {
+        user_id: [
+            step.format(friend=user_ids[(number + 1) % len(user_ids)])
+            for name in random.choices(names, weights, k=conversations)
+            for step in CONVERSATIONS[name]
+        ]
+        for number, user_id in enumerate(user_ids)
+    }
+
+    updates = []
+    pending = [user_id for user_id in user_ids if scripts[user_id]]
+    positions = dict.fromkeys(user_ids, 0)
+
+    while pending:
+        index = random.randrange(len(pending))
+        user_id = pending[index]
+
+        updates.append(_make_update(len(updates) + 1, user_id, scripts[user_id][positions[user_id]]))
+        positions[user_id] += 1
+
+        if positions[user_id] == len(scripts[user_id]):
+            pending[index] = pending[-1]
+            pending.pop()
+
+    return updates
+
+
+def read_updates(path: str) -> List[dict]:
+    with open(path, encoding="utf-8") as file:
+        return [loads(line) for line in file if line.strip()]
+
+
+def write_updates(path: str, updates: Iterable[dict]) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        file.writelines(dumps(update, ensure_ascii=False) + "\n" for update in updates)
+
+
+def get_labels(updates: List[dict]) -> List[str]:
+    commands: Dict[int, str] = {}
+    steps: Dict[int, int] = defaultdict(int)
+    labels = []
+
+    for update in updates:
+        message = update.get("message") or {}
+        chat_id = _get_chat_id(update)
+        text = message.get("text") or ("<photo>" if message.get("photo") else "<other>")
+
+        if text.startswith("/") and text not in ("/skip", "/confirm", "/cancel"):
+            commands[chat_id] = text.split()[0]
+            steps[chat_id] = 0
+        else:
+            steps[chat_id] += 1
+
+        command = commands.get(chat_id, "<none>")
+        labels.append(command if steps[chat_id] == 0 else f"{command} #{steps[chat_id]}")
+
+    return labels
+
+
+def replay_to_service(
+    updates: List[dict], api: FakeBotApi, workers: int, rate: Optional[float] = None, token: str = "123456:replay"
+) -> ReplayResult:
+    measurements = {update["update_id"]: Measurement(label) for update, label in zip(updates, get_labels(updates))}
+    submitted: Dict[int, float] = {}
+    processed = _Countdown(len(updates))
+
+    bot = Bot(
+        token,
+        base_url=api.url,
+        base_file_url=api.file_url,
+        request=Request(con_pool_size=workers + settings.BOT_ASYNC_WORKERS),
+    )
+    dispatcher = create_dispatcher(bot)
+
+    def fail(update: object, context: CallbackContext) -> None:
+        if isinstance(update, Update):
+            measurements[update.update_id].failed = True
+
+    dispatcher.add_error_handler(fail)
+
+    def process(json: dict) -> None:
+        measurement = measurements[json["update_id"]]
+        queries = QueryCounter()
+        started = perf_counter()
+
+        try:
+            with connection.execute_wrapper(queries):
+                dispatcher.process_update(Update.de_json(json, bot))
+        finally:
+            measurement.processing = perf_counter() - started
+            measurement.latency = time() - submitted[json["update_id"]]
+            measurement.queries = queries.amount
+            processed.count_down()
+
+    pool = UpdateWorkerPool(process, workers, settings.BOT_QUEUE_SIZE, max(len(updates), 1), mode=_REPLAY_MODE)
+    pool.start()
+
+    started = perf_counter()
+    for number, json in enumerate(updates):
+        _pace(started, number, rate)
+        submitted[json["update_id"]] = time()
+
+        if not pool.submit(json):
+            processed.count_down()
+
+    processed.wait()
+    elapsed = perf_counter() - started
+
+    pool.stop()
+    dispatcher.stop()
+    api.wait_idle(_IDLE_SECONDS, _TIMEOUT_SECONDS)
+
+    return ReplayResult(len(updates), elapsed, list(measurements.values()), api.get_methods())
+
+
+def replay_to_url(updates: List[dict], api: FakeBotApi, url: str, concurrency: int) -> ReplayResult:
+    labels = get_labels(updates)
+    measurements = [Measurement(label) for label in labels]
+
+    chats: Dict[int, List[int]] = defaultdict(list)
+    for number, update in enumerate(updates):
+        chats[_get_chat_id(update)].append(number)
+
+    def post(numbers: List[int]) -> None:
+        for number in numbers:
+            request = HttpRequest(url, dumps(updates[number]).encode(), {"Content-Type": "application/json"})
+            sent = perf_counter()
+
+            try:
+                with urlopen(request, timeout=_TIMEOUT_SECONDS) as response:
+                    response.read()
+            except URLError:
+                measurements[number].failed = True
+
+            measurements[number].latency = perf_counter() - sent
+
+    started_at = time()
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(post, chats.values()))
+
+    api.wait_idle(_IDLE_SECONDS, _TIMEOUT_SECONDS)
+    elapsed = (api.get_last_call_time() or time()) - started_at
+
+    return ReplayResult(len(updates), elapsed, measurements, api.get_methods())
+
+
+def format_summary(summary: dict) -> str:
+    lines = [
+        f"updates: {summary['updates']}",
+        f"elapsed: {summary['elapsed_seconds']} s",
+        f"throughput: {summary['updates_per_second']} updates/s",
+        "bot api calls: " + ", ".join(f"{method}={amount}" for method, amount in summary["bot_api_calls"].items()),
+        "",
+        f"{'label':<20}{'count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}{'proc ms':>10}"
+        f"{'queries':>10}{'errors':>8}",
+    ]
+
+    for label, row in summary["labels"].items():
+        lines.append(
+            f"{label:<20}{row['count']:>8}{row['p50_ms']:>10.1f}{row['p90_ms']:>10.1f}{row['p99_ms']:>10.1f}"
+            f"{row['max_ms']:>10.1f}{_format_optional(row['processing_ms']):>10}"
+            f"{_format_optional(row['queries_per_update']):>10}{row['errors']:>8}"
+        )
+
+    return "\n".join(lines)
+
+
+def _make_update(update_id: int, user_id: int, step: str) -> dict:
+    if _CALLBACK_SEPARATOR in step:
+        return _callback_update(update_id, user_id, step)
+
+    return {"update_id": update_id, "message": _message(update_id, user_id, step)}
+
+
+def _callback_update(update_id: int, user_id: int, data: str) -> dict:
+    return {
+        "update_id": update_id,
+        "callback_query": {
+            "id": str(update_id),
+            "from": _user(user_id),
+            "chat_instance": str(user_id),
+            "message": _message(update_id, user_id, ""),
+            "data": data,
+        },
+    }
+
+
+def _message(message_id: int, user_id: int, text: str) -> dict:
+    message = {
+        "message_id": message_id,
+        "date": int(time()),
+        "chat": {"id": user_id, "type": "private"},
+        "from": _user(user_id),
+        "text": text,
+    }
+
+    if text.startswith("/"):
+        message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text)}]
+
+    return message
+
+
+def _user(user_id: int) -> dict:
+    return {"id": user_id, "is_bot": False, "first_name": "Load", "username": f"load_{user_id}"}
+
+
+def _summarize(measurements: List[Measurement]) -> dict:
+    processing = [measurement.processing for measurement in measurements if measurement.processing is not None]
+    queries = [measurement.queries for measurement in measurements if measurement.queries is not None]
+
+    return {
+        "count": len(measurements),
+        "errors": sum(measurement.failed for measurement in measurements),
+        **summarize_latencies([measurement.latency for measurement in measurements]),
+        "processing_ms": sum(processing) / len(processing) * 1000 if processing else None,
+        "queries_per_update": sum(queries) / len(queries) if queries else None,
+    }
+
+
+def _format_optional(value: Optional[float]) -> str:
+    return "n/a" if value is None else f"{value:.1f}"
+
+
+def _get_chat_id(update: dict) -> int:
+    for value in update.values():
+        if isinstance(value, dict):
+            chat = value.get("chat") or value.get("message", {}).get("chat") or value.get("from")
+            if chat and "id" in chat:
+                return chat["id"]
+
+    return 0
+
+
+def _pace(started: float, number: int, rate: Optional[float]) -> None:
+    if rate:
+        delay = started + number / rate - perf_counter()
+        if delay > 0:
+            sleep(delay)
+
+
+class _Countdown:
+    def __init__(self, amount: int):
+        self._amount = amount
+        self._lock = Lock()
+        self._done = Event()
+
+        if amount == 0:
+            self._done.set()
+
+    def count_down(self) -> None:
+        with self._lock:
+            self._amount -= 1
+            if self._amount == 0:
+                self._done.set()
+
+    def wait(self) -> None:
+        self._done.wait()
@@ -0,0 +1,140 @@
+from collections import Counter
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from json import dumps, loads
+from threading import Condition, Thread
+from time import monotonic, time
+from typing import Dict, List, NamedTuple, Optional
+
+_FILE_CONTENT = b"\x89PNG\r\n\x1a\n"
+_SEND_METHODS = {"sendMessage", "sendDocument", "sendPhoto"}
+
+
+class BotApiCall(NamedTuple):
+    method: str
+    chat_id: Optional[int]
+    received_at: float
+
+
+class FakeBotApi:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.calls: List[BotApiCall] = []
+
+        self._condition = Condition()
+        self._message_ids = count(1)
+        self._server = ThreadingHTTPServer((host, port), _FakeBotApiHandler)
+        self._server.daemon_threads = True
+        self._server.api = self
+        self._thread: Optional[Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/bot"
+
+    @property
+    def file_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/file/bot"
+
+    def start(self) -> None:
+        self._thread = Thread(target=self._server.serve_forever, name="fake-bot-api", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def get_methods(self) -> Dict[str, int]:
+        with self._condition:
+            return dict(Counter(call.method for call in self.calls))
+
+    def get_last_call_time(self) -> Optional[float]:
+        with self._condition:
+            return self.calls[-1].received_at if self.calls else None
+
+    def wait_idle(self, idle: float, timeout: float) -> bool:
+        deadline = monotonic() + timeout
+
+        with self._condition:
+            while monotonic() < deadline:
+                amount = len(self.calls)
+                self._condition.wait(min(idle, max(deadline - monotonic(), 0)))
+
+                if len(self.calls) == amount:
+                    return True
+
+        return False
+
+    def call(self, method: str, params: dict) -> object:
+        chat_id = params.get("chat_id")
+        chat_id = int(chat_id) if chat_id is not None else None
+
+        with self._condition:
+            self.calls.append(BotApiCall(method, chat_id, time()))
+            self._condition.notify_all()
+
+        if method == "getMe":
+            return {"id": 1, "is_bot": True, "first_name": "Bank", "username": "fake_bank_bot"}
+
+        if method == "getFile":
+            return {
+                "file_id": params.get("file_id"),
+                "file_unique_id": params.get("file_id"),
+                "file_size": len(_FILE_CONTENT),
+                "file_path": f"photos/{params.get('file_id')}.png",
+            }
+
+        if method in _SEND_METHODS:
+            return {
+                "message_id": next(self._message_ids),
+                "date": int(time()),
+                "chat": {"id": chat_id, "type": "private"},
+                "text": params.get("text") or params.get("caption") or "",
+            }
+
+        return True
+
+
+class _FakeBotApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        method = self.path.rstrip("/").rsplit("/", 1)[-1]
+        result = self.server.api.call(method, self._read_params())
+
+        self._reply(dumps({"ok": True, "result": result}).encode(), "application/json")
+
+    def do_GET(self) -> None:
+        self._reply(_FILE_CONTENT, "application/octet-stream")
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _read_params(self) -> dict:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        content_type = self.headers.get("Content-Type", "")
+
+        if not body:
+            return {}
+
+        if content_type.startswith("multipart/form-data"):
+            message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+
+            return {
+                part.get_param("name", header="content-disposition"): part.get_payload(decode=True)
+                for part in message.iter_parts()
+                if not part.get_filename()
+            }
+
+        return loads(body)
+
+    def _reply(self, body: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
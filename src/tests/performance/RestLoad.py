@@ -0,0 +1,159 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from json import dumps, loads
+from random import Random
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+from tests.performance.BankDataset import PASSWORD, BankDataset
+from tests.performance.latency import summarize_latencies
+
+LOGIN = "login"
+ACCOUNTS = "accounts"
+HISTORY = "history"
+TRANSFER = "transfer"
+
+WEIGHTS = {ACCOUNTS: 5, HISTORY: 2, TRANSFER: 2, LOGIN: 1}
+
+_LOGIN_URL = "/api/auth/login"
+_ACCOUNTS_URL = "/api/bank/accounts"
+_HISTORY_URL = "/api/bank/accounts/{number}/history"
+_TRANSFER_URL = "/api/bank/transfer"
+
+_TIMEOUT_SECONDS = 60
+
+
+@dataclass
+class RequestResult:
+    endpoint: str
+    latency: float
+    status: int
+
+
+@dataclass
+class LoadResult:
+    clients: int
+    elapsed: float
+    results: List[RequestResult] = field(default_factory=list)
+
+    def get_summary(self) -> dict:
+        groups: Dict[str, List[RequestResult]] = defaultdict(list)
+        for result in self.results:
+            groups[result.endpoint].append(result)
+
+        return {
+            "clients": self.clients,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "requests": len(self.results),
+            "requests_per_second": round(len(self.results) / self.elapsed, 1) if self.elapsed else 0,
+            "endpoints": {endpoint: self._summarize(results) for endpoint, results in sorted(groups.items())},
+        }
+
+    def _summarize(self, results: List[RequestResult]) -> dict:
+        return {
+            "count": len(results),
+            "errors": sum(result.status != 200 for result in results),
+            "requests_per_second": round(len(results) / self.elapsed, 1) if self.elapsed else 0,
+            **summarize_latencies([result.latency for result in results]),
+        }
+
+
+class _Client:
+    def __init__(self, base_url: str, dataset: BankDataset, number: int, seed: int):
+        self._base_url = base_url.rstrip("/")
+        self._dataset = dataset
+        self._random = Random(f"{seed}:{number}")
+        self._user_id = dataset.user_ids[number % len(dataset.user_ids)]
+        self._accounts = [
+            account for account in dataset.account_numbers if dataset.get_owner_id(account) == self._user_id
+        ]
+        self._token: Optional[str] = None
+
+        self.results: List[RequestResult] = []
+
+    def run(self, deadline: float) -> None:
+        self.login()
+
+        endpoints = list(WEIGHTS)
+        weights = list(WEIGHTS.values())
+
+        while perf_counter() < deadline:
+            endpoint = self._random.choices(endpoints, weights)[0]
+            getattr(self, endpoint)()
+
+    def login(self) -> None:
+        credentials = {"username": self._dataset.get_username(self._user_id), "password": PASSWORD}
+        status, body = self._request(LOGIN, _LOGIN_URL, dumps(credentials).encode(), "application/json")
+
+        if status == 200:
+            self._token = loads(body)["access_token"]
+
+    def accounts(self) -> None:
+        self._request(ACCOUNTS, _ACCOUNTS_URL)
+
+    def history(self) -> None:
+        self._request(HISTORY, _HISTORY_URL.format(number=self._random.choice(self._accounts)))
+
+    def transfer(self) -> None:
+        source = self._random.choice(self._accounts)
+        destination = self._random.choice(self._dataset.account_numbers)
+
+        if destination == source:
+            return
+
+        body = urlencode({"source": source, "destination": destination, "accrual": "1"}).encode()
+        self._request(TRANSFER, _TRANSFER_URL, body, "application/x-www-form-urlencoded")
+
+    def _request(
+        self, endpoint: str, path: str, body: Optional[bytes] = None, content_type: Optional[str] = None
+    ) -> Tuple[int, bytes]:
+        headers = {"Content-Type": content_type} if content_type else {}
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
+
+        request = Request(self._base_url + path, body, headers)
+        started = perf_counter()
+
+        try:
+            with urlopen(request, timeout=_TIMEOUT_SECONDS) as response:
+                status, content = response.status, response.read()
+        except HTTPError as error:
+            status, content = error.code, error.read()
+        except URLError:
+            status, content = 0, b""
+
+        self.results.append(RequestResult(endpoint, perf_counter() - started, status))
+
+        return status, content
+
+
+def run_load(base_url: str, dataset: BankDataset, clients: int, duration: float, seed: int = 0) -> LoadResult:
+    workers = [_Client(base_url, dataset, number, seed) for number in range(clients)]
+
+    started = perf_counter()
+    with ThreadPoolExecutor(clients) as executor:
+        list(executor.map(lambda client: client.run(started + duration), workers))
+
+    return LoadResult(clients, perf_counter() - started, [result for client in workers for result in client.results])
+
+
+def format_summary(summary: dict) -> str:
+    lines = [
+        f"clients: {summary['clients']}",
+        f"elapsed: {summary['elapsed_seconds']} s",
+        f"requests: {summary['requests']} ({summary['requests_per_second']} rps)",
+        "",
+        f"{'endpoint':<12}{'count':>8}{'rps':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errors':>8}",
+    ]
+
+    for endpoint, row in summary["endpoints"].items():
+        lines.append(
+            f"{endpoint:<12}{row['count']:>8}{row['requests_per_second']:>8}{row['p50_ms']:>10.1f}"
+            f"{row['p90_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}{row['errors']:>8}"
+        )
+
+    return "\n".join(lines)
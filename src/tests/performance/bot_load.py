@@ -0,0 +1,81 @@
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from json import dump
+
+import django
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from tests.performance.BotReplay import (  # noqa: E402
+    format_summary,
+    generate_updates,
+    read_updates,
+    remove_users,
+    replay_to_service,
+    replay_to_url,
+    seed_users,
+    write_updates,
+)
+from tests.performance.FakeBotApi import FakeBotApi  # noqa: E402
+
+
+def _parse_args() -> Namespace:
+    parser = ArgumentParser(description="Replays Telegram updates against the bot and reports its throughput")
+
+    parser.add_argument("--users", type=int, default=1000, help="simulated users to seed and generate updates for")
+    parser.add_argument("--conversations", type=int, default=3, help="conversations per simulated user")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the generated stream")
+    parser.add_argument("--replay", help="jsonl file with recorded updates to replay instead of generating them")
+    parser.add_argument("--record", help="jsonl file to write the replayed updates to")
+    parser.add_argument("--target", choices=("service", "url"), default="service")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/bot/", help="webhook url for the url target")
+    parser.add_argument("--workers", type=int, default=4, help="update workers for the service target")
+    parser.add_argument("--concurrency", type=int, default=16, help="parallel chats for the url target")
+    parser.add_argument("--rate", type=float, help="limit of submitted updates per second for the service target")
+    parser.add_argument("--api-port", type=int, default=0, help="port of the fake Bot API")
+    parser.add_argument("--output", help="json file to write the summary to")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded users")
+
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+
+    api = FakeBotApi(port=args.api_port)
+    api.start()
+    print(f"fake Bot API: TELEGRAM_API_URL={api.url} TELEGRAM_FILE_URL={api.file_url}")
+
+    user_ids = [] if args.replay else seed_users(args.users)
+
+    try:
+        updates = (
+            read_updates(args.replay) if args.replay else generate_updates(user_ids, args.conversations, args.seed)
+        )
+
+        if args.record:
+            write_updates(args.record, updates)
+
+        if args.target == "service":
+            result = replay_to_service(updates, api, args.workers, args.rate)
+        else:
+            result = replay_to_url(updates, api, args.url, args.concurrency)
+    finally:
+        if user_ids and not args.keep:
+            remove_users(user_ids)
+
+        api.stop()
+
+    summary = result.get_summary()
+    print(format_summary(summary))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            dump(summary, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
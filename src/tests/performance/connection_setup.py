@@ -0,0 +1,42 @@
+import os
+import sys
+from time import perf_counter
+
+import django
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.db import DEFAULT_DB_ALIAS, connections  # noqa: E402
+from django.db.backends.postgresql import base  # noqa: E402
+
+from app.internal.general.db.backends.postgresql.base import DatabaseWrapper  # noqa: E402
+
+REQUESTS = int(os.environ.get("CONNECTION_SETUP_REQUESTS", 500))
+
+
+def _measure(wrapper_class: type) -> float:
+    connection = wrapper_class(connections[DEFAULT_DB_ALIAS].settings_dict, DEFAULT_DB_ALIAS)
+    started = perf_counter()
+
+    for _ in range(REQUESTS):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+        connection.close()
+
+    return (perf_counter() - started) / REQUESTS
+
+
+def main() -> None:
+    direct = _measure(base.DatabaseWrapper)
+    pooled = _measure(DatabaseWrapper)
+
+    print(f"{REQUESTS} requests, connect + SELECT 1 + close per request")
+    print(f"New connection: {direct * 1000:8.3f} ms")
+    print(f"Pooled:         {pooled * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
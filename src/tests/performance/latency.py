@@ -0,0 +1,19 @@
+from typing import List
+
+
+def summarize_latencies(latencies: List[float]) -> dict:
+    values = sorted(latencies)
+
+    if not values:
+        return {"p50_ms": None, "p90_ms": None, "p99_ms": None, "max_ms": None}
+
+    return {
+        "p50_ms": _percentile(values, 0.5) * 1000,
+        "p90_ms": _percentile(values, 0.9) * 1000,
+        "p99_ms": _percentile(values, 0.99) * 1000,
+        "max_ms": values[-1] * 1000,
+    }
+
+
+def _percentile(values: List[float], quantile: float) -> float:
+    return values[min(int(quantile * len(values)), len(values) - 1)]
@@ -0,0 +1,59 @@
+import multiprocessing
+import os
+import resource
+import sys
+from concurrent.futures import ProcessPoolExecutor, wait
+from io import BytesIO
+from time import perf_counter
+
+from PIL import Image
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.internal.general.images import render_variants  # noqa: E402
+
+PHOTOS = int(os.environ.get("PHOTO_PIPELINE_PHOTOS", 200))
+SIDES = {"thumbnail": 160, "medium": 800}
+FORMAT = "WEBP"
+QUALITY = 80
+
+
+def _get_photo() -> bytes:
+    image = Image.effect_mandelbrot((1280, 960), (-2, -1.5, 1, 1.5), 100).convert("RGB")
+
+    buffer = BytesIO()
+    image.save(buffer, "JPEG", quality=90)
+
+    return buffer.getvalue()
+
+
+def _measure(photo: bytes, workers: int) -> None:
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    start = perf_counter()
+
+    with ProcessPoolExecutor(workers, multiprocessing.get_context("spawn")) as executor:
+        wait([executor.submit(render_variants, photo, SIDES, FORMAT, QUALITY) for _ in range(PHOTOS)])
+        seconds = perf_counter() - start
+
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = after.ru_utime + after.ru_stime - before.ru_utime - before.ru_stime
+
+    print(f"{workers:>7} {PHOTOS / seconds:>12.1f} {cpu / PHOTOS * 1000:>15.1f}")
+
+
+def main() -> None:
+    photo = _get_photo()
+    variants = render_variants(photo, SIDES, FORMAT, QUALITY)
+
+    print(
+        f"Original {len(photo) / 1024:.0f} KiB, "
+        + ", ".join(f"{v} {len(c) / 1024:.0f} KiB" for v, c in variants.items())
+    )
+    print(f"{'Workers':>7} {'Photos/sec':>12} {'CPU ms/photo':>15}")
+
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        _measure(photo, workers)
+
+
+if __name__ == "__main__":
+    main()
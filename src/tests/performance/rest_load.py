@@ -0,0 +1,74 @@
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from datetime import datetime, timezone
+from json import dump
+from subprocess import CalledProcessError, check_output
+
+import django
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from tests.performance.BankDataset import BankDataset  # noqa: E402
+from tests.performance.RestLoad import format_summary, run_load  # noqa: E402
+
+
+def _parse_args() -> Namespace:
+    parser = ArgumentParser(description="Runs a multi-client REST load against a server sharing the local database")
+
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="base url of the running server")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent clients")
+    parser.add_argument("--duration", type=float, default=30, help="load duration in seconds")
+    parser.add_argument("--users", type=int, default=1000, help="seeded users")
+    parser.add_argument("--accounts-per-user", type=int, default=2, help="seeded accounts per user")
+    parser.add_argument("--transactions", type=int, default=100_000, help="seeded transactions")
+    parser.add_argument("--seed", type=int, default=0, help="random seed of the dataset and the clients")
+    parser.add_argument("--output", help="json file to write the results to")
+    parser.add_argument("--keep", action="store_true", help="keep the seeded dataset")
+
+    return parser.parse_args()
+
+
+def _get_commit() -> str:
+    try:
+        return check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+    except (CalledProcessError, OSError):
+        return ""
+
+
+def main() -> None:
+    args = _parse_args()
+
+    dataset = BankDataset(
+        users=args.users, accounts_per_user=args.accounts_per_user, transactions=args.transactions, seed=args.seed
+    )
+    dataset.create()
+
+    try:
+        result = run_load(args.url, dataset, args.clients, args.duration, args.seed)
+    finally:
+        if not args.keep:
+            dataset.remove()
+
+    summary = {
+        "commit": _get_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "dataset": {
+            "users": args.users,
+            "accounts_per_user": args.accounts_per_user,
+            "transactions": args.transactions,
+            "seed": args.seed,
+        },
+        **result.get_summary(),
+    }
+    print(format_summary(summary))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            dump(summary, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
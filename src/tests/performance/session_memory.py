@@ -0,0 +1,72 @@
+import os
+import sys
+import tracemalloc
+from decimal import Decimal
+from json import dumps
+from typing import Callable, List
+
+import django
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from telegram import PhotoSize  # noqa: E402
+
+from app.internal.bank.db.models import BankAccount, BankCard  # noqa: E402
+from app.internal.user.db.models import TelegramUser  # noqa: E402
+
+CONVERSATIONS = 10_000
+DOCUMENTS = 4
+FRIENDS = 10
+
+
+def _orm_session(user_id: int) -> dict:
+    owner = TelegramUser(id=user_id, username=f"user{user_id}", first_name="User")
+    accounts = [BankAccount(number=str(10**19 + i), owner=owner, balance=Decimal(100)) for i in range(DOCUMENTS)]
+    cards = [BankCard(number=str(10**15 + i), bank_account=accounts[0]) for i in range(DOCUMENTS)]
+    friends = [TelegramUser(id=user_id * 100 + i, username=f"friend{i}", first_name="Friend") for i in range(FRIENDS)]
+
+    return {
+        "source_documents": dict(enumerate([*accounts, *cards], start=1)),
+        "friend_variants": dict(enumerate(friends, start=1)),
+        "source_document": accounts[0],
+        "accrual": Decimal("10.50"),
+        "transfer_photo": PhotoSize("file-id", "file-unique-id", 1280, 720, 102400),
+    }
+
+
+def _compact_session(user_id: int) -> dict:
+    return {
+        "source_documents": [str(10**19 + i) for i in range(DOCUMENTS)] + [str(10**15 + i) for i in range(DOCUMENTS)],
+        "friend_variants": [user_id * 100 + i for i in range(FRIENDS)],
+        "source_document": str(10**19),
+        "accrual": "10.50",
+        "transfer_photo": {"file_id": "file-id", "file_unique_id": "file-unique-id", "file_size": 102400},
+    }
+
+
+def _measure(build: Callable[[int], dict]) -> int:
+    tracemalloc.start()
+    sessions: List[dict] = [build(user_id) for user_id in range(1, CONVERSATIONS + 1)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del sessions
+
+    return size
+
+
+def main() -> None:
+    orm = _measure(_orm_session)
+    compact = _measure(_compact_session)
+    stored = sum(len(dumps(_compact_session(user_id))) for user_id in range(1, CONVERSATIONS + 1))
+
+    print(f"{CONVERSATIONS} conversations")
+    print(f"ORM user_data in memory:     {orm / 2**20:8.2f} MiB ({orm // CONVERSATIONS} B per conversation)")
+    print(f"Compact user_data in memory: {compact / 2**20:8.2f} MiB ({compact // CONVERSATIONS} B per conversation)")
+    print(f"Compact JSON in bot_sessions:{stored / 2**20:8.2f} MiB ({stored // CONVERSATIONS} B per conversation)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import os
+import sys
+import tracemalloc
+from tempfile import TemporaryDirectory
+from typing import Callable
+
+import django
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.files.base import ContentFile, File  # noqa: E402
+from django.core.files.storage import FileSystemStorage  # noqa: E402
+from django.core.files.uploadedfile import SimpleUploadedFile  # noqa: E402
+from django.http import HttpRequest  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+
+from app.internal.general.rest.SpooledUploadHandler import SpooledUploadHandler  # noqa: E402
+
+REQUESTS = 20
+
+
+def _buffered(request: HttpRequest, storage: FileSystemStorage) -> None:
+    photo = request.FILES["photo"]
+
+    storage.save("photo.jpg", ContentFile(photo.read(), name="photo.jpg"))
+
+
+def _spooled(request: HttpRequest, storage: FileSystemStorage) -> None:
+    request.upload_handlers = [SpooledUploadHandler(request, settings.MAX_SIZE_PHOTO_BYTES, "image/")]
+    photo = request.FILES["photo"]
+
+    storage.save("photo.jpg", File(photo.file, name="photo.jpg"))
+
+
+def _measure(handle: Callable[[HttpRequest, FileSystemStorage], None], storage: FileSystemStorage) -> int:
+    content = b"1" * settings.MAX_SIZE_PHOTO_BYTES
+    peak = 0
+
+    for _ in range(REQUESTS):
+        photo = SimpleUploadedFile("photo.jpg", content, content_type="image/jpeg")
+        request = RequestFactory().post("/api/bank/transfer", {"accrual": 1, "photo": photo})
+
+        tracemalloc.start()
+        handle(request, storage)
+        _, request_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        peak = max(peak, request_peak)
+
+    return peak
+
+
+def main() -> None:
+    with TemporaryDirectory() as location:
+        storage = FileSystemStorage(location=location)
+
+        buffered = _measure(_buffered, storage)
+        spooled = _measure(_spooled, storage)
+
+    print(f"{settings.MAX_SIZE_PHOTO_BYTES // 1024} KiB photo, peak allocations per request")
+    print(f"Buffered upload: {buffered / 2**20:8.2f} MiB")
+    print(f"Spooled upload:  {spooled / 2**20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
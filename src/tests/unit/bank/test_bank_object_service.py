@@ -3,6 +3,7 @@ from typing import List
 import pytest
 
 from app.internal.bank.db.models import BankAccount, BankCard
+from app.internal.bank.domain.services.DocumentCatalog import DocumentCatalog
 from app.internal.general.services import bank_object_service
 from app.internal.user.db.models import TelegramUser
 
@@ -16,15 +17,36 @@ def test_getting_bank_account_from_document(bank_account: BankAccount, card: Ban
 
 @pytest.mark.django_db
 @pytest.mark.unit
-def test_getting_documents_order(
-    telegram_user: TelegramUser, bank_accounts: List[BankAccount], cards: List[BankCard]
+def test_getting_document_catalog(
+    django_assert_num_queries, telegram_user: TelegramUser, bank_accounts: List[BankAccount], cards: List[BankCard]
 ) -> None:
-    order = bank_object_service.get_documents_order(telegram_user)
+    with django_assert_num_queries(1):
+        catalog = bank_object_service.get_document_catalog(telegram_user)
 
-    assert sorted(order.keys()) == list(range(1, len(bank_accounts) + len(cards) + 1))
-    assert sorted(order.values(), key=lambda obj: obj.number_field) == sorted(
-        bank_accounts + cards, key=lambda obj: obj.number_field
+    documents = [document for _, document in catalog.get_numbered()]
+    accounts = [document for document in documents if not document.is_card]
+
+    assert len(catalog) == len(bank_accounts) + len(cards)
+    assert documents[: len(accounts)] == accounts
+    assert sorted(document.number for document in documents) == sorted(
+        obj.number_field for obj in [*bank_accounts, *cards]
+    )
+    assert all(
+        document.account == card.bank_account.number and document.balance == card.bank_account.balance
+        for card in cards
+        for document in documents
+        if document.number == card.number
     )
+    assert DocumentCatalog.from_rows(catalog.to_rows()).documents == [
+        document._replace(balance=None) for document in catalog.documents
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_getting_balance(bank_account: BankAccount) -> None:
+    assert bank_object_service.get_balance(bank_account.number) == bank_account.balance
+    assert bank_object_service.get_balance("0" * len(bank_account.number)) is None
 
 
 @pytest.mark.django_db
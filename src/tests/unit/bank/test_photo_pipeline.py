@@ -0,0 +1,79 @@
+from io import BytesIO
+from threading import current_thread
+from typing import Iterator
+
+import pytest
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from PIL import Image
+
+from app.internal.bank.db.models import PhotoBlob
+from app.internal.bank.db.repositories import PhotoRepository
+from app.internal.bank.domain.services import PhotoPipeline
+from app.internal.metrics import PHOTO_VARIANT_ERRORS
+
+TIMEOUT_SECONDS = 60
+
+photo_repo = PhotoRepository()
+
+
+@pytest.fixture(scope="function")
+def pipeline() -> Iterator[PhotoPipeline]:
+    pipeline = PhotoPipeline(photo_repo, workers=1)
+
+    yield pipeline
+
+    pipeline.shutdown()
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.unit
+def test_storing_variants(pipeline: PhotoPipeline, storage: FileSystemStorage, photo_content: bytes) -> None:
+    name, *_ = photo_repo.store(ContentFile(photo_content, "photo.jpg"))
+
+    assert pipeline.submit(name, photo_content).result(TIMEOUT_SECONDS)
+
+    assert PhotoBlob.objects.get().has_variants
+    for variant, variant_name in PhotoBlob.get_variant_names(name).items():
+        with Image.open(BytesIO(storage.open(variant_name).read())) as image:
+            assert max(image.size) == settings.PHOTO_VARIANT_SIDES[variant]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.unit
+def test_storing_variants_of_broken_photo(pipeline: PhotoPipeline, storage: FileSystemStorage) -> None:
+    name, *_ = photo_repo.store(ContentFile(b"broken", "photo.jpg"))
+    errors = PHOTO_VARIANT_ERRORS._value.get()
+
+    assert not pipeline.submit(name, b"broken").result(TIMEOUT_SECONDS)
+
+    assert not PhotoBlob.objects.get().has_variants
+    assert PHOTO_VARIANT_ERRORS._value.get() == errors + 1
+
+
+@pytest.mark.unit
+def test_storing_variants_off_result_thread(pipeline: PhotoPipeline, monkeypatch, photo_content: bytes) -> None:
+    threads = []
+    monkeypatch.setattr(photo_repo, "save_variants", lambda name, variants: threads.append(current_thread().name))
+
+    assert pipeline.submit("photo.jpg", photo_content).result(TIMEOUT_SECONDS)
+
+    assert threads[0].startswith("photo-store")
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_scheduling_variants_on_broken_executor(
+    pipeline: PhotoPipeline, django_capture_on_commit_callbacks, photo_content: bytes
+) -> None:
+    executor, _ = pipeline._get_executors()
+    executor.shutdown()
+    errors = PHOTO_VARIANT_ERRORS._value.get()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        pipeline.schedule("photo.jpg", photo_content)
+
+    assert len(callbacks) == 1
+    assert PHOTO_VARIANT_ERRORS._value.get() == errors + 1
+    assert pipeline._get_executors()[0] is not executor
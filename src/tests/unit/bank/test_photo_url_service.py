@@ -0,0 +1,91 @@
+from typing import List
+
+import freezegun
+import pytest
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
+
+from app.internal.bank.db.models import Transaction
+from app.internal.bank.domain.services import PhotoUrlService
+from app.internal.metrics import PHOTO_URLS_SIGNED
+
+EXPIRE_SECONDS = 600
+MARGIN_SECONDS = 60
+NAMES = ["photos/ab/first.jpg", "photos/cd/second.jpg"]
+
+
+class SigningStorage(FileSystemStorage):
+    querystring_auth = True
+    querystring_expire = EXPIRE_SECONDS
+
+    def __init__(self, location: str):
+        super().__init__(location=location)
+
+        self.signed: List[str] = []
+
+    def url(self, name: str) -> str:
+        self.signed.append(name)
+
+        return f"{super().url(name)}?signature={len(self.signed)}"
+
+
+@pytest.fixture(scope="function")
+def signing_storage(monkeypatch, tmp_path) -> SigningStorage:
+    storage = SigningStorage(str(tmp_path))
+    monkeypatch.setattr(Transaction._meta.get_field("photo"), "storage", storage)
+
+    return storage
+
+
+@pytest.mark.unit
+def test_signing_urls_once(signing_storage: SigningStorage) -> None:
+    service = PhotoUrlService("", MARGIN_SECONDS)
+    signed = PHOTO_URLS_SIGNED._value.get()
+
+    urls = service.get_urls(NAMES)
+
+    assert service.get_urls([*NAMES, NAMES[0]]) == urls
+    assert sorted(signing_storage.signed) == NAMES
+    assert PHOTO_URLS_SIGNED._value.get() == signed + len(NAMES)
+
+
+@pytest.mark.unit
+def test_signing_urls_before_expiry(signing_storage: SigningStorage) -> None:
+    service = PhotoUrlService("", MARGIN_SECONDS)
+
+    with freezegun.freeze_time(timezone.now()) as frozen:
+        service.get_urls(NAMES[:1])
+
+        frozen.tick(EXPIRE_SECONDS - MARGIN_SECONDS - 1)
+        service.get_urls(NAMES[:1])
+
+        assert len(signing_storage.signed) == 1
+
+        frozen.tick(2)
+        service.get_urls(NAMES[:1])
+
+        assert len(signing_storage.signed) == 2
+
+
+@pytest.mark.unit
+def test_caching_unsigned_urls(signing_storage: SigningStorage) -> None:
+    service = PhotoUrlService("", MARGIN_SECONDS)
+    signing_storage.querystring_auth = False
+
+    with freezegun.freeze_time(timezone.now()) as frozen:
+        urls = service.get_urls(NAMES)
+
+        frozen.tick(EXPIRE_SECONDS * 100)
+
+        assert service.get_urls(NAMES) == urls
+        assert len(signing_storage.signed) == len(NAMES)
+
+
+@pytest.mark.unit
+def test_getting_prefixed_urls(signing_storage: SigningStorage) -> None:
+    service = PhotoUrlService("https://cdn.example.com/media/", MARGIN_SECONDS)
+
+    assert service.get_urls(["photos/ab/a b.jpg"]) == {
+        "photos/ab/a b.jpg": "https://cdn.example.com/media/photos/ab/a%20b.jpg"
+    }
+    assert signing_storage.signed == []
@@ -0,0 +1,179 @@
+import gzip
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from app.internal.bank.db.models import BankAccount, Transaction, TransactionArchive
+from app.internal.bank.db.repositories import TransactionArchiveRepository
+from app.internal.general.services import transaction_partition_service, transaction_service
+
+OLD = timezone.now() - timedelta(days=400)
+
+
+@pytest.fixture(scope="function")
+def old_transactions(bank_account: BankAccount, another_accounts: List[BankAccount]) -> List[Transaction]:
+    transactions = Transaction.objects.bulk_create(
+        Transaction(source=bank_account, destination=account, accrual=index, photo=f"photos/{index}.jpg")
+        for index, account in enumerate(another_accounts, start=1)
+    )
+    Transaction.objects.filter(pk__in=[transaction.pk for transaction in transactions]).update(created_at=OLD)
+
+    return list(Transaction.objects.filter(created_at=OLD).order_by("pk"))
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_upcoming_partitions_exist() -> None:
+    months = TransactionArchiveRepository().get_partition_months()
+
+    assert timezone.now().date().replace(day=1) in months
+    assert transaction_partition_service.create_partitions(timezone.now(), 3) == []
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_creating_partitions_moves_unpartitioned_rows(old_transactions: List[Transaction]) -> None:
+    assert _get_partitions(old_transactions) == {"transactions_default"}
+
+    created = transaction_partition_service.create_partitions(timezone.now(), 3)
+
+    assert created[0] == OLD.date().replace(day=1)
+    assert _get_partitions(old_transactions) == {f"transactions_p{OLD:%Y_%m}"}
+    assert TransactionArchiveRepository().get_oldest_unpartitioned() is None
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_archiving_partitions(
+    archive_root: Path, bank_account: BankAccount, old_transactions: List[Transaction]
+) -> None:
+    transaction_partition_service.create_partitions(OLD, 3)
+    recent = Transaction.objects.create(source=bank_account, destination=old_transactions[0].destination)
+
+    archives = transaction_partition_service.archive_partitions(12)
+
+    assert [archive.month for archive in archives] == [OLD.date().replace(day=1)]
+    assert archives[0].rows == len(old_transactions)
+    assert (archive_root / archives[0].name).exists()
+    assert list(archive_root.glob("*.partial")) == []
+    assert list(Transaction.objects.all()) == [recent]
+    assert OLD.date().replace(day=1) not in TransactionArchiveRepository().get_partition_months()
+
+    assert transaction_partition_service.create_partitions(OLD, 3) == []
+    assert transaction_partition_service.archive_partitions(12) == []
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_archiving_partitions__exports_before_detaching(
+    archive_root: Path, monkeypatch: pytest.MonkeyPatch, old_transactions: List[Transaction]
+) -> None:
+    transaction_partition_service.create_partitions(OLD, 3)
+    locks = []
+    open_archive = gzip.open
+
+    def get_locks(*args: Any, **kwargs: Any) -> Any:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT relation::regclass::text, mode FROM pg_locks "
+                "WHERE pid = pg_backend_pid() AND relation IN ('transactions'::regclass, %s::regclass)",
+                [f"transactions_p{OLD:%Y_%m}"],
+            )
+            locks.extend(cursor.fetchall())
+
+        return open_archive(*args, **kwargs)
+
+    monkeypatch.setattr(gzip, "open", get_locks)
+
+    transaction_partition_service.archive_partitions(12)
+
+    assert ("transactions", "AccessExclusiveLock") not in locks
+    assert (f"transactions_p{OLD:%Y_%m}", "ShareLock") in locks
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_getting_archived_transactions(
+    archive_root: Path, bank_account: BankAccount, old_transactions: List[Transaction]
+) -> None:
+    transaction_partition_service.create_partitions(OLD, 3)
+    recent = Transaction.objects.create(source=bank_account, destination=old_transactions[0].destination)
+    transaction_partition_service.archive_partitions(12)
+
+    assert transaction_service.get_transactions(bank_account) == [recent]
+
+    transactions = transaction_service.get_transactions(bank_account, include_archived=True)
+
+    assert transactions == [*old_transactions, recent]
+    for actual, expected in zip(transactions, old_transactions):
+        assert actual.created_at == expected.created_at
+        assert actual.accrual == expected.accrual
+        assert actual.photo.name == expected.photo.name
+        assert (actual.source_id, actual.destination_id) == (expected.source_id, expected.destination_id)
+
+    since = transaction_service.get_transactions(bank_account, since=OLD + timedelta(seconds=1), include_archived=True)
+    until = transaction_service.get_transactions(bank_account, until=OLD + timedelta(seconds=1), include_archived=True)
+    another = transaction_service.get_transactions(old_transactions[0].destination, include_archived=True)
+
+    assert since == [recent]
+    assert until == old_transactions
+    assert another == [old_transactions[0], recent]
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_history_includes_archived_transactions(
+    archive_root: Path, bank_account: BankAccount, old_transactions: List[Transaction]
+) -> None:
+    transaction_partition_service.create_partitions(OLD, 3)
+    transaction_partition_service.archive_partitions(12)
+    username = old_transactions[0].destination.owner.username.encode()
+
+    assert username not in transaction_service.get_history_html(bank_account.number)
+    assert username in transaction_service.get_history_html(bank_account.number, include_archived=True)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_history_skips_archived_transactions_of_deleted_accounts(
+    archive_root: Path, bank_account: BankAccount, old_transactions: List[Transaction]
+) -> None:
+    transaction_partition_service.create_partitions(OLD, 3)
+    transaction_partition_service.archive_partitions(12)
+    deleted, kept = old_transactions[0].destination, old_transactions[1].destination
+    deleted.delete()
+
+    transactions = TransactionArchiveRepository().get_detailed_archived_transactions(bank_account.number, None, None)
+
+    assert [transaction.destination for transaction in transactions] == [kept]
+    assert kept.owner.username.encode() in transaction_service.get_history_html(
+        bank_account.number, include_archived=True
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_archives_are_filtered_by_month(archive_root: Path, old_transactions: List[Transaction]) -> None:
+    transaction_partition_service.create_partitions(OLD, 3)
+    transaction_partition_service.archive_partitions(12)
+    (archive_root / TransactionArchive.objects.get().name).unlink()
+
+    transactions = TransactionArchiveRepository().get_archived_transactions(
+        old_transactions[0].source_id, OLD + timedelta(days=40), None
+    )
+
+    assert transactions == []
+
+
+def _get_partitions(transactions: List[Transaction]) -> set:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT DISTINCT tableoid::regclass::text FROM transactions WHERE id = ANY(%s)",
+            [[transaction.pk for transaction in transactions]],
+        )
+
+        return {name for name, in cursor.fetchall()}
@@ -7,7 +7,7 @@ from django.core.exceptions import ValidationError
 from django.core.files.base import ContentFile
 
 from app.internal.bank.db.models import BankAccount, Transaction, TransactionTypes
-from app.internal.general.services import transaction_service
+from app.internal.general.services import transaction_service, transfer_service
 
 
 @pytest.mark.django_db
@@ -36,15 +36,13 @@ def test_declaration(bank_accounts: List[BankAccount]) -> None:
 @pytest.mark.unit
 def test_getting_related_usernames(bank_account: BankAccount, friend_accounts: List[BankAccount]) -> None:
     half = len(friend_accounts) // 2
-    Transaction.objects.bulk_create(
-        Transaction(source=bank_account, destination=another) for another in friend_accounts[:half]
-    )
-    Transaction.objects.bulk_create(
-        Transaction(source=another, destination=bank_account) for another in friend_accounts[half:]
-    )
+    for another in friend_accounts[:half]:
+        transfer_service.try_transfer(bank_account, another, Decimal(1), None)
+    for another in friend_accounts[half:]:
+        transfer_service.try_transfer(another, bank_account, Decimal(1), None)
 
-    actual = sorted(transaction_service.get_related_usernames(bank_account.owner.id))
-    expected = sorted(account.owner.username for account in friend_accounts)
+    actual = transaction_service.get_related_usernames(bank_account.owner.id)
+    expected = [account.owner.username for account in reversed(friend_accounts)]
 
     assert actual == expected
 
@@ -1,3 +1,4 @@
+from datetime import timedelta
 from decimal import Decimal
 from enum import IntEnum, auto
 from itertools import chain
@@ -5,12 +6,20 @@ from typing import List
 
 import pytest
 from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
 from ninja import UploadedFile
 
-from app.internal.bank.db.models import BankAccount, BankCard, BankObject, Transaction
-from app.internal.general.services import bank_object_service, transfer_service
+from app.internal.bank.db.models import BankAccount, BankCard, BankObject, PhotoBlob, Transaction
+from app.internal.bank.db.repositories import TransactionRepository
+from app.internal.bank.domain.services.Photo import Photo
+from app.internal.general.services import bank_object_service, photo_pipeline, transfer_service
+from app.internal.metrics import PHOTO_STORAGE_SAVED, PHOTO_UPLOADS_AVOIDED, TRANSFER_ERRORS
+from app.internal.user.db.models import Counterparty
 from tests.conftest import BALANCE
 
+PHOTO_CONTENT = b"photo"
+
 
 class TransferError(IntEnum):
     NONE = auto()
@@ -222,3 +231,239 @@ def _assert_documents_transfer(
 
 def _get_actual(document: BankObject) -> BankObject:
     return (BankAccount if isinstance(document, BankAccount) else BankCard).objects.filter(pk=document.pk).first()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_transfer_declined_by_conditional_debit(bank_account: BankAccount, another_account: BankAccount) -> None:
+    errors = TRANSFER_ERRORS._value.get()
+
+    assert (
+        transfer_service.try_transfer_by_numbers(bank_account.number, another_account.number, BALANCE + 1, None) is None
+    )
+    assert TRANSFER_ERRORS._value.get() == errors + 1
+    assert _get_actual(bank_account).get_balance() == bank_account.balance
+    assert _get_actual(another_account).get_balance() == another_account.balance
+    assert not Transaction.objects.exists()
+    assert not Counterparty.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_transfer_records_counterparties(bank_accounts: List[BankAccount], another_account: BankAccount) -> None:
+    transfer_service.try_transfer(bank_accounts[0], another_account, Decimal(1), None)
+    transaction = transfer_service.try_transfer(another_account, bank_accounts[1], Decimal(1), None)
+    transfer_service.try_transfer(bank_accounts[0], bank_accounts[1], Decimal(1), None)
+
+    user, another = bank_accounts[0].owner, another_account.owner
+    counterparties = Counterparty.objects.order_by("user_id").values_list(
+        "user_id", "counterparty_id", "count", "last_interaction"
+    )
+
+    assert sorted(counterparties) == sorted(
+        [
+            (user.id, another.id, 2, transaction.created_at),
+            (another.id, user.id, 2, transaction.created_at),
+        ]
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+@pytest.mark.parametrize("size", [0, settings.MAX_SIZE_PHOTO_BYTES + 1])
+def test_attaching_invalid_photo(bank_account: BankAccount, another_account: BankAccount, size: int) -> None:
+    transaction = transfer_service.try_transfer(bank_account, another_account, Decimal(1), None)
+
+    assert not transfer_service.attach_photo(
+        transaction.id, transaction.created_at, Photo(unique_name="photo", content=b"", size=size)
+    )
+
+    transaction.refresh_from_db()
+    assert not transaction.photo
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_storing_same_photo_once(
+    bank_account: BankAccount, another_account: BankAccount, storage: FileSystemStorage
+) -> None:
+    avoided = PHOTO_UPLOADS_AVOIDED._value.get()
+
+    transactions = [_transfer_with_photo(bank_account, another_account, name) for name in ("first", "second")]
+
+    blob = PhotoBlob.objects.get()
+    assert blob.references == 2
+    assert {transaction.photo.name for transaction in transactions} == {blob.name}
+    assert storage.listdir(f"photos/{blob.digest[:2]}")[1] == [f"{blob.digest}.jpg"]
+    assert PHOTO_UPLOADS_AVOIDED._value.get() == avoided + 1
+    assert PHOTO_STORAGE_SAVED.collect()[0].samples[0].value == len(PHOTO_CONTENT)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_attaching_stored_photo(
+    bank_account: BankAccount, another_account: BankAccount, storage: FileSystemStorage
+) -> None:
+    first = _transfer_with_photo(bank_account, another_account, "first")
+    second = transfer_service.try_transfer(bank_account, another_account, Decimal(1), None)
+
+    photo = Photo(unique_name="second", content=PHOTO_CONTENT, size=len(PHOTO_CONTENT))
+
+    assert transfer_service.attach_photo(second.id, second.created_at, photo)
+
+    second.refresh_from_db()
+    assert second.photo.name == first.photo.name
+    assert PhotoBlob.objects.get().references == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_attaching_photo_within_partition(bank_account: BankAccount, another_account: BankAccount) -> None:
+    transaction = transfer_service.try_transfer(bank_account, another_account, Decimal(1), None)
+
+    TransactionRepository().attach_photo(transaction.id, transaction.created_at - timedelta(days=40), "photo.jpg")
+    transaction.refresh_from_db()
+    assert not transaction.photo
+
+    TransactionRepository().attach_photo(transaction.id, transaction.created_at, "photo.jpg")
+    transaction.refresh_from_db()
+    assert transaction.photo.name == "photo.jpg"
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_releasing_shared_photo(
+    bank_account: BankAccount,
+    another_account: BankAccount,
+    storage: FileSystemStorage,
+    django_capture_on_commit_callbacks,
+) -> None:
+    first, second = [_transfer_with_photo(bank_account, another_account, name) for name in ("first", "second")]
+    name = first.photo.name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        first.delete()
+
+    assert storage.exists(name)
+    assert PhotoBlob.objects.get().references == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second.delete()
+
+    assert not storage.exists(name)
+    assert not PhotoBlob.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_releasing_photo_on_cascade(
+    bank_account: BankAccount,
+    another_accounts: List[BankAccount],
+    storage: FileSystemStorage,
+    django_capture_on_commit_callbacks,
+) -> None:
+    kept = _transfer_with_photo(bank_account, another_accounts[0], "kept")
+    _transfer_with_photo(bank_account, another_accounts[1], "deleted")
+    name = kept.photo.name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        another_accounts[1].delete()
+
+    assert storage.exists(name)
+    assert PhotoBlob.objects.get().references == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        bank_account.delete()
+
+    assert not storage.exists(name)
+    assert not PhotoBlob.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_storing_photo_while_released(
+    bank_account: BankAccount,
+    another_account: BankAccount,
+    storage: FileSystemStorage,
+    django_capture_on_commit_callbacks,
+) -> None:
+    first = _transfer_with_photo(bank_account, another_account, "first")
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        first.delete()
+
+    second = _transfer_with_photo(bank_account, another_account, "second")
+    for callback in callbacks:
+        callback()
+
+    assert storage.exists(second.photo.name)
+    assert PhotoBlob.objects.get().references == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_rendering_variants_until_stored(
+    bank_account: BankAccount,
+    another_account: BankAccount,
+    storage: FileSystemStorage,
+    django_capture_on_commit_callbacks,
+    monkeypatch,
+) -> None:
+    submitted = []
+    monkeypatch.setattr(photo_pipeline, "submit", lambda name, content: submitted.append((name, content)))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        transactions = [_transfer_with_photo(bank_account, another_account, name) for name in ("first", "second")]
+
+    name = transactions[0].photo.name
+    transfer_service._photo_repo.save_variants(
+        name, {variant: b"variant" for variant in PhotoBlob.get_variant_names(name)}
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _transfer_with_photo(bank_account, another_account, "third")
+
+    assert submitted == [(name, PHOTO_CONTENT), (name, PHOTO_CONTENT)]
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_releasing_photo_with_variants(
+    bank_account: BankAccount,
+    another_account: BankAccount,
+    storage: FileSystemStorage,
+    django_capture_on_commit_callbacks,
+) -> None:
+    transaction = _transfer_with_photo(bank_account, another_account, "photo")
+    variants = PhotoBlob.get_variant_names(transaction.photo.name)
+    transfer_service._photo_repo.save_variants(transaction.photo.name, {variant: b"variant" for variant in variants})
+
+    with django_capture_on_commit_callbacks(execute=True):
+        transaction.delete()
+
+    assert not any(storage.exists(name) for name in variants.values())
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_releasing_legacy_photo(
+    bank_account: BankAccount,
+    another_account: BankAccount,
+    storage: FileSystemStorage,
+    django_capture_on_commit_callbacks,
+) -> None:
+    transaction = Transaction.objects.create(
+        source=bank_account, destination=another_account, accrual=1, photo=ContentFile(PHOTO_CONTENT, "legacy.jpg")
+    )
+    name = transaction.photo.name
+
+    with django_capture_on_commit_callbacks(execute=True):
+        transaction.delete()
+
+    assert not storage.exists(name)
+
+
+def _transfer_with_photo(source: BankAccount, destination: BankAccount, unique_name: str) -> Transaction:
+    photo = Photo(unique_name=unique_name, content=PHOTO_CONTENT, size=len(PHOTO_CONTENT))
+
+    return transfer_service.try_transfer(source, destination, Decimal(1), photo)
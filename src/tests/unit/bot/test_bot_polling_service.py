@@ -0,0 +1,75 @@
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from telegram import Update
+from telegram.error import NetworkError
+
+import app.internal.polling.BotPollingService as module
+from app.internal.polling.BotPollingService import BotPollingService
+
+TOKEN = "123456:TEST-token"
+
+
+def _update(update_id: int, chat_id: int) -> Update:
+    return Update.de_json(
+        {
+            "update_id": update_id,
+            "message": {"message_id": update_id, "date": 0, "chat": {"id": chat_id, "type": "private"}},
+        },
+        None,
+    )
+
+
+@pytest.fixture(scope="function")
+def service(monkeypatch) -> BotPollingService:
+    monkeypatch.setattr(module, "create_dispatcher", lambda bot: MagicMock())
+
+    service = BotPollingService(TOKEN, workers=2)
+    service.bot = MagicMock()
+
+    return service
+
+
+def _processed(service: BotPollingService) -> List[int]:
+    return [call.args[0].update_id for call in service.dispatcher.process_update.call_args_list]
+
+
+@pytest.mark.unit
+def test_polling(service: BotPollingService) -> None:
+    batches = [[_update(1, 1), _update(2, 2), _update(3, 1)], [_update(3, 1), _update(4, 2)]]
+
+    def get_updates(offset=None, **kwargs) -> List[Update]:
+        if not batches:
+            service.stop()
+            return []
+
+        return batches.pop(0)
+
+    service.bot.get_updates.side_effect = get_updates
+
+    service.run()
+
+    assert sorted(_processed(service)) == [1, 2, 3, 4]
+    assert [update_id for update_id in _processed(service) if update_id in (1, 3)] == [1, 3]
+    assert service.bot.get_updates.call_args_list[-1].kwargs["offset"] == 5
+    service.dispatcher.stop.assert_called_once()
+
+
+@pytest.mark.unit
+def test_polling__network_error(service: BotPollingService, settings) -> None:
+    settings.BOT_POLLING_RETRY_SECONDS = 0
+    errors = [NetworkError("Bad gateway")]
+
+    def get_updates(offset=None, **kwargs) -> List[Update]:
+        if errors:
+            raise errors.pop()
+
+        service.stop()
+        return [_update(1, 1)]
+
+    service.bot.get_updates.side_effect = get_updates
+
+    service.run()
+
+    assert _processed(service) == [1]
@@ -0,0 +1,29 @@
+import pytest
+
+from tests.performance.BotReplay import CONVERSATIONS, generate_updates, get_labels
+
+
+@pytest.mark.unit
+def test_generated_conversations_are_ordered() -> None:
+    user_ids = [1, 2, 3]
+    updates = generate_updates(user_ids, conversations=2, seed=1)
+
+    for number, user_id in enumerate(user_ids):
+        texts = [_get_step(update) for update in updates if _get_chat_id(update) == user_id]
+        labels = [label for update, label in zip(updates, get_labels(updates)) if _get_chat_id(update) == user_id]
+        friend = user_ids[(number + 1) % len(user_ids)]
+        first = [step.format(friend=friend) for step in CONVERSATIONS[texts[0][1:]]]
+
+        assert texts[: len(first)] == first
+        assert labels[: len(first)] == [first[0], *(f"{first[0]} #{step}" for step in range(1, len(first)))]
+
+    assert generate_updates(user_ids, conversations=2, seed=1) == updates
+    assert [update["update_id"] for update in updates] == list(range(1, len(updates) + 1))
+
+
+def _get_step(update: dict) -> str:
+    return update["message"]["text"] if "message" in update else update["callback_query"]["data"]
+
+
+def _get_chat_id(update: dict) -> int:
+    return (update.get("message") or update["callback_query"]["message"])["chat"]["id"]
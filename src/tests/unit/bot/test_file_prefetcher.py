@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.internal.general.bot.FilePrefetcher import FilePrefetcher
+
+
+def _bot() -> MagicMock:
+    bot = MagicMock()
+    bot.get_file.side_effect = lambda file_id: MagicMock(download_as_bytearray=lambda: bytearray(file_id, "utf-8"))
+
+    return bot
+
+
+@pytest.mark.unit
+def test_prefetching_once() -> None:
+    bot = _bot()
+    prefetcher = FilePrefetcher(limit=10)
+
+    first = prefetcher.prefetch(bot, "file", "unique")
+    second = prefetcher.prefetch(bot, "file", "unique")
+
+    assert first is second
+    assert first.result(timeout=5) == b"file"
+    bot.get_file.assert_called_once_with("file")
+
+
+@pytest.mark.unit
+def test_taking_prefetched() -> None:
+    bot = _bot()
+    prefetcher = FilePrefetcher(limit=10)
+    prefetched = prefetcher.prefetch(bot, "file", "unique")
+
+    assert prefetcher.take(bot, "file", "unique") is prefetched
+    assert len(prefetcher) == 0
+    assert prefetcher.take(bot, "file", "unique").result(timeout=5) == b"file"
+    assert bot.get_file.call_count == 2
+
+
+@pytest.mark.unit
+def test_evicting_oldest() -> None:
+    bot = _bot()
+    prefetcher = FilePrefetcher(limit=2)
+
+    for number in range(3):
+        prefetcher.prefetch(bot, str(number), str(number))
+
+    assert len(prefetcher) == 2
+
+    prefetcher.prefetch(bot, "0", "0").result(timeout=5)
+
+    assert bot.get_file.call_count == 4
@@ -0,0 +1,50 @@
+from threading import Event, current_thread
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.internal.bank.db.models import BankAccount
+from app.internal.bank.presentation.handlers.bot.document import CATALOG_SESSION
+from app.internal.bank.presentation.handlers.bot.history.handlers import handle_getting_document
+from app.internal.general.bot.handlers import run_in_background
+from app.internal.general.services import bank_object_service
+from app.internal.user.db.models import TelegramUser
+
+TIMEOUT_SECONDS = 5
+
+
+@pytest.mark.unit
+def test_running_in_background() -> None:
+    future = run_in_background(lambda value: (value, current_thread().name), 1)
+
+    value, thread = future.result(timeout=TIMEOUT_SECONDS)
+
+    assert value == 1
+    assert thread.startswith("bot-background")
+
+
+@pytest.mark.unit
+def test_running_in_background__failure() -> None:
+    def fail() -> None:
+        raise ValueError()
+
+    assert run_in_background(fail).result(timeout=TIMEOUT_SECONDS) is None
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.unit
+def test_sending_history_in_background(telegram_user_with_phone: TelegramUser, bank_account: BankAccount) -> None:
+    sent = Event()
+    message = MagicMock()
+    message.text = "1"
+    message.reply_document.side_effect = lambda *args, **kwargs: sent.set()
+    update = MagicMock(message=message)
+    context = MagicMock()
+    context.user_data = {
+        CATALOG_SESSION: bank_object_service.get_document_catalog(telegram_user_with_phone).to_rows(),
+    }
+
+    handle_getting_document(update, context)
+
+    assert sent.wait(TIMEOUT_SECONDS)
+    assert message.reply_document.call_args.kwargs["filename"].startswith("Выписка")
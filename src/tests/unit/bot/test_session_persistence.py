@@ -0,0 +1,124 @@
+from datetime import timedelta
+from threading import Thread
+
+import pytest
+from django.utils.timezone import now
+from telegram.ext.utils.promise import Promise
+
+from app.internal.general.bot.SessionPersistence import SessionPersistence
+from app.internal.general.db.models import BotSession
+from app.internal.general.db.repositories import BotSessionRepository
+
+USER_ID = 42
+KEY = (USER_ID, USER_ID)
+CONVERSATION = "transfer"
+TTL = timedelta(hours=1)
+
+
+def _persistence() -> SessionPersistence:
+    return SessionPersistence(BotSessionRepository(), TTL, timedelta(minutes=5))
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_session_is_shared_between_workers() -> None:
+    first, second = _persistence(), _persistence()
+
+    user_data = {}
+    first.refresh_user_data(USER_ID, user_data)
+    user_data["documents"] = ["10000000000000000000"]
+    first.get_conversations(CONVERSATION)[KEY] = 1
+    first.update_user_data(USER_ID, user_data)
+
+    assert user_data == {}
+
+    user_data = {}
+    second.refresh_user_data(USER_ID, user_data)
+    conversations = second.get_conversations(CONVERSATION)
+
+    assert user_data == {"documents": ["10000000000000000000"]}
+    assert KEY in conversations
+    assert conversations[KEY] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.unit
+def test_session_is_kept_per_chat() -> None:
+    persistence = _persistence()
+    conversations = persistence.get_conversations(CONVERSATION)
+    group_key = (-100, USER_ID)
+
+    def handle_group_update() -> None:
+        user_data = {}
+        persistence.refresh_user_data(USER_ID, user_data)
+        conversations[group_key] = 2
+        persistence.update_user_data(USER_ID, user_data)
+
+    user_data = {}
+    persistence.refresh_user_data(USER_ID, user_data)
+    conversations[KEY] = 1
+
+    thread = Thread(target=handle_group_update)
+    thread.start()
+    thread.join()
+
+    persistence.update_user_data(USER_ID, user_data)
+
+    assert BotSession.objects.get(user_id=USER_ID).states == {f"{CONVERSATION}:{USER_ID}": 1, f"{CONVERSATION}:-100": 2}
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_finished_session_is_removed() -> None:
+    persistence = _persistence()
+    BotSession.objects.create(user_id=USER_ID, data={"documents": []}, states={f"{CONVERSATION}:{USER_ID}": 1})
+
+    user_data = {}
+    persistence.refresh_user_data(USER_ID, user_data)
+    user_data.clear()
+    del persistence.get_conversations(CONVERSATION)[KEY]
+    persistence.update_user_data(USER_ID, user_data)
+
+    assert not BotSession.objects.filter(user_id=USER_ID).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_unchanged_session_is_not_written() -> None:
+    persistence = _persistence()
+
+    user_data = {}
+    persistence.refresh_user_data(USER_ID, user_data)
+    persistence.update_user_data(USER_ID, user_data)
+
+    assert not BotSession.objects.filter(user_id=USER_ID).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_idle_session_is_expired() -> None:
+    persistence = _persistence()
+    BotSession.objects.create(user_id=USER_ID, data={"documents": []}, states={f"{CONVERSATION}:{USER_ID}": 1})
+    BotSession.objects.filter(user_id=USER_ID).update(updated_at=now() - TTL * 2)
+
+    user_data = {}
+    persistence.refresh_user_data(USER_ID, user_data)
+
+    assert user_data == {}
+    assert KEY not in persistence.get_conversations(CONVERSATION)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_pending_state_is_not_stored() -> None:
+    persistence = _persistence()
+    conversations = persistence.get_conversations(CONVERSATION)
+    pending = (1, Promise(lambda: 2, [], {}))
+
+    user_data = {}
+    persistence.refresh_user_data(USER_ID, user_data)
+    conversations[KEY] = pending
+    persistence.update_user_data(USER_ID, user_data)
+
+    assert conversations[KEY] is pending
+    assert not BotSession.objects.filter(user_id=USER_ID).exists()
@@ -0,0 +1,75 @@
+from queue import Full
+from threading import Lock
+from time import sleep
+from typing import Dict, List
+
+import pytest
+
+from app.internal.general.bot.UpdateWorkerPool import UpdateWorkerPool
+
+CHATS = [1, 2, 3, 4, 5]
+MESSAGES_PER_CHAT = 20
+
+
+def _update(update_id: int, chat_id: int) -> dict:
+    return {"update_id": update_id, "message": {"message_id": update_id, "chat": {"id": chat_id}}}
+
+
+@pytest.mark.unit
+def test_processing_order_in_chat() -> None:
+    processed: Dict[int, List[int]] = {chat: [] for chat in CHATS}
+    lock = Lock()
+
+    def process(json: dict) -> None:
+        sleep(0.001)
+        with lock:
+            processed[json["message"]["chat"]["id"]].append(json["update_id"])
+
+    pool = UpdateWorkerPool(process, workers=3, queue_size=1000, deduplication_window=1000, mode="test_order")
+    pool.start()
+
+    expected: Dict[int, List[int]] = {chat: [] for chat in CHATS}
+    for update_id in range(MESSAGES_PER_CHAT * len(CHATS)):
+        chat = CHATS[update_id % len(CHATS)]
+        expected[chat].append(update_id)
+        pool.submit(_update(update_id, chat))
+
+    pool.stop()
+
+    assert processed == expected
+    assert pool.get_depth() == 0
+
+
+@pytest.mark.unit
+def test_deduplication() -> None:
+    processed = []
+
+    pool = UpdateWorkerPool(processed.append, workers=2, queue_size=10, deduplication_window=10, mode="test_dedup")
+    pool.start()
+
+    assert pool.submit(_update(1, 1))
+    assert not pool.submit(_update(1, 1))
+    assert pool.submit(_update(2, 1))
+
+    pool.stop()
+
+    assert [json["update_id"] for json in processed] == [1, 2]
+
+
+@pytest.mark.unit
+def test_backpressure() -> None:
+    processed = []
+
+    pool = UpdateWorkerPool(processed.append, workers=1, queue_size=1, deduplication_window=10, mode="test_full")
+
+    assert pool.submit(_update(1, 1), timeout=0)
+    with pytest.raises(Full):
+        pool.submit(_update(2, 1), timeout=0)
+
+    assert pool.get_depth() == 1
+
+    pool.start()
+    pool.stop()
+
+    assert pool.submit(_update(2, 1), timeout=0)
+    assert [json["update_id"] for json in processed] == [1]
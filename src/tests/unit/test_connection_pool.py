@@ -0,0 +1,188 @@
+import gc
+from threading import Thread
+from typing import Any, Callable, Iterator, List
+
+import psycopg2
+import pytest
+from django.conf import settings
+from django.db import connection
+from prometheus_client import CollectorRegistry, Gauge, generate_latest
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from app.internal.general.db.ConnectionPool import ConnectionPool
+from app.internal.general.db.ConnectionReleasingRegistry import ConnectionReleasingRegistry
+from app.internal.metrics import DATABASE_POOL_TIMEOUTS
+from app.internal.user.db.models import TelegramUser
+
+POOL = "test"
+
+
+@pytest.fixture(scope="function")
+def connect() -> Iterator[Callable[[], Any]]:
+    params = connection.get_connection_params()
+    connections: List[Any] = []
+
+    def connect() -> Any:
+        connections.append(psycopg2.connect(**params))
+
+        return connections[-1]
+
+    connect.created = connections
+
+    yield connect
+
+    for created in connections:
+        created.close()
+
+
+def create_pool(
+    max_size: int = 2, wait_seconds: float = 1, idle_seconds: float = 60, health_check_seconds: float = 60
+) -> ConnectionPool:
+    return ConnectionPool(POOL, max_size, wait_seconds, idle_seconds, health_check_seconds)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_reusing_connection(connect) -> None:
+    pool = create_pool()
+
+    first = pool.acquire(connect)
+    pool.release(first)
+
+    assert pool.acquire(connect) is first
+    assert pool.get_size() == (1, 0)
+    assert len(connect.created) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_exhausting_pool(connect) -> None:
+    pool = create_pool(max_size=1, wait_seconds=0.05)
+    timeouts = DATABASE_POOL_TIMEOUTS.labels(POOL)._value.get()
+
+    pool.acquire(connect)
+
+    with pytest.raises(psycopg2.OperationalError):
+        pool.acquire(connect)
+
+    assert DATABASE_POOL_TIMEOUTS.labels(POOL)._value.get() == timeouts + 1
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_waiting_for_released_connection(connect) -> None:
+    pool = create_pool(max_size=1, wait_seconds=5)
+    first = pool.acquire(connect)
+    acquired = []
+
+    waiter = Thread(target=lambda: acquired.append(pool.acquire(connect)))
+    waiter.start()
+    pool.release(first)
+    waiter.join(5)
+
+    assert acquired == [first]
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_rolling_back_released_connection(connect) -> None:
+    pool = create_pool()
+    first = pool.acquire(connect)
+
+    with first.cursor() as cursor:
+        cursor.execute("SELECT 1")
+
+    pool.release(first)
+
+    assert first.get_transaction_status() == TRANSACTION_STATUS_IDLE
+    assert pool.acquire(connect) is first
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_dropping_closed_connection(connect) -> None:
+    pool = create_pool()
+    first = pool.acquire(connect)
+    first.close()
+
+    pool.release(first)
+
+    assert pool.get_size() == (0, 0)
+    assert pool.acquire(connect) is not first
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_checking_health_of_idle_connection(connect) -> None:
+    pool = create_pool(health_check_seconds=0)
+    first = pool.acquire(connect)
+    pool.release(first)
+
+    with connect().cursor() as cursor:
+        cursor.execute("SELECT pg_terminate_backend(%s)", [first.get_backend_pid()])
+
+    second = pool.acquire(connect)
+
+    assert second is not first
+    assert first.closed
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_reaping_idle_connections(connect) -> None:
+    pool = create_pool(idle_seconds=0)
+    first = pool.acquire(connect)
+    pool.release(first)
+
+    assert pool.acquire(connect) is not first
+    assert first.closed
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.unit
+def test_reusing_django_connection() -> None:
+    connection.ensure_connection()
+    first = connection.connection
+
+    connection.close()
+    connection.ensure_connection()
+
+    assert connection.connection is first
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.unit
+def test_releasing_connection_of_finished_thread() -> None:
+    connection.ensure_connection()
+    pool = connection._pool
+    expected = pool.get_size()[0]
+
+    thread = Thread(target=lambda: TelegramUser.objects.exists())
+    thread.start()
+    thread.join()
+    del thread
+    gc.collect()
+
+    assert pool.get_size()[0] == expected
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.unit
+def test_releasing_connection_after_scrape() -> None:
+    connection.ensure_connection()
+    pool = connection._pool
+    expected = pool.get_size()[0]
+    registry = CollectorRegistry()
+    Gauge("scraped_users", "", registry=registry).set_function(TelegramUser.objects.count)
+    outputs = []
+
+    threads = [
+        Thread(target=lambda: outputs.append(generate_latest(ConnectionReleasingRegistry(registry))))
+        for _ in range(settings.DATABASE_POOL_MAX_SIZE + 1)
+    ]
+    for thread in threads:
+        thread.start()
+        thread.join()
+
+    assert len(outputs) == len(threads)
+    assert pool.get_size()[0] == expected
@@ -8,13 +8,17 @@ from app.internal.user.db.models import FriendRequest, TelegramUser
 
 @pytest.mark.django_db
 @pytest.mark.unit
-def test_getting_friendship_username_list(
+def test_getting_requesters_page(
     telegram_user: TelegramUser, another_telegram_users: List[TelegramUser], friend_requests: List[FriendRequest]
 ) -> None:
-    actual = list(request_service.get_usernames_to_friends(telegram_user))
-    expected = [user.username for user in another_telegram_users]
+    requesters = sorted(another_telegram_users, key=lambda user: user.username)
 
-    assert actual == expected
+    page = request_service.get_requesters_page(telegram_user, len(requesters))
+    next_page = request_service.get_requesters_page(telegram_user, 1, after=requesters[0].username)
+
+    assert (page.items, page.has_previous, page.has_next) == (requesters, False, False)
+    assert (next_page.items, next_page.has_previous, next_page.has_next) == (requesters[1:2], True, False)
+    assert request_service.get_requesters_page(another_telegram_users[0], 1).items == []
 
 
 @pytest.mark.django_db
@@ -81,3 +85,53 @@ def test_rejecting_friend_request__not_exist(telegram_user: TelegramUser, anothe
     request_service.try_reject(another_telegram_user, telegram_user)
 
     assert not FriendRequest.objects.filter(source=another_telegram_user, destination=telegram_user).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_accepting_all_friend_requests(
+    telegram_user: TelegramUser, another_telegram_users: List[TelegramUser], friend_requests: List[FriendRequest]
+) -> None:
+    accepted = request_service.accept_all(telegram_user)
+
+    assert accepted == {user.id: user.username for user in another_telegram_users}
+    assert set(telegram_user.friends.all()) == set(another_telegram_users)
+    assert all(user.friends.filter(id=telegram_user.id).exists() for user in another_telegram_users)
+    assert not FriendRequest.objects.filter(destination=telegram_user).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_accepting_selected_friend_requests(
+    telegram_user: TelegramUser, another_telegram_users: List[TelegramUser], friend_requests: List[FriendRequest]
+) -> None:
+    selected, rest = another_telegram_users[0], another_telegram_users[1:]
+    selected.friends.add(telegram_user)
+
+    accepted = request_service.accept_all(telegram_user, [selected.username, "unknown"])
+
+    assert accepted == {selected.id: selected.username}
+    assert list(telegram_user.friends.all()) == [selected]
+    assert set(FriendRequest.objects.filter(destination=telegram_user).values_list("source", flat=True)) == {
+        user.id for user in rest
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_accepting_all_friend_requests__empty(telegram_user: TelegramUser) -> None:
+    assert request_service.accept_all(telegram_user) == {}
+    assert not telegram_user.friends.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_rejecting_all_friend_requests(
+    telegram_user: TelegramUser, another_telegram_users: List[TelegramUser], friend_requests: List[FriendRequest]
+) -> None:
+    selected = another_telegram_users[0]
+
+    assert request_service.reject_all(telegram_user, [selected.username]) == {selected.id: selected.username}
+    assert request_service.reject_all(telegram_user) == {user.id: user.username for user in another_telegram_users[1:]}
+    assert not FriendRequest.objects.filter(destination=telegram_user).exists()
+    assert not telegram_user.friends.exists()
@@ -1,8 +1,10 @@
+from decimal import Decimal
 from typing import List
 
 import pytest
 
-from app.internal.general.services import friend_service
+from app.internal.bank.db.models import BankAccount
+from app.internal.general.services import friend_service, transfer_service
 from app.internal.user.db.models import TelegramUser
 
 
@@ -26,11 +28,33 @@ def test_getting_friends(telegram_user: TelegramUser, friends: List[TelegramUser
 
 @pytest.mark.django_db
 @pytest.mark.unit
-def test_getting_friends_as_dict(telegram_user: TelegramUser, friends: List[TelegramUser]) -> None:
-    actual = friend_service.get_friends_as_dict(telegram_user)
+def test_getting_friends_page(telegram_user: TelegramUser, friends: List[TelegramUser]) -> None:
+    first, second = sorted(friends, key=lambda friend: friend.username)
 
-    assert sorted(actual.keys()) == list(range(1, len(friends) + 1))
-    assert sorted(actual.values(), key=lambda user: user.id) == sorted(friends, key=lambda user: user.id)
+    page = friend_service.get_friends_page(telegram_user, 1)
+    next_page = friend_service.get_friends_page(telegram_user, 1, after=first.username)
+    previous_page = friend_service.get_friends_page(telegram_user, 1, before=second.username)
+
+    assert (page.items, page.has_previous, page.has_next) == ([first], False, True)
+    assert (next_page.items, next_page.has_previous, next_page.has_next) == ([second], True, False)
+    assert (previous_page.items, previous_page.has_previous, previous_page.has_next) == ([first], False, True)
+    assert friend_service.get_friends_page(telegram_user, 1, after=second.username).items == []
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_getting_recent_recipients(
+    telegram_user: TelegramUser, friends: List[TelegramUser], bank_account: BankAccount
+) -> None:
+    stranger = TelegramUser.objects.create(id=1, username="stranger", first_name="Stranger")
+    accounts = [BankAccount.objects.create(owner=user) for user in [*friends, stranger]]
+
+    for account in [accounts[1], accounts[0], accounts[-1]]:
+        transfer_service.try_transfer(bank_account, account, Decimal(1), None)
+
+    assert friend_service.get_recent_recipients(telegram_user, 1) == [friends[0]]
+    assert friend_service.get_recent_recipients(telegram_user, len(accounts)) == [friends[0], friends[1]]
+    assert friend_service.get_recent_recipients(stranger, len(accounts)) == []
 
 
 @pytest.mark.django_db
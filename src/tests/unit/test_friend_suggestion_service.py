@@ -0,0 +1,98 @@
+from typing import Dict, List, Tuple
+
+import pytest
+from django.utils.timezone import now
+
+from app.internal.general.services import suggestion_service
+from app.internal.user.db.models import Counterparty, FriendRequest, FriendSuggestion, TelegramUser
+
+LIMIT = 10
+
+
+@pytest.fixture(scope="function")
+def graph() -> Dict[str, TelegramUser]:
+    users = {
+        name: TelegramUser.objects.create(id=index, username=name, first_name=name.upper())
+        for index, name in enumerate("abcdef", start=1)
+    }
+
+    users["a"].friends.add(users["b"], users["c"])
+    users["d"].friends.add(users["b"], users["c"])
+    users["e"].friends.add(users["c"])
+    FriendRequest.objects.create(source=users["a"], destination=users["e"])
+    Counterparty.objects.bulk_create(
+        [
+            Counterparty(user=users["a"], counterparty=users["f"], last_interaction=now(), count=3),
+            Counterparty(user=users["a"], counterparty=users["b"], last_interaction=now(), count=5),
+        ]
+    )
+
+    return users
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_rebuilding_suggestions(graph: Dict[str, TelegramUser]) -> None:
+    built = suggestion_service.rebuild(batch_size=100, limit=LIMIT)
+
+    assert built == FriendSuggestion.objects.count()
+    assert _get_suggestions(graph["a"]) == [("d", 2, 0), ("f", 0, 3)]
+    assert _get_suggestions(graph["e"]) == [("a", 1, 0), ("d", 1, 0)]
+    assert _get_suggestions(graph["f"]) == []
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_rebuilding_suggestions__in_batches(graph: Dict[str, TelegramUser]) -> None:
+    suggestion_service.rebuild(batch_size=100, limit=LIMIT)
+    expected = {user.username: _get_suggestions(user) for user in graph.values()}
+
+    built = suggestion_service.rebuild(batch_size=1, limit=LIMIT)
+
+    assert built == FriendSuggestion.objects.count()
+    assert {user.username: _get_suggestions(user) for user in graph.values()} == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_rebuilding_suggestions__limit(graph: Dict[str, TelegramUser]) -> None:
+    suggestion_service.rebuild(batch_size=100, limit=1)
+
+    assert _get_suggestions(graph["a"]) == [("d", 2, 0)]
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_rebuilding_suggestions__drops_stale(graph: Dict[str, TelegramUser]) -> None:
+    suggestion_service.rebuild(batch_size=100, limit=LIMIT)
+    graph["a"].friends.add(graph["d"])
+
+    suggestion_service.rebuild(batch_size=100, limit=LIMIT)
+
+    assert _get_suggestions(graph["a"]) == [("f", 0, 3)]
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_getting_suggestions__skips_new_friends_and_requests(graph: Dict[str, TelegramUser]) -> None:
+    suggestion_service.rebuild(batch_size=100, limit=LIMIT)
+    graph["a"].friends.add(graph["d"])
+    FriendRequest.objects.create(source=graph["a"], destination=graph["f"])
+    FriendRequest.objects.create(source=graph["e"], destination=graph["a"])
+
+    assert _get_suggestions(graph["a"]) == []
+    assert _get_suggestions(graph["e"]) == [("d", 1, 0)]
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_getting_suggestions__empty(telegram_user: TelegramUser) -> None:
+    assert suggestion_service.rebuild(batch_size=100, limit=LIMIT) == 0
+    assert suggestion_service.get_suggestions(telegram_user, LIMIT) == []
+
+
+def _get_suggestions(user: TelegramUser) -> List[Tuple[str, int, int]]:
+    return [
+        (suggestion.suggestion.username, suggestion.mutual_friends, suggestion.interactions)
+        for suggestion in suggestion_service.get_suggestions(user, LIMIT)
+    ]
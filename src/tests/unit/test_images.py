@@ -0,0 +1,54 @@
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from app.internal.general.images import render_variants
+from tests.conftest import EXIF_MAKE
+
+SIDES = {"thumbnail": 160, "medium": 800}
+EXIF_ORIENTATION = 0x0112
+ROTATED_RIGHT = 6
+
+
+@pytest.mark.unit
+def test_rendering_variants(photo_content: bytes) -> None:
+    variants = render_variants(photo_content, SIDES, "WEBP", 80)
+
+    assert variants.keys() == SIDES.keys()
+
+    for variant, side in SIDES.items():
+        with Image.open(BytesIO(variants[variant])) as image:
+            assert image.format == "WEBP"
+            assert image.size == (side, side * 3 // 4)
+            assert EXIF_MAKE not in image.getexif()
+
+        assert len(variants[variant]) < len(photo_content)
+
+
+@pytest.mark.unit
+def test_rendering_small_photo() -> None:
+    buffer = BytesIO()
+    Image.new("RGB", (100, 50)).save(buffer, "PNG")
+
+    variants = render_variants(buffer.getvalue(), SIDES, "JPEG", 80)
+
+    for content in variants.values():
+        with Image.open(BytesIO(content)) as image:
+            assert image.format == "JPEG"
+            assert image.size == (100, 50)
+
+
+@pytest.mark.unit
+def test_rendering_rotated_photo() -> None:
+    exif = Image.Exif()
+    exif[EXIF_ORIENTATION] = ROTATED_RIGHT
+
+    buffer = BytesIO()
+    Image.new("RGB", (400, 200)).save(buffer, "JPEG", exif=exif)
+
+    variants = render_variants(buffer.getvalue(), {"thumbnail": 100}, "WEBP", 80)
+
+    with Image.open(BytesIO(variants["thumbnail"])) as image:
+        assert image.size == (50, 100)
+        assert EXIF_ORIENTATION not in image.getexif()
@@ -0,0 +1,91 @@
+import pytest
+
+from app.internal.general.budget import QueryBudgetExceeded, query_budget
+from app.internal.metrics import QUERY_BUDGET_EXCEEDED
+from app.internal.user.db.models import TelegramUser
+
+
+@query_budget(1)
+def count_users(amount: int = 1) -> int:
+    return sum(TelegramUser.objects.count() for _ in range(amount))
+
+
+@query_budget(1)
+def count_users_twice() -> int:
+    return count_users() + count_users()
+
+
+class Handlers:
+    @query_budget(1)
+    def count_users(self, amount: int) -> int:
+        return count_users(amount)
+
+
+@pytest.mark.unit
+def test_budget_is_declared() -> None:
+    assert count_users.query_budget == 1
+    assert count_users.__name__ == "count_users"
+    assert Handlers().count_users.query_budget == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_within_budget() -> None:
+    assert count_users() == 0
+    assert Handlers().count_users(1) == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_exceeding_budget() -> None:
+    with pytest.raises(QueryBudgetExceeded) as error:
+        count_users(2)
+
+    assert error.value.name == "test_query_budget.count_users"
+    assert error.value.amount == 2
+    assert error.value.limit == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_exceeding_method_budget() -> None:
+    with pytest.raises(QueryBudgetExceeded) as error:
+        Handlers().count_users(3)
+
+    assert error.value.name == "Handlers.count_users"
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_nested_budgets_count_outer_handler() -> None:
+    with pytest.raises(QueryBudgetExceeded) as error:
+        count_users_twice()
+
+    assert error.value.name == "test_query_budget.count_users_twice"
+    assert error.value.amount == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_exceeding_budget_in_production(settings) -> None:
+    settings.QUERY_BUDGET_STRICT = False
+    before = _get_exceeded("test_query_budget.count_users")
+
+    assert count_users(2) == 0
+    assert _get_exceeded("test_query_budget.count_users") == before + 1
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_disabled_monitoring(settings) -> None:
+    settings.QUERY_BUDGET_MONITORING = False
+
+    assert count_users(2) == 0
+
+
+def _get_exceeded(name: str) -> float:
+    samples = QUERY_BUDGET_EXCEEDED.collect()[0].samples
+
+    return next(
+        (sample.value for sample in samples if sample.name.endswith("_total") and sample.labels == {"handler": name}), 0
+    )
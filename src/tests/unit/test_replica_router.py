@@ -0,0 +1,159 @@
+from typing import Iterator, Optional
+
+import freezegun
+import pytest
+from django.conf import settings
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, DatabaseError
+from django.db.transaction import atomic
+from django.test import override_settings
+from django.utils import timezone
+
+from app.internal.general.db.ReplicaMonitor import ReplicaMonitor
+from app.internal.general.db.ReplicaRouter import ReplicaRouter
+from app.internal.general.db.replicas import read_replica, reset_database_user, set_database_user
+from app.internal.user.db.models import TelegramUser
+
+REPLICA = "replica_0"
+USER_ID = 1337
+
+
+class StubMonitor:
+    def __init__(self, alias: Optional[str]):
+        self.alias = alias
+
+    def choose(self) -> Optional[str]:
+        return self.alias
+
+
+@pytest.fixture(autouse=True)
+def database_user() -> Iterator[None]:
+    reset_database_user()
+
+    yield
+
+    reset_database_user()
+
+
+@pytest.fixture(scope="function")
+def router() -> ReplicaRouter:
+    router = ReplicaRouter()
+    router.monitor = StubMonitor(REPLICA)
+
+    return router
+
+
+@pytest.mark.unit
+def test_reading_from_primary_by_default(router: ReplicaRouter) -> None:
+    assert router.db_for_read(TelegramUser) == DEFAULT_DB_ALIAS
+    assert router.db_for_write(TelegramUser) == DEFAULT_DB_ALIAS
+
+
+@pytest.mark.unit
+def test_reading_from_replica(router: ReplicaRouter) -> None:
+    with read_replica():
+        assert router.db_for_read(TelegramUser) == REPLICA
+
+    assert router.db_for_read(TelegramUser) == DEFAULT_DB_ALIAS
+
+
+@pytest.mark.unit
+def test_falling_back_to_primary(router: ReplicaRouter) -> None:
+    router.monitor.alias = None
+
+    with read_replica():
+        assert router.db_for_read(TelegramUser) == DEFAULT_DB_ALIAS
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_reading_from_primary_in_transaction(router: ReplicaRouter) -> None:
+    with read_replica(), atomic():
+        assert router.db_for_read(TelegramUser) == DEFAULT_DB_ALIAS
+
+
+@pytest.mark.unit
+def test_reading_own_writes(router: ReplicaRouter) -> None:
+    with freezegun.freeze_time(timezone.now()) as frozen:
+        set_database_user(USER_ID)
+        router.db_for_write(TelegramUser)
+
+        with read_replica():
+            assert router.db_for_read(TelegramUser) == DEFAULT_DB_ALIAS
+
+            set_database_user(USER_ID)
+            assert router.db_for_read(TelegramUser) == DEFAULT_DB_ALIAS
+
+            set_database_user(USER_ID + 1)
+            assert router.db_for_read(TelegramUser) == REPLICA
+
+            frozen.tick(settings.DATABASE_REPLICA_STICKY_SECONDS + 1)
+            set_database_user(USER_ID)
+            assert router.db_for_read(TelegramUser) == REPLICA
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "cache"}})
+def test_reading_own_writes__database_cache(router: ReplicaRouter) -> None:
+    call_command("createcachetable")
+    set_database_user(USER_ID)
+
+    TelegramUser.objects.create(id=USER_ID, username="user", first_name="user")
+
+    set_database_user(USER_ID)
+    with read_replica():
+        assert router.db_for_read(TelegramUser) == DEFAULT_DB_ALIAS
+
+
+@pytest.mark.unit
+def test_migrating_only_primary(router: ReplicaRouter) -> None:
+    assert router.allow_migrate(DEFAULT_DB_ALIAS, "app")
+    assert not router.allow_migrate(REPLICA, "app")
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_monitoring_primary_as_replica() -> None:
+    monitor = ReplicaMonitor([DEFAULT_DB_ALIAS], max_lag_seconds=1, check_interval_seconds=60)
+
+    assert monitor.get_healthy() == [DEFAULT_DB_ALIAS]
+
+
+@pytest.mark.unit
+def test_monitoring_replicas(monkeypatch) -> None:
+    lags = {"lagging": 10, "healthy": 0}
+    checked = []
+
+    def get_lag(alias: str) -> float:
+        checked.append(alias)
+
+        if alias not in lags:
+            raise DatabaseError()
+
+        return lags[alias]
+
+    monitor = ReplicaMonitor(
+        ["lagging", "healthy", "unavailable", "second"], max_lag_seconds=5, check_interval_seconds=60
+    )
+    monkeypatch.setattr(monitor, "_get_lag", get_lag)
+    lags["second"] = 1
+
+    assert [monitor.choose() for _ in range(4)] == ["healthy", "second", "healthy", "second"]
+    assert checked == ["lagging", "healthy", "unavailable", "second"]
+
+
+@pytest.mark.unit
+def test_rechecking_replicas(monkeypatch) -> None:
+    lags = {"replica": 10}
+    monitor = ReplicaMonitor(["replica"], max_lag_seconds=5, check_interval_seconds=5)
+    monkeypatch.setattr(monitor, "_get_lag", lambda alias: lags[alias])
+
+    with freezegun.freeze_time(timezone.now(), tick=False) as frozen:
+        assert monitor.choose() is None
+
+        lags["replica"] = 0
+        assert monitor.choose() is None
+
+        frozen.tick(6)
+        assert monitor.choose() == "replica"
@@ -0,0 +1,89 @@
+from typing import List, Tuple
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count, F
+
+from app.internal.bank.db.models import BankAccount, BankCard, Transaction
+from app.internal.general.services import auth_service, suggestion_service
+from app.internal.seeding import ScaleSeeder
+from app.internal.user.db.models import Counterparty, FriendRequest, FriendSuggestion, TelegramUser
+
+SCALE = 0.01
+
+
+def _transactions() -> List[Tuple[str, str, str]]:
+    return list(Transaction.objects.order_by("created_at").values_list("source_id", "destination_id", "accrual"))
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_seed_scale() -> None:
+    call_command("seed_scale", scale=SCALE)
+    seeder = ScaleSeeder(scale=SCALE)
+
+    assert TelegramUser.objects.count() == seeder.users
+    assert BankAccount.objects.count() == seeder.accounts
+    assert BankCard.objects.count() == seeder.cards
+    assert Transaction.objects.count() == seeder.transactions
+    assert not BankAccount.objects.filter(balance__lt=0).exists()
+    assert not Transaction.objects.filter(source=F("destination")).exists()
+    assert auth_service.get_user_by_credentials(seeder.USERNAME.format(number=0), seeder.PASSWORD)
+
+    friends = TelegramUser.objects.annotate(amount=Count("friends")).values_list("amount", flat=True)
+    assert sum(friends) / len(friends) > seeder.friends_per_user / 2
+
+    transaction = Transaction.objects.select_related("source", "destination").exclude(
+        source__owner=F("destination__owner")
+    )[0]
+    counterparty = Counterparty.objects.get(user=transaction.source.owner, counterparty=transaction.destination.owner)
+    assert counterparty.count >= 1 and counterparty.last_interaction >= transaction.created_at
+    assert Counterparty.objects.filter(
+        user=transaction.destination.owner, counterparty=transaction.source.owner
+    ).exists()
+
+    for request in FriendRequest.objects.all():
+        assert request.source_id != request.destination_id
+        assert not request.source.friends.filter(id=request.destination_id).exists()
+        assert not FriendRequest.objects.filter(source=request.destination, destination=request.source).exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_seed_scale_is_deterministic() -> None:
+    call_command("seed_scale", scale=SCALE, seed=1)
+    first = _transactions()
+
+    call_command("seed_scale", scale=SCALE, seed=1)
+
+    assert _transactions() == first
+    assert TelegramUser.objects.count() == ScaleSeeder(scale=SCALE).users
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_seed_scale_skew() -> None:
+    call_command("seed_scale", scale=SCALE, skew=1.5)
+    seeder = ScaleSeeder(scale=SCALE)
+
+    hottest = (
+        BankAccount.objects.annotate(amount=Count("transactions_from_me")).order_by("-amount").values("amount").first()
+    )
+
+    assert hottest["amount"] > 10 * seeder.transactions / seeder.accounts
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_seed_scale_clear() -> None:
+    user = TelegramUser.objects.create(id=1, username="real", first_name="Real")
+    call_command("seed_scale", scale=SCALE)
+    suggestion_service.rebuild(batch_size=1000, limit=10)
+
+    call_command("seed_scale", clear=True)
+
+    assert list(TelegramUser.objects.all()) == [user]
+    assert not Transaction.objects.filter(source__owner_id__gte=ScaleSeeder.FIRST_USER_ID).exists()
+    assert not BankAccount.objects.exists()
+    assert not Counterparty.objects.exists()
+    assert not FriendSuggestion.objects.exists()
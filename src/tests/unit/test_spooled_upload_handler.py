@@ -0,0 +1,70 @@
+from io import BytesIO
+
+import pytest
+from django.conf import settings
+
+from app.internal.general.rest.exceptions import BadRequestException
+from app.internal.general.rest.SpooledUploadHandler import SpooledUploadHandler
+
+MAX_SIZE = 1024
+
+
+def _handler(content_type: str = "image/jpeg") -> SpooledUploadHandler:
+    handler = SpooledUploadHandler(None, MAX_SIZE, "image/")
+    handler.new_file("photo", "photo.jpg", content_type, None)
+
+    return handler
+
+
+def _upload(handler: SpooledUploadHandler, content: bytes, chunk: int = 100):
+    for start in range(0, len(content), chunk):
+        handler.receive_data_chunk(content[start : start + chunk], start)
+
+    return handler.file_complete(len(content))
+
+
+@pytest.mark.unit
+def test_spooling_upload() -> None:
+    content = bytes(range(256)) * 4
+
+    uploaded = _upload(_handler(), content)
+
+    assert uploaded.size == len(content)
+    assert uploaded.content_type == "image/jpeg"
+    assert uploaded.name == "photo.jpg"
+    assert uploaded.read() == content
+
+
+@pytest.mark.unit
+def test_rolling_over_to_disk(settings) -> None:
+    settings.UPLOAD_SPOOL_MEMORY_BYTES = 256
+    handler = _handler()
+
+    _upload(handler, b"1" * MAX_SIZE)
+
+    assert handler.file._rolled
+
+
+@pytest.mark.unit
+def test_rejecting_large_file() -> None:
+    handler = _handler()
+
+    with pytest.raises(BadRequestException):
+        _upload(handler, b"1" * (MAX_SIZE + 1))
+
+    assert handler.file.closed
+
+
+@pytest.mark.unit
+def test_rejecting_content_type() -> None:
+    with pytest.raises(BadRequestException):
+        _handler("text/plain")
+
+
+@pytest.mark.unit
+def test_rejecting_large_body() -> None:
+    handler = SpooledUploadHandler(None, MAX_SIZE, "image/")
+    length = MAX_SIZE + settings.DATA_UPLOAD_MAX_MEMORY_SIZE + 1
+
+    with pytest.raises(BadRequestException):
+        handler.handle_raw_input(BytesIO(), {}, length, b"boundary")
@@ -0,0 +1,100 @@
+from logging import INFO, LogRecord
+from threading import Event
+from time import monotonic
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.internal.logging import TelegramLogHandler
+from app.internal.metrics import LOG_RECORDS_DROPPED
+
+TOKEN = "123456:TEST-token"
+CHAT_ID = 1
+
+
+def _handler(flush_interval: float = 60, queue_size: int = 100) -> TelegramLogHandler:
+    handler = TelegramLogHandler(TOKEN, CHAT_ID, flush_interval=flush_interval, queue_size=queue_size)
+    handler.bot = MagicMock()
+
+    return handler
+
+
+def _record(message: str) -> LogRecord:
+    return LogRecord("transfer", INFO, __file__, 0, message, None, None)
+
+
+def _dropped() -> float:
+    return LOG_RECORDS_DROPPED.collect()[0].samples[0].value
+
+
+@pytest.mark.unit
+def test_records_are_batched() -> None:
+    handler = _handler()
+
+    for number in range(3):
+        handler.handle(_record(f"record {number}"))
+
+    handler.bot.send_message.assert_not_called()
+
+    handler.close()
+
+    handler.bot.send_message.assert_called_once_with(chat_id=CHAT_ID, text="record 0\nrecord 1\nrecord 2")
+
+
+@pytest.mark.unit
+def test_records_are_sent_every_interval() -> None:
+    handler = _handler(flush_interval=0.05)
+    sent = Event()
+    handler.bot.send_message.side_effect = lambda **kwargs: sent.set()
+
+    handler.handle(_record("record"))
+
+    assert sent.wait(timeout=5)
+    handler.close()
+
+
+@pytest.mark.unit
+def test_emit_does_not_wait_for_telegram() -> None:
+    handler = _handler(flush_interval=0)
+    released = Event()
+    handler.bot.send_message.side_effect = lambda **kwargs: released.wait(timeout=5)
+
+    started = monotonic()
+    for number in range(50):
+        handler.handle(_record(f"record {number}"))
+    elapsed = monotonic() - started
+
+    released.set()
+    handler.close()
+
+    assert elapsed < 0.5
+
+
+@pytest.mark.unit
+def test_records_are_dropped_when_queue_is_full() -> None:
+    handler = _handler(flush_interval=0, queue_size=1)
+    released = Event()
+    handler.bot.send_message.side_effect = lambda **kwargs: released.wait(timeout=5)
+    dropped = _dropped()
+
+    for number in range(20):
+        handler.handle(_record(f"record {number}"))
+
+    released.set()
+    handler.close()
+
+    assert _dropped() > dropped
+
+
+@pytest.mark.unit
+def test_long_batches_are_split() -> None:
+    handler = _handler()
+    text = "a" * (TelegramLogHandler.MAX_MESSAGE_LENGTH - 10)
+
+    handler.handle(_record(text))
+    handler.handle(_record(text))
+    handler.close()
+
+    assert handler.bot.send_message.call_count == 2
+    for call in handler.bot.send_message.call_args_list:
+        assert len(call.kwargs["text"]) <= TelegramLogHandler.MAX_MESSAGE_LENGTH
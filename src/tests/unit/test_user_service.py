@@ -4,6 +4,7 @@ from re import sub
 from typing import List
 
 import pytest
+from django.db import connection
 from telegram import User
 
 from app.internal.general.services import user_service
@@ -39,6 +40,58 @@ def test_updating_user_in_db(telegram_user: TelegramUser) -> None:
     _assert_telegram_user(user)
 
 
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_updating_user_in_db__unchanged(user: User) -> None:
+    user_service.try_add_or_update_user(user)
+    version = _get_row_version(user.id)
+
+    was_added = user_service.try_add_or_update_user(user)
+
+    assert not was_added
+    assert _get_row_version(user.id) == version
+    _assert_telegram_user(user)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_refreshing_users(users: List[User]) -> None:
+    existing, *new = users
+    user_service.try_add_or_update_user(existing)
+    renamed = User(id=existing.id, first_name=existing.first_name[::-1], username=existing.username, is_bot=False)
+    anonymous = User(id=1, first_name="Аноним", is_bot=False)
+
+    created = user_service.refresh_users([renamed, *new, anonymous])
+
+    assert created == {user.id for user in new}
+    assert user_service.refresh_users([renamed, *new, anonymous]) == set()
+    assert not TelegramUser.objects.filter(id=anonymous.id).exists()
+    _assert_telegram_user(renamed)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_refreshing_users__latest_profile_wins(user: User) -> None:
+    renamed = User(id=user.id, first_name=user.first_name[::-1], username=user.username, is_bot=False)
+
+    assert user_service.refresh_users([user, renamed]) == {user.id}
+
+    _assert_telegram_user(renamed)
+
+
+@pytest.mark.django_db
+@pytest.mark.unit
+def test_refreshing_users__username_conflict(user: User, second_user: User, third_user: User) -> None:
+    user_service.try_add_or_update_user(user)
+    thief = User(id=second_user.id, first_name=second_user.first_name, username=user.username, is_bot=False)
+
+    created = user_service.refresh_users([thief, third_user])
+
+    assert created == {third_user.id}
+    assert not TelegramUser.objects.filter(id=thief.id).exists()
+    _assert_telegram_user(user)
+
+
 @pytest.mark.django_db
 @pytest.mark.unit
 def test_getting_user_by_identifier(users: List[User], telegram_users: List[TelegramUser]) -> None:
@@ -109,3 +162,10 @@ def test_creating_password(user: User, telegram_user: TelegramUser) -> None:
 def test_confirmation_secret_key(user: User, telegram_user_with_password: TelegramUser) -> None:
     assert user_service.is_secret_key_correct(user, KEY) is True
     assert user_service.is_secret_key_correct(user, WRONG_KEY) is False
+
+
+def _get_row_version(user_id: int) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT xmin FROM telegram_users WHERE id = %s", [user_id])
+
+        return cursor.fetchone()[0]